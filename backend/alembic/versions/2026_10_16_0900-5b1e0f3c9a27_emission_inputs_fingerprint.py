@@ -0,0 +1,42 @@
+# codeql[py/unused-global-variable]
+"""Add data_entry_emissions.inputs_fingerprint (recalc skip-unchanged).
+
+Revision ID: 5b1e0f3c9a27
+Revises: d88cd2f143bf
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+__all__ = [
+    "revision",
+    "down_revision",
+    "branch_labels",
+    "depends_on",
+]
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e0f3c9a27"  # noqa: F841
+down_revision: Union[str, Sequence[str], None] = "d88cd2f143bf"  # noqa: F841
+branch_labels: Union[str, Sequence[str], None] = None  # noqa: F841
+depends_on: Union[str, Sequence[str], None] = None  # noqa: F841
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable, no default: existing rows carry no fingerprint, so the
+    # first recalc after the upgrade rewrites them once and stamps it.
+    op.add_column(
+        "data_entry_emissions",
+        sa.Column("inputs_fingerprint", sa.String(length=32), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("data_entry_emissions", "inputs_fingerprint")
@@ -0,0 +1,50 @@
+"""Add calculation_inputs store and data_entry_emissions.inputs_id.
+
+Revision ID: 8c4d2a6e1f70
+Revises: 5b1e0f3c9a27
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+__all__ = [
+    "revision",
+    "down_revision",
+    "branch_labels",
+    "depends_on",
+]
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4d2a6e1f70"  # noqa: F841
+down_revision: Union[str, Sequence[str], None] = "5b1e0f3c9a27"  # noqa: F841
+branch_labels: Union[str, Sequence[str], None] = None  # noqa: F841
+depends_on: Union[str, Sequence[str], None] = None  # noqa: F841
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "calculation_inputs",
+        sa.Column("id", sa.String(length=32), nullable=False),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Nullable: existing rows keep their inline meta (readers handle both
+    # shapes) until the next recalc rewrites them in the compact form.
+    op.add_column(
+        "data_entry_emissions",
+        sa.Column("inputs_id", sa.String(length=32), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("data_entry_emissions", "inputs_id")
+    op.drop_table("calculation_inputs")
@@ -0,0 +1,86 @@
+"""Add module_emission_totals summary table.
+
+Revision ID: 3e7a9d5c2b14
+Revises: 8c4d2a6e1f70
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+__all__ = [
+    "revision",
+    "down_revision",
+    "branch_labels",
+    "depends_on",
+]
+
+# revision identifiers, used by Alembic.
+revision: str = "3e7a9d5c2b14"  # noqa: F841
+down_revision: Union[str, Sequence[str], None] = "8c4d2a6e1f70"  # noqa: F841
+branch_labels: Union[str, Sequence[str], None] = None  # noqa: F841
+depends_on: Union[str, Sequence[str], None] = None  # noqa: F841
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "module_emission_totals",
+        sa.Column("carbon_report_module_id", sa.Integer(), nullable=False),
+        sa.Column("emission_type_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("kg_co2eq", sa.Float(), nullable=False),
+        sa.Column("additional_value", sa.Float(), nullable=True),
+        sa.Column("additional_count", sa.Integer(), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["carbon_report_module_id"],
+            ["carbon_report_modules.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("carbon_report_module_id", "emission_type_id", "year"),
+    )
+    op.create_index(
+        "idx_module_emission_totals_year",
+        "module_emission_totals",
+        ["year"],
+        unique=False,
+    )
+    # Backfill from the existing emissions so readers can switch to the
+    # summary straight away; same grouping as
+    # ModuleEmissionTotalRepository.refresh_modules.
+    op.execute(
+        """
+        INSERT INTO module_emission_totals (
+            carbon_report_module_id, emission_type_id, year, kg_co2eq,
+            additional_value, additional_count, entry_count, updated_at
+        )
+        SELECT
+            de.carbon_report_module_id,
+            dee.emission_type_id,
+            cr.year,
+            SUM(dee.kg_co2eq),
+            SUM(dee.additional_value),
+            COUNT(dee.additional_value),
+            COUNT(DISTINCT de.id),
+            now()
+        FROM data_entry_emissions dee
+        JOIN data_entries de ON de.id = dee.data_entry_id
+        JOIN carbon_report_modules crm ON crm.id = de.carbon_report_module_id
+        JOIN carbon_reports cr ON cr.id = crm.carbon_report_id
+        GROUP BY de.carbon_report_module_id, dee.emission_type_id, cr.year
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "idx_module_emission_totals_year", table_name="module_emission_totals"
+    )
+    op.drop_table("module_emission_totals")
@@ -0,0 +1,53 @@
+"""Add data_ingestion_jobs.priority for prioritised dispatch.
+
+Revision ID: 9a2f6c1d4e83
+Revises: 3e7a9d5c2b14
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+__all__ = [
+    "revision",
+    "down_revision",
+    "branch_labels",
+    "depends_on",
+]
+
+# revision identifiers, used by Alembic.
+revision: str = "9a2f6c1d4e83"  # noqa: F841
+down_revision: Union[str, Sequence[str], None] = "3e7a9d5c2b14"  # noqa: F841
+branch_labels: Union[str, Sequence[str], None] = None  # noqa: F841
+depends_on: Union[str, Sequence[str], None] = None  # noqa: F841
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows default to JobPriority.BULK (0): pending rows keep
+    # their insertion order among themselves.
+    op.add_column(
+        "data_ingestion_jobs",
+        sa.Column("priority", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.create_index(
+        "ix_data_ingestion_jobs_pending_priority",
+        "data_ingestion_jobs",
+        [sa.text("priority DESC"), "id"],
+        unique=False,
+        postgresql_where=sa.text(
+            "state = 'NOT_STARTED'::ingestion_state_enum AND locked_by IS NULL"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_data_ingestion_jobs_pending_priority", table_name="data_ingestion_jobs"
+    )
+    op.drop_column("data_ingestion_jobs", "priority")
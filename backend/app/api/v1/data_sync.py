@@ -1,4 +1,3 @@
-import asyncio
 import enum
 import io
 import json
@@ -49,6 +48,7 @@ from app.models.year_configuration import YearConfiguration
 from app.repositories.data_ingestion import DataIngestionRepository, WhyStaleLiteral
 from app.services.data_ingestion.provider_factory import ProviderFactory
 from app.services.pipeline_progress import PhaseLabel, compute_pipeline_progress
+from app.services.stream_broker import StreamState, stream_broker
 from app.tasks._background import fire_and_forget
 from app.tasks.runner import run_job
 from app.tasks.unit_sync_tasks import SyncUnitRequest
@@ -1384,14 +1384,14 @@ async def job_stream_by_id(
     """
     Server-Sent Events endpoint to stream a single job update in real-time.
 
-    Polls the database for status changes and sends updates to the client.
-    Stream ends when the job is completed, failed, or the client disconnects.
+    Sends the job's status whenever it changes.  Stream ends when the job
+    is completed, failed, or the client disconnects.
 
-    Session lifetime: a fresh ``SessionLocal()`` is opened per poll iteration
-    and closed before the sleep so we don't pin an asyncpg pool slot for the
-    full stream duration (minutes).  ``request.is_disconnected()`` is checked
-    at the top of each iteration so client aborts surface immediately rather
-    than after the next poll.
+    Polling goes through ``stream_broker``: every client watching this job
+    on the pod shares one ~2s poll, which opens a fresh ``SessionLocal()``
+    per tick and closes it before the sleep so no asyncpg pool slot is
+    pinned for the stream duration (minutes).  ``request.is_disconnected()``
+    is checked at least once per poll interval.
 
     TODO(#459): tighten when sub-perimeter scoping ships
     """
@@ -1409,27 +1409,13 @@ async def job_stream_by_id(
             # TODO(#459): tighten when sub-perimeter scoping ships
             await _check_job_scope(existing, current_user, session, action="view")
 
-    async def event_generator():
-        last_status = None
-        last_message = None
-        polls_after_completion = 0
-
-        while True:
-            if await request.is_disconnected():
-                break
-
-            async with db_module.SessionLocal() as session:
-                job = await DataIngestionRepository(session).get_job_by_id(job_id)
-
-            if not job:
-                not_found_status = {
-                    "job_id": job_id,
-                    "status_message": "Job not found",
-                }
-                yield f"data: {json.dumps(not_found_status)}\n\n"
-                break
-
-            current_status = {
+    async def fetch_job() -> Optional[StreamState]:
+        async with db_module.SessionLocal() as session:
+            job = await DataIngestionRepository(session).get_job_by_id(job_id)
+        if not job:
+            return None
+        return StreamState(
+            payload={
                 "job_id": job.id,
                 "module_type_id": job.module_type_id,
                 "target_type": job.target_type,
@@ -1439,24 +1425,31 @@ async def job_stream_by_id(
                 "result": job.result,
                 "status_message": job.status_message,
                 "meta": job.meta if job.meta else None,
-            }
+            },
+            done=job.state == IngestionState.FINISHED,
+        )
 
-            # Yield if either status OR message changed
-            if last_status != current_status or last_message != job.status_message:
-                yield f"data: {json.dumps(current_status)}\n\n"
-                last_status = current_status
-                last_message = job.status_message
+    async def event_generator():
+        last_version = None
+        async for update in stream_broker.watch(
+            ("job", job_id), fetch_job, request.is_disconnected
+        ):
+            if update.payload is None:
+                not_found_status = {
+                    "job_id": job_id,
+                    "status_message": "Job not found",
+                }
+                yield f"data: {json.dumps(not_found_status)}\n\n"
+                continue
 
-            # If job is finished...
-            if job.state == IngestionState.FINISHED:
-                polls_after_completion += 1
-                if polls_after_completion >= 2:
-                    # Send final completion message before closing stream
-                    final_status = {**current_status, "stream_closed": True}
-                    yield f"data: {json.dumps(final_status)}\n\n"
-                    break
+            if update.version != last_version:
+                yield f"data: {json.dumps(update.payload)}\n\n"
+                last_version = update.version
 
-            await asyncio.sleep(2)
+            if update.closed:
+                # Send final completion message before closing stream
+                final_status = {**update.payload, "stream_closed": True}
+                yield f"data: {json.dumps(final_status)}\n\n"
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -1820,8 +1813,9 @@ async def pipeline_stream_by_id(
 
     Plan 310D — the frontend stale-stats UX subscribes here when a module's
     carbon-report response surfaces a ``current_pipeline_id``.  Each tick
-    re-reads every job in the pipeline and emits an ``event:
-    pipeline-update`` SSE message *only when* a job's
+    of the pod's shared ``stream_broker`` poll (one per watched pipeline,
+    however many clients) re-reads every job in the pipeline and emits an
+    ``event: pipeline-update`` SSE message *only when* a job's
     ``(state, status_message, result, started_at, finished_at)`` tuple
     changed — so an idle pipeline doesn't spam the wire.  ``started_at``
     is included because PR #1026 made it transition NOT_STARTED → claim
@@ -1857,106 +1851,91 @@ async def pipeline_stream_by_id(
             initial_jobs, current_user, session, action="view"
         )
 
-    # Tunables — keep the polling cadence tight enough that UI updates
-    # feel real-time, but spread the heartbeat across many polls so the
-    # ping packet is rare.  Defaults match the existing job-stream poll.
-    poll_interval_seconds = 2
+    # Keep-alive cadence, spread across many polls so the ping packet is
+    # rare.  The poll itself runs at the broker's shared ~2s tick.
     heartbeat_interval_seconds = 15
 
+    async def fetch_pipeline() -> StreamState:
+        # Fresh session per poll so the asyncpg pool slot is released
+        # between ticks.  The previous implementation captured
+        # ``Depends(get_db)`` for the entire generator lifetime, pinning
+        # one slot per subscriber for the whole stream (minutes).
+        async with db_module.SessionLocal() as session:
+            repo = DataIngestionRepository(session)
+            jobs = await repo.list_jobs_by_pipeline_id(pipeline_id)
+            # Phase 3 read-flip (#1236): pull the pipelines row each
+            # tick so ``progress.done`` reflects the runner's most
+            # recent post-finish_job status write (or the cron sweep
+            # if that write log-and-skipped).
+            pipeline_row = await repo.get_pipeline_by_id(pipeline_id)
+
+        # Snapshot the columns the spec calls out for the dashboard:
+        # only these fields trigger a re-emit, so meta-only mutations
+        # (e.g. progress dicts) don't flood the stream.
+        snapshot = [
+            {
+                "id": job.id,
+                "job_type": job.job_type,
+                # Carried so the frontend can scope a per-submodule
+                # phase badge to the dets actually in the pipeline
+                # (a single-submodule upload recalcs only its det;
+                # other submodule cards must stay quiet).
+                "data_entry_type_id": job.data_entry_type_id,
+                # Enum NAME so the frontend's string comparisons
+                # (``j.state === 'FINISHED'``) work uniformly across
+                # the list endpoint, single endpoint, and this SSE
+                # stream.  See ``PipelineJobListEntry`` serializers.
+                "state": (job.state.name if job.state is not None else None),
+                "result": (job.result.name if job.result is not None else None),
+                "status_message": job.status_message,
+                "started_at": (job.started_at.isoformat() if job.started_at else None),
+                "finished_at": (
+                    job.finished_at.isoformat() if job.finished_at else None
+                ),
+            }
+            for job in jobs
+            if job.id is not None
+        ]
+
+        # Issue #1219 — server-authoritative completion.  Phase 3
+        # (#1236) further: ``done``/``has_error`` derive from
+        # ``pipelines.status`` (durable, recompute-and-stored)
+        # rather than from the possibly-stale job snapshot.  Orphans
+        # (no pipelines row) fall back to job-derived inside
+        # compute_pipeline_progress.
+        progress = compute_pipeline_progress(jobs, pipeline=pipeline_row)
+        return StreamState(
+            payload={
+                "pipeline_id": str(pipeline_id),
+                "jobs": snapshot,
+                "progress": progress,
+            },
+            done=progress["done"],
+            fingerprint=snapshot,
+        )
+
     async def event_generator():
-        last_snapshot: Optional[list[dict]] = None
-        polls_after_completion = 0
-        seconds_since_heartbeat = 0
-
-        while True:
-            if await request.is_disconnected():
-                break
-
-            # Open a fresh session per poll so the asyncpg pool slot is
-            # released between ticks.  The previous implementation captured
-            # ``Depends(get_db)`` for the entire generator lifetime, pinning
-            # one slot per subscriber for the whole stream (minutes).
-            async with db_module.SessionLocal() as session:
-                repo = DataIngestionRepository(session)
-                jobs = await repo.list_jobs_by_pipeline_id(pipeline_id)
-                # Phase 3 read-flip (#1236): pull the pipelines row each
-                # tick so ``progress.done`` reflects the runner's most
-                # recent post-finish_job status write (or the cron sweep
-                # if that write log-and-skipped).
-                pipeline_row = await repo.get_pipeline_by_id(pipeline_id)
-
-            # Snapshot the columns the spec calls out for the dashboard:
-            # only these fields trigger a re-emit, so meta-only mutations
-            # (e.g. progress dicts) don't flood the stream.
-            snapshot = [
-                {
-                    "id": job.id,
-                    "job_type": job.job_type,
-                    # Carried so the frontend can scope a per-submodule
-                    # phase badge to the dets actually in the pipeline
-                    # (a single-submodule upload recalcs only its det;
-                    # other submodule cards must stay quiet).
-                    "data_entry_type_id": job.data_entry_type_id,
-                    # Enum NAME so the frontend's string comparisons
-                    # (``j.state === 'FINISHED'``) work uniformly across
-                    # the list endpoint, single endpoint, and this SSE
-                    # stream.  See ``PipelineJobListEntry`` serializers.
-                    "state": (job.state.name if job.state is not None else None),
-                    "result": (job.result.name if job.result is not None else None),
-                    "status_message": job.status_message,
-                    "started_at": (
-                        job.started_at.isoformat() if job.started_at else None
-                    ),
-                    "finished_at": (
-                        job.finished_at.isoformat() if job.finished_at else None
-                    ),
-                }
-                for job in jobs
-                if job.id is not None
-            ]
-
-            # Issue #1219 — server-authoritative completion.  Phase 3
-            # (#1236) further: ``done``/``has_error`` derive from
-            # ``pipelines.status`` (durable, recompute-and-stored)
-            # rather than from the possibly-stale job snapshot.  Orphans
-            # (no pipelines row) fall back to job-derived inside
-            # compute_pipeline_progress.
-            progress = compute_pipeline_progress(jobs, pipeline=pipeline_row)
-
-            if snapshot != last_snapshot:
-                payload = {
-                    "pipeline_id": str(pipeline_id),
-                    "jobs": snapshot,
-                    "progress": progress,
-                }
-                yield f"event: pipeline-update\ndata: {json.dumps(payload)}\n\n"
-                last_snapshot = snapshot
-                # Snapshot change counts as keep-alive — reset the heartbeat
-                # clock so we don't double-emit on the next tick.
-                seconds_since_heartbeat = 0
-
-            if progress["done"]:
-                polls_after_completion += 1
+        last_version = None
+        async for update in stream_broker.watch(
+            ("pipeline", pipeline_id),
+            fetch_pipeline,
+            request.is_disconnected,
+            idle_timeout=heartbeat_interval_seconds,
+        ):
+            if update is None:
+                yield "event: ping\ndata: {}\n\n"
+                continue
+
+            if update.version != last_version:
+                yield f"event: pipeline-update\ndata: {json.dumps(update.payload)}\n\n"
+                last_version = update.version
+
+            if update.closed:
                 # Mirror the job-stream endpoint's "send a final marker
                 # then close" handshake so clients can flip UI state
                 # before the EventSource reconnect logic fires.
-                if polls_after_completion >= 2:
-                    final_payload = {
-                        "pipeline_id": str(pipeline_id),
-                        "jobs": last_snapshot or snapshot,
-                        "progress": progress,
-                        "stream_closed": True,
-                    }
-                    yield (
-                        f"event: pipeline-update\ndata: {json.dumps(final_payload)}\n\n"
-                    )
-                    break
-
-            await asyncio.sleep(poll_interval_seconds)
-            seconds_since_heartbeat += poll_interval_seconds
-            if seconds_since_heartbeat >= heartbeat_interval_seconds:
-                yield "event: ping\ndata: {}\n\n"
-                seconds_since_heartbeat = 0
+                final_payload = {**update.payload, "stream_closed": True}
+                yield (f"event: pipeline-update\ndata: {json.dumps(final_payload)}\n\n")
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
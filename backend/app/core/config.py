@@ -3,7 +3,7 @@
 from functools import lru_cache
 from typing import Optional
 
-from pydantic import Field, computed_field, field_validator
+from pydantic import Field, PositiveInt, computed_field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.models.user import UserProvider
@@ -347,6 +347,27 @@ class Settings(BaseSettings):
             "raise if a specific job type is expected to run longer."
         ),
     )
+    API_RUNS_JOBS: bool = Field(
+        default=True,
+        description=(
+            "Whether the API process runs background jobs itself: the "
+            "poller, reconciler and pod heartbeat in its lifespan, plus the "
+            "in-process ``run_job`` an endpoint fires after creating a job.  "
+            "Turn off when a ``python -m app.worker`` deployment runs jobs; "
+            "API pods then only enqueue, and the insert's NOTIFY wakes a "
+            "worker."
+        ),
+    )
+    WORKER_SHUTDOWN_GRACE_SECONDS: int = Field(
+        default=25,
+        ge=0,
+        description=(
+            "Seconds a stopping worker waits for its in-flight jobs after it "
+            "stops claiming new ones.  Keep below the deployment's "
+            "termination grace period; jobs still running at the deadline "
+            "are left to the stale-job sweep."
+        ),
+    )
     RUN_BACKGROUND_POLLER: bool = Field(
         default=True,
         description="Whether to run the in-process safety poller",
@@ -373,6 +394,49 @@ class Settings(BaseSettings):
             "run_job tasks one sweep can fan out at once."
         ),
     )
+    JOB_NOTIFY_ENABLED: bool = Field(
+        default=True,
+        description=(
+            "Whether each pod holds a Postgres ``LISTEN`` connection on the "
+            "job channel.  Job inserts and recoveries ``NOTIFY`` it at "
+            "commit, waking the poller's dispatch sweep immediately instead "
+            "of after ``POLLER_INTERVAL_SECONDS``.  Costs one pooled "
+            "connection per pod; only takes effect with the poller on."
+        ),
+    )
+    JOB_NOTIFY_FALLBACK_POLL_SECONDS: int = Field(
+        default=30,
+        ge=1,
+        description=(
+            "Seconds between timed dispatch sweeps while the job listener "
+            "is connected.  Notifications carry dispatch latency, so the "
+            "timed sweep is only the fallback for missed notifications; "
+            "the stuck-RUNNING recovery and deferred ``run_after`` jobs keep "
+            "their own timers, and while the listener is down the poller "
+            "keeps ``POLLER_INTERVAL_SECONDS``."
+        ),
+    )
+    JOB_CONCURRENCY_LIMITS: dict[str, PositiveInt] = Field(
+        default_factory=dict,
+        description=(
+            "Per-pod cap on concurrently running jobs, by job type — e.g. "
+            '``{"emission_recalc": 2, "csv_ingest": 1, "aggregation": 4}`` '
+            "(JSON in the environment).  At the cap the runner leaves a "
+            "job unclaimed for another pod, or for this one once a slot "
+            "frees, so a heavy pipeline can't take every pooled connection "
+            "from API requests.  Unlisted types are unbounded."
+        ),
+    )
+    JOB_PIPELINE_RESERVED_SLOTS: int = Field(
+        default=1,
+        ge=0,
+        description=(
+            "Slots of each ``JOB_CONCURRENCY_LIMITS`` type that one pipeline "
+            "may not take on a pod, so a bulk reload's fan-out can't hold "
+            "every slot while another pipeline waits.  A pipeline always "
+            "gets at least one slot; 0 lets it take them all."
+        ),
+    )
     INGEST_COPY_BATCH_SIZE: int = Field(
         default=50_000,
         ge=1,
@@ -384,6 +448,136 @@ class Settings(BaseSettings):
             "INSERT overhead away."
         ),
     )
+    INGEST_VALIDATION_WORKERS: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Worker processes for the row-validation stage of a data-entry "
+            "CSV ingest.  Above 1, and when every handler of the upload "
+            "sets ``csv_parallel_validation`` (pure ``validate_create`` + "
+            "factor defaults, no per-row I/O), chunks of resolved rows are "
+            "validated in a process pool from a snapshot of the factor "
+            "values; results come back in file order for COPY.  1 keeps "
+            "the in-process path."
+        ),
+    )
+    INGEST_VALIDATION_PARALLEL_MIN_ROWS: int = Field(
+        default=20_000,
+        ge=1,
+        description=(
+            "Smallest CSV (approximate row count) that takes the "
+            "process-pool validation path when ``INGEST_VALIDATION_WORKERS`` "
+            "> 1.  Spawning workers costs a few seconds of imports, which "
+            "only pays off on large files."
+        ),
+    )
+    INGEST_SKIP_IDENTICAL_UPLOADS: bool = Field(
+        default=True,
+        description=(
+            "Finish a MODULE_PER_YEAR CSV upload without re-ingesting when "
+            "its content, factors and formula version match the previous "
+            "successful run of the same combo and the replaced rows are "
+            "untouched since."
+        ),
+    )
+    INGEST_ROW_DIFF: bool = Field(
+        default=False,
+        description=(
+            "Apply a MODULE_PER_YEAR CSV re-upload as a diff against the "
+            "stored rows, matched on the handlers' csv_natural_key: only "
+            "new, changed and removed rows are written and recalculated. "
+            "Unchanged rows keep their ids."
+        ),
+    )
+    BULK_COPY_BINARY: bool = Field(
+        default=True,
+        description=(
+            "Write the bulk ``data_entries`` (CSV ingest) and "
+            "``data_entry_emissions`` (recalc) COPYs in PostgreSQL binary "
+            "format with declared column types and pre-encoded JSON, "
+            "instead of text COPY with per-value adaptation.  Turn off to "
+            "fall back to the text writer."
+        ),
+    )
+    EMISSION_RECALC_WORKERS: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Worker processes for a year-wide ``emission_recalc`` job.  "
+            "Above 1 the slice is split into shards of whole "
+            "``carbon_report_module_id`` groups, each computed in its own "
+            "process (one extra DB connection per worker, read-only); the "
+            "job's own session still writes every emission, so the factor "
+            "advisory lock and the runner's single commit are unchanged.  "
+            "1 keeps the in-process path."
+        ),
+    )
+    EMISSION_RECALC_PARALLEL_MIN_ENTRIES: int = Field(
+        default=20_000,
+        ge=1,
+        description=(
+            "Smallest slice (entry count) that takes the sharded recalc "
+            "path when ``EMISSION_RECALC_WORKERS`` > 1.  Spawning worker "
+            "processes costs a few seconds of imports, which only pays "
+            "off on large slices; unit-scoped recalcs stay in-process."
+        ),
+    )
+    EMISSION_RECALC_SKIP_UNCHANGED: bool = Field(
+        default=True,
+        description=(
+            "Skip the DELETE + COPY of an entry's emissions during a recalc "
+            "when its freshly computed ``inputs_fingerprint`` (entry data, "
+            "pre_compute context, resolved factors, year, formula version) "
+            "matches the one stored on its current rows.  A factor ingest "
+            "that only touches a handful of factors then rewrites just the "
+            "entries those factors feed.  Turn off to force a full rewrite."
+        ),
+    )
+    EMISSION_RECALC_WRITE_BEHIND: bool = Field(
+        default=True,
+        description=(
+            "In the in-process recalc, write each chunk's emissions (DELETE "
+            "+ COPY) while the next chunk's formula pass runs in a worker "
+            "thread, instead of stopping the compute for every write.  At "
+            "most two chunks are in flight and every statement still runs "
+            "on the job's session, inside the runner's transaction.  Turn "
+            "off to write each chunk inline before the next one is read."
+        ),
+    )
+    EMISSION_RECALC_CHECKPOINTED: bool = Field(
+        default=False,
+        description=(
+            "Commit an ``emission_recalc`` job's work chunk by chunk, with "
+            "the last processed data_entry id saved as a cursor in the job "
+            "meta, so a job the stale-job sweep sends back to NOT_STARTED "
+            "resumes from the cursor instead of recomputing the slice.  "
+            "Runs in-process (no sharding) under a session-level factor "
+            "lock; partial results become visible as chunks commit."
+        ),
+    )
+    MODULE_STATS_DELTA: bool = Field(
+        default=True,
+        description=(
+            "Apply a single data-entry create / update / delete to the "
+            "module and report stats as a delta of that entry's emission "
+            "rows instead of re-aggregating every emission of the module.  "
+            "Falls back to the full recompute when the stored stats cannot "
+            "be patched exactly; the aggregation job still recomputes in "
+            "full and corrects any floating-point drift."
+        ),
+    )
+    EMISSION_TOTALS_SUMMARY: bool = Field(
+        default=True,
+        description=(
+            "Read report and unit emission totals (per-module totals, "
+            "breakdowns, IT totals, yearly unit totals) from the "
+            "``module_emission_totals`` summary instead of joining every "
+            "``data_entry_emissions`` row through ``data_entries``.  Every "
+            "emission write and data-entry delete moves the summary in the "
+            "same transaction, and the aggregation job rebuilds it.  Turn "
+            "off to read the raw emissions, e.g. to rule out summary drift."
+        ),
+    )
 
     # #1236 Phase 3 — pipeline status reconciliation cron.
     RUN_PIPELINE_RECONCILER: bool = Field(
@@ -1,6 +1,5 @@
 """FastAPI application entry point."""
 
-import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, status
@@ -57,69 +56,24 @@ async def lifespan(app: FastAPI):
 
     bootstrap_handlers()
 
-    # Start the safety poller (Plan 310A)
-    if settings.RUN_BACKGROUND_POLLER:
-        from app.tasks._pod_id import POD_ID
-        from app.tasks._poller import poll_pending_jobs
+    # Job-running loops (poller, reconciler, pod heartbeat).  Off when a
+    # dedicated ``app.worker`` deployment runs jobs and the API only
+    # enqueues them.
+    if settings.API_RUNS_JOBS:
+        from app.tasks._services import start_job_services
 
-        logger.info(f"Starting safety poller on pod {POD_ID}")
-        app.state.poller_task = asyncio.create_task(poll_pending_jobs())
-
-    # Start the pipeline reconciliation sweep (#1236 Phase 3) — durable
-    # backstop for the runner's log-and-skip post-``finish_job`` write.
-    if settings.RUN_PIPELINE_RECONCILER:
-        from app.tasks._pipeline_reconciler import reconcile_pipeline_statuses_loop
-
-        logger.info(
-            "Starting pipeline reconciler (every %ss)",
-            settings.PIPELINE_RECONCILER_INTERVAL_SECONDS,
-        )
-        app.state.pipeline_reconciler_task = asyncio.create_task(
-            reconcile_pipeline_statuses_loop()
-        )
-
-    # Start the pod heartbeat writer (#1080 sprint-9) — registers
-    # this pod in the ``pods`` table and refreshes its
-    # ``last_heartbeat_at`` so the workers view can show "who's
-    # claiming work right now".  Motivating incident: a dev branch
-    # running locally against the stage DB silently collided with
-    # the deployed stage app — no UI surfaced two pods.
-    if settings.RUN_POD_HEARTBEAT:
-        from app.tasks._pod_heartbeat import pod_heartbeat_loop
-
-        logger.info(
-            "Starting pod heartbeat (every %ss)",
-            settings.POD_HEARTBEAT_INTERVAL_SECONDS,
-        )
-        app.state.pod_heartbeat_task = asyncio.create_task(pod_heartbeat_loop())
+        app.state.job_services = start_job_services()
+    else:
+        logger.info("API_RUNS_JOBS is off — jobs run in app.worker processes")
 
     yield
 
     # Cancel background tasks on shutdown
-    task = getattr(app.state, "poller_task", None)
-    if task:
-        logger.info("Cancelling safety poller")
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            logger.info("Safety poller cancelled successfully")
-    reconciler_task = getattr(app.state, "pipeline_reconciler_task", None)
-    if reconciler_task:
-        logger.info("Cancelling pipeline reconciler")
-        reconciler_task.cancel()
-        try:
-            await reconciler_task
-        except asyncio.CancelledError:
-            logger.info("Pipeline reconciler cancelled successfully")
-    heartbeat_task = getattr(app.state, "pod_heartbeat_task", None)
-    if heartbeat_task:
-        logger.info("Cancelling pod heartbeat")
-        heartbeat_task.cancel()
-        try:
-            await heartbeat_task
-        except asyncio.CancelledError:
-            logger.info("Pod heartbeat cancelled successfully")
+    job_services = getattr(app.state, "job_services", None)
+    if job_services:
+        from app.tasks._services import stop_job_services
+
+        await stop_job_services(job_services)
 
     logger.info("Shutdown complete", extra={settings.APP_NAME: settings.APP_VERSION})
 
@@ -4,6 +4,7 @@ from sqlmodel import Relationship
 
 from .audit import AuditDocument
 from .building_room import BuildingRoom
+from .calculation_input import CalculationInput
 from .carbon_project import CarbonProject
 from .carbon_report import CarbonReport, CarbonReportModule
 from .data_entry import DataEntry
@@ -11,6 +12,7 @@ from .data_entry_emission import DataEntryEmission
 from .data_ingestion import DataIngestionJob
 from .factor import Factor
 from .location import Location
+from .module_emission_total import ModuleEmissionTotal
 from .pod import Pod
 from .unit import Unit
 from .unit_user import UnitUser
@@ -50,6 +52,7 @@ DataEntryEmission.data_entry = Relationship()
 
 __all__ = [
     "BuildingRoom",
+    "CalculationInput",
     "AuditDocument",
     "Unit",
     "User",
@@ -60,6 +63,7 @@ __all__ = [
     "CarbonReport",
     "CarbonReportModule",
     "Location",
+    "ModuleEmissionTotal",
     "DataEntry",
     "DataEntryEmission",
     "Pod",
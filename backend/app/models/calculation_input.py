@@ -0,0 +1,64 @@
+"""Content-addressed store for the inputs an emission was computed from."""
+
+import hashlib
+import json
+from datetime import datetime
+from enum import StrEnum
+
+from sqlalchemy import String
+from sqlmodel import JSON, TIMESTAMP, Column, Field, SQLModel
+
+
+class CalculationInputKind(StrEnum):
+    # Entry data enriched by the handler's ``pre_compute`` (the formula ctx).
+    context = "context"
+    # A factor's ``values`` as they were when the emission was computed.
+    factor_values = "factor_values"
+
+
+def calculation_input_id(payload: dict) -> str:
+    """Content address of ``payload``: 128-bit blake2b of its canonical JSON.
+
+    Key order does not matter; anything not JSON-native is folded in
+    through ``str`` (same encoding as the emission inputs fingerprint).
+    """
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class CalculationInput(SQLModel, table=True):
+    """
+    One calculation input payload, stored once and shared by every
+    emission computed from it.
+
+    ``data_entry_emissions`` rows reference their entry context through
+    ``inputs_id`` and each factor snapshot through
+    ``meta.factors_used[].values_id`` instead of embedding copies, so a
+    headcount member's 4+ emission rows (and every rollup) share one
+    context row, and every entry using a factor shares one snapshot row.
+
+    Rows are immutable: the id is the hash of the payload
+    (``calculation_input_id``), so writers insert with ON CONFLICT DO
+    NOTHING and never update.
+    """
+
+    __tablename__ = "calculation_inputs"
+
+    id: str = Field(
+        sa_column=Column(String(32), primary_key=True),
+        description="calculation_input_id(payload)",
+    )
+    kind: CalculationInputKind = Field(
+        sa_column=Column(String(32), nullable=False),
+        description="What the payload is: an entry context or factor values",
+    )
+    payload: dict = Field(
+        default_factory=dict,
+        sa_column=Column(JSON, nullable=False),
+        description="The stored inputs (context dict or factor values dict)",
+    )
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=False),
+        description="When the payload was first stored",
+    )
@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum, IntEnum, StrEnum
 from typing import Callable, Optional, TypedDict
 
-from sqlalchemy import Float, ForeignKey
+from sqlalchemy import Float, ForeignKey, String
 from sqlmodel import JSON, TIMESTAMP, Column, Field, Integer, SQLModel
 
 from app.models.data_entry import DataEntryTypeEnum
@@ -247,8 +247,7 @@ class EmissionType(int, Enum):
 
     @property
     def parent(self) -> "EmissionType | None":
-        pv = _PARENT_MAP.get(self.value)
-        return EmissionType(pv) if pv is not None else None
+        return EMISSION_TYPE_TREE.parent(self)
 
 
 # =============================================================================
@@ -960,29 +959,143 @@ _SCOPE_CATEGORY_MAP: dict[int, EmissionMeta] = {
 # =============================================================================
 
 
+class EmissionTypeTree:
+    """Immutable index of the ``EmissionType`` hierarchy.
+
+    Built once at import time from ``_PARENT_MAP``.  Every node gets a
+    dense ordinal (its position in enum declaration order); children,
+    subtree leaves, preorder subtree, depth and ancestor chain are
+    precomputed per ordinal, so each lookup is a dict hit plus a tuple
+    index instead of a scan over every member.
+    """
+
+    __slots__ = (
+        "nodes",
+        "_ordinal",
+        "_parent",
+        "_children",
+        "_leaves",
+        "_subtree",
+        "_depth",
+        "_ancestors",
+        "_lineage",
+    )
+
+    def __init__(self, parent_map: dict[int, int]):
+        nodes = tuple(EmissionType)
+        ordinal = {node.value: i for i, node in enumerate(nodes)}
+        parent = tuple(
+            ordinal[parent_map[node.value]] if node.value in parent_map else -1
+            for node in nodes
+        )
+        children: list[list[int]] = [[] for _ in nodes]
+        for i, p in enumerate(parent):
+            if p >= 0:
+                children[p].append(i)
+
+        # Roots first, then each level below them: every parent is
+        # finished before its children start.
+        depth = [0] * len(nodes)
+        ancestors: list[tuple[int, ...]] = [()] * len(nodes)
+        pending = [i for i, p in enumerate(parent) if p < 0]
+        while pending:
+            following: list[int] = []
+            for i in pending:
+                for child in children[i]:
+                    depth[child] = depth[i] + 1
+                    ancestors[child] = (i, *ancestors[i])
+                    following.append(child)
+            pending = following
+
+        # Children before parents (deepest first) so each subtree is
+        # assembled from its children's, in declaration order.
+        leaves: list[tuple[int, ...]] = [()] * len(nodes)
+        subtree: list[tuple[int, ...]] = [()] * len(nodes)
+        for i in sorted(range(len(nodes)), key=lambda i: -depth[i]):
+            kids = children[i]
+            leaves[i] = (
+                tuple(leaf for c in kids for leaf in leaves[c]) if kids else (i,)
+            )
+            subtree[i] = (i, *(n for c in kids for n in subtree[c]))
+
+        def _members(ordinals: tuple[int, ...]) -> tuple[EmissionType, ...]:
+            return tuple(nodes[o] for o in ordinals)
+
+        self.nodes: tuple[EmissionType, ...] = nodes
+        self._ordinal = ordinal
+        self._parent = tuple(nodes[p] if p >= 0 else None for p in parent)
+        self._children = tuple(_members(tuple(kids)) for kids in children)
+        self._leaves = tuple(tuple(nodes[o].value for o in lv) for lv in leaves)
+        self._subtree = tuple(_members(st) for st in subtree)
+        self._depth = tuple(depth)
+        self._ancestors = tuple(_members(a) for a in ancestors)
+        self._lineage = tuple((i, *a) for i, a in enumerate(ancestors))
+
+    def ordinal(self, node: EmissionType) -> int:
+        """Dense index of ``node``: position in enum declaration order."""
+        return self._ordinal[node.value]
+
+    def parent(self, node: EmissionType) -> "EmissionType | None":
+        return self._parent[self._ordinal[node.value]]
+
+    def children(self, node: EmissionType) -> tuple[EmissionType, ...]:
+        """Direct children, in declaration order."""
+        return self._children[self._ordinal[node.value]]
+
+    def is_leaf(self, node: EmissionType) -> bool:
+        return not self._children[self._ordinal[node.value]]
+
+    def subtree_leaves(self, node: EmissionType) -> tuple[int, ...]:
+        """Leaf values under ``node`` (``(node.value,)`` for a leaf)."""
+        return self._leaves[self._ordinal[node.value]]
+
+    def subtree(self, node: EmissionType) -> tuple[EmissionType, ...]:
+        """``node`` and every node below it, in preorder."""
+        return self._subtree[self._ordinal[node.value]]
+
+    def depth(self, node: EmissionType) -> int:
+        """Parent chain length (0 = root)."""
+        return self._depth[self._ordinal[node.value]]
+
+    def ancestors(self, node: EmissionType) -> tuple[EmissionType, ...]:
+        """Parent, grandparent, … up to the root."""
+        return self._ancestors[self._ordinal[node.value]]
+
+    def rollup_leaves(self, values: dict[int, float]) -> list[float]:
+        """Subtree totals for every node, indexed by ordinal.
+
+        ``values`` maps leaf emission_type_id to an amount; each one is
+        added to its leaf and every ancestor in a single pass, so the
+        result holds the rollup at every level of the tree at once.
+        Non-leaf and unknown ids are ignored, matching a sum over
+        ``get_subtree_leaves``.
+        """
+        totals = [0.0] * len(self.nodes)
+        for value, amount in values.items():
+            i = self._ordinal.get(value)
+            if i is None or self._children[i]:
+                continue
+            for o in self._lineage[i]:
+                totals[o] += amount
+        return totals
+
+
+EMISSION_TYPE_TREE = EmissionTypeTree(_PARENT_MAP)
+
+
 def get_children(root: EmissionType) -> list[EmissionType]:
     """Get direct children of a node (one level down)."""
-    return [e for e in EmissionType if _PARENT_MAP.get(e.value) == root.value]
+    return list(EMISSION_TYPE_TREE.children(root))
 
 
 def get_subtree_leaves(root: EmissionType) -> list[int]:
     """Get all leaf emission_type_id values under a given node (recursive)."""
-    kids = [e for e in EmissionType if _PARENT_MAP.get(e.value) == root.value]
-    if not kids:
-        return [root.value]
-    result: list[int] = []
-    for child in kids:
-        result.extend(get_subtree_leaves(child))
-    return result
+    return list(EMISSION_TYPE_TREE.subtree_leaves(root))
 
 
 def get_all_nodes(root: EmissionType) -> list[EmissionType]:
     """Get all nodes (root + intermediates + leaves) under a given node."""
-    result: list[EmissionType] = [root]
-    kids = [e for e in EmissionType if _PARENT_MAP.get(e.value) == root.value]
-    for child in kids:
-        result.extend(get_all_nodes(child))
-    return result
+    return list(EMISSION_TYPE_TREE.subtree(root))
 
 
 ### =============================================================================
@@ -1117,13 +1230,38 @@ class DataEntryEmissionBase(SQLModel):
     meta: dict = Field(
         default_factory=dict,
         sa_column=Column(JSON),
-        description="Calculation inputs and factors_used array for full traceability",
+        description=(
+            "Per-row calculation details and the factors_used array "
+            "(factor id + calculation_inputs id of its values snapshot)"
+        ),
+    )
+    # No FK: calculation_inputs rows are immutable and never deleted, so
+    # the reference cannot dangle, and the recalc COPY skips a per-row
+    # lookup.
+    inputs_id: Optional[str] = Field(
+        default=None,
+        sa_column=Column(String(32), nullable=True),
+        description=(
+            "calculation_inputs row holding the entry context (data + "
+            "pre_compute output) the emission was computed from; shared by "
+            "every emission of the entry"
+        ),
     )
     computed_at: datetime = Field(
         default_factory=datetime.utcnow,
         sa_column=Column(TIMESTAMP(timezone=True), nullable=False, index=True),
         description="Timestamp when emission was computed",
     )
+    inputs_fingerprint: Optional[str] = Field(
+        default=None,
+        sa_column=Column(String(32), nullable=True),
+        description=(
+            "Hash of everything the entry's emission set was computed from "
+            "(entry data + pre_compute context, resolved factor ids/values, "
+            "year, formula version); identical on every row of the set.  "
+            "A recalc whose fresh fingerprint matches skips the rewrite."
+        ),
+    )
 
 
 class DataEntryEmission(DataEntryEmissionBase, table=True):
@@ -1133,25 +1271,32 @@ class DataEntryEmission(DataEntryEmissionBase, table=True):
     Stores computed CO2 emissions for all module types. Supports:
     - Multiple emissions per data entry (headcount → food, waste, commute)
     - Single emission per data entry (equipment → equipment)
-    - Multi-factor calculations (all factors stored in meta.factors_used)
+    - Multi-factor calculations (all factors referenced in meta.factors_used)
 
     One data entry can produce N emission rows, one per emission_type.
 
     Factor storage:
     - primary_factor_id: Main calculation factor
         (for traceability and recalculation queries)
-    - meta.factors_used: Array of all factors with roles
-        [{id, role, factor_family, values}]
+    - meta.factors_used: Array of all factors used
+        [{id, values_id}]
+
+    Calculation inputs are stored once in ``calculation_inputs``
+    (content-addressed, see ``CalculationInput``) and referenced, never
+    copied per row:
+    - inputs_id → the entry context (data + pre_compute output)
+    - meta.factors_used[].values_id → the factor values at compute time
+    ``CalculationInputRepository.expand_meta`` rebuilds the full
+    ``{**ctx, factors_used: [{id, values}], ...}`` view for readers.
 
     For equipment calculations (2 factors):
     - primary_factor_id → power factor (watts)
-    - meta.factors_used → [{role: 'primary', ...power},
-        {role: 'emission'}]
+    - meta.factors_used → [{id: power}, {id: emission}]
     - Formula: kg_co2eq = annual_kwh x emission_factor.values.kg_co2eq_per_kwh
 
     For headcount calculations (1 factor per emission):
     - primary_factor_id → headcount factor for that emission_type
-    - meta.factors_used → [{role: 'primary', ...headcount_factor}]
+    - meta.factors_used → [{id: headcount_factor}]
     - Formula: kg_co2eq = fte x factor.values.kg_co2eq_per_fte
 
     Category/treemaps: Use emission_type.path or emission_type.parent
@@ -1165,22 +1310,22 @@ class DataEntryEmission(DataEntryEmissionBase, table=True):
         Equipment emission (1 row):
             data_entry_id=42, emission_type_id=80100 (equipment__scientific),
             kg_co2eq=123.4, primary_factor_id=5 (power),
+            inputs_id="9f2c…" (→ {"annual_kwh": 3569.3, ...}),
             meta={
-                "annual_kwh": 3569.3,
                 "factors_used": [
-                    {"id": 5, "role": "primary",
-                        "factor_family": "power", "values": {...}},
-                    {"id": 10, "role": "emission",
-                        "factor_family": "emission", "values": {...}}
+                    {"id": 5, "values_id": "41ab…"},
+                    {"id": 10, "values_id": "c07e…"}
                 ]
             }
 
-        Headcount emissions (4 rows):
+        Headcount emissions (4 rows, one shared inputs_id):
             data_entry_id=77, emission_type_id=10000 (food), kg_co2eq=336.0,
             primary_factor_id=11 (food factor),
+            inputs_id="5d10…" (→ {"fte": 0.8, ...}),
             meta={
-                "fte": 0.8,
-                "factors_used": [{"id": 11, "role": "primary", "values": {...}}]
+                "factors_used": [{"id": 11, "values_id": "e3a9…"}],
+                "quantity": 128.0,
+                "quantity_unit": "kg"
             }
     """
 
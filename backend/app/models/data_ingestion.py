@@ -102,6 +102,17 @@ class IngestionState(int, Enum):
     FINISHED = 3  # terminal state no more updates expected (error + success)
 
 
+class JobPriority(int, Enum):
+    """Dispatch priority of a job; the poller claims higher values first.
+
+    Stored as a plain integer so finer levels can be added in between.
+    """
+
+    BULK = 0  # backoffice year-wide reloads, recalc fan-outs, syncs
+    NORMAL = 50  # aggregations refreshing dashboards
+    INTERACTIVE = 100  # a user's own upload on their unit's module page
+
+
 class IngestionResult(int, Enum):
     """Outcome result of an ingestion job (only valid when state is FINISHED)."""
 
@@ -311,6 +322,15 @@ class DataIngestionJob(DataIngestionJobBase, table=True):
         sa_column=Column(String(100)),
         description="Job type identifier (csv_ingest, factor_ingest, etc.)",
     )
+    priority: int = Field(
+        default=JobPriority.BULK,
+        sa_column=Column(Integer, nullable=False, server_default="0"),
+        description=(
+            "Dispatch priority (JobPriority); the poller claims higher first. "
+            "Raised to the job type's default on create; chained jobs "
+            "inherit their parent's"
+        ),
+    )
 
     # Partial unique index on (combo, is_current=TRUE) — Plan 310-A's
     # "exactly one current per combo" invariant.  ``job_type`` is *not*
@@ -373,6 +393,16 @@ class DataIngestionJob(DataIngestionJobBase, table=True):
                 "state = 'NOT_STARTED'::ingestion_state_enum AND locked_by IS NULL"
             ),
         ),
+        # Backs the poller's ``ORDER BY priority DESC, id`` over the same
+        # pending slice.
+        Index(
+            "ix_data_ingestion_jobs_pending_priority",
+            text("priority DESC"),
+            "id",
+            postgresql_where=text(
+                "state = 'NOT_STARTED'::ingestion_state_enum AND locked_by IS NULL"
+            ),
+        ),
         # Active-job dedup guards (created in migrations e7f1a2b3c4d5 /
         # f8a9b1c2d3e4). They back the ON CONFLICT clauses in _chain.py;
         # mirrored here so Alembic autogenerate stops proposing drops.
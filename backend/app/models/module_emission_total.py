@@ -0,0 +1,65 @@
+"""Per-module emission totals, maintained alongside the module stats."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Float, ForeignKey, Index, Integer
+from sqlmodel import TIMESTAMP, Column, Field, SQLModel
+
+
+class ModuleEmissionTotal(SQLModel, table=True):
+    """
+    ``data_entry_emissions`` summed per (module, emission type).
+
+    One row per ``(carbon_report_module_id, emission_type_id, year)``
+    that has at least one emission with a ``kg_co2eq``; the same filter
+    the report / unit total readers apply, so they can sum these rows
+    instead of joining the raw emissions through ``data_entries``.
+    Rollup emission types are kept (readers exclude them as before).
+
+    Written by ``ModuleEmissionTotalRepository``: moved by the delta of
+    every emission write and data-entry delete, in the same transaction,
+    and rebuilt for the modules an aggregation job recomputes.
+    """
+
+    __tablename__ = "module_emission_totals"
+    __table_args__ = (Index("idx_module_emission_totals_year", "year"),)
+
+    carbon_report_module_id: int = Field(
+        sa_column=Column(
+            Integer,
+            ForeignKey("carbon_report_modules.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+    )
+    emission_type_id: int = Field(
+        sa_column=Column(Integer, primary_key=True),
+    )
+    year: int = Field(
+        sa_column=Column(Integer, primary_key=True),
+        description="Year of the module's carbon report (denormalised)",
+    )
+    kg_co2eq: float = Field(
+        default=0.0,
+        sa_column=Column(Float, nullable=False),
+        description="SUM(kg_co2eq) over the module's emissions of this type",
+    )
+    additional_value: Optional[float] = Field(
+        default=None,
+        sa_column=Column(Float, nullable=True),
+        description="SUM(additional_value); NULL when no row carries one",
+    )
+    additional_count: int = Field(
+        default=0,
+        sa_column=Column(Integer, nullable=False),
+        description="Rows with a non-NULL additional_value",
+    )
+    entry_count: int = Field(
+        default=0,
+        sa_column=Column(Integer, nullable=False),
+        description="Distinct data entries with an emission of this type",
+    )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=False),
+    )
@@ -22,6 +22,7 @@ from app.schemas.data_entry import (
     DataEntryCreate,
     DataEntryResponseGen,
     DataEntryUpdate,
+    SliceReference,
 )
 from app.schemas.factor import (
     BaseFactorHandler,
@@ -138,6 +139,18 @@ class BuildingRoomHandlerUpdate(DataEntryUpdate):
         return v
 
 
+async def _load_rooms_by_name(session: Any, room_names: list[str]) -> dict:
+    """``SliceReference`` loader: the slice's rooms keyed by room_name.
+
+    First row (by id) wins on a duplicated name — the per-entry
+    ``get_room`` lookup is a ``first()`` on the same filter.
+    """
+    rooms: dict = {}
+    for room in await BuildingRoomService(session).get_rooms_by_names(room_names):
+        rooms.setdefault(room.room_name, room)
+    return rooms
+
+
 class BuildingRoomModuleHandler(BaseModuleHandler):
     module_type: ModuleTypeEnum = ModuleTypeEnum.buildings
     data_entry_type: DataEntryTypeEnum = DataEntryTypeEnum.building
@@ -178,8 +191,22 @@ class BuildingRoomModuleHandler(BaseModuleHandler):
         EmissionType.buildings__rooms__heating_thermal: "heating_kwh_per_square_meter",
     }
 
-    async def pre_compute(self, data_entry: Any, session: Any) -> dict:
-        """call RoomService to get room surface by room_name"""
+    slice_references = (
+        SliceReference(
+            cache_key="rooms",
+            fields=("room_name",),
+            loader=_load_rooms_by_name,
+        ),
+    )
+
+    async def pre_compute(
+        self, data_entry: Any, session: Any, *, slice_cache: dict | None = None
+    ) -> dict:
+        """call RoomService to get room surface by room_name
+
+        During a recalc the room comes from ``slice_cache["rooms"]``
+        (bulk-loaded by ``prefetch_slice``) instead of a query per entry.
+        """
         room_name = data_entry.data.get("room_name")
         building_name = data_entry.data.get("building_name")
         if not room_name or not building_name:
@@ -196,8 +223,10 @@ class BuildingRoomModuleHandler(BaseModuleHandler):
                 building_name,
             )
             return {}
-        service = BuildingRoomService(session)
-        room = await service.get_room(room_name=room_name)
+        if slice_cache is not None:
+            room = slice_cache["rooms"].get(room_name)
+        else:
+            room = await BuildingRoomService(session).get_room(room_name=room_name)
         if room is None:
             # Same "no leaf rows" outcome as the missing-name branch
             # above — log so the operator can chase the missing
@@ -141,6 +141,8 @@ class EquipmentModuleHandler(BaseModuleHandler):
     # Allow subkind to be optional for equipment
     require_subkind_for_factor = False
     require_factor_to_match = False
+    csv_parallel_validation = True
+    csv_natural_key = ("equipment_id",)
 
     create_dto = EquipmentHandlerCreate
     update_dto = EquipmentHandlerUpdate
@@ -153,6 +153,7 @@ class HeadcountMemberModuleHandler(BaseModuleHandler):
     subkind_field = None
     require_subkind_for_factor = False
     require_factor_to_match = False
+    csv_natural_key = ("user_institutional_id",)
     default_where: list = []
     filter_map: dict[str, Any] = {
         "name": DataEntry.data["name"].as_string(),
@@ -14,12 +14,14 @@ from app.models.data_entry_emission import (
     EmissionType,
     FactorQuery,
 )
+from app.models.location import TransportModeEnum
 from app.models.module_type import ModuleTypeEnum
 from app.schemas.data_entry import (
     BaseModuleHandler,
     DataEntryCreate,
     DataEntryResponseGen,
     DataEntryUpdate,
+    SliceReference,
 )
 from app.schemas.factor import (
     BaseFactorHandler,
@@ -64,6 +66,20 @@ async def _get_report_year_for_module(
     return year if year is not None else reference_year
 
 
+async def _load_airports_by_iata(session: Any, iata_codes: list[str]) -> dict:
+    """``SliceReference`` loader: the slice's airports keyed by IATA code."""
+    locations = await LocationService(session).get_locations_by_iata(iata_codes)
+    return {loc.iata_code: loc for loc in locations}
+
+
+async def _load_stations_by_natural_key(session: Any, natural_keys: list[str]) -> dict:
+    """``SliceReference`` loader: the slice's stations keyed by natural_key."""
+    locations = await LocationService(session).get_locations_by_natural_keys(
+        natural_keys
+    )
+    return {loc.natural_key: loc for loc in locations}
+
+
 def _validate_non_negative_float(
     v: Optional[float], field_name: str
 ) -> Optional[float]:
@@ -285,6 +301,14 @@ class ProfessionalTravelPlaneModuleHandler(ProfessionalTravelBaseModuleHandler):
         "destination_iata": DataEntry.data["destination_iata"].as_string(),
     }
 
+    slice_references = (
+        SliceReference(
+            cache_key="locations",
+            fields=("origin_iata", "destination_iata"),
+            loader=_load_airports_by_iata,
+        ),
+    )
+
     async def prefetch_slice(
         self,
         entries: list[Any],
@@ -298,31 +322,19 @@ class ProfessionalTravelPlaneModuleHandler(ProfessionalTravelBaseModuleHandler):
         lookup and a full plane-factor reload *per entry* — ~4 DB round-trips
         × every flight in the slice. All three are constant across a
         ``(plane, year)`` slice, so we resolve them here in two queries and
-        ``pre_compute`` reads them in-memory. Returns ``{}`` when the slice
-        has no year (``pre_compute`` then keeps its per-entry fallback).
+        ``pre_compute`` reads them in-memory: the airports through the
+        declared ``slice_references``, the plane factors on top.  Returns
+        ``{}`` when the slice has no year (``pre_compute`` then keeps its
+        per-entry fallback).
         """
         if year is None:
             return {}
-        iata_codes: set[str] = set()
-        for entry in entries:
-            origin = entry.data.get("origin_iata")
-            destination = entry.data.get("destination_iata")
-            if origin:
-                iata_codes.add(origin)
-            if destination:
-                iata_codes.add(destination)
-        locations = await LocationService(session).get_locations_by_iata(
-            list(iata_codes)
-        )
-        plane_factors = await FactorService(session).list_by_data_entry_type(
+        cache = await super().prefetch_slice(entries, session, year=year)
+        cache["plane_factors"] = await FactorService(session).list_by_data_entry_type(
             DataEntryTypeEnum.plane,
             year=year,
         )
-        return {
-            "locations": {loc.iata_code: loc for loc in locations},
-            "plane_factors": plane_factors,
-            "year": year,
-        }
+        return cache
 
     async def pre_compute(
         self, data_entry: Any, session: Any, *, slice_cache: dict | None = None
@@ -476,10 +488,29 @@ class ProfessionalTravelTrainModuleHandler(ProfessionalTravelBaseModuleHandler):
         "destination_name": DataEntry.data["destination_name"].as_string(),
     }
 
+    slice_references = (
+        SliceReference(
+            cache_key="locations",
+            fields=("origin_natural_key", "destination_natural_key"),
+            loader=_load_stations_by_natural_key,
+        ),
+    )
+
+    async def prefetch_csv(self, session: Any) -> dict:
+        """Every train station in a ``LocationIndex``, loaded once per
+        ingest job so ``enrich_csv_row`` resolves names in memory."""
+        return {
+            "stations": await LocationService(session).load_index(
+                TransportModeEnum.train
+            )
+        }
+
     async def enrich_csv_row(
         self,
         data: dict,
         session: Any,
+        *,
+        csv_cache: dict | None = None,
     ) -> tuple[dict, Optional[str]]:
         """Resolve ``origin_name`` / ``destination_name`` → ``*_natural_key``.
 
@@ -500,8 +531,12 @@ class ProfessionalTravelTrainModuleHandler(ProfessionalTravelBaseModuleHandler):
             persist the entry without ``natural_key``; ``pre_compute`` logs
             a WARNING and skips emission. Operator sees the gap in
             entry-vs-emission counts.
+
+        Stations come from ``csv_cache["stations"]`` (``prefetch_csv``)
+        when given, else from one lookup per endpoint.
         """
         enriched = dict(data)
+        stations = (csv_cache or {}).get("stations")
         loc_service = LocationService(session)
         for role in ("origin", "destination"):
             if enriched.get(f"{role}_natural_key"):
@@ -517,10 +552,16 @@ class ProfessionalTravelTrainModuleHandler(ProfessionalTravelBaseModuleHandler):
                     data,
                     f"Missing {role}_country_code (required for train CSV ingestion)",
                 )
-            station, reason = await loc_service.resolve_train_station_for_csv(
-                name=name,
-                country_code=country_code,
-            )
+            if stations is not None:
+                station, reason = stations.resolve_train_station_for_csv(
+                    name=name,
+                    country_code=country_code,
+                )
+            else:
+                station, reason = await loc_service.resolve_train_station_for_csv(
+                    name=name,
+                    country_code=country_code,
+                )
             if station is not None:
                 enriched[f"{role}_natural_key"] = station.natural_key
                 continue
@@ -540,8 +581,15 @@ class ProfessionalTravelTrainModuleHandler(ProfessionalTravelBaseModuleHandler):
             )
         return enriched, None
 
-    async def pre_compute(self, data_entry: Any, session: Any) -> dict:
-        """Compute train distance and determine relevant country code."""
+    async def pre_compute(
+        self, data_entry: Any, session: Any, *, slice_cache: dict | None = None
+    ) -> dict:
+        """Compute train distance and determine relevant country code.
+
+        ``slice_cache`` (from ``prefetch_slice``) supplies the stations
+        in-memory during a recalc; absent it (single-entry create/update),
+        two per-entry natural_key lookups run instead.
+        """
         origin_name = data_entry.data.get("origin_name")
         destination_name = data_entry.data.get("destination_name")
         origin_natural_key = data_entry.data.get("origin_natural_key")
@@ -570,9 +618,9 @@ class ProfessionalTravelTrainModuleHandler(ProfessionalTravelBaseModuleHandler):
             )
             return {}
 
-        loc_service = LocationService(session)
-        origin = await loc_service.get_location_by_natural_key(origin_natural_key)
-        dest = await loc_service.get_location_by_natural_key(destination_natural_key)
+        origin, dest = await self._lookup_stations(
+            session, origin_natural_key, destination_natural_key, slice_cache
+        )
 
         if origin is None or dest is None:
             logger.warning(
@@ -609,6 +657,27 @@ class ProfessionalTravelTrainModuleHandler(ProfessionalTravelBaseModuleHandler):
             "country_code": country_code,
         }
 
+    async def _lookup_stations(
+        self,
+        session: Any,
+        origin_natural_key: str,
+        destination_natural_key: str,
+        slice_cache: dict | None,
+    ) -> tuple[Any, Any]:
+        """Origin/destination ``Location`` from the slice cache, else two
+        per-entry point lookups (single-entry path)."""
+        if slice_cache is not None:
+            locations = slice_cache["locations"]
+            return (
+                locations.get(origin_natural_key),
+                locations.get(destination_natural_key),
+            )
+        loc_service = LocationService(session)
+        return (
+            await loc_service.get_location_by_natural_key(origin_natural_key),
+            await loc_service.get_location_by_natural_key(destination_natural_key),
+        )
+
     def resolve_computations(
         self, data_entry: Any, emission_type: Any, ctx: dict
     ) -> list:
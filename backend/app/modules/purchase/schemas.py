@@ -228,6 +228,7 @@ class PurchaseModuleHandler(BaseModuleHandler):
     # it's Optional in create_dto and update_dto, and some entries
     # may have it missing or null in csv
     require_factor_to_match = False
+    csv_parallel_validation = True
 
     sort_map = {
         "id": DataEntry.id,
@@ -339,6 +340,7 @@ class PurchaseAdditionalModuleHandler(BaseModuleHandler):
 
     kind_field: str = "name"
     subkind_field: Optional[str] = ""
+    csv_parallel_validation = True
 
     sort_map = {
         "id": DataEntry.id,
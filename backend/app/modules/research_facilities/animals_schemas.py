@@ -74,6 +74,7 @@ class ResearchFacilitiesAnimalModuleHandler(BaseModuleHandler):
     kind_field: str = "researchfacility_id"
     subkind_field: str = "researchfacility_type"
     require_subkind_for_factor = False
+    csv_natural_key = ("researchfacility_id",)
 
     sort_map = {
         "id": DataEntry.id,
@@ -111,6 +111,7 @@ class ResearchFacilitiesCommonModuleHandler(BaseModuleHandler):
     kind_field: str = "researchfacility_id"
     subkind_field: Optional[str] = None
     require_subkind_for_factor = False
+    csv_natural_key = ("researchfacility_id",)
 
     sort_map = {
         "id": DataEntry.id,
@@ -25,6 +25,22 @@ class BuildingRoomRepository:
         result = await self.session.exec(stmt)
         return result.first()
 
+    async def get_rooms_by_names(self, room_names: list[str]) -> list[BuildingRoom]:
+        """Bulk-fetch rooms for a set of room names in one query, by id.
+
+        Lets the building recalc slice resolve every entry's room up front
+        instead of one ``get_room`` per entry.  Empty input short-circuits.
+        """
+        if not room_names:
+            return []
+        stmt = (
+            select(BuildingRoom)
+            .where(col(BuildingRoom.room_name).in_(room_names))
+            .order_by(col(BuildingRoom.id))
+        )
+        result = await self.session.exec(stmt)
+        return list(result.all())
+
     async def list_buildings(self) -> list[dict]:
         """Return distinct buildings with location and name."""
         stmt = (
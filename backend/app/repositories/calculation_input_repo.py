@@ -0,0 +1,138 @@
+"""Calculation input repository (content-addressed emission inputs)."""
+
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.calculation_input import CalculationInput
+
+# Rows per INSERT / ids per IN list; keeps a statement well under
+# PostgreSQL's 65535 bind-parameter limit.
+_CHUNK = 1000
+
+
+class CalculationInputRepository:
+    """Repository for the ``calculation_inputs`` store."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def store_many(self, inputs: dict[str, tuple[str, dict]]) -> None:
+        """Store ``{id: (kind, payload)}``, skipping ids already present.
+
+        Ids are content addresses (``calculation_input_id``), so an
+        existing row already holds the same payload and is never
+        updated.  On PostgreSQL this is INSERT … ON CONFLICT DO NOTHING,
+        in id order so concurrent writers lock rows in the same order;
+        other dialects (SQLite test harness) filter out existing ids first.
+        """
+        if not inputs:
+            return
+        now = datetime.utcnow()
+        items = sorted(inputs.items())
+        bind = self.session.get_bind()
+        if bind.dialect.name == "postgresql":
+            for i in range(0, len(items), _CHUNK):
+                stmt = (
+                    pg_insert(CalculationInput)
+                    .values(
+                        [
+                            {
+                                "id": input_id,
+                                "kind": kind,
+                                "payload": payload,
+                                "created_at": now,
+                            }
+                            for input_id, (kind, payload) in items[i : i + _CHUNK]
+                        ]
+                    )
+                    .on_conflict_do_nothing(index_elements=["id"])
+                )
+                await self.session.execute(stmt)
+            return
+        existing: set[str] = set()
+        for i in range(0, len(items), _CHUNK):
+            result = await self.session.execute(
+                select(col(CalculationInput.id)).where(
+                    col(CalculationInput.id).in_(
+                        [input_id for input_id, _ in items[i : i + _CHUNK]]
+                    )
+                )
+            )
+            existing.update(result.scalars().all())
+        self.session.add_all(
+            [
+                CalculationInput(
+                    id=input_id, kind=kind, payload=payload, created_at=now
+                )
+                for input_id, (kind, payload) in items
+                if input_id not in existing
+            ]
+        )
+        await self.session.flush()
+
+    async def get_many(self, ids: Iterable[str]) -> dict[str, dict]:
+        """Payload per id; unknown ids are absent from the result."""
+        unique = sorted(set(ids))
+        out: dict[str, dict] = {}
+        for i in range(0, len(unique), _CHUNK):
+            result = await self.session.execute(
+                select(col(CalculationInput.id), col(CalculationInput.payload)).where(
+                    col(CalculationInput.id).in_(unique[i : i + _CHUNK])
+                )
+            )
+            for input_id, payload in result.all():
+                out[input_id] = payload
+        return out
+
+    @staticmethod
+    def referenced_ids(meta: dict | None, inputs_id: str | None) -> list[str]:
+        """Store ids an emission row references (context + factor values)."""
+        ids = [inputs_id] if inputs_id else []
+        factors_used = (meta or {}).get("factors_used")
+        if isinstance(factors_used, list):
+            ids.extend(
+                f["values_id"]
+                for f in factors_used
+                if isinstance(f, dict) and f.get("values_id")
+            )
+        return ids
+
+    @staticmethod
+    def expand_meta(
+        meta: dict | None, inputs_id: str | None, payloads: dict[str, dict]
+    ) -> dict:
+        """Rebuild the inline view of an emission's ``meta``.
+
+        Returns ``{**meta, "factors_used": [{"id", "values"}], **ctx}`` —
+        the shape emissions stored before the inputs store existed, so
+        readers handle both.  Rows still in that legacy shape (no
+        ``inputs_id``, inline ``values``) come back unchanged.
+        """
+        expanded = dict(meta or {})
+        factors_used = expanded.get("factors_used")
+        if isinstance(factors_used, list):
+            expanded["factors_used"] = [
+                {"id": f.get("id"), "values": payloads.get(f["values_id"])}
+                if isinstance(f, dict) and "values_id" in f
+                else f
+                for f in factors_used
+            ]
+        if inputs_id:
+            expanded.update(payloads.get(inputs_id) or {})
+        return expanded
+
+    async def expand_metas(
+        self, rows: list[tuple[dict | None, str | None]]
+    ) -> list[dict]:
+        """``expand_meta`` for ``(meta, inputs_id)`` rows, with one
+        ``get_many`` for every payload they reference."""
+        payloads = await self.get_many(
+            input_id
+            for meta, inputs_id in rows
+            for input_id in self.referenced_ids(meta, inputs_id)
+        )
+        return [self.expand_meta(meta, inputs_id, payloads) for meta, inputs_id in rows]
@@ -0,0 +1,139 @@
+"""PostgreSQL ``COPY … FROM STDIN`` writer shared by the bulk repositories.
+
+Two wire formats, chosen per call site:
+
+* ``CopyFormat.text`` — psycopg adapts every value and JSON columns go
+  through ``Json`` (stdlib ``json.dumps``).  The historical path.
+* ``CopyFormat.binary`` — ``COPY … (FORMAT BINARY)`` with the column
+  types declared up front (``set_types``), so psycopg packs each value
+  with a fixed binary dumper instead of looking one up per value, and
+  JSON is pre-encoded to bytes by ``dumps_json``.
+
+Rows are plain tuples in the table's column order; nothing here builds
+ORM objects.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import StrEnum
+from typing import Any, Callable, Iterable
+
+from psycopg.types.json import Json
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib fallback below
+    orjson = None  # type: ignore[assignment]
+
+
+class CopyFormat(StrEnum):
+    text = "text"
+    binary = "binary"
+
+
+def dumps_json(obj: Any) -> bytes:
+    """UTF-8 JSON for a ``json`` column (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+@dataclass(frozen=True)
+class CopyTable:
+    """A COPY target: table name and ``(column, postgres type)`` pairs.
+
+    Types are PostgreSQL names (``int4``, ``float8``, ``text``,
+    ``timestamp``, ``timestamptz``) plus two logical ones: ``json`` for
+    a JSON column fed Python objects and ``enum`` for a native enum fed
+    its label.  ``id`` columns are left out so the sequence assigns them.
+    """
+
+    name: str
+    columns: tuple[tuple[str, str], ...]
+
+    def statement(self, copy_format: CopyFormat) -> str:
+        columns = ", ".join(column for column, _ in self.columns)
+        sql = f"COPY {self.name} ({columns}) FROM STDIN"
+        if copy_format == CopyFormat.binary:
+            sql += " (FORMAT BINARY)"
+        return sql
+
+
+# Binary field type actually sent for the logical types.  A ``json``
+# field's binary form is its UTF-8 text, byte-for-byte what ``bytea``
+# sends for the pre-encoded value; an enum's is its label.
+_BINARY_WIRE_TYPES = {"json": "bytea", "enum": "text"}
+
+
+def _json_text(value: Any) -> Any:
+    return None if value is None else Json(value)
+
+
+def _json_binary(value: Any) -> bytes | None:
+    return None if value is None else dumps_json(value)
+
+
+def _timestamptz_binary(value: datetime | None) -> datetime | None:
+    # Naive values are ``datetime.utcnow()`` stamps; the binary dumper
+    # needs them tz-aware.
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _timestamp_binary(value: datetime | None) -> datetime | None:
+    # ``timestamp`` input drops an offset in text form; do the same.
+    if value is not None and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    return value
+
+
+_CONVERTERS: dict[CopyFormat, dict[str, Callable[[Any], Any]]] = {
+    CopyFormat.text: {"json": _json_text},
+    CopyFormat.binary: {
+        "json": _json_binary,
+        "timestamptz": _timestamptz_binary,
+        "timestamp": _timestamp_binary,
+    },
+}
+
+
+async def copy_rows(
+    session: AsyncSession,
+    table: CopyTable,
+    rows: Iterable[tuple],
+    copy_format: CopyFormat = CopyFormat.text,
+) -> int:
+    """COPY ``rows`` into ``table`` on the session's own connection.
+
+    Participates in the session's open transaction, so a later rollback
+    discards the rows.  psycopg3 only: callers route other drivers to
+    their ORM fallback first.  Returns the number of rows written.
+    """
+    sa_conn = await session.connection()
+    raw = await sa_conn.get_raw_connection()
+    driver_conn = raw.driver_connection  # psycopg AsyncConnection
+    if driver_conn is None:
+        raise RuntimeError("bulk_copy: raw connection has no driver connection")
+    by_type = _CONVERTERS[copy_format]
+    converters = [
+        (index, by_type[pg_type])
+        for index, (_, pg_type) in enumerate(table.columns)
+        if pg_type in by_type
+    ]
+    written = 0
+    async with driver_conn.cursor() as cur:
+        async with cur.copy(table.statement(copy_format)) as copy:
+            if copy_format == CopyFormat.binary:
+                copy.set_types([_BINARY_WIRE_TYPES.get(t, t) for _, t in table.columns])
+            for row in rows:
+                if converters:
+                    values = list(row)
+                    for index, convert in converters:
+                        values[index] = convert(values[index])
+                    row = tuple(values)
+                await copy.write_row(row)
+                written += 1
+    return written
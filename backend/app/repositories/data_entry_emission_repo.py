@@ -1,37 +1,109 @@
 """Data entry emission repository for database operations."""
 
-from typing import Any, Dict, List, Optional
-
-from psycopg.types.json import Json
-from sqlalchemy import ColumnElement, Integer, Select, and_, bindparam, case, literal
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    and_,
+    bindparam,
+    case,
+    literal,
+    true,
+)
 from sqlalchemy import text as sa_text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlmodel import col, delete, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import get_settings
 from app.core.constants import ModuleStatus
 from app.models.carbon_report import CarbonReport, CarbonReportModule
 from app.models.data_entry import DataEntry, DataEntryTypeEnum
 from app.models.data_entry_emission import DataEntryEmission, EmissionType
 from app.models.factor import Factor
+from app.models.module_emission_total import ModuleEmissionTotal
+from app.repositories.calculation_input_repo import CalculationInputRepository
+from app.repositories.copy_writer import CopyFormat, CopyTable, copy_rows
 from app.utils.data_entry_emission_type_map import ROLLUP_EMISSION_TYPE_IDS
 from app.utils.it_breakdown import ITSqlTotals
 
 # COPY target for ``bulk_copy`` — every non-defaulted column;
 # ``id`` is omitted so the sequence assigns it server-side.
-_EMISSION_COPY_SQL = """
-COPY data_entry_emissions (
-    data_entry_id, emission_type_id, primary_factor_id, kg_co2eq,
-    additional_value, scope, meta, computed_at
-) FROM STDIN
-"""
-
-
-def _is_leaf_emission() -> ColumnElement[bool]:
+_EMISSION_COPY_TABLE = CopyTable(
+    "data_entry_emissions",
+    (
+        ("data_entry_id", "int4"),
+        ("emission_type_id", "int4"),
+        ("primary_factor_id", "int4"),
+        ("kg_co2eq", "float8"),
+        ("additional_value", "float8"),
+        ("scope", "int4"),
+        ("meta", "json"),
+        ("inputs_id", "text"),
+        ("computed_at", "timestamptz"),
+        ("inputs_fingerprint", "text"),
+    ),
+)
+_EMISSION_COPY_COLUMNS = tuple(column for column, _ in _EMISSION_COPY_TABLE.columns)
+
+
+def _is_leaf_emission(
+    emission_type_id: Any = DataEntryEmission.emission_type_id,
+) -> ColumnElement[bool]:
     """Exclude rollup rows from aggregation to prevent double-counting."""
     if not ROLLUP_EMISSION_TYPE_IDS:
-        return col(DataEntryEmission.id).isnot(None)
-    return col(DataEntryEmission.emission_type_id).notin_(ROLLUP_EMISSION_TYPE_IDS)
+        return true()
+    return col(emission_type_id).notin_(ROLLUP_EMISSION_TYPE_IDS)
+
+
+@dataclass(frozen=True)
+class _TotalsSource:
+    """What the report / unit total readers sum, and how it reaches
+    ``carbon_report_modules``.
+
+    Either the raw ``data_entry_emissions`` (joined through
+    ``data_entries``) or the ``module_emission_totals`` summary, which
+    holds the same sums per (module, emission type) and joins the
+    module directly.
+    """
+
+    kg_co2eq: Any
+    emission_type_id: Any
+    additional_value: Any
+    join_modules: Callable[[Select[Any]], Select[Any]]
+
+
+_RAW_EMISSIONS = _TotalsSource(
+    kg_co2eq=col(DataEntryEmission.kg_co2eq),
+    emission_type_id=col(DataEntryEmission.emission_type_id),
+    additional_value=col(DataEntryEmission.additional_value),
+    join_modules=lambda stmt: (
+        stmt.select_from(DataEntryEmission)
+        .join(DataEntry, col(DataEntryEmission.data_entry_id) == col(DataEntry.id))
+        .join(
+            CarbonReportModule,
+            col(DataEntry.carbon_report_module_id) == col(CarbonReportModule.id),
+        )
+    ),
+)
+_MODULE_TOTALS = _TotalsSource(
+    kg_co2eq=col(ModuleEmissionTotal.kg_co2eq),
+    emission_type_id=col(ModuleEmissionTotal.emission_type_id),
+    additional_value=col(ModuleEmissionTotal.additional_value),
+    join_modules=lambda stmt: stmt.select_from(ModuleEmissionTotal).join(
+        CarbonReportModule,
+        col(ModuleEmissionTotal.carbon_report_module_id) == col(CarbonReportModule.id),
+    ),
+)
+
+
+def _totals_source() -> _TotalsSource:
+    if get_settings().EMISSION_TOTALS_SUMMARY:
+        return _MODULE_TOTALS
+    return _RAW_EMISSIONS
 
 
 class DataEntryEmissionRepository:
@@ -78,6 +150,19 @@ class DataEntryEmissionRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_stats_rows_by_data_entry_id(
+        self, data_entry_id: int
+    ) -> list[tuple[int, float | None, float | None]]:
+        """``(emission_type_id, kg_co2eq, additional_value)`` for each of an
+        entry's rows — what the entry contributes to ``get_stats_pair_many``.
+        """
+        query = select(
+            col(DataEntryEmission.emission_type_id),
+            col(DataEntryEmission.kg_co2eq),
+            col(DataEntryEmission.additional_value),
+        ).where(col(DataEntryEmission.data_entry_id) == data_entry_id)
+        return [tuple(row) for row in (await self.session.execute(query)).all()]
+
     async def delete_by_data_entry_id(self, data_entry_id: int) -> None:
         query = select(DataEntryEmission).where(
             DataEntryEmission.data_entry_id == data_entry_id
@@ -125,13 +210,82 @@ class DataEntryEmissionRepository:
                 )
             )
 
-    async def bulk_copy(self, emissions: list[DataEntryEmission]) -> int:
+    async def get_inputs_fingerprints(
+        self, data_entry_ids: list[int]
+    ) -> dict[int, str]:
+        """Stored ``inputs_fingerprint`` per entry, for the recalc skip.
+
+        An entry only gets a value when every one of its emission rows
+        carries the same non-null fingerprint — a set written before the
+        column existed, or half-rewritten by hand, must be recomputed.
+        Entries without emission rows are absent from the result.
+        """
+        if not data_entry_ids:
+            return {}
+        out: dict[int, str] = {}
+        chunk = 10_000
+        for i in range(0, len(data_entry_ids), chunk):
+            query = (
+                select(
+                    col(DataEntryEmission.data_entry_id),
+                    func.min(DataEntryEmission.inputs_fingerprint),
+                )
+                .where(
+                    col(DataEntryEmission.data_entry_id).in_(
+                        data_entry_ids[i : i + chunk]
+                    )
+                )
+                .group_by(col(DataEntryEmission.data_entry_id))
+                # count(col) skips NULLs: equal to count(*) only when no
+                # row lacks a fingerprint; min == max means they all agree.
+                .having(
+                    func.count(DataEntryEmission.inputs_fingerprint) == func.count(),
+                    func.min(DataEntryEmission.inputs_fingerprint)
+                    == func.max(DataEntryEmission.inputs_fingerprint),
+                )
+            )
+            result = await self.session.execute(query)
+            for data_entry_id, fingerprint in result.all():
+                out[data_entry_id] = fingerprint
+        return out
+
+    @staticmethod
+    def copy_row(emission: DataEntryEmission) -> tuple:
+        """Encode one emission as a row in ``_EMISSION_COPY_COLUMNS`` order.
+
+        Plain tuples pickle cheaply, so the sharded recalc ships its
+        worker output in this shape and hands it to ``bulk_copy_rows``.
+        """
+        return (
+            emission.data_entry_id,
+            emission.emission_type_id,
+            emission.primary_factor_id,
+            emission.kg_co2eq,
+            emission.additional_value,
+            emission.scope,
+            emission.meta,
+            emission.inputs_id,
+            emission.computed_at,
+            emission.inputs_fingerprint,
+        )
+
+    @staticmethod
+    def from_copy_row(row: tuple) -> DataEntryEmission:
+        """Inverse of ``copy_row``: an unsaved ORM emission from a row."""
+        return DataEntryEmission(**dict(zip(_EMISSION_COPY_COLUMNS, row)))
+
+    async def bulk_copy(
+        self,
+        emissions: list[DataEntryEmission],
+        copy_format: CopyFormat = CopyFormat.text,
+    ) -> int:
         """Bulk insert via PostgreSQL ``COPY … FROM STDIN`` (psycopg3).
 
         Same contract as ``DataEntryRepository.bulk_copy``: runs on the
         session's own connection (transactional), returns a row count,
         never populates ids.  Non-psycopg drivers (SQLite / asyncpg test
-        fixtures) take the ORM bulk path.
+        fixtures) take the ORM bulk path.  ``copy_format`` picks the wire
+        format (see ``copy_writer``).
         """
         if not emissions:
             return 0
@@ -140,28 +294,25 @@ class DataEntryEmissionRepository:
             self.session.add_all(emissions)
             await self.session.flush()
             return len(emissions)
+        return await copy_rows(
+            self.session,
+            _EMISSION_COPY_TABLE,
+            (self.copy_row(e) for e in emissions),
+            copy_format,
+        )
 
-        sa_conn = await self.session.connection()
-        raw = await sa_conn.get_raw_connection()
-        driver_conn = raw.driver_connection  # psycopg AsyncConnection
-        if driver_conn is None:
-            raise RuntimeError("bulk_copy: raw connection has no driver connection")
-        async with driver_conn.cursor() as cur:
-            async with cur.copy(_EMISSION_COPY_SQL) as copy:
-                for e in emissions:
-                    await copy.write_row(
-                        (
-                            e.data_entry_id,
-                            e.emission_type_id,
-                            e.primary_factor_id,
-                            e.kg_co2eq,
-                            e.additional_value,
-                            e.scope,
-                            Json(e.meta) if e.meta is not None else None,
-                            e.computed_at,
-                        )
-                    )
-        return len(emissions)
+    async def bulk_copy_rows(
+        self,
+        rows: list[tuple],
+        copy_format: CopyFormat = CopyFormat.text,
+    ) -> int:
+        """``bulk_copy`` for rows already encoded by ``copy_row``."""
+        if not rows:
+            return 0
+        bind = self.session.get_bind()
+        if bind.dialect.driver != "psycopg":
+            return await self.bulk_copy([self.from_copy_row(row) for row in rows])
+        return await copy_rows(self.session, _EMISSION_COPY_TABLE, rows, copy_format)
 
     async def get_stats(
         self,
@@ -302,26 +453,22 @@ class DataEntryEmissionRepository:
     ) -> List[Dict[str, Any]]:
         """Aggregate validated emission totals by year for a unit.
 
-        Joins CarbonReport → CarbonReportModule → DataEntry → DataEntryEmission
-        and sums kg_co2eq across ALL validated modules, grouped by year.
+        Joins CarbonReport → CarbonReportModule → the totals source (see
+        ``_totals_source``) and sums kg_co2eq across ALL validated modules,
+        grouped by year.
 
         Returns:
             [{"year": 2023, "kg_co2eq": 61700.0}, {"year": 2024, "kg_co2eq": 45000.0}]
         """
+        src = _totals_source()
         year_expr = col(CarbonReport.year)
 
         query: Select[Any] = (
-            select(
-                year_expr.label("year"),
-                func.sum(col(DataEntryEmission.kg_co2eq)).label("kg_co2eq"),
-            )
-            .join(
-                DataEntry,
-                col(DataEntryEmission.data_entry_id) == col(DataEntry.id),
-            )
-            .join(
-                CarbonReportModule,
-                col(DataEntry.carbon_report_module_id) == col(CarbonReportModule.id),
+            src.join_modules(
+                select(
+                    year_expr.label("year"),
+                    func.sum(src.kg_co2eq).label("kg_co2eq"),
+                )
             )
             .join(
                 CarbonReport,
@@ -334,8 +481,8 @@ class DataEntryEmissionRepository:
                     if not validated_only
                     else [CarbonReportModule.status == ModuleStatus.VALIDATED]
                 ),
-                col(DataEntryEmission.kg_co2eq).isnot(None),
-                _is_leaf_emission(),
+                src.kg_co2eq.isnot(None),
+                _is_leaf_emission(src.emission_type_id),
             )
             .group_by(year_expr)
             .order_by(year_expr.asc())
@@ -360,26 +507,21 @@ class DataEntryEmissionRepository:
     ) -> Dict[str, float]:
         """Aggregate validated emission totals per module for a carbon report.
 
-        Joins DataEntryEmission → DataEntry → CarbonReportModule and returns
-        SUM(kg_co2eq) grouped by module_type_id, filtered to validated modules
-        only.
+        Joins the totals source (see ``_totals_source``) → CarbonReportModule
+        and returns SUM(kg_co2eq) grouped by module_type_id, filtered to
+        validated modules only.
 
         Returns:
             Dict keyed by module_type_id (as string), e.g.:
             {"2": 15000.0, "4": 41700.0, "7": 5000.0}
         """
+        src = _totals_source()
         query = (
-            select(
-                col(CarbonReportModule.module_type_id),
-                func.sum(col(DataEntryEmission.kg_co2eq)).label("total"),
-            )
-            .join(
-                DataEntry,
-                col(DataEntryEmission.data_entry_id) == col(DataEntry.id),
-            )
-            .join(
-                CarbonReportModule,
-                col(DataEntry.carbon_report_module_id) == col(CarbonReportModule.id),
+            src.join_modules(
+                select(
+                    col(CarbonReportModule.module_type_id),
+                    func.sum(src.kg_co2eq).label("total"),
+                )
             )
             .where(
                 col(CarbonReportModule.carbon_report_id) == carbon_report_id,
@@ -388,8 +530,8 @@ class DataEntryEmissionRepository:
                     if not validated_only
                     else [CarbonReportModule.status == ModuleStatus.VALIDATED]
                 ),
-                col(DataEntryEmission.kg_co2eq).isnot(None),
-                _is_leaf_emission(),
+                src.kg_co2eq.isnot(None),
+                _is_leaf_emission(src.emission_type_id),
             )
             .group_by(col(CarbonReportModule.module_type_id))
         )
@@ -413,28 +555,23 @@ class DataEntryEmissionRepository:
         Returns:
             [(module_type_id, emission_type_id, sum_kg_co2eq), ...]
         """
+        src = _totals_source()
         query = (
-            select(
-                col(CarbonReportModule.module_type_id),
-                col(DataEntryEmission.emission_type_id),
-                func.sum(col(DataEntryEmission.kg_co2eq)).label("total"),
-            )
-            .join(
-                DataEntry,
-                col(DataEntryEmission.data_entry_id) == col(DataEntry.id),
-            )
-            .join(
-                CarbonReportModule,
-                col(DataEntry.carbon_report_module_id) == col(CarbonReportModule.id),
+            src.join_modules(
+                select(
+                    col(CarbonReportModule.module_type_id),
+                    src.emission_type_id,
+                    func.sum(src.kg_co2eq).label("total"),
+                )
             )
             .where(
                 col(CarbonReportModule.carbon_report_id) == carbon_report_id,
-                col(DataEntryEmission.kg_co2eq).isnot(None),
-                _is_leaf_emission(),
+                src.kg_co2eq.isnot(None),
+                _is_leaf_emission(src.emission_type_id),
             )
             .group_by(
                 col(CarbonReportModule.module_type_id),
-                col(DataEntryEmission.emission_type_id),
+                src.emission_type_id,
             )
         )
 
@@ -467,34 +604,27 @@ class DataEntryEmissionRepository:
                 ),
                 ...
             ]
-            where sum_additional_value is summed from DataEntryEmission
-            columns (NULL when absent).
+            where sum_additional_value is summed from the emissions'
+            additional_value (NULL when absent).
         """
+        src = _totals_source()
         query: Select[Any] = (
-            select(
-                col(CarbonReportModule.module_type_id),
-                col(DataEntryEmission.emission_type_id),
-                func.sum(col(DataEntryEmission.kg_co2eq)).label("total"),
-                func.sum(col(DataEntryEmission.additional_value)).label(
-                    "sum_additional_value"
-                ),
-            )
-            .join(
-                DataEntry,
-                col(DataEntryEmission.data_entry_id) == col(DataEntry.id),
-            )
-            .join(
-                CarbonReportModule,
-                col(DataEntry.carbon_report_module_id) == col(CarbonReportModule.id),
+            src.join_modules(
+                select(
+                    col(CarbonReportModule.module_type_id),
+                    src.emission_type_id,
+                    func.sum(src.kg_co2eq).label("total"),
+                    func.sum(src.additional_value).label("sum_additional_value"),
+                )
             )
             .where(
                 col(CarbonReportModule.carbon_report_id) == carbon_report_id,
-                col(DataEntryEmission.kg_co2eq).isnot(None),
-                _is_leaf_emission(),
+                src.kg_co2eq.isnot(None),
+                _is_leaf_emission(src.emission_type_id),
             )
             .group_by(
                 col(CarbonReportModule.module_type_id),
-                col(DataEntryEmission.emission_type_id),
+                src.emission_type_id,
             )
         )
 
@@ -533,42 +663,41 @@ class DataEntryEmissionRepository:
         - ``validated_it_kg``: IT emissions from validated IT source modules
           (numerator for ``percentage_of_source_modules``).
         """
-        is_it_emission = col(DataEntryEmission.emission_type_id).in_(
-            it_emission_type_ids
-        )
+        src = _totals_source()
+        is_it_emission = src.emission_type_id.in_(it_emission_type_ids)
         is_validated_source = col(CarbonReportModule.module_type_id).in_(
             validated_source_module_type_ids
         )
 
         base_where: list[ColumnElement[bool]] = [
             col(CarbonReportModule.carbon_report_id) == carbon_report_id,
-            col(DataEntryEmission.kg_co2eq).isnot(None),
+            src.kg_co2eq.isnot(None),
         ]
         if exclude_module_type_ids:
             base_where.append(
                 col(CarbonReportModule.module_type_id).notin_(exclude_module_type_ids)
             )
-        base_where.append(_is_leaf_emission())
+        base_where.append(_is_leaf_emission(src.emission_type_id))
 
-        query = (
+        query = src.join_modules(
             select(
                 func.coalesce(
                     func.sum(
                         case(
-                            (is_it_emission, col(DataEntryEmission.kg_co2eq)),
+                            (is_it_emission, src.kg_co2eq),
                             else_=None,
                         )
                     ),
                     0.0,
                 ).label("it_total_kg"),
                 func.coalesce(
-                    func.sum(col(DataEntryEmission.kg_co2eq)),
+                    func.sum(src.kg_co2eq),
                     0.0,
                 ).label("overall_total_kg"),
                 func.coalesce(
                     func.sum(
                         case(
-                            (is_validated_source, col(DataEntryEmission.kg_co2eq)),
+                            (is_validated_source, src.kg_co2eq),
                             else_=None,
                         )
                     ),
@@ -579,7 +708,7 @@ class DataEntryEmissionRepository:
                         case(
                             (
                                 and_(is_validated_source, is_it_emission),
-                                col(DataEntryEmission.kg_co2eq),
+                                src.kg_co2eq,
                             ),
                             else_=None,
                         )
@@ -587,16 +716,7 @@ class DataEntryEmissionRepository:
                     0.0,
                 ).label("validated_it_kg"),
             )
-            .join(
-                DataEntry,
-                col(DataEntryEmission.data_entry_id) == col(DataEntry.id),
-            )
-            .join(
-                CarbonReportModule,
-                col(DataEntry.carbon_report_module_id) == col(CarbonReportModule.id),
-            )
-            .where(*base_where)
-        )
+        ).where(*base_where)
 
         result = await self.session.execute(query)
         row = result.one()
@@ -658,7 +778,8 @@ class DataEntryEmissionRepository:
 
         Aggregates from persisted ``DataEntryEmission`` rows and apportions each
         entry total across factor categories using the factor values that were
-        used at compute time (stored in ``meta.factors_used``).
+        used at compute time (``meta.factors_used`` snapshots, resolved with the
+        entry context through ``calculation_inputs``).
 
         This keeps the breakdown consistent with:
         - CSV ``kg_co2eq`` overrides (stored emissions may not equal surface × EF)
@@ -672,6 +793,7 @@ class DataEntryEmissionRepository:
             select(
                 col(DataEntryEmission.kg_co2eq).label("kg_co2eq"),
                 col(DataEntryEmission.meta).label("meta"),
+                col(DataEntryEmission.inputs_id).label("inputs_id"),
             )
             .join(
                 DataEntry,
@@ -696,6 +818,12 @@ class DataEntryEmissionRepository:
         rows = result.all()
         if not rows:
             return []
+        metas = await CalculationInputRepository(self.session).expand_metas(
+            [
+                (row.meta if isinstance(row.meta, dict) else {}, row.inputs_id)
+                for row in rows
+            ]
+        )
 
         def _factor_ids(meta: dict) -> list[int]:
             factors_used = meta.get("factors_used")
@@ -710,9 +838,22 @@ class DataEntryEmissionRepository:
                     ids.append(fid)
             return ids
 
+        def _snapshot_efs(meta: dict) -> dict[int, float]:
+            # ``ef_kgco2eq_per_m2`` from the values snapshot taken at
+            # compute time, where the row carries one.
+            efs: dict[int, float] = {}
+            for f in meta.get("factors_used") or []:
+                if not isinstance(f, dict) or not isinstance(f.get("id"), int):
+                    continue
+                ef = (f.get("values") or {}).get("ef_kgco2eq_per_m2")
+                try:
+                    efs[f["id"]] = float(ef)
+                except (TypeError, ValueError):
+                    continue
+            return efs
+
         factor_ids: set[int] = set()
-        for row in rows:
-            meta = row.meta if isinstance(row.meta, dict) else {}
+        for meta in metas:
             factor_ids.update(_factor_ids(meta))
 
         factor_category_map: dict[int, str] = {}
@@ -730,12 +871,11 @@ class DataEntryEmissionRepository:
                 factor_ef_map[fid] = float(f.ef) if f.ef is not None else 0.0
 
         category_totals: dict[str, float] = {}
-        for row in rows:
+        for row, meta in zip(rows, metas):
             kg_total = float(row.kg_co2eq or 0.0)
             if kg_total <= 0:
                 continue
 
-            meta = row.meta if isinstance(row.meta, dict) else {}
             surface = meta.get("room_surface_square_meter")
             if surface is None:
                 continue
@@ -753,10 +893,11 @@ class DataEntryEmissionRepository:
                 )
                 continue
 
+            snapshot_efs = _snapshot_efs(meta)
             raw_by_cat: dict[str, float] = {}
             raw_total = 0.0
             for fid in ids:
-                ef = factor_ef_map.get(fid, 0.0)
+                ef = snapshot_efs.get(fid, factor_ef_map.get(fid, 0.0))
                 if ef <= 0:
                     continue
                 cat = factor_category_map.get(fid, "unknown")
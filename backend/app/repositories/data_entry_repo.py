@@ -1,12 +1,25 @@
 """Data entry repository for database operations."""
 
 import asyncio
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
 
-from psycopg.types.json import Json
 from pydantic import BaseModel
-from sqlalchemy import Select, asc, desc, func, or_
+from sqlalchemy import (
+    Integer,
+    Select,
+    String,
+    any_,
+    asc,
+    bindparam,
+    desc,
+    func,
+    or_,
+    update,
+)
 from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import aliased
 from sqlmodel import col, delete, select
@@ -16,13 +29,15 @@ from app.core.constants import ModuleStatus
 from app.core.logging import get_logger
 from app.models.building_room import BuildingRoom
 from app.models.carbon_report import CarbonReport, CarbonReportModule
-from app.models.data_entry import DataEntry, DataEntryTypeEnum
+from app.models.data_entry import DataEntry, DataEntryStatusEnum, DataEntryTypeEnum
 from app.models.data_entry_emission import DataEntryEmission
 from app.models.factor import Factor
 from app.models.location import Location, TransportModeEnum
 from app.models.module_type import MODULE_TYPE_TO_DATA_ENTRY_TYPES, ModuleTypeEnum
 from app.modules.professional_travel.schemas import MemberEntry
 from app.repositories.carbon_report_module_repo import CarbonReportModuleRepository
+from app.repositories.copy_writer import CopyFormat, CopyTable, copy_rows
+from app.repositories.module_emission_total_repo import ModuleEmissionTotalRepository
 from app.schemas.carbon_report_response import SubmoduleResponse, SubmoduleSummary
 from app.schemas.data_entry import (
     BaseModuleHandler,
@@ -41,12 +56,57 @@ DEFAULT_FILTER_MAP = {"name": DataEntry.data["name"].as_string()}
 
 # COPY target for ``bulk_copy`` — every non-defaulted data_entries column.
 # ``id`` is omitted so the sequence assigns it server-side.
-_DATA_ENTRY_COPY_SQL = """
-COPY data_entries (
-    data_entry_type_id, carbon_report_module_id, data, status,
-    source, created_by_id, created_at, updated_at, year, unit_id
-) FROM STDIN
-"""
+_DATA_ENTRY_COPY_TABLE = CopyTable(
+    "data_entries",
+    (
+        ("data_entry_type_id", "int4"),
+        ("carbon_report_module_id", "int4"),
+        ("data", "json"),
+        ("status", "enum"),
+        ("source", "int4"),
+        ("created_by_id", "int4"),
+        ("created_at", "timestamp"),
+        ("updated_at", "timestamp"),
+        ("year", "int4"),
+        ("unit_id", "int4"),
+    ),
+)
+
+
+@dataclass(frozen=True)
+class ChangedFactorScope:
+    """Narrows a recalc slice to the entries a set of changed factors feeds.
+
+    Built by the recalc workflow from a factor ingest's
+    ``changed_factor_ids``; plain tuples so the sharded recalc can pickle
+    it to its workers.  An entry is kept when it:
+
+    * has no ``primary_factor_id`` — Strategy-B entries resolve their
+      factors in ``pre_compute`` and can't be matched up front;
+    * links one of ``factor_ids``; or
+    * carries a ``kind_field`` / ``override_field`` value one of the
+      changed factors is classified under — the recalc's rematch may
+      move it onto that factor.
+    """
+
+    factor_ids: tuple[int, ...]
+    kind_field: Optional[str] = None
+    kinds: tuple[str, ...] = ()
+    override_field: Optional[str] = None
+    override_codes: tuple[str, ...] = ()
+
+    def where_clause(self) -> Any:
+        primary_factor_id = DataEntry.data["primary_factor_id"].as_integer()
+        clauses = [primary_factor_id.is_(None)]
+        if self.factor_ids:
+            clauses.append(primary_factor_id.in_(self.factor_ids))
+        if self.kind_field and self.kinds:
+            clauses.append(DataEntry.data[self.kind_field].as_string().in_(self.kinds))
+        if self.override_field and self.override_codes:
+            clauses.append(
+                DataEntry.data[self.override_field].as_string().in_(self.override_codes)
+            )
+        return or_(*clauses)
 
 
 class DataEntryRepository:
@@ -56,6 +116,9 @@ class DataEntryRepository:
         self.session = session
         self.entity_type = DataEntry.__name__
         self.carbon_report_module_repo = CarbonReportModuleRepository(session)
+        # Deletes subtract the entries from the module totals first: the
+        # cascade takes their emissions without the emission repository.
+        self._totals_repo = ModuleEmissionTotalRepository(session)
 
     def _detach(self, *objs: Any) -> None:
         """Expunge ORM rows from the session so accidental mutations cannot
@@ -95,7 +158,30 @@ class DataEntryRepository:
         await self.session.flush()
         return db_objs
 
-    async def bulk_copy(self, data_entries: list[DataEntry]) -> int:
+    @staticmethod
+    def copy_row(entry: DataEntry) -> tuple:
+        """Encode one entry as a row in ``_DATA_ENTRY_COPY_TABLE`` order."""
+        return (
+            entry.data_entry_type_id,
+            entry.carbon_report_module_id,
+            entry.data or {},
+            # Native PG enum column stores the member name.
+            DataEntryStatusEnum(entry.status).name
+            if entry.status is not None
+            else None,
+            entry.source,
+            entry.created_by_id,
+            entry.created_at,
+            entry.updated_at,
+            entry.year,
+            entry.unit_id,
+        )
+
+    async def bulk_copy(
+        self,
+        data_entries: list[DataEntry],
+        copy_format: CopyFormat = CopyFormat.text,
+    ) -> int:
         """Bulk insert via PostgreSQL ``COPY … FROM STDIN`` (psycopg3).
 
         Runs on the session's own connection, so the COPY participates in
@@ -104,9 +190,24 @@ class DataEntryRepository:
         NOT populated; callers that need ids (audit trail, immediate
         emission build) must use ``bulk_create``.
 
+        ``CopyFormat.binary`` (see ``copy_writer``) encodes the entries
+        straight to tuples with ``copy_row``, skipping the per-entry
+        ``model_validate`` copy the text path makes; the entries must
+        therefore already be ``DataEntry`` instances.
+
         On non-PostgreSQL binds (the SQLite test harness) COPY is not part
         of the wire protocol, so the ORM bulk path is used instead.
         """
+        bind = self.session.get_bind()
+        if copy_format == CopyFormat.binary and bind.dialect.driver == "psycopg":
+            if not data_entries:
+                return 0
+            return await copy_rows(
+                self.session,
+                _DATA_ENTRY_COPY_TABLE,
+                (self.copy_row(entry) for entry in data_entries),
+                copy_format,
+            )
         # Validate in chunks, yielding between them: a full batch can be
         # INGEST_COPY_BATCH_SIZE (50k) rows, and one un-yielded model_validate
         # list-comp blocks the event loop long enough to fail liveness probes.
@@ -117,7 +218,6 @@ class DataEntryRepository:
                 await asyncio.sleep(0)
         if not db_objs:
             return 0
-        bind = self.session.get_bind()
         if bind.dialect.driver != "psycopg":
             # COPY streaming here is psycopg3-specific (``cursor().copy()``).
             # Production runs ``postgresql+psycopg``; SQLite and the
@@ -130,40 +230,23 @@ class DataEntryRepository:
             await self.session.flush()
             return len(db_objs)
 
-        sa_conn = await self.session.connection()
-        raw = await sa_conn.get_raw_connection()
-        driver_conn = raw.driver_connection  # psycopg AsyncConnection
-        if driver_conn is None:
-            raise RuntimeError("bulk_copy: raw connection has no driver connection")
-        async with driver_conn.cursor() as cur:
-            async with cur.copy(_DATA_ENTRY_COPY_SQL) as copy:
-                for obj in db_objs:
-                    await copy.write_row(
-                        (
-                            obj.data_entry_type_id,
-                            obj.carbon_report_module_id,
-                            Json(obj.data or {}),
-                            # Native PG enum column stores the member name.
-                            obj.status.name if obj.status is not None else None,
-                            obj.source,
-                            obj.created_by_id,
-                            obj.created_at,
-                            obj.updated_at,
-                            obj.year,
-                            obj.unit_id,
-                        )
-                    )
-        return len(db_objs)
+        return await copy_rows(
+            self.session,
+            _DATA_ENTRY_COPY_TABLE,
+            (self.copy_row(obj) for obj in db_objs),
+            copy_format,
+        )
 
     async def bulk_delete(
         self, carbon_report_module_id: int, data_entry_type_id: DataEntryTypeEnum
     ) -> None:
         """Bulk delete data entries by module and type."""
-        statement = delete(DataEntry).where(
+        where = (
             col(DataEntry.carbon_report_module_id) == carbon_report_module_id,
             col(DataEntry.data_entry_type_id) == data_entry_type_id,
         )
-        await self.session.execute(statement)
+        await self._totals_repo.remove_entries_where(*where)
+        await self.session.execute(delete(DataEntry).where(*where))
         await self.session.flush()
 
     async def bulk_delete_by_source(
@@ -180,12 +263,13 @@ class DataEntryRepository:
             data_entry_type_id: The data entry type to delete
             source: Only delete entries from this source (e.g., CSV_MODULE_PER_YEAR)
         """
-        statement = delete(DataEntry).where(
+        where = (
             col(DataEntry.carbon_report_module_id) == carbon_report_module_id,
             col(DataEntry.data_entry_type_id) == data_entry_type_id.value,
             col(DataEntry.source) == source,
         )
-        await self.session.execute(statement)
+        await self._totals_repo.remove_entries_where(*where)
+        await self.session.execute(delete(DataEntry).where(*where))
         await self.session.flush()
 
     async def bulk_delete_by_source_year(
@@ -204,15 +288,125 @@ class DataEntryRepository:
         """
         if not data_entry_type_ids:
             return 0
-        statement = delete(DataEntry).where(
+        where = (
             col(DataEntry.year) == year,
             col(DataEntry.data_entry_type_id).in_(data_entry_type_ids),
             col(DataEntry.source) == source,
         )
-        result = await self.session.execute(statement)
+        await self._totals_repo.remove_entries_where(*where)
+        result = await self.session.execute(delete(DataEntry).where(*where))
         await self.session.flush()
         return getattr(result, "rowcount", 0) or 0
 
+    async def get_source_year_summary(
+        self,
+        year: int,
+        data_entry_type_ids: list[int],
+        source: int,  # DataEntrySourceEnum value
+        created_by_id: int,
+    ) -> tuple[int, int, Optional[datetime]]:
+        """``(rows, rows created by created_by_id, latest updated_at)`` of
+        the scope ``bulk_delete_by_source_year`` replaces.
+
+        One aggregate over the same indexed predicate; lets a per-year
+        re-upload tell whether the scope is still exactly what a
+        previous job wrote.
+        """
+        if not data_entry_type_ids:
+            return 0, 0, None
+        statement = sa_select(
+            func.count(),
+            func.count().filter(col(DataEntry.created_by_id) == created_by_id),
+            func.max(col(DataEntry.updated_at)),
+        ).where(
+            col(DataEntry.year) == year,
+            col(DataEntry.data_entry_type_id).in_(data_entry_type_ids),
+            col(DataEntry.source) == source,
+        )
+        total, created, last_updated = (await self.session.execute(statement)).one()
+        return int(total or 0), int(created or 0), last_updated
+
+    async def iter_source_year_rows(
+        self,
+        year: int,
+        data_entry_type_ids: list[int],
+        source: int,  # DataEntrySourceEnum value
+        *,
+        chunk_size: int = 5000,
+    ) -> AsyncIterator[list[tuple[int, int, int, dict]]]:
+        """Stream ``(id, carbon_report_module_id, data_entry_type_id, data)``
+        of the scope ``bulk_delete_by_source_year`` replaces, in keyset
+        chunks of ``chunk_size`` rows.
+
+        Columns rather than entities: the row-diff CSV ingest only
+        compares them, so nothing accumulates in the identity map.
+        """
+        if not data_entry_type_ids:
+            return
+        last_id = 0
+        while True:
+            statement = (
+                sa_select(
+                    col(DataEntry.id),
+                    col(DataEntry.carbon_report_module_id),
+                    col(DataEntry.data_entry_type_id),
+                    col(DataEntry.data),
+                )
+                .where(
+                    col(DataEntry.year) == year,
+                    col(DataEntry.data_entry_type_id).in_(data_entry_type_ids),
+                    col(DataEntry.source) == source,
+                    col(DataEntry.id) > last_id,
+                )
+                .order_by(asc(col(DataEntry.id)))
+                .limit(chunk_size)
+            )
+            rows = [
+                (int(entry_id), int(module_id), int(type_id), data or {})
+                for entry_id, module_id, type_id, data in (
+                    await self.session.execute(statement)
+                ).all()
+            ]
+            if not rows:
+                return
+            yield rows
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1][0]
+
+    async def list_ids_created_by(
+        self,
+        created_by_id: int,
+        year: int,
+        source: int,  # DataEntrySourceEnum value
+    ) -> list[int]:
+        """Ids of the ``(year, source)`` entries ``created_by_id`` wrote —
+        how a bulk ingest learns the ids its COPY assigned."""
+        statement = (
+            sa_select(col(DataEntry.id))
+            .where(
+                col(DataEntry.created_by_id) == created_by_id,
+                col(DataEntry.year) == year,
+                col(DataEntry.source) == source,
+            )
+            .order_by(asc(col(DataEntry.id)))
+        )
+        return [int(i) for i in (await self.session.execute(statement)).scalars()]
+
+    async def delete_by_ids(self, ids: list[int], chunk_size: int = 5000) -> int:
+        """DELETE the given entries, ``chunk_size`` ids per statement.
+
+        Emissions go with them (ON DELETE CASCADE).  Statements only —
+        the commit stays with the caller.  Returns the rows deleted.
+        """
+        deleted = 0
+        for i in range(0, len(ids), chunk_size):
+            where = col(DataEntry.id).in_(ids[i : i + chunk_size])
+            await self._totals_repo.remove_entries_where(where)
+            result = await self.session.execute(delete(DataEntry).where(where))
+            deleted += getattr(result, "rowcount", 0) or 0
+        return deleted
+
     async def update(
         self, id: int, data: DataEntryUpdate, user_id: int
     ) -> Optional[DataEntry]:
@@ -241,6 +435,7 @@ class DataEntryRepository:
         return db_obj
 
     async def delete(self, id: int) -> bool:
+        await self._totals_repo.remove_entries_where(col(DataEntry.id) == id)
         statement = delete(DataEntry).where(col(DataEntry.id) == id)
         result = await self.session.execute(statement)
 
@@ -284,6 +479,61 @@ class DataEntryRepository:
         result = await self.session.execute(statement)
         return result.scalar_one_or_none() is None
 
+    async def get_taken_json_field_values(
+        self,
+        carbon_report_module_ids: list[int],
+        data_entry_type_id: int,
+        field: str,
+        values: list[str],
+    ) -> set[tuple[int, str]]:
+        """Set-based form of :meth:`check_json_field_unique`.
+
+        Returns the ``(carbon_report_module_id, value)`` pairs among
+        ``carbon_report_module_ids`` × ``values`` that an existing entry of
+        the submodule already holds.  On PostgreSQL each list ships as ONE
+        array bind param (``= ANY(:ids)``); the SQLite test harness has no
+        array type, so it falls back to chunked ``IN`` lists.
+        """
+        if not carbon_report_module_ids or not values:
+            return set()
+        value_expr = DataEntry.data[field].as_string()
+        base = (
+            select(col(DataEntry.carbon_report_module_id), value_expr)
+            .where(col(DataEntry.data_entry_type_id) == data_entry_type_id)
+            .distinct()
+        )
+        if self.session.get_bind().dialect.name == "postgresql":
+            statements = [
+                base.where(
+                    col(DataEntry.carbon_report_module_id)
+                    == any_(
+                        bindparam(
+                            "module_ids",
+                            carbon_report_module_ids,
+                            type_=ARRAY(Integer),
+                        )
+                    ),
+                    value_expr
+                    == any_(bindparam("values", values, type_=ARRAY(String))),
+                )
+            ]
+        else:
+            chunk = 10_000
+            statements = [
+                base.where(
+                    col(DataEntry.carbon_report_module_id).in_(
+                        carbon_report_module_ids
+                    ),
+                    value_expr.in_(values[i : i + chunk]),
+                )
+                for i in range(0, len(values), chunk)
+            ]
+        taken: set[tuple[int, str]] = set()
+        for statement in statements:
+            result = await self.session.execute(statement)
+            taken.update((module_id, value) for module_id, value in result.all())
+        return taken
+
     async def get_list(
         self,
         carbon_report_module_id: int,
@@ -310,30 +560,18 @@ class DataEntryRepository:
         result = await self.session.execute(statement)
         return list(result.scalars().all())
 
-    async def list_by_data_entry_type_and_year(
+    def _slice_statement(
         self,
         data_entry_type_id: DataEntryTypeEnum,
         year: int,
         carbon_report_module_ids: Optional[list[int]] = None,
-    ) -> list[DataEntry]:
-        """Fetch all DataEntries for a given data_entry_type and report year.
-
-        JOINs DataEntry → CarbonReportModule → CarbonReport to filter by year.
-
-        Args:
-            data_entry_type_id: The data entry type to filter on.
-            year: The carbon report year to filter on.
-            carbon_report_module_ids: Optional module scope — set by
-                unit-specific ingests so their recalc touches only the
-                uploaded module instead of the whole (det, year) slice.
-
-        Returns:
-            List of matching DataEntry rows (may be empty).
-        """
-        # TODO: check if it's safe to expunge the returned rows here for
-        # symmetry with get_submodule_data. The recalculation workflow in
-        # workflows/emission_recalculation.py is the primary caller and may
-        # mutate; audit before adding self._detach.
+        changed_factors: Optional[ChangedFactorScope] = None,
+        data_entry_ids: Optional[list[int]] = None,
+    ) -> Select:
+        """WHERE/JOIN shape shared by every ``(data_entry_type, year)`` slice
+        reader: DataEntry → CarbonReportModule → CarbonReport, filtered on
+        the report year and (optionally) a module scope, the entries a
+        set of changed factors feeds and an explicit set of entry ids."""
         statement = (
             select(DataEntry)
             .join(
@@ -353,9 +591,202 @@ class DataEntryRepository:
             statement = statement.where(
                 col(DataEntry.carbon_report_module_id).in_(carbon_report_module_ids)
             )
+        if changed_factors is not None:
+            statement = statement.where(changed_factors.where_clause())
+        if data_entry_ids is not None:
+            statement = statement.where(self._id_among(data_entry_ids))
+        return statement
+
+    def _id_among(self, data_entry_ids: list[int]) -> Any:
+        """``DataEntry.id`` among ``data_entry_ids``.
+
+        On PostgreSQL the set ships as ONE array bind param
+        (``= ANY(:data_entry_ids)``), so a 10k-id row-diff scope stays a
+        single parameter in every keyset chunk; the SQLite test harness
+        has no array type and takes a plain ``IN`` list.
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            return col(DataEntry.id) == any_(
+                bindparam("data_entry_ids", data_entry_ids, type_=ARRAY(Integer))
+            )
+        return col(DataEntry.id).in_(data_entry_ids)
+
+    async def group_ids_by_module(
+        self, data_entry_ids: list[int]
+    ) -> dict[int, list[int]]:
+        """``carbon_report_module_id -> sorted entry ids`` of the given
+        entries (unknown ids are left out).
+
+        Lets the sharded recalc hand each worker only the targeted ids of
+        its own modules.
+        """
+        if not data_entry_ids:
+            return {}
+        statement = (
+            sa_select(col(DataEntry.carbon_report_module_id), col(DataEntry.id))
+            .where(self._id_among(data_entry_ids))
+            .order_by(asc(col(DataEntry.id)))
+        )
+        grouped: dict[int, list[int]] = {}
+        for module_id, entry_id in (await self.session.execute(statement)).all():
+            grouped.setdefault(int(module_id), []).append(int(entry_id))
+        return grouped
+
+    async def list_by_data_entry_type_and_year(
+        self,
+        data_entry_type_id: DataEntryTypeEnum,
+        year: int,
+        carbon_report_module_ids: Optional[list[int]] = None,
+    ) -> list[DataEntry]:
+        """Fetch all DataEntries for a given data_entry_type and report year.
+
+        JOINs DataEntry → CarbonReportModule → CarbonReport to filter by year.
+
+        Materialises the whole slice — the recalc workflow streams it
+        through ``iter_by_data_entry_type_and_year`` instead.
+
+        Args:
+            data_entry_type_id: The data entry type to filter on.
+            year: The carbon report year to filter on.
+            carbon_report_module_ids: Optional module scope — set by
+                unit-specific ingests so their recalc touches only the
+                uploaded module instead of the whole (det, year) slice.
+
+        Returns:
+            List of matching DataEntry rows (may be empty).
+        """
+        statement = self._slice_statement(
+            data_entry_type_id, year, carbon_report_module_ids
+        )
         result = await self.session.execute(statement)
         return list(result.scalars().all())
 
+    async def count_by_data_entry_type_and_year(
+        self,
+        data_entry_type_id: DataEntryTypeEnum,
+        year: int,
+        carbon_report_module_ids: Optional[list[int]] = None,
+        changed_factors: Optional[ChangedFactorScope] = None,
+        data_entry_ids: Optional[list[int]] = None,
+    ) -> int:
+        """Row count of the slice ``iter_by_data_entry_type_and_year`` walks.
+
+        Lets the streaming recalc report ``done/total`` progress (and
+        early-exit on an empty slice) without loading any row.
+        """
+        subquery = self._slice_statement(
+            data_entry_type_id,
+            year,
+            carbon_report_module_ids,
+            changed_factors,
+            data_entry_ids,
+        ).subquery()
+        result = await self.session.execute(
+            sa_select(func.count()).select_from(subquery)
+        )
+        return int(result.scalar_one() or 0)
+
+    async def count_by_module_for_data_entry_type_and_year(
+        self,
+        data_entry_type_id: DataEntryTypeEnum,
+        year: int,
+        carbon_report_module_ids: Optional[list[int]] = None,
+        changed_factors: Optional[ChangedFactorScope] = None,
+        data_entry_ids: Optional[list[int]] = None,
+    ) -> list[tuple[int, int]]:
+        """Per-module row counts of the slice, as ``(module_id, count)``.
+
+        Feeds the sharded recalc's partitioning: shards are whole
+        ``carbon_report_module_id`` groups balanced by entry count.
+        """
+        subquery = self._slice_statement(
+            data_entry_type_id,
+            year,
+            carbon_report_module_ids,
+            changed_factors,
+            data_entry_ids,
+        ).subquery()
+        statement = (
+            sa_select(subquery.c.carbon_report_module_id, func.count())
+            .group_by(subquery.c.carbon_report_module_id)
+            .order_by(subquery.c.carbon_report_module_id)
+        )
+        result = await self.session.execute(statement)
+        return [(int(module_id), int(count)) for module_id, count in result.all()]
+
+    async def iter_by_data_entry_type_and_year(
+        self,
+        data_entry_type_id: DataEntryTypeEnum,
+        year: int,
+        carbon_report_module_ids: Optional[list[int]] = None,
+        *,
+        chunk_size: int = 5000,
+        after_id: int = 0,
+        changed_factors: Optional[ChangedFactorScope] = None,
+        data_entry_ids: Optional[list[int]] = None,
+    ) -> AsyncIterator[list[DataEntry]]:
+        """Stream the slice in keyset-ordered chunks of ``chunk_size`` rows.
+
+        Each chunk is one ``WHERE id > :last ORDER BY id LIMIT :n`` query
+        against the same slice predicate as
+        ``list_by_data_entry_type_and_year``, so peak memory is bounded by
+        the chunk size instead of the slice size.  Keyset pagination
+        (rather than a server-side cursor) keeps the session free for the
+        DELETE + COPY the caller runs between chunks.
+
+        Yielded rows stay attached so the caller can mutate ``data`` (the
+        recalc factor relink); hand each chunk back to ``release_chunk``
+        once done so the identity map does not grow with the slice.
+        """
+        base = self._slice_statement(
+            data_entry_type_id,
+            year,
+            carbon_report_module_ids,
+            changed_factors,
+            data_entry_ids,
+        )
+        last_id = after_id
+        while True:
+            statement = (
+                base.where(col(DataEntry.id) > last_id)
+                .order_by(asc(col(DataEntry.id)))
+                .limit(chunk_size)
+            )
+            result = await self.session.execute(statement)
+            chunk = list(result.scalars().all())
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < chunk_size:
+                return
+            last_id = chunk[-1].id or last_id
+
+    async def release_chunk(self, entries: list[DataEntry]) -> None:
+        """Flush pending edits on a streamed chunk, then detach its rows.
+
+        Statements only — the flush lands in the caller's open
+        transaction, so the commit (or rollback) still belongs to the
+        runner.  Expunging afterwards lets the ORM rows and their JSON
+        ``data`` dicts be garbage-collected before the next chunk loads.
+        """
+        await self.session.flush()
+        self._detach(*entries)
+
+    async def bulk_update_data(self, data_by_id: dict[int, dict]) -> None:
+        """Overwrite ``data`` for many entries in one executemany UPDATE.
+
+        The sharded recalc computes factor relinks out of process, so
+        there is no attached ORM row to mutate; this applies them by
+        primary key on the caller's session (statements only — the
+        commit stays with the caller).
+        """
+        if not data_by_id:
+            return
+        await self.session.execute(
+            update(DataEntry),
+            [{"id": entry_id, "data": data} for entry_id, data in data_by_id.items()],
+        )
+
     async def get_module_type_id_for_carbon_report_module(
         self, carbon_report_module_id: int
     ) -> Optional[int]:
@@ -3,7 +3,7 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Literal, Optional, TypedDict
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, func, or_, text
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import col, desc, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -16,6 +16,7 @@ from app.models.data_ingestion import (
     IngestionMethod,
     IngestionResult,
     IngestionState,
+    JobPriority,
     Pipeline,
     PipelineStatus,
     TargetType,
@@ -23,6 +24,33 @@ from app.models.data_ingestion import (
 
 logger = get_logger(__name__)
 
+# ``emission_recalc`` config keys that narrow its slice to the entries an
+# ingest changed: a factor ingest's changed factors, a row-diff CSV
+# ingest's written entries.
+RECALC_TARGETING_KEYS = ("changed_factor_ids", "changed_entry_ids")
+
+# Postgres ``NOTIFY`` channel a runnable job is announced on; each pod's
+# ``app.tasks._job_listener`` LISTENs on it to wake the dispatch sweep.
+JOB_NOTIFY_CHANNEL = "data_ingestion_jobs"
+
+
+def default_job_priority(
+    job_type: Optional[str], entity_type: Optional[EntityType]
+) -> int:
+    """Floor priority for a new job, from its trigger and type.
+
+    A unit-specific job is a user's own upload from their module page;
+    an aggregation refreshes a dashboard.  Everything else — year-wide
+    backoffice reloads, recalc fan-outs, syncs — is bulk.  Chained jobs
+    also inherit their parent's priority, so a user upload's recalc and
+    aggregation stay interactive.
+    """
+    if entity_type == EntityType.MODULE_UNIT_SPECIFIC:
+        return JobPriority.INTERACTIVE.value
+    if job_type == "aggregation":
+        return JobPriority.NORMAL.value
+    return JobPriority.BULK.value
+
 
 class _ClaimUnavailable(Exception):
     """Internal sentinel — Step 2 of claim_job matched no row.
@@ -43,11 +71,44 @@ class DataIngestionRepository:
         data: DataIngestionJob,
     ) -> DataIngestionJob:
         job = DataIngestionJob.model_validate(data)
+        job.priority = max(
+            job.priority, default_job_priority(job.job_type, job.entity_type)
+        )
         self.session.add(job)
         await self.session.flush()
         await self.session.refresh(job)
+        if (
+            job.id is not None
+            and job.job_type is not None
+            and job.state == IngestionState.NOT_STARTED
+        ):
+            await self.notify_jobs_ready([job.id])
         return job
 
+    async def notify_jobs_ready(self, job_ids: List[int]) -> None:
+        """Announce runnable jobs on ``JOB_NOTIFY_CHANNEL``.
+
+        Queues one ``NOTIFY`` per id in the caller's transaction;
+        Postgres delivers them at commit and drops them on rollback, so
+        a listener only wakes once the rows are claimable.  No-op on
+        other dialects and for an empty list.
+        """
+        if not job_ids:
+            return
+        try:
+            dialect_name = self.session.get_bind().dialect.name
+        except Exception:
+            dialect_name = ""
+        if dialect_name != "postgresql":
+            return
+        await self.session.execute(
+            text(
+                "SELECT pg_notify(:channel, id::text) "
+                "FROM unnest(CAST(:ids AS bigint[])) AS id"
+            ),
+            {"channel": JOB_NOTIFY_CHANNEL, "ids": list(job_ids)},
+        )
+
     def sanitize_for_json(self, obj):
         if isinstance(obj, dict):
             return {
@@ -1221,9 +1282,43 @@ class DataIngestionRepository:
         )
         abandoned_ids = list(abandoned.scalars().all())
 
+        await self.notify_jobs_ready(recovered_ids)
         await self.session.commit()
         return len(recovered_ids), len(abandoned_ids)
 
+    async def release_job(self, job_id: int, pod_id: str) -> bool:
+        """Hand a RUNNING job we own back to NOT_STARTED, for immediate retry.
+
+        Used when a stopping worker cuts a job off: rather than leaving
+        the row RUNNING until the stale-job sweep reclaims it, it is
+        unlocked and re-announced now.  Same guard as ``finish_job``
+        (``locked_by`` + ``state``), and ``attempts`` is kept, as in
+        ``sweep_stuck_running_jobs``.  Commits.
+
+        Returns False when the job was no longer ours (nothing written).
+        """
+        result = await self.session.execute(
+            update(DataIngestionJob)
+            .where(
+                col(DataIngestionJob.id) == job_id,
+                col(DataIngestionJob.locked_by) == pod_id,
+                col(DataIngestionJob.state) == IngestionState.RUNNING,
+            )
+            .values(
+                state=IngestionState.NOT_STARTED,
+                locked_by=None,
+                locked_at=None,
+                is_current=False,
+                run_after=None,
+            )
+            .returning(col(DataIngestionJob.id))
+        )
+        released_id = result.scalar_one_or_none()
+        if released_id is not None:
+            await self.notify_jobs_ready([released_id])
+        await self.session.commit()
+        return released_id is not None
+
     async def recover_job(
         self, job_id: int, stale_timeout_minutes: int
     ) -> Optional[DataIngestionJob]:
@@ -1253,8 +1348,10 @@ class DataIngestionRepository:
             )
             .returning(col(DataIngestionJob.id))
         )
-        await self.session.commit()
         recovered_id = result.scalar_one_or_none()
+        if recovered_id is not None:
+            await self.notify_jobs_ready([recovered_id])
+        await self.session.commit()
         if recovered_id is None:
             return None
         return await self.get_job_by_id(recovered_id)
@@ -1303,6 +1400,32 @@ class DataIngestionRepository:
         exec_result = await self.session.execute(stmt)
         return list(exec_result.scalars().all())
 
+    async def get_previous_finished_in_combo(
+        self, job: DataIngestionJob
+    ) -> Optional[DataIngestionJob]:
+        """The most recently finished other job of ``job``'s
+        module/det/target/method/year combo and entity type, or None.
+
+        Backs the identical-upload check of per-year CSV ingests: only
+        the latest run of the combo describes what the scope holds now.
+        """
+        stmt = (
+            select(DataIngestionJob)
+            .where(
+                self._build_combo_where(job),
+                col(DataIngestionJob.entity_type) == job.entity_type,
+                col(DataIngestionJob.state) == IngestionState.FINISHED,
+                col(DataIngestionJob.id) != job.id,
+            )
+            .order_by(
+                desc(col(DataIngestionJob.finished_at)),
+                desc(col(DataIngestionJob.id)),
+            )
+            .limit(1)
+        )
+        exec_result = await self.session.execute(stmt)
+        return exec_result.scalars().first()
+
     async def mark_job_as_current(self, job: DataIngestionJob) -> None:
         """
         Mark a job as current, unsetting any previous current job.
@@ -1515,6 +1638,147 @@ class DataIngestionRepository:
         """
         return await self._get_jobs_by_state([IngestionState.FINISHED], negate=True)
 
+    async def widen_active_recalc_targeting(
+        self,
+        *,
+        module_type_id: int,
+        data_entry_type_id: int,
+        year: int,
+        changed_factor_ids: Optional[list[int]] = None,
+        changed_entry_ids: Optional[list[int]] = None,
+        changed_module_ids: Optional[list[int]] = None,
+        carbon_report_module_ids: Optional[list[int]] = None,
+    ) -> int:
+        """Fold an ingest's changes into the active recalc for
+        ``(module, det, year)`` that ``EMISSION_RECALC_DEDUP`` kept it
+        from chaining.
+
+        An active (NOT_STARTED / QUEUED / RUNNING) ``emission_recalc``
+        narrowed to an earlier ingest's changes would otherwise never
+        revisit the entries this ingest changed.
+
+        * Targeting (``RECALC_TARGETING_KEYS``): a targeted set of the
+          same kind as this ingest's becomes the union of both; any
+          other targeting — or all of it, when this ingest could not
+          enumerate its changes (both ids ``None``) — is dropped.
+          Untargeted recalcs keep their targeting.
+        * Module scope (``carbon_report_module_ids``, pinned by
+          unit-specific ingests): joined by the modules this ingest's
+          changes are confined to — its own ``carbon_report_module_ids``
+          or, for a row diff, ``changed_module_ids`` — and dropped (whole
+          slice) when they are not confined, as for a factor ingest.
+        * ``changed_module_ids`` joins the recalc's own (the modules its
+          trailing aggregation refreshes regardless).
+
+        Either way a checkpointed recalc loses its ``recalc_checkpoint``:
+        entries before its cursor were computed against the factors or
+        entries this ingest just replaced, so it must start over.
+        Flushes only — the caller commits.
+
+        Returns the number of job rows widened.
+        """
+        ids_by_key = {
+            "changed_factor_ids": changed_factor_ids,
+            "changed_entry_ids": changed_entry_ids,
+        }
+        confined_to = (
+            carbon_report_module_ids
+            if carbon_report_module_ids is not None
+            else changed_module_ids
+        )
+        stmt = select(DataIngestionJob).where(
+            col(DataIngestionJob.job_type) == "emission_recalc",
+            col(DataIngestionJob.module_type_id) == module_type_id,
+            col(DataIngestionJob.data_entry_type_id) == data_entry_type_id,
+            col(DataIngestionJob.year) == year,
+            col(DataIngestionJob.state).in_(
+                [
+                    IngestionState.NOT_STARTED,
+                    IngestionState.QUEUED,
+                    IngestionState.RUNNING,
+                ]
+            ),
+        )
+        widened = 0
+        for active in (await self.session.execute(stmt)).scalars().all():
+            meta = dict(active.meta or {})
+            config = dict(meta.get("config") or {})
+            checkpointed = meta.pop("recalc_checkpoint", None) is not None
+            retargeted = False
+            for key in RECALC_TARGETING_KEYS:
+                existing = config.get(key)
+                if not isinstance(existing, list):
+                    continue
+                retargeted = True
+                ids = ids_by_key[key]
+                if ids is None:
+                    config.pop(key)
+                else:
+                    config[key] = sorted(set(existing) | set(ids))
+            existing_scope = config.get("carbon_report_module_ids")
+            if isinstance(existing_scope, list):
+                retargeted = True
+                if confined_to is None:
+                    config.pop("carbon_report_module_ids")
+                else:
+                    config["carbon_report_module_ids"] = sorted(
+                        set(existing_scope) | set(confined_to)
+                    )
+            if changed_module_ids:
+                existing_modules = config.get("changed_module_ids")
+                config["changed_module_ids"] = sorted(
+                    set(existing_modules if isinstance(existing_modules, list) else [])
+                    | set(changed_module_ids)
+                )
+                retargeted = True
+            if retargeted:
+                meta["config"] = config
+            elif not checkpointed:
+                continue
+            # Reassign (not mutate) so the plain JSON column is marked dirty.
+            active.meta = meta
+            widened += 1
+        if widened:
+            await self.session.flush()
+        return widened
+
+    async def save_recalc_checkpoint(
+        self, job_id: int, pod_id: str, checkpoint: dict
+    ) -> bool:
+        """Store ``checkpoint`` as ``meta.recalc_checkpoint`` on a RUNNING
+        job we still own.
+
+        The row is read ``FOR UPDATE`` with the same ``locked_by`` /
+        ``state`` guard as ``finish_job``, so a stale-lock sweep cannot
+        slip between the check and the write, and with
+        ``populate_existing`` so this session's later meta merges
+        (``update_ingestion_job``) start from the stored checkpoint.
+        Flushes only — the caller commits.
+
+        Returns False when the job was preempted (nothing written).
+        """
+        job = (
+            await self.session.execute(
+                select(DataIngestionJob)
+                .where(
+                    col(DataIngestionJob.id) == job_id,
+                    col(DataIngestionJob.locked_by) == pod_id,
+                    col(DataIngestionJob.state) == IngestionState.RUNNING,
+                )
+                .with_for_update()
+                .execution_options(populate_existing=True)
+            )
+        ).scalar_one_or_none()
+        if job is None:
+            return False
+        job.meta = {
+            **(job.meta or {}),
+            "recalc_checkpoint": self.sanitize_for_json(checkpoint),
+        }
+        self.session.add(job)
+        await self.session.flush()
+        return True
+
     async def get_recalculation_status_by_year(
         self, year: int
     ) -> list["RecalculationStatusRow"]:
@@ -1,9 +1,12 @@
 """Repository for generic factors."""
 
-from typing import Dict, List, Optional
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from psycopg.types.json import Json
-from sqlalchemy import case, or_, text
+from sqlalchemy import case, cast, literal_column, or_, text, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -49,6 +52,11 @@ COPY factors_staging (
 # One INSERT…SELECT per identity-index partition (year IS NOT NULL vs
 # IS NULL) — same split as the VALUES-based fallback, because the two
 # partial unique indexes have different column lists and predicates.
+# ``xmax = 0`` holds only for a freshly inserted tuple, so RETURNING
+# tells inserts apart from conflict updates.  The DO UPDATE guard skips
+# conflicting rows whose ``values`` are unchanged (compared as jsonb, so
+# key order does not count): no new tuple, WAL or index entry, and no
+# RETURNING row.
 _FACTOR_UPSERT_FROM_STAGING = {
     True: """
         INSERT INTO factors (
@@ -64,6 +72,8 @@ _FACTOR_UPSERT_FROM_STAGING = {
         WHERE year IS NOT NULL
         DO UPDATE SET "values" = EXCLUDED."values",
                       last_seen_job_id = EXCLUDED.last_seen_job_id
+        WHERE factors."values"::jsonb IS DISTINCT FROM EXCLUDED."values"::jsonb
+        RETURNING id, (xmax = 0) AS inserted
     """,
     False: """
         INSERT INTO factors (
@@ -79,10 +89,53 @@ _FACTOR_UPSERT_FROM_STAGING = {
         WHERE year IS NULL
         DO UPDATE SET "values" = EXCLUDED."values",
                       last_seen_job_id = EXCLUDED.last_seen_job_id
+        WHERE factors."values"::jsonb IS DISTINCT FROM EXCLUDED."values"::jsonb
+        RETURNING id, (xmax = 0) AS inserted
     """,
 }
 
 
+def _identity_key(
+    data_entry_type_id: Any,
+    year: Optional[int],
+    emission_type_id: Any,
+    classification: Optional[dict],
+) -> tuple:
+    """Python twin of the factor identity index, to match a batch to the
+    stored rows.
+
+    ``classification`` is compared in canonical JSON form — sorted keys,
+    as the jsonb column normalises ``classification::text`` too.
+    """
+    return (
+        int(data_entry_type_id),
+        year,
+        int(emission_type_id),
+        json.dumps(classification, sort_keys=True),
+    )
+
+
+@dataclass
+class FactorUpsertResult:
+    """What an ``upsert_factors`` call did, by factor id."""
+
+    inserted_ids: list[int] = field(default_factory=list)
+    updated_ids: list[int] = field(default_factory=list)
+    # Existing rows the batch matched with identical ``values``: not
+    # written, so their ``last_seen_job_id`` is unchanged too.
+    unchanged_ids: list[int] = field(default_factory=list)
+
+    @property
+    def affected(self) -> int:
+        """Rows written (inserted + updated)."""
+        return len(self.inserted_ids) + len(self.updated_ids)
+
+    @property
+    def changed_ids(self) -> list[int]:
+        """Ids whose factor is new or re-valued — what a recalc needs."""
+        return [*self.inserted_ids, *self.updated_ids]
+
+
 class FactorRepository:
     """Repository for factor CRUD operations and lookups."""
 
@@ -139,7 +192,7 @@ class FactorRepository:
         self,
         factors: List[Factor],
         current_job_id: int,
-    ) -> int:
+    ) -> FactorUpsertResult:
         """Insert-or-update factors keyed on the identity index.
 
         Identity key is ``(data_entry_type_id, year, emission_type_id,
@@ -151,46 +204,110 @@ class FactorRepository:
         Preserves ``factor.id`` for existing rows so downstream
         references — including ``primary_factor_id`` values stored in
         ``DataEntry.data`` (a JSON value, not a real FK column) — stay
-        valid across reuploads.  Stamps ``last_seen_job_id`` so callers
-        can later detect rows not present in the current batch.
+        valid across reuploads.  Stamps ``last_seen_job_id`` on the rows
+        it writes so callers can later detect rows not present in the
+        current batch.
 
-        Postgres-only: relies on ``INSERT ... ON CONFLICT DO UPDATE``.
+        Existing rows whose ``values`` are unchanged are not written at
+        all — a re-import without edits touches no factor row — and come
+        back as ``unchanged_ids`` (one SELECT of the batch's identities
+        after the write); callers that track what an upload asserted
+        stamp them with ``stamp_last_seen``.
 
-        Returns the number of rows affected (insert + update).
+        Postgres-only: relies on ``INSERT ... ON CONFLICT DO UPDATE``.
         """
+        result = FactorUpsertResult()
         if not factors:
-            return 0
+            return result
 
         bind = self.session.get_bind()
         if bind.dialect.driver == "psycopg":
-            return await self._upsert_via_copy(factors, current_job_id)
-
-        # Non-psycopg drivers (asyncpg test fixtures): VALUES-based
-        # upsert, partitioned by year-presence.
-        with_year: List[Factor] = []
-        no_year: List[Factor] = []
-        for f in factors:
-            if f.year is not None:
-                with_year.append(f)
-            else:
-                no_year.append(f)
+            await self._upsert_via_copy(factors, current_job_id, result)
+        else:
+            # Non-psycopg drivers (asyncpg test fixtures): VALUES-based
+            # upsert, partitioned by year-presence.
+            with_year: List[Factor] = []
+            no_year: List[Factor] = []
+            for f in factors:
+                if f.year is not None:
+                    with_year.append(f)
+                else:
+                    no_year.append(f)
+            if with_year:
+                await self._upsert_subset(
+                    with_year, current_job_id, year_present=True, result=result
+                )
+            if no_year:
+                await self._upsert_subset(
+                    no_year, current_job_id, year_present=False, result=result
+                )
 
-        affected = 0
-        if with_year:
-            affected += await self._upsert_subset(
-                with_year, current_job_id, year_present=True
+        # Every batch row now has a stored match; those not written had
+        # identical values.
+        existing = await self._existing_ids_by_identity(factors)
+        matched = {
+            existing.get(
+                _identity_key(
+                    f.data_entry_type_id, f.year, f.emission_type_id, f.classification
+                )
             )
-        if no_year:
-            affected += await self._upsert_subset(
-                no_year, current_job_id, year_present=False
+            for f in factors
+        }
+        written = {*result.inserted_ids, *result.updated_ids}
+        result.unchanged_ids = sorted(i for i in matched - written if i is not None)
+        return result
+
+    async def _existing_ids_by_identity(
+        self, factors: List[Factor]
+    ) -> dict[tuple, int]:
+        """``_identity_key`` → id of the stored factors the batch's
+        identities can hit; one SELECT over its dets/types/years."""
+        years = {f.year for f in factors}
+        year_filter = [col(Factor.year).in_([y for y in years if y is not None])]
+        if None in years:
+            year_filter.append(col(Factor.year).is_(None))
+        stmt = select(
+            Factor.id,
+            Factor.data_entry_type_id,
+            Factor.year,
+            Factor.emission_type_id,
+            Factor.classification,
+        ).where(
+            col(Factor.data_entry_type_id).in_({f.data_entry_type_id for f in factors}),
+            col(Factor.emission_type_id).in_({f.emission_type_id for f in factors}),
+            or_(*year_filter),
+        )
+        result = await self.session.execute(stmt)
+        return {
+            _identity_key(det, year, et, classification): factor_id
+            for factor_id, det, year, et, classification in result.all()
+        }
+
+    async def stamp_last_seen(
+        self, factor_ids: list[int], job_id: int, chunk_size: int = 5000
+    ) -> None:
+        """Set ``last_seen_job_id`` on factors an ingest asserted without
+        changing them (``FactorUpsertResult.unchanged_ids``).
+
+        Rows already stamped with ``job_id`` are skipped.  Statements
+        only — the commit stays with the caller.
+        """
+        for i in range(0, len(factor_ids), chunk_size):
+            await self.session.execute(
+                update(Factor)
+                .where(
+                    col(Factor.id).in_(factor_ids[i : i + chunk_size]),
+                    col(Factor.last_seen_job_id).is_distinct_from(job_id),
+                )
+                .values(last_seen_job_id=job_id)
             )
-        return affected
 
     async def _upsert_via_copy(
         self,
         factors: List[Factor],
         current_job_id: int,
-    ) -> int:
+        result: FactorUpsertResult,
+    ) -> None:
         """COPY → staging → ``INSERT … SELECT … ON CONFLICT`` upsert.
 
         Streams the whole batch through one COPY instead of a multi-row
@@ -199,6 +316,8 @@ class FactorRepository:
         instead of 25 chunked statements).  Runs on the session's own
         connection: same transaction, rollback discards everything,
         and the TEMP staging table drops on commit.
+
+        Adds the ids it inserted and updated to ``result``.
         """
         sa_conn = await self.session.connection()
         raw = await sa_conn.get_raw_connection()
@@ -226,13 +345,15 @@ class FactorRepository:
                         )
                     )
 
-        affected = 0
         for year_present in (True, False):
-            result = await self.session.execute(
+            rows = await self.session.execute(
                 text(_FACTOR_UPSERT_FROM_STAGING[year_present])
             )
-            affected += getattr(result, "rowcount", 0) or 0
-        return affected
+            for factor_id, inserted in rows.all():
+                if inserted:
+                    result.inserted_ids.append(factor_id)
+                else:
+                    result.updated_ids.append(factor_id)
 
     async def _upsert_subset(
         self,
@@ -240,19 +361,20 @@ class FactorRepository:
         current_job_id: int,
         *,
         year_present: bool,
-    ) -> int:
+        result: FactorUpsertResult,
+    ) -> None:
         # Chunk so a COPY-sized batch (INGEST_COPY_BATCH_SIZE, e.g. 50k)
         # handed to this fallback never exceeds driver bind-param limits.
         chunk_size = 1000
         if len(factors) > chunk_size:
-            affected = 0
             for i in range(0, len(factors), chunk_size):
-                affected += await self._upsert_subset(
+                await self._upsert_subset(
                     factors[i : i + chunk_size],
                     current_job_id,
                     year_present=year_present,
+                    result=result,
                 )
-            return affected
+            return
         payload = [
             {
                 **f.model_dump(exclude={"id", "last_seen_job_id"}),
@@ -282,7 +404,7 @@ class FactorRepository:
             index_where = text("year IS NULL")
 
         # Bracket access on excluded avoids the .values name clash with
-        # Insert.values().
+        # Insert.values().  Same unchanged-values guard as the COPY path.
         stmt = stmt.on_conflict_do_update(
             index_elements=index_elements,
             index_where=index_where,
@@ -290,11 +412,15 @@ class FactorRepository:
                 "values": stmt.excluded["values"],
                 "last_seen_job_id": stmt.excluded["last_seen_job_id"],
             },
-        )
-        result = await self.session.execute(stmt)
-        # rowcount is a CursorResult attribute on DML; cast away the
-        # narrower Result[Any] type Pyright infers from session.execute.
-        return getattr(result, "rowcount", 0) or 0
+            where=cast(col(Factor.values), JSONB).is_distinct_from(
+                cast(stmt.excluded["values"], JSONB)
+            ),
+        ).returning(col(Factor.id), literal_column("(xmax = 0)"))
+        for factor_id, inserted in (await self.session.execute(stmt)).all():
+            if inserted:
+                result.inserted_ids.append(factor_id)
+            else:
+                result.updated_ids.append(factor_id)
 
     async def _latest_factor_job_per_det(self, year: int) -> Dict[int, int]:
         """Resolve the most recent ``is_current`` finished FACTORS job that
@@ -309,6 +435,10 @@ class FactorRepository:
         jobs for one year" is small (one per active module / det), so
         loading them in-process is cheap.
 
+        Jobs marked ``stamped_last_seen: False`` are passed over: their
+        upload changed nothing, so they stamped no row either (see
+        ``BaseFactorCSVProvider._stamp_reasserted_factors``).
+
         Returns:
             Map from ``data_entry_type_id`` to the highest job id that
             wrote factors for that det in this year.
@@ -321,6 +451,7 @@ class FactorRepository:
             DataIngestionJob.id,
             DataIngestionJob.module_type_id,
             DataIngestionJob.data_entry_type_id,
+            DataIngestionJob.meta,
         ).where(
             col(DataIngestionJob.year) == year,
             col(DataIngestionJob.target_type) == TargetType.FACTORS,
@@ -332,8 +463,8 @@ class FactorRepository:
         rows = (await self.session.execute(stmt)).all()
 
         latest: Dict[int, int] = {}
-        for job_id, module_type_id, det_id in rows:
-            if job_id is None:
+        for job_id, module_type_id, det_id, meta in rows:
+            if job_id is None or (meta or {}).get("stamped_last_seen") is False:
                 continue
             covered: tuple[int, ...]
             if det_id is not None:
@@ -415,8 +546,8 @@ class FactorRepository:
         if not factor:
             return None
 
-        for field, value in update_data.items():
-            setattr(factor, field, value)
+        for key, value in update_data.items():
+            setattr(factor, key, value)
 
         await self.session.flush()
         await self.session.refresh(factor)
@@ -528,6 +659,16 @@ class FactorRepository:
         result = await self.session.exec(stmt)
         return list(result.all())
 
+    async def list_by_ids(self, factor_ids: list[int]) -> List[Factor]:
+        """Fetch factors by id (chunked ``IN``); unknown ids are skipped."""
+        factors: List[Factor] = []
+        chunk = 10_000
+        for i in range(0, len(factor_ids), chunk):
+            stmt = select(Factor).where(col(Factor.id).in_(factor_ids[i : i + chunk]))
+            result = await self.session.exec(stmt)
+            factors.extend(result.all())
+        return factors
+
     async def list_by_data_entry_type(
         self,
         data_entry_type_id: DataEntryTypeEnum,
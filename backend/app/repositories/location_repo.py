@@ -165,6 +165,18 @@ class LocationRepository:
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
+    async def get_by_natural_keys(self, natural_keys: List[str]) -> List[Location]:
+        """Bulk-fetch locations for a set of natural_keys in one query.
+
+        The train recalc slice's counterpart of ``get_by_iata_codes``.
+        Empty input short-circuits.
+        """
+        if not natural_keys:
+            return []
+        statement = select(Location).where(col(Location.natural_key).in_(natural_keys))
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
+
     async def get_by_iata(self, iata_code: str) -> Optional[Location]:
         """Get location by IATA code."""
         statement = select(Location).where(col(Location.iata_code) == iata_code)
@@ -183,6 +195,20 @@ class LocationRepository:
         result = await self.session.execute(statement)
         return list(result.scalars().all())
 
+    async def list_by_transport_mode(
+        self, transport_mode: TransportModeEnum
+    ) -> List[Location]:
+        """Every location of one transport mode, in a single SELECT.
+
+        Backs the in-memory ``LocationIndex`` a CSV ingest job builds once
+        instead of looking stations up row by row.
+        """
+        statement = select(Location).where(
+            col(Location.transport_mode) == transport_mode
+        )
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
+
     async def find_train_stations_by_name(
         self,
         name: str,
@@ -0,0 +1,303 @@
+"""Module emission totals repository (``module_emission_totals``)."""
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator
+
+from sqlalchemy import case, distinct, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import col, delete, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.carbon_report import CarbonReport, CarbonReportModule
+from app.models.data_entry import DataEntry
+from app.models.data_entry_emission import DataEntryEmission
+from app.models.module_emission_total import ModuleEmissionTotal
+
+# Module / entry ids per statement; keeps the IN lists short.
+_CHUNK = 1000
+
+# (carbon_report_module_id, emission_type_id, year) — the table's key.
+_Key = tuple[int, int, int]
+
+
+@dataclass
+class _Contribution:
+    """What a set of entries adds to one ``module_emission_totals`` row."""
+
+    kg_co2eq: float = 0.0
+    additional_value: float = 0.0
+    additional_count: int = 0
+    entry_count: int = 0
+
+
+def _grouped_emissions() -> Any:
+    """Emissions summed per (module, emission type, year), the way the
+    totals table holds them; callers add the ``WHERE`` on the entries."""
+    return (
+        select(
+            col(DataEntry.carbon_report_module_id),
+            col(DataEntryEmission.emission_type_id),
+            col(CarbonReport.year),
+            func.sum(col(DataEntryEmission.kg_co2eq)),
+            func.sum(col(DataEntryEmission.additional_value)),
+            func.count(col(DataEntryEmission.additional_value)),
+            func.count(distinct(col(DataEntry.id))),
+        )
+        .join(DataEntry, col(DataEntryEmission.data_entry_id) == col(DataEntry.id))
+        .join(
+            CarbonReportModule,
+            col(DataEntry.carbon_report_module_id) == col(CarbonReportModule.id),
+        )
+        .join(
+            CarbonReport,
+            col(CarbonReportModule.carbon_report_id) == col(CarbonReport.id),
+        )
+        .group_by(
+            col(DataEntry.carbon_report_module_id),
+            col(DataEntryEmission.emission_type_id),
+            col(CarbonReport.year),
+        )
+    )
+
+
+class ModuleEmissionTotalRepository:
+    """Repository for the per-module emission totals summary.
+
+    Every write of ``data_entry_emissions`` keeps the summary in step in
+    the same transaction: emission rewrites run inside
+    :meth:`tracking_entries` and entry deletes call
+    :meth:`remove_entries_where` first.  :meth:`refresh_modules` rebuilds
+    modules from scratch and corrects any floating-point drift.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def refresh_modules(self, carbon_report_module_ids: list[int]) -> None:
+        """Rebuild the totals of the given modules from their emissions.
+
+        Per chunk of modules: one DELETE and one INSERT … SELECT with the
+        GROUP BY done server-side, so no emission row leaves the database.
+        Flushes nothing (Core statements) — the caller commits.
+        """
+        ids = sorted(set(carbon_report_module_ids))
+        for i in range(0, len(ids), _CHUNK):
+            chunk = ids[i : i + _CHUNK]
+            await self.session.execute(
+                delete(ModuleEmissionTotal).where(
+                    col(ModuleEmissionTotal.carbon_report_module_id).in_(chunk)
+                )
+            )
+            grouped = (
+                _grouped_emissions()
+                .add_columns(func.current_timestamp())
+                .where(col(DataEntry.carbon_report_module_id).in_(chunk))
+            )
+            await self.session.execute(
+                insert(ModuleEmissionTotal).from_select(
+                    [
+                        "carbon_report_module_id",
+                        "emission_type_id",
+                        "year",
+                        "kg_co2eq",
+                        "additional_value",
+                        "additional_count",
+                        "entry_count",
+                        "updated_at",
+                    ],
+                    grouped,
+                )
+            )
+
+    @asynccontextmanager
+    async def tracking_entries(self, data_entry_ids: list[int]) -> AsyncIterator[None]:
+        """Keep the totals in step with a rewrite of these entries'
+        emissions done inside the block.
+
+        Sums the entries' emissions before and after (server-side, per
+        chunk of ids) and applies the difference, so the cost follows the
+        entries rewritten, not the size of their modules.
+        """
+        ids = sorted(set(data_entry_ids))
+        before = await self._contributions_of(ids)
+        yield
+        after = await self._contributions_of(ids)
+        await self._apply_delta(before, after)
+
+    async def remove_entries_where(self, *where: Any) -> None:
+        """Subtract the entries matching ``where`` (clauses on
+        ``DataEntry``) ahead of their DELETE, whose ON DELETE CASCADE takes
+        their emissions without passing through the repositories."""
+        await self._apply_delta(await self._contributions(*where), {})
+
+    async def _contributions_of(
+        self, data_entry_ids: list[int]
+    ) -> dict[_Key, _Contribution]:
+        totals: dict[_Key, _Contribution] = {}
+        for i in range(0, len(data_entry_ids), _CHUNK):
+            chunk = data_entry_ids[i : i + _CHUNK]
+            for key, part in (
+                await self._contributions(col(DataEntry.id).in_(chunk))
+            ).items():
+                total = totals.setdefault(key, _Contribution())
+                total.kg_co2eq += part.kg_co2eq
+                total.additional_value += part.additional_value
+                total.additional_count += part.additional_count
+                total.entry_count += part.entry_count
+        return totals
+
+    async def _contributions(self, *where: Any) -> dict[_Key, _Contribution]:
+        result = await self.session.execute(_grouped_emissions().where(*where))
+        return {
+            (module_id, emission_type_id, year): _Contribution(
+                kg_co2eq=kg_co2eq or 0.0,
+                additional_value=additional_value or 0.0,
+                additional_count=additional_count,
+                entry_count=entry_count,
+            )
+            for (
+                module_id,
+                emission_type_id,
+                year,
+                kg_co2eq,
+                additional_value,
+                additional_count,
+                entry_count,
+            ) in result.all()
+        }
+
+    async def _apply_delta(
+        self,
+        before: dict[_Key, _Contribution],
+        after: dict[_Key, _Contribution],
+    ) -> None:
+        """Add ``after - before`` to the totals; rows no entry contributes
+        to any more are deleted.
+
+        On PostgreSQL one ``INSERT … ON CONFLICT DO UPDATE`` adds the
+        deltas in place, so concurrent writers to the same module (a
+        recalc chunk and a single-entry edit) cannot lose an update.  The
+        SQLite test harness has a single writer and patches the rows
+        through the ORM.
+        """
+        empty = _Contribution()
+        deltas: dict[_Key, _Contribution] = {}
+        for key in before.keys() | after.keys():
+            was = before.get(key, empty)
+            now_is = after.get(key, empty)
+            delta = _Contribution(
+                kg_co2eq=now_is.kg_co2eq - was.kg_co2eq,
+                additional_value=now_is.additional_value - was.additional_value,
+                additional_count=now_is.additional_count - was.additional_count,
+                entry_count=now_is.entry_count - was.entry_count,
+            )
+            if delta != empty:
+                deltas[key] = delta
+        if not deltas:
+            return
+        now = datetime.now(timezone.utc)
+        if self.session.get_bind().dialect.name == "postgresql":
+            await self._upsert_deltas(deltas, now)
+        else:
+            await self._patch_deltas(deltas, now)
+
+    async def _upsert_deltas(
+        self, deltas: dict[_Key, _Contribution], now: datetime
+    ) -> None:
+        items = sorted(deltas.items())
+        for i in range(0, len(items), _CHUNK):
+            stmt = pg_insert(ModuleEmissionTotal).values(
+                [
+                    {
+                        "carbon_report_module_id": module_id,
+                        "emission_type_id": emission_type_id,
+                        "year": year,
+                        "kg_co2eq": delta.kg_co2eq,
+                        "additional_value": (
+                            delta.additional_value
+                            if delta.additional_count > 0
+                            else None
+                        ),
+                        "additional_count": delta.additional_count,
+                        "entry_count": delta.entry_count,
+                        "updated_at": now,
+                    }
+                    for (module_id, emission_type_id, year), delta in items[
+                        i : i + _CHUNK
+                    ]
+                ]
+            )
+            table = ModuleEmissionTotal.__table__  # type: ignore[attr-defined]
+            additional_count = table.c.additional_count + stmt.excluded.additional_count
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["carbon_report_module_id", "emission_type_id", "year"],
+                set_={
+                    "kg_co2eq": table.c.kg_co2eq + stmt.excluded.kg_co2eq,
+                    "additional_value": case(
+                        (
+                            additional_count > 0,
+                            func.coalesce(table.c.additional_value, 0.0)
+                            + func.coalesce(stmt.excluded.additional_value, 0.0),
+                        ),
+                        else_=None,
+                    ),
+                    "additional_count": additional_count,
+                    "entry_count": table.c.entry_count + stmt.excluded.entry_count,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            await self.session.execute(stmt)
+        module_ids = sorted({key[0] for key in deltas})
+        for i in range(0, len(module_ids), _CHUNK):
+            await self.session.execute(
+                delete(ModuleEmissionTotal).where(
+                    col(ModuleEmissionTotal.carbon_report_module_id).in_(
+                        module_ids[i : i + _CHUNK]
+                    ),
+                    col(ModuleEmissionTotal.entry_count) <= 0,
+                )
+            )
+
+    async def _patch_deltas(
+        self, deltas: dict[_Key, _Contribution], now: datetime
+    ) -> None:
+        module_ids = sorted({key[0] for key in deltas})
+        existing: dict[_Key, ModuleEmissionTotal] = {}
+        for i in range(0, len(module_ids), _CHUNK):
+            rows = await self.session.execute(
+                select(ModuleEmissionTotal).where(
+                    col(ModuleEmissionTotal.carbon_report_module_id).in_(
+                        module_ids[i : i + _CHUNK]
+                    )
+                )
+            )
+            for row in rows.scalars().all():
+                existing[
+                    (row.carbon_report_module_id, row.emission_type_id, row.year)
+                ] = row
+        for key, delta in sorted(deltas.items()):
+            row = existing.get(key)
+            if row is None:
+                module_id, emission_type_id, year = key
+                row = ModuleEmissionTotal(
+                    carbon_report_module_id=module_id,
+                    emission_type_id=emission_type_id,
+                    year=year,
+                )
+            row.kg_co2eq += delta.kg_co2eq
+            row.additional_count += delta.additional_count
+            row.additional_value = (
+                (row.additional_value or 0.0) + delta.additional_value
+                if row.additional_count > 0
+                else None
+            )
+            row.entry_count += delta.entry_count
+            if row.entry_count <= 0:
+                if key in existing:
+                    await self.session.delete(row)
+                continue
+            row.updated_at = now
+            self.session.add(row)
+        await self.session.flush()
@@ -1,4 +1,16 @@
-from typing import Any, Dict, Optional, Protocol, Type, TypeVar, get_args, get_origin
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Protocol,
+    Type,
+    TypeVar,
+    get_args,
+    get_origin,
+)
 
 from pydantic import BaseModel, Field, model_validator
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -103,6 +115,24 @@ class DataEntryResponseGen(DataEntryBase):
 
 # == =========== DTO BASE ================================= #
 
+
+@dataclass(frozen=True)
+class SliceReference:
+    """A per-entry reference lookup a handler declares for slice prefetch.
+
+    ``fields`` are the ``DataEntry.data`` keys holding the lookup keys
+    (e.g. ``origin_natural_key`` / ``destination_natural_key``);
+    ``loader`` resolves a batch of distinct keys in one query and returns
+    ``{key: row}``.  ``BaseModuleHandler.prefetch_slice`` stores the
+    result under ``slice_cache[cache_key]``; keys the loader doesn't
+    return are simply absent (the per-entry "not found" branch).
+    """
+
+    cache_key: str
+    fields: tuple[str, ...]
+    loader: Callable[[AsyncSession, list[Any]], Awaitable[dict[Any, Any]]]
+
+
 T = TypeVar("T", bound=BaseModel, contravariant=True)
 
 
@@ -131,6 +161,9 @@ class ModuleHandler(Protocol[T]):
     kind_label_field: Optional[str] = None
     subkind_label_field: Optional[str] = None
     factor_value_fields: Optional[list[str]] = None
+    slice_references: tuple[SliceReference, ...] = ()
+    csv_parallel_validation: bool = False
+    csv_natural_key: tuple[str, ...] = ()
 
     def to_response(
         self,
@@ -149,10 +182,13 @@ class ModuleHandler(Protocol[T]):
 
     def validate_create(self, payload: dict) -> DataEntryCreate: ...
     def validate_update(self, payload: dict) -> DataEntryUpdate: ...
+    async def prefetch_csv(self, session: AsyncSession) -> dict: ...
     async def enrich_csv_row(
         self,
         data: dict,
         session: AsyncSession,
+        *,
+        csv_cache: Optional[dict] = None,
     ) -> tuple[dict, Optional[str]]: ...
     async def pre_compute(
         self,
@@ -246,6 +282,25 @@ class BaseModuleHandler(metaclass=ModuleHandlerMeta):
     # "standby_usage_hours_per_week"] for equipment).
     factor_value_fields: Optional[list[str]] = None
 
+    # -- Slice reference data --
+    # Per-entry reference lookups ``pre_compute`` would otherwise issue
+    # one query at a time (stations, rooms, ...).  The default
+    # ``prefetch_slice`` bulk-loads every declared reference once per
+    # recalc chunk and hands the maps back through ``slice_cache``.
+    slice_references: tuple[SliceReference, ...] = ()
+
+    # -- CSV ingestion --
+    # Opt-in for the CSV provider's process-pool validation stage
+    # (``INGEST_VALIDATION_WORKERS``): set only when ``validate_create``
+    # and the ``factor_value_fields`` fill are all a row needs — no
+    # ``enrich_csv_row`` / session use — so rows can be validated in
+    # worker processes from a factor-values snapshot.
+    csv_parallel_validation: bool = False
+    # ``data`` fields identifying a row within its module, for the
+    # row-diff re-upload (``INGEST_ROW_DIFF``): a stored row and a CSV row
+    # with the same key are the same entry. Empty opts the type out.
+    csv_natural_key: tuple[str, ...] = ()
+
     # -- Registration --
     # The DataEntryTypeEnum this handler serves. For handlers that cover
     # multiple types, set ``registration_keys`` instead.
@@ -301,12 +356,40 @@ class BaseModuleHandler(metaclass=ModuleHandlerMeta):
     ) -> dict:
         """Per-slice prefetch hook called once before a recalc loops entries.
 
-        Override to bulk-load data that is constant across the whole
-        ``(data_entry_type, year)`` slice (e.g. all airports for plane
-        travel) so ``pre_compute`` reads it from the returned cache instead
-        of re-querying per entry. The dict is passed back into
-        ``pre_compute`` via ``slice_cache``. Empty by default — handlers
-        whose ``pre_compute`` needs no shared state ignore it.
+        Bulk-loads data that is constant across the whole
+        ``(data_entry_type, year)`` slice so ``pre_compute`` reads it from
+        the returned cache instead of re-querying per entry. The dict is
+        passed back into ``pre_compute`` via ``slice_cache``.
+
+        The default resolves the handler's ``slice_references``: one
+        loader call per reference over the distinct keys of ``entries``,
+        stored under its ``cache_key``, plus the slice ``year`` (every
+        entry of a recalc slice belongs to a report of that year, so no
+        per-entry report lookup is needed).  Empty when the handler
+        declares no references — ``pre_compute`` then takes no
+        ``slice_cache`` and keeps its per-entry path.  Override to add
+        non-keyed data (e.g. the plane factor set).
+        """
+        if not self.slice_references:
+            return {}
+        cache: dict = {"year": year}
+        for reference in self.slice_references:
+            keys = {
+                entry.data.get(field) for entry in entries for field in reference.fields
+            }
+            keys.discard(None)
+            keys.discard("")
+            cache[reference.cache_key] = (
+                await reference.loader(session, sorted(keys, key=str)) if keys else {}
+            )
+        return cache
+
+    async def prefetch_csv(self, session: AsyncSession) -> dict:
+        """Per-job prefetch hook called once before the first
+        ``enrich_csv_row`` of a CSV ingest.
+
+        Loads reference data ``enrich_csv_row`` would otherwise query per
+        row; the dict comes back to it as ``csv_cache``.  Empty by default.
         """
         return {}
 
@@ -314,6 +397,8 @@ class BaseModuleHandler(metaclass=ModuleHandlerMeta):
         self,
         data: dict,
         session: AsyncSession,
+        *,
+        csv_cache: Optional[dict] = None,
     ) -> tuple[dict, Optional[str]]:
         """CSV-time data enrichment hook.
 
@@ -321,6 +406,8 @@ class BaseModuleHandler(metaclass=ModuleHandlerMeta):
         construction. Override to compute fields that are derived from CSV
         columns plus DB state (e.g. resolve a train station ``origin_name``
         to its ``origin_natural_key`` via a Location lookup).
+        ``csv_cache`` is this handler's ``prefetch_csv`` result when called
+        from the CSV provider.
 
         Returns:
             ``(enriched_data, error_msg)``. If ``error_msg`` is non-None,
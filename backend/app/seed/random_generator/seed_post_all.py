@@ -29,6 +29,19 @@ rebuild_statements = [
     "ALTER TABLE data_entry_emissions ADD CONSTRAINT "
     "data_entry_emissions_primary_factor_id_fkey FOREIGN KEY (primary_factor_id) "
     "REFERENCES primary_factors (id);",
+    # --- 4. Rebuild the module emission totals from the seeded emissions ---
+    "DELETE FROM module_emission_totals;",
+    "INSERT INTO module_emission_totals (carbon_report_module_id, "
+    "emission_type_id, year, kg_co2eq, additional_value, additional_count, "
+    "entry_count, updated_at) "
+    "SELECT de.carbon_report_module_id, dee.emission_type_id, cr.year, "
+    "SUM(dee.kg_co2eq), SUM(dee.additional_value), "
+    "COUNT(dee.additional_value), COUNT(DISTINCT de.id), now() "
+    "FROM data_entry_emissions dee "
+    "JOIN data_entries de ON de.id = dee.data_entry_id "
+    "JOIN carbon_report_modules crm ON crm.id = de.carbon_report_module_id "
+    "JOIN carbon_reports cr ON cr.id = crm.carbon_report_id "
+    "GROUP BY de.carbon_report_module_id, dee.emission_type_id, cr.year;",
 ]
 
 
@@ -16,6 +16,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.logging import get_logger
 from app.models.audit import AuditChangeTypeEnum, AuditDocument
 from app.repositories.audit_repo import AuditDocumentRepository
+from app.repositories.calculation_input_repo import CalculationInputRepository
 from app.tasks.audit_sync_tasks import sync_audit_records_with_elasticsearch
 
 logger = get_logger(__name__)
@@ -490,21 +491,40 @@ class AuditDocumentService:
 
         return True
 
+    async def _with_stored_values(
+        self, snapshot: Optional[Dict], entity_id: int, values_id: Optional[str]
+    ) -> Optional[Dict]:
+        """Overlay the ``calculation_inputs`` values snapshot on ``snapshot``.
+
+        The stored payload is exactly what the formula read, so it wins
+        over the document version closest to ``computed_at``.
+        """
+        if not values_id:
+            return snapshot
+        stored = await CalculationInputRepository(self.session).get_many([values_id])
+        if values_id not in stored:
+            return snapshot
+        return {**(snapshot or {"id": entity_id}), "values": stored[values_id]}
+
     async def get_factor_snapshot_at_emission(
         self,
         factor_id: int,
         computed_at: datetime,
+        values_id: Optional[str] = None,
     ) -> Optional[Dict]:
         """
         Get the factor values as they were when an emission was computed.
 
         This is the key method for historical traceability - reconstructs
         what inputs were used for a calculation based on document_versions.
+        With ``values_id`` (the emission's ``meta.factors_used[].values_id``)
+        the values come from the ``calculation_inputs`` snapshot instead.
 
         Args:
             self.session: Database self.session
             factor_id: Factor ID
             computed_at: Timestamp when the emission was computed
+            values_id: calculation_inputs id of the factor values used
 
         Returns:
             Factor data snapshot at that time, or None if not found
@@ -523,12 +543,15 @@ class AuditDocumentService:
             entity_id=factor_id,
             timestamp=computed_at,
         )
-        return version.data_snapshot if version else None
+        return await self._with_stored_values(
+            version.data_snapshot if version else None, factor_id, values_id
+        )
 
     async def get_emission_factor_snapshot_at_emission(
         self,
         emission_factor_id: int,
         computed_at: datetime,
+        values_id: Optional[str] = None,
     ) -> Optional[Dict]:
         """
         Get the emission factor (electricity mix, etc.) as it was when computed.
@@ -536,6 +559,7 @@ class AuditDocumentService:
         Args:
             emission_factor_id: Emission factor ID
             computed_at: Timestamp when the emission was computed
+            values_id: calculation_inputs id of the factor values used
 
         Returns:
             Emission factor data snapshot at that time, or None if not found
@@ -545,4 +569,6 @@ class AuditDocumentService:
             entity_id=emission_factor_id,
             timestamp=computed_at,
         )
-        return version.data_snapshot if version else None
+        return await self._with_stored_values(
+            version.data_snapshot if version else None, emission_factor_id, values_id
+        )
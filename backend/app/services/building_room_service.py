@@ -24,6 +24,10 @@ class BuildingRoomService:
             room_name=room_name,
         )
 
+    async def get_rooms_by_names(self, room_names: list[str]) -> list[BuildingRoom]:
+        """Bulk-fetch rooms for many room names in one query."""
+        return await self.repo.get_rooms_by_names(room_names)
+
     async def list_buildings(self) -> list[dict]:
         """Return distinct buildings with location and name."""
         return await self.repo.list_buildings()
@@ -6,17 +6,16 @@ from typing import List, Optional
 from sqlmodel import col, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import get_settings
 from app.core.constants import ModuleStatus
 from app.core.logging import _sanitize_for_log as sanitize
 from app.core.logging import get_logger
-from app.models.carbon_report import CarbonReportModule, CarbonReportType
-from app.models.data_entry import DataEntry
-from app.models.data_entry_emission import (
-    EmissionType,
-    get_all_nodes,
-    get_children,
-    get_subtree_leaves,
+from app.models.carbon_report import (
+    CarbonReportModule,
+    CarbonReportType,
 )
+from app.models.data_entry import DataEntry
+from app.models.data_entry_emission import EMISSION_TYPE_TREE, EmissionType
 from app.models.module_type import (
     ALL_MODULE_TYPE_IDS,
     MODULE_TYPE_TO_EMISSION_ROOTS,
@@ -24,6 +23,7 @@ from app.models.module_type import (
 )
 from app.repositories.carbon_report_module_repo import CarbonReportModuleRepository
 from app.repositories.data_entry_emission_repo import DataEntryEmissionRepository
+from app.repositories.module_emission_total_repo import ModuleEmissionTotalRepository
 from app.schemas.carbon_report import (
     CarbonReportModuleCreate,
     CarbonReportModuleRead,
@@ -55,11 +55,14 @@ def compute_module_stats(
     scope_totals: dict[str, float] = {"scope1": 0.0, "scope2": 0.0, "scope3": 0.0}
 
     # Collect all nodes across all roots for this module
+    tree = EMISSION_TYPE_TREE
     all_nodes: list[EmissionType] = []
     for root in emission_roots:
-        all_nodes.extend(get_all_nodes(root))
+        all_nodes.extend(tree.subtree(root))
 
     # 1. Populate leaf values from DB results + accumulate scope totals
+    leaf_kg: dict[int, float] = {}
+    leaf_additional: dict[int, float] = {}
     for node in all_nodes:
         val = leaf_emissions.get(str(node.value))
         if val is not None and val != 0:
@@ -70,17 +73,20 @@ def compute_module_stats(
         add_val = additional_values.get(str(node.value))
         if add_val is not None and add_val != 0:
             by_additional[str(node.value)] = add_val
-
-    # 2. Compute rollups for non-leaf nodes from their subtree leaves
+        if tree.is_leaf(node):
+            leaf_kg[node.value] = val or 0
+            leaf_additional[node.value] = add_val or 0
+
+    # 2. Compute rollups for non-leaf nodes from their subtree leaves,
+    #    every level in one pass over the leaves
+    rollups = tree.rollup_leaves(leaf_kg)
+    add_rollups = tree.rollup_leaves(leaf_additional)
     for node in all_nodes:
-        if get_children(node):  # non-leaf
-            leaf_ids = get_subtree_leaves(node)
-            rollup = sum(leaf_emissions.get(str(lid), 0) or 0 for lid in leaf_ids)
+        if not tree.is_leaf(node):
+            rollup = rollups[tree.ordinal(node)]
             if rollup != 0:
                 by_et[str(node.value)] = rollup
-            add_rollup = sum(
-                additional_values.get(str(lid), 0) or 0 for lid in leaf_ids
-            )
+            add_rollup = add_rollups[tree.ordinal(node)]
             if add_rollup != 0:
                 by_additional[str(node.value)] = add_rollup
 
@@ -96,6 +102,121 @@ def compute_module_stats(
     }
 
 
+# Below this many kg (or additional-value units) a delta-patched value
+# is float residue of an add/subtract pair, i.e. zero.
+_DELTA_EPSILON = 1e-9
+
+
+def _snap(value: float) -> float:
+    return 0.0 if abs(value) < _DELTA_EPSILON else value
+
+
+def _patch_by_emission_type(
+    stored: dict[str, float],
+    delta: dict[int, float],
+    nodes: dict[int, EmissionType],
+) -> dict[str, float] | None:
+    """One ``by_…`` map of ``compute_module_stats`` after ``delta``.
+
+    Leaves are stored as-is, so they patch exactly.  A non-leaf shows
+    its subtree rollup, or its own rows' total when that rollup is zero
+    (e.g. a rollup-row type with no leaf rows yet); the latter is only
+    known while the rollup *stays* zero, so a rollup that drops to zero
+    returns ``None``.
+    """
+    tree = EMISSION_TYPE_TREE
+    leaves_before = {
+        value: float(stored.get(str(value)) or 0.0)
+        for value, node in nodes.items()
+        if tree.is_leaf(node)
+    }
+    leaves_after = dict(leaves_before)
+    for value, change in delta.items():
+        if value in leaves_after:
+            leaves_after[value] = _snap(leaves_after[value] + change)
+    rollups_before = tree.rollup_leaves(leaves_before)
+    rollups_after = tree.rollup_leaves(leaves_after)
+
+    patched: dict[str, float] = {}
+    for value, node in nodes.items():
+        key = str(value)
+        if value in leaves_after:
+            amount = leaves_after[value]
+        else:
+            ordinal = tree.ordinal(node)
+            amount = _snap(rollups_after[ordinal])
+            if amount == 0:
+                if _snap(rollups_before[ordinal]) != 0:
+                    return None
+                amount = _snap(float(stored.get(key) or 0.0) + delta.get(value, 0.0))
+        if amount != 0:
+            patched[key] = amount
+    return patched
+
+
+def apply_module_stats_delta(
+    stats: dict | None,
+    kg_delta: dict[int, float],
+    additional_delta: dict[int, float],
+    emission_roots: list[EmissionType],
+    entry_count_delta: int = 0,
+) -> dict | None:
+    """Patch a module's stored stats with one data entry's change.
+
+    Args:
+        stats: The module's current ``stats`` (``compute_module_stats``
+            output).
+        kg_delta: {emission_type_id: new − old kg_co2eq} over the entry's
+            emission rows.
+        additional_delta: Same for ``additional_value``.
+        emission_roots: EmissionType roots for this module.
+        entry_count_delta: +1 for a created entry, -1 for a deleted one.
+
+    Returns:
+        The stats ``compute_module_stats`` would build from the emissions
+        table after the change (up to float rounding), or ``None`` when
+        that cannot be derived from ``stats`` alone: no stored stats, a
+        change on a non-leaf type that counts towards a scope, or a
+        rollup dropping to zero.  Callers then recompute in full.
+    """
+    if not isinstance(stats, dict):
+        return None
+    by_et = stats.get("by_emission_type")
+    by_additional = stats.get("by_additional_value")
+    if not isinstance(by_et, dict) or not isinstance(by_additional, dict):
+        return None
+
+    tree = EMISSION_TYPE_TREE
+    nodes = {n.value: n for root in emission_roots for n in tree.subtree(root)}
+    scope_totals = {
+        key: float(stats.get(key) or 0.0) for key in ("scope1", "scope2", "scope3")
+    }
+    for value, change in kg_delta.items():
+        node = nodes.get(value)
+        if node is None or node.scope is None:
+            continue
+        if not tree.is_leaf(node):
+            return None
+        scope_key = f"scope{int(node.scope)}"
+        scope_totals[scope_key] = _snap(scope_totals[scope_key] + change)
+
+    patched_et = _patch_by_emission_type(by_et, kg_delta, nodes)
+    patched_additional = _patch_by_emission_type(by_additional, additional_delta, nodes)
+    if patched_et is None or patched_additional is None:
+        return None
+
+    total = scope_totals["scope1"] + scope_totals["scope2"] + scope_totals["scope3"]
+
+    return {
+        **scope_totals,
+        "total": total,
+        "by_emission_type": patched_et,
+        "by_additional_value": patched_additional,
+        "computed_at": datetime.now(timezone.utc).isoformat(),
+        "entry_count": max(0, int(stats.get("entry_count") or 0) + entry_count_delta),
+    }
+
+
 class CarbonReportModuleService:
     """Service for carbon report module business logic."""
 
@@ -277,7 +398,8 @@ class CarbonReportModuleService:
         entry-count query, then one batched report rollup
         (``recompute_report_stats_many``) over the distinct parent
         reports.  Each refreshed module is also marked IN_PROGRESS (data
-        changed → prior validation is stale).  Returns the number of
+        changed → prior validation is stale) and gets its
+        ``module_emission_totals`` rows rebuilt.  Returns the number of
         modules refreshed.
         """
         if not carbon_report_module_ids:
@@ -316,7 +438,7 @@ class CarbonReportModuleService:
         counts = {module_id: count for module_id, count in count_rows}
 
         now_utc = int(datetime.now(timezone.utc).timestamp())
-        refreshed = 0
+        refreshed_ids: list[int] = []
         report_ids: set[int] = set()
         for module in modules:
             if module.id is None:
@@ -341,8 +463,12 @@ class CarbonReportModuleService:
             module.status = ModuleStatus.IN_PROGRESS
             self.session.add(module)
             report_ids.add(module.carbon_report_id)
-            refreshed += 1
+            refreshed_ids.append(module.id)
         await self.session.flush()
+        refreshed = len(refreshed_ids)
+        # The report / unit total readers sum these instead of the raw
+        # emissions; rebuilt for exactly the modules whose stats were.
+        await ModuleEmissionTotalRepository(self.session).refresh_modules(refreshed_ids)
         logger.info(
             f"Stats recomputed for {refreshed} module(s) (batched), "
             f"{len(report_ids)} report rollup(s) pending"
@@ -363,6 +489,126 @@ class CarbonReportModuleService:
         """
         await self.recompute_stats_many([carbon_report_module_id])
 
+    async def _lock_module(
+        self, carbon_report_module_id: int
+    ) -> Optional[CarbonReportModule]:
+        return (
+            await self.session.execute(
+                select(CarbonReportModule)
+                .where(col(CarbonReportModule.id) == carbon_report_module_id)
+                .with_for_update()
+            )
+        ).scalar_one_or_none()
+
+    async def snapshot_entry_emissions(
+        self, carbon_report_module_id: int, data_entry_id: int
+    ) -> Optional[list[tuple[int, float | None, float | None]]]:
+        """Lock the module's stats and read an entry's emission rows
+        before an edit, for :meth:`apply_entry_stats_delta`.
+
+        The module row stays locked (``FOR UPDATE``) until the caller's
+        transaction ends, so concurrent edits in the same module patch
+        its stats one after the other and never from a stale snapshot.
+        Returns ``None`` when the entry is missing or belongs to another
+        module (its rows must not be patched into this module's stats),
+        and ``[]`` without locking when delta stats are disabled.
+        """
+        if not get_settings().MODULE_STATS_DELTA:
+            return []
+        await self._lock_module(carbon_report_module_id)
+        entry_module_id = (
+            await self.session.execute(
+                select(col(DataEntry.carbon_report_module_id)).where(
+                    col(DataEntry.id) == data_entry_id
+                )
+            )
+        ).scalar_one_or_none()
+        if entry_module_id != carbon_report_module_id:
+            return None
+        return await DataEntryEmissionRepository(
+            self.session
+        ).get_stats_rows_by_data_entry_id(data_entry_id)
+
+    async def apply_entry_stats_delta(
+        self,
+        carbon_report_module_id: int,
+        data_entry_id: int,
+        before: Optional[list[tuple[int, float | None, float | None]]],
+        *,
+        after: Optional[list[tuple[int, float | None, float | None]]] = None,
+        entry_count_delta: int = 0,
+    ) -> None:
+        """Refresh module and report stats after a single-entry edit.
+
+        Subtracts the entry's ``before`` emission rows (from
+        :meth:`snapshot_entry_emissions`; ``[]`` for a new entry) from the
+        module's stored stats and adds its ``after`` rows (read now when
+        not given; ``[]`` for a deleted entry), so the cost does not
+        depend on the module's size.  Same side effects as
+        :meth:`recompute_stats` — IN_PROGRESS status bump and report
+        rollup — which it falls back to when the delta cannot be applied
+        exactly, ``before`` is ``None`` (the entry is not one of this
+        module's) or ``MODULE_STATS_DELTA`` is off.  The module's
+        ``module_emission_totals`` rows were already moved by the emission
+        write or entry delete itself.
+        """
+        if before is None or not get_settings().MODULE_STATS_DELTA:
+            await self.recompute_stats(carbon_report_module_id)
+            return
+        # Local import mirrors ``recompute_stats_many``.
+        from app.services.carbon_report_service import CarbonReportService
+
+        module = await self._lock_module(carbon_report_module_id)
+        if module is None or module.id is None:
+            return
+        emission_roots = MODULE_TYPE_TO_EMISSION_ROOTS.get(
+            ModuleTypeEnum(module.module_type_id)
+        )
+        if not emission_roots:
+            return
+        if after is None:
+            after = await DataEntryEmissionRepository(
+                self.session
+            ).get_stats_rows_by_data_entry_id(data_entry_id)
+
+        kg_delta: dict[int, float] = {}
+        additional_delta: dict[int, float] = {}
+        for sign, rows in ((-1.0, before), (1.0, after)):
+            for emission_type_id, kg_co2eq, additional_value in rows:
+                if kg_co2eq is not None:
+                    kg_delta[emission_type_id] = (
+                        kg_delta.get(emission_type_id, 0.0) + sign * kg_co2eq
+                    )
+                if additional_value is not None:
+                    additional_delta[emission_type_id] = (
+                        additional_delta.get(emission_type_id, 0.0)
+                        + sign * additional_value
+                    )
+
+        stats = apply_module_stats_delta(
+            module.stats,
+            kg_delta,
+            additional_delta,
+            emission_roots,
+            entry_count_delta,
+        )
+        if stats is None:
+            logger.info(
+                f"Stats delta not applicable for module {module.id}, "
+                "recomputing in full"
+            )
+            await self.recompute_stats(module.id)
+            return
+        module.stats = stats
+        module.last_updated = int(datetime.now(timezone.utc).timestamp())
+        # Same as the full recompute: changed data invalidates validation.
+        module.status = ModuleStatus.IN_PROGRESS
+        self.session.add(module)
+        await self.session.flush()
+
+        report_service = CarbonReportService(self.session)
+        await report_service.recompute_report_stats_many([module.carbon_report_id])
+
     async def delete_all_modules_for_report(self, carbon_report_id: int) -> int:
         """Delete all modules for a carbon report. Returns count deleted."""
         return await self.repo.delete_by_report(carbon_report_id)
@@ -1,4 +1,8 @@
-from typing import Optional
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Optional
 
 from sqlalchemy import func
 from sqlmodel import col, select
@@ -6,10 +10,12 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.models.calculation_input import CalculationInputKind, calculation_input_id
 from app.models.carbon_project import CarbonProject
 from app.models.carbon_report import CarbonReport, CarbonReportModule, CarbonReportType
 from app.models.data_entry import DataEntry, DataEntryTypeEnum
 from app.models.data_entry_emission import (
+    EMISSION_TYPE_TREE,
     DataEntryEmission,
     EmissionComputation,
     EmissionType,
@@ -17,9 +23,12 @@ from app.models.data_entry_emission import (
     get_subtree_leaves,
 )
 from app.models.factor import Factor
+from app.repositories.calculation_input_repo import CalculationInputRepository
+from app.repositories.copy_writer import CopyFormat
 from app.repositories.data_entry_emission_repo import (
     DataEntryEmissionRepository,
 )
+from app.repositories.module_emission_total_repo import ModuleEmissionTotalRepository
 from app.schemas.data_entry import BaseModuleHandler, DataEntryResponse
 from app.services.factor_service import FactorService
 from app.utils.data_entry_emission_type_map import (
@@ -43,16 +52,6 @@ logger = get_logger(__name__)
 KG_CO2EQ_OVERRIDE_KEY = "__kg_co2eq_override__"
 
 
-def _emission_depth(et: EmissionType) -> int:
-    """Count parent chain length (0 = root)."""
-    depth = 0
-    p = et.parent
-    while p is not None:
-        depth += 1
-        p = p.parent
-    return depth
-
-
 def _pick_emission_type_id(
     comp_emission_type: EmissionType, factor_emission_type_id: int
 ) -> int:
@@ -66,7 +65,8 @@ def _pick_emission_type_id(
     """
     try:
         factor_et = EmissionType(factor_emission_type_id)
-        if _emission_depth(factor_et) > _emission_depth(comp_emission_type):
+        tree = EMISSION_TYPE_TREE
+        if tree.depth(factor_et) > tree.depth(comp_emission_type):
             return factor_emission_type_id
     except ValueError:
         logger.debug(
@@ -78,12 +78,336 @@ def _pick_emission_type_id(
     return comp_emission_type.value
 
 
+# ``computed_at`` position in a COPY row; everything before it is
+# deterministic in the plan's inputs (see ``_inputs_fingerprint``).
+_COMPUTED_AT_INDEX = 8
+
+# Layout of the stored rows, folded into the inputs fingerprint: bumping
+# it makes the next recalc rewrite every stored set once.  2 = ctx and
+# factor values referenced in ``calculation_inputs`` instead of inlined.
+_ROW_FORMAT = 2
+
+
+def _store_input(
+    inputs: dict[str, tuple[str, dict]],
+    memo: dict[int, str],
+    kind: CalculationInputKind,
+    payload: dict,
+) -> str:
+    """Content id of ``payload``, recorded in ``inputs`` for the store.
+
+    ``memo`` maps ``id(payload)`` to its content id so a dict shared by
+    many rows (a plan's ctx, a cached factor's values) is hashed once;
+    ``inputs`` keeps the payload alive, so its ``id()`` cannot be reused.
+    """
+    content_id = memo.get(id(payload))
+    if content_id is None:
+        content_id = calculation_input_id(payload)
+        memo[id(payload)] = content_id
+        inputs[content_id] = (kind.value, payload)
+    return content_id
+
+
+@dataclass
+class _FactorTerm:
+    """One (computation, factor) pair of a plan, awaiting its kg_co2eq."""
+
+    slot: int
+    comp: EmissionComputation
+    factor: Factor
+    ctx: dict
+    # The resolved emission type the computation was produced for (logs).
+    emission_type: EmissionType
+
+
+@dataclass
+class EmissionPlan:
+    """One entry's emissions with the formula arithmetic still pending.
+
+    ``rows`` holds finished COPY rows (``DataEntryEmissionRepository.copy_row``
+    order) for override emissions and ``None`` placeholders for each
+    ``terms`` entry, so evaluated rows keep the computation order.
+
+    ``fingerprint`` digests every input the rows are derived from (see
+    ``_inputs_fingerprint``); it is stamped on each row so a later recalc
+    can tell an unchanged entry apart without evaluating it.
+
+    ``inputs`` holds the ``calculation_inputs`` payloads the override rows
+    reference, ``{id: (kind, payload)}``.
+    """
+
+    data_entry_id: int
+    rollup_type: EmissionType | None
+    rows: list[tuple | None] = field(default_factory=list)
+    terms: list[_FactorTerm] = field(default_factory=list)
+    fingerprint: str | None = None
+    inputs: dict[str, tuple[str, dict]] = field(default_factory=dict)
+
+
+@dataclass
+class EmissionBatch:
+    """Result of ``evaluate_emission_plans``."""
+
+    # Entries whose plan evaluated cleanly (possibly to zero rows).
+    data_entry_ids: list[int] = field(default_factory=list)
+    # COPY rows for those entries, rollups included.
+    rows: list[tuple] = field(default_factory=list)
+    # data_entry_id → first formula error; these entries produce no rows.
+    failed: dict[int, Exception] = field(default_factory=dict)
+    # ``calculation_inputs`` payloads the rows reference, {id: (kind,
+    # payload)}; must be stored (``CalculationInputRepository.store_many``)
+    # alongside the rows.
+    inputs: dict[str, tuple[str, dict]] = field(default_factory=dict)
+
+
+def _inputs_fingerprint(plan: EmissionPlan, ctx: dict, year: int | None) -> str:
+    """Digest of everything ``plan``'s rows are computed from.
+
+    Covers the enriched ctx (entry data + ``pre_compute`` output), the
+    year, the formula version and row format, every finished override row minus its
+    timestamp, and for each pending term the computation's keys plus the
+    factor's id, type and values.  Two plans with the same digest produce
+    the same rows, so the recalc may keep the stored ones.  Anything not
+    JSON-native (dates, enums, Decimals) is folded in through ``str``.
+    """
+    payload = {
+        "row_format": _ROW_FORMAT,
+        "formula": settings.FORMULA_VERSION_SHA256_SHORT or settings.GIT_SHA or "",
+        "year": year,
+        "ctx": ctx,
+        "rows": [
+            row[:_COMPUTED_AT_INDEX] if row is not None else None for row in plan.rows
+        ],
+        "terms": [
+            (
+                term.slot,
+                term.comp.emission_type.value,
+                term.comp.quantity_key,
+                term.comp.formula_key,
+                term.comp.multiplier_key,
+                term.comp.multiplier_default,
+                getattr(term.comp.formula_func, "__qualname__", None),
+                term.factor.id,
+                term.factor.emission_type_id,
+                term.factor.values,
+            )
+            for term in plan.terms
+        ],
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _key_based_kg(terms: list[_FactorTerm]) -> list[float | None]:
+    """Column-wise ``quantity × ef × multiplier`` for one term group.
+
+    Same arithmetic and None semantics as ``_apply_formula``'s key-based
+    branch, over the whole group at once: the keys and default are read
+    once, then three gathered columns are multiplied in a single pass.
+    Raises on the first non-numeric value; the caller then falls back
+    to per-term evaluation to pin the failure on its entry.
+    """
+    comp = terms[0].comp
+    quantity_key, formula_key = comp.quantity_key, comp.formula_key
+    multiplier_key, multiplier_default = comp.multiplier_key, comp.multiplier_default
+    quantities = [term.ctx.get(quantity_key) for term in terms]
+    efs = [(term.factor.values or {}).get(formula_key) for term in terms]
+    if multiplier_key:
+        multipliers = [
+            (term.factor.values or {}).get(multiplier_key, multiplier_default)
+            for term in terms
+        ]
+        multipliers = [multiplier_default if m is None else m for m in multipliers]
+    else:
+        multipliers = [1.0] * len(terms)
+    kgs = [
+        None if q is None or ef is None else float(q) * float(ef) * float(m)
+        for q, ef, m in zip(quantities, efs, multipliers)
+    ]
+    missing = kgs.count(None)
+    if missing:
+        logger.info(
+            f"Missing required values for emission calculation "
+            f"for key: {quantity_key} or {formula_key} ({missing} rows)"
+        )
+    return kgs
+
+
+def evaluate_emission_plans(
+    plans: list[EmissionPlan],
+    *,
+    apply_formula: Optional[
+        Callable[[dict, dict, EmissionComputation], Optional[float]]
+    ] = None,
+) -> EmissionBatch:
+    """Step 5 of ``prepare_create`` for a whole batch of plans.
+
+    Terms are grouped by (emission_type, quantity_key, formula_key,
+    multiplier_key, multiplier_default, formula_func).  A key-based group
+    is evaluated column-wise by ``_key_based_kg``; ``formula_func`` groups
+    keep the scalar ``_apply_formula`` path.  Per-group constants — the
+    additional-value unit, the emission type picked against each factor
+    type and its scope — are resolved once per group instead of once per
+    row, and rows come out as COPY tuples with no ORM object per row.
+
+    Each row references its entry ctx (``inputs_id``) and factor values
+    (``meta.factors_used[].values_id``) in the ``calculation_inputs``
+    store instead of copying them; the payloads come back in ``inputs``,
+    hashed once per distinct ctx / factor.
+
+    A term that raises fails only its own entry (``failed``); every other
+    entry's rows are kept, matching the recalc's per-entry isolation.
+
+    ``apply_formula`` replaces the scalar path (defaults to
+    ``DataEntryEmissionService._apply_formula``); passing one also routes
+    key-based groups through it, so an overridden formula sees every term.
+    """
+    scalar_formula = apply_formula or DataEntryEmissionService._apply_formula
+    computed_at = datetime.utcnow()
+    failed: dict[int, Exception] = {}
+    inputs: dict[str, tuple[str, dict]] = {}
+    input_memo: dict[int, str] = {}
+    groups: dict[tuple, list[tuple[EmissionPlan, _FactorTerm]]] = {}
+    for plan in plans:
+        for term in plan.terms:
+            comp = term.comp
+            key = (
+                comp.emission_type,
+                comp.quantity_key,
+                comp.formula_key,
+                comp.multiplier_key,
+                comp.multiplier_default,
+                comp.formula_func,
+            )
+            groups.setdefault(key, []).append((plan, term))
+
+    for members in groups.values():
+        terms = [term for _, term in members]
+        comp = terms[0].comp
+        kgs: list[float | None] | None = None
+        if (
+            apply_formula is None
+            and comp.formula_func is None
+            and comp.quantity_key
+            and comp.formula_key
+        ):
+            try:
+                kgs = _key_based_kg(terms)
+            except (TypeError, ValueError):
+                kgs = None  # per-term pass below attributes the failure
+
+        has_unit = additional_value_unit(comp.emission_type) is not None
+        picked: dict[int, tuple[int, object]] = {}
+        for index, (plan, term) in enumerate(members):
+            if plan.data_entry_id in failed:
+                continue
+            factor = term.factor
+            values = factor.values or {}
+            try:
+                if kgs is not None:
+                    per_factor_kg = kgs[index]
+                else:
+                    per_factor_kg = scalar_formula(term.ctx, values, comp)
+                if per_factor_kg is None:
+                    missing_ctx_keys = [
+                        key
+                        for key in [comp.quantity_key, comp.multiplier_key]
+                        if key and term.ctx.get(key) is None
+                    ]
+                    missing_factor_keys = [
+                        key
+                        for key in [comp.formula_key, comp.multiplier_key]
+                        if key and values.get(key) is None
+                    ]
+                    logger.warning(
+                        f"Formula returned None for "
+                        f"emission_type={term.emission_type.name!r} "
+                        f"data_entry_id={plan.data_entry_id!r} - "
+                        f"Missing context keys: {missing_ctx_keys}, "
+                        f"Missing factor keys: {missing_factor_keys}"
+                    )
+                    continue
+                quantity: float | None = None
+                if comp.quantity_key and term.ctx.get(comp.quantity_key) is not None:
+                    base_qty = float(term.ctx[comp.quantity_key])
+                    multiplier = float(
+                        values.get(comp.multiplier_key, comp.multiplier_default)
+                        if comp.multiplier_key
+                        else comp.multiplier_default
+                    )
+                    quantity = base_qty * multiplier
+                if factor.emission_type_id not in picked:
+                    et_id = _pick_emission_type_id(
+                        comp.emission_type, factor.emission_type_id
+                    )
+                    picked[factor.emission_type_id] = (et_id, EmissionType(et_id).scope)
+                et_id, scope = picked[factor.emission_type_id]
+                values_id = (
+                    _store_input(
+                        inputs,
+                        input_memo,
+                        CalculationInputKind.factor_values,
+                        factor.values,
+                    )
+                    if factor.values is not None
+                    else None
+                )
+                plan.rows[term.slot] = (
+                    plan.data_entry_id,
+                    et_id,
+                    factor.id,
+                    per_factor_kg,
+                    quantity if (quantity is not None and has_unit) else None,
+                    scope,
+                    {
+                        "factors_used": [{"id": factor.id, "values_id": values_id}],
+                        "quantity": quantity,
+                        "quantity_unit": values.get("unit"),
+                    },
+                    _store_input(
+                        inputs, input_memo, CalculationInputKind.context, term.ctx
+                    ),
+                    computed_at,
+                    plan.fingerprint,
+                )
+            except Exception as exc:
+                failed[plan.data_entry_id] = exc
+
+    batch = EmissionBatch(failed=failed)
+    for plan in plans:
+        if plan.data_entry_id in failed:
+            continue
+        rows = [row for row in plan.rows if row is not None]
+        if plan.rollup_type is not None and len(rows) > 1:
+            rows.append(
+                (
+                    plan.data_entry_id,
+                    plan.rollup_type.value,
+                    min((r[2] for r in rows if r[2] is not None), default=None),
+                    sum(r[3] or 0.0 for r in rows),
+                    None,
+                    None,
+                    {"is_rollup": True},
+                    None,
+                    computed_at,
+                    plan.fingerprint,
+                )
+            )
+        batch.data_entry_ids.append(plan.data_entry_id)
+        batch.rows.extend(rows)
+        batch.inputs.update(plan.inputs)
+    batch.inputs.update(inputs)
+    return batch
+
+
 class DataEntryEmissionService:
     """Service for data entry business logic."""
 
     def __init__(self, session: AsyncSession):
         self.session = session
         self.repo = DataEntryEmissionRepository(session)
+        self.inputs_repo = CalculationInputRepository(session)
+        self.totals_repo = ModuleEmissionTotalRepository(session)
 
     async def _get_report_for_data_entry(
         self, data_entry: DataEntry | DataEntryResponse
@@ -246,6 +570,10 @@ class DataEntryEmissionService:
         4. ``_fetch_factors``          → look up Factor (Strategy A or B)
         5. ``_apply_formula``         → kg_co2eq = f(ctx, factor.values)
 
+        Steps 1–4 are ``plan_create``; step 5 is ``evaluate_emission_plans``
+        on a batch of one.  The recalc workflow runs the same two halves
+        over a whole chunk, so both paths produce identical rows.
+
         Args:
             data_entry: Fully hydrated data entry with ``data_entry_type``.
             kg_co2eq_override: When set (legacy inline ingestion path),
@@ -262,25 +590,67 @@ class DataEntryEmissionService:
                 preserves Tableau's ``OUT_CO2_CORRECTED`` (and CSV-side
                 overrides) across the async path instead of formula-recomputing.
 
+        The ``calculation_inputs`` payloads the rows reference are stored
+        here, so the rows are ready to insert as returned.
+
         Returns:
             Ready-to-insert ``DataEntryEmission`` rows; empty on any failure.
         """
+        plan = await self.plan_create(
+            data_entry,
+            kg_co2eq_override,
+            year=year,
+            factor_cache=factor_cache,
+            factor_query_cache=factor_query_cache,
+            slice_cache=slice_cache,
+        )
+        if plan is None:
+            return []
+        batch = evaluate_emission_plans([plan], apply_formula=self._apply_formula)
+        if batch.failed:
+            # Single entry: surface the formula error to the caller exactly
+            # as the inline computation used to.
+            raise batch.failed[plan.data_entry_id]
+        await self.inputs_repo.store_many(batch.inputs)
+        return [DataEntryEmissionRepository.from_copy_row(row) for row in batch.rows]
+
+    async def plan_create(
+        self,
+        data_entry: DataEntry | DataEntryResponse,
+        kg_co2eq_override: float | None = None,
+        *,
+        year: int | None = None,
+        factor_cache: dict[int, Factor] | None = None,
+        factor_query_cache: dict | None = None,
+        slice_cache: dict | None = None,
+    ) -> "EmissionPlan | None":
+        """Steps 1–4 of ``prepare_create``: everything up to the arithmetic.
+
+        Does all the per-entry reads (``pre_compute``, factor lookups,
+        percentage-of-last-year overrides) and records one pending term
+        per (computation, factor) pair; the kg_co2eq arithmetic and row
+        assembly are left to ``evaluate_emission_plans`` so a caller can
+        evaluate a whole chunk of plans in grouped passes.
+
+        Returns ``None`` where ``prepare_create`` would return no rows
+        without computing anything (unknown type, no emission types, no id).
+        """
         if not data_entry or data_entry.data_entry_type is None:
             logger.error("DataEntry must have a data_entry_type.")
-            return []
+            return None
 
         emission_types = resolve_emission_types(
             data_entry.data_entry_type, data_entry.data
         )
         if emission_types is None:
             logger.warning(f"Unhandled type: {data_entry.data_entry_type}")
-            return []
+            return None
         if not emission_types:
-            return []
+            return None
 
         if data_entry.id is None:
             logger.error("DataEntry must have an ID before creating emissions.")
-            return []
+            return None
 
         handler = BaseModuleHandler.get_by_type(
             DataEntryTypeEnum(data_entry.data_entry_type)
@@ -306,7 +676,7 @@ class DataEntryEmissionService:
 
         # Build context: data_entry.data enriched with pre-computed values.
         # Strip the reserved override carrier so it never leaks into the
-        # ``meta`` blobs spread from ``ctx`` below; the source dict on the
+        # context stored from ``ctx`` below; the source dict on the
         # data entry is left intact so re-runs remain idempotent.
         ctx: dict = {**data_entry.data}
         ctx.pop(KG_CO2EQ_OVERRIDE_KEY, None)
@@ -348,7 +718,15 @@ class DataEntryEmissionService:
         # Add factor year to context for year-specific formulas
         ctx["_year"] = year
 
-        results: list[DataEntryEmission] = []
+        plan = EmissionPlan(
+            data_entry_id=data_entry.id,
+            rollup_type=DATA_ENTRY_TYPE_TO_ROLLUP_EMISSION.get(
+                DataEntryTypeEnum(data_entry.data_entry_type)
+            ),
+        )
+        # Content ids for the override rows' store references (see
+        # ``_store_input``); formula rows get theirs when evaluated.
+        input_memo: dict[int, str] = {}
 
         for emission_type in emission_types:
             computations = handler.resolve_computations(data_entry, emission_type, ctx)
@@ -368,21 +746,29 @@ class DataEntryEmissionService:
                         report=report,
                     )
                     if override_kg is not None:
-                        results.append(
-                            DataEntryEmission(
-                                data_entry_id=data_entry.id,
-                                emission_type_id=emission_type.value,
-                                primary_factor_id=None,
-                                scope=emission_type.scope,
-                                kg_co2eq=float(override_kg),
-                                meta={
+                        plan.rows.append(
+                            (
+                                data_entry.id,
+                                emission_type.value,
+                                None,
+                                float(override_kg),
+                                None,
+                                emission_type.scope,
+                                {
                                     "factors_used": [],
                                     "percentage_of_last_year": data_entry.data.get(
                                         "percentage_of_last_year"
                                     ),
                                     "reference_year": report.reference_year,
-                                    **ctx,
                                 },
+                                _store_input(
+                                    plan.inputs,
+                                    input_memo,
+                                    CalculationInputKind.context,
+                                    ctx,
+                                ),
+                                datetime.utcnow(),
+                                None,  # fingerprint, stamped below
                             )
                         )
                         continue
@@ -394,112 +780,64 @@ class DataEntryEmissionService:
                         f"emission_type={emission_type.name!r} "
                         f"data_entry_id={data_entry.id!r}"
                     )
-                    results.append(
-                        DataEntryEmission(
-                            data_entry_id=data_entry.id,
-                            emission_type_id=comp.emission_type.value,
-                            primary_factor_id=None,
-                            kg_co2eq=float(effective_override),
-                            scope=comp.emission_type.scope,
-                            meta={
+                    plan.rows.append(
+                        (
+                            data_entry.id,
+                            comp.emission_type.value,
+                            None,
+                            float(effective_override),
+                            None,
+                            comp.emission_type.scope,
+                            {
                                 "factors_used": [
-                                    {"id": factor.id, "values": factor.values}
+                                    {
+                                        "id": factor.id,
+                                        "values_id": (
+                                            _store_input(
+                                                plan.inputs,
+                                                input_memo,
+                                                CalculationInputKind.factor_values,
+                                                factor.values,
+                                            )
+                                            if factor.values is not None
+                                            else None
+                                        ),
+                                    }
                                     for factor in factors
                                 ],
-                                **ctx,
                             },
+                            _store_input(
+                                plan.inputs,
+                                input_memo,
+                                CalculationInputKind.context,
+                                ctx,
+                            ),
+                            datetime.utcnow(),
+                            None,  # fingerprint, stamped below
                         )
                     )
                     continue
 
                 for factor in factors:
-                    per_factor_kg = self._apply_formula(ctx, factor.values or {}, comp)
-                    if per_factor_kg is None:
-                        missing_ctx_keys = [
-                            key
-                            for key in [comp.quantity_key, comp.multiplier_key]
-                            if key and ctx.get(key) is None
-                        ]
-                        missing_factor_keys = [
-                            key
-                            for key in [comp.formula_key, comp.multiplier_key]
-                            if key and (factor.values or {}).get(key) is None
-                        ]
-                        logger.warning(
-                            f"Formula returned None for "
-                            f"emission_type={emission_type.name!r} "
-                            f"data_entry_id={data_entry.id!r} - "
-                            f"Missing context keys: {missing_ctx_keys}, "
-                            f"Missing factor keys: {missing_factor_keys}"
-                        )
-                        continue
-                    quantity: float | None = None
-                    if comp.quantity_key and ctx.get(comp.quantity_key) is not None:
-                        base_qty = float(ctx[comp.quantity_key])
-                        multiplier = float(
-                            (factor.values or {}).get(
-                                comp.multiplier_key, comp.multiplier_default
-                            )
-                            if comp.multiplier_key
-                            else comp.multiplier_default
-                        )
-                        quantity = base_qty * multiplier
-                    quantity_unit: str | None = (factor.values or {}).get("unit")
-                    _et_id = _pick_emission_type_id(
-                        comp.emission_type, factor.emission_type_id
-                    )
-                    additional_value: float | None = (
-                        quantity
-                        if (
-                            quantity is not None
-                            and additional_value_unit(comp.emission_type) is not None
-                        )
-                        else None
-                    )
-                    results.append(
-                        DataEntryEmission(
-                            data_entry_id=data_entry.id,
-                            emission_type_id=_et_id,
-                            primary_factor_id=factor.id,
-                            kg_co2eq=per_factor_kg,
-                            additional_value=additional_value,
-                            scope=EmissionType(_et_id).scope,
-                            meta={
-                                "factors_used": [
-                                    {"id": factor.id, "values": factor.values}
-                                ],
-                                "quantity": quantity,
-                                "quantity_unit": quantity_unit,
-                                **ctx,
-                            },
+                    # Slot reserved now so evaluated rows keep the
+                    # computation order; filled (or dropped on a None
+                    # formula result) by ``evaluate_emission_plans``.
+                    plan.terms.append(
+                        _FactorTerm(
+                            slot=len(plan.rows),
+                            comp=comp,
+                            factor=factor,
+                            ctx=ctx,
+                            emission_type=emission_type,
                         )
                     )
+                    plan.rows.append(None)
 
-        rollup_type = DATA_ENTRY_TYPE_TO_ROLLUP_EMISSION.get(
-            DataEntryTypeEnum(data_entry.data_entry_type)
-        )
-        if rollup_type is not None and len(results) > 1:
-            total_kg = sum(r.kg_co2eq or 0.0 for r in results)
-            primary_factor_id = min(
-                (
-                    r.primary_factor_id
-                    for r in results
-                    if r.primary_factor_id is not None
-                ),
-                default=None,
-            )
-            results.append(
-                DataEntryEmission(
-                    data_entry_id=data_entry.id,
-                    emission_type_id=rollup_type.value,
-                    primary_factor_id=primary_factor_id,
-                    kg_co2eq=total_kg,
-                    scope=None,
-                    meta={"is_rollup": True},
-                )
-            )
-
-        return results
+        plan.fingerprint = _inputs_fingerprint(plan, ctx, year)
+        plan.rows = [
+            row if row is None else (*row[:-1], plan.fingerprint) for row in plan.rows
+        ]
+        return plan
 
     async def _fetch_factors(
         self,
@@ -654,8 +992,8 @@ class DataEntryEmissionService:
 
         return result
 
+    @staticmethod
     def _apply_formula(
-        self,
         ctx: dict,
         factor_values: dict,
         comp: EmissionComputation,
@@ -705,14 +1043,16 @@ class DataEntryEmissionService:
         if not emission_records:
             return []
 
-        created_emissions = await self.repo.bulk_create(emission_records)
-        return created_emissions
+        return await self.bulk_create(emission_records)
 
     async def bulk_create(
         self, emission_records: list[DataEntryEmission]
     ) -> list[DataEntryEmission]:
         """Create emissions for multiple data entries, if applicable."""
-        created_emissions = await self.repo.bulk_create(emission_records)
+        async with self.totals_repo.tracking_entries(
+            [r.data_entry_id for r in emission_records if r.data_entry_id is not None]
+        ):
+            created_emissions = await self.repo.bulk_create(emission_records)
         return created_emissions
 
     async def bulk_replace_for_entries(
@@ -730,8 +1070,39 @@ class DataEntryEmissionService:
         """
         if not data_entry_ids:
             return 0
-        await self.repo.delete_by_data_entry_ids(data_entry_ids)
-        return await self.repo.bulk_copy(emissions)
+        async with self.totals_repo.tracking_entries(data_entry_ids):
+            await self.repo.delete_by_data_entry_ids(data_entry_ids)
+            return await self.repo.bulk_copy(emissions, self._copy_format())
+
+    async def bulk_replace_rows_for_entries(
+        self,
+        data_entry_ids: list[int],
+        rows: list[tuple],
+        inputs: dict[str, tuple[str, dict]] | None = None,
+    ) -> int:
+        """``bulk_replace_for_entries`` for emissions already encoded as
+        COPY rows (``DataEntryEmissionRepository.copy_row``) — the shape
+        the sharded recalc's worker processes hand back.
+
+        ``inputs`` (``EmissionBatch.inputs``) are the ``calculation_inputs``
+        payloads the rows reference; ids already stored are skipped."""
+        if not data_entry_ids:
+            return 0
+        await self.inputs_repo.store_many(inputs or {})
+        async with self.totals_repo.tracking_entries(data_entry_ids):
+            await self.repo.delete_by_data_entry_ids(data_entry_ids)
+            return await self.repo.bulk_copy_rows(rows, self._copy_format())
+
+    @staticmethod
+    def _copy_format() -> CopyFormat:
+        """Wire format of the recalc's emission COPY (``BULK_COPY_BINARY``)."""
+        return CopyFormat.binary if settings.BULK_COPY_BINARY else CopyFormat.text
+
+    async def get_inputs_fingerprints(
+        self, data_entry_ids: list[int]
+    ) -> dict[int, str]:
+        """Stored ``inputs_fingerprint`` per entry (see the repository)."""
+        return await self.repo.get_inputs_fingerprints(data_entry_ids)
 
     async def upsert_by_data_entry(
         self, data_entry_response: DataEntryResponse
@@ -743,16 +1114,15 @@ class DataEntryEmissionService:
         """
         # Prepare the emission records
         prepared_emissions = await self.prepare_create(data_entry_response)
-        if not prepared_emissions:
+        async with self.totals_repo.tracking_entries([data_entry_response.id]):
+            # Delete existing emissions
             await self.repo.delete_by_data_entry_id(data_entry_response.id)
-            await self.session.flush()
-            return None
-
-        # Delete existing emissions
-        await self.repo.delete_by_data_entry_id(data_entry_response.id)
+            if not prepared_emissions:
+                await self.session.flush()
+                return None
 
-        # Create new emissions
-        created_emissions = await self.repo.bulk_create(prepared_emissions)
+            # Create new emissions
+            created_emissions = await self.repo.bulk_create(prepared_emissions)
         return created_emissions
 
     async def get_stats(
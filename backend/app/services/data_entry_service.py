@@ -7,12 +7,14 @@ from typing import Any, Optional
 from fastapi import BackgroundTasks
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import get_settings
 from app.core.logging import _sanitize_for_log as sanitize
 from app.core.logging import get_logger
 from app.models.audit import AuditChangeTypeEnum
 from app.models.data_entry import DataEntry, DataEntryTypeEnum
 
 # from app.repositories.headcount_repo import HeadCountRepository
+from app.repositories.copy_writer import CopyFormat
 from app.repositories.data_entry_repo import DataEntryRepository
 from app.schemas.carbon_report_response import (
     ModuleResponse,
@@ -75,6 +77,18 @@ class DataEntryService:
             exclude_id=exclude_id,
         )
 
+    async def get_taken_institutional_ids(
+        self, carbon_report_module_ids: list[int], uids: list[str]
+    ) -> set[tuple[int, str]]:
+        """Batched :meth:`check_institutional_id_unique`: the
+        ``(carbon_report_module_id, uid)`` pairs already used by a member."""
+        return await self.repo.get_taken_json_field_values(
+            carbon_report_module_ids=carbon_report_module_ids,
+            data_entry_type_id=DataEntryTypeEnum.member.value,
+            field="user_institutional_id",
+            values=uids,
+        )
+
     async def get_stats_by_carbon_report_id(
         self,
         carbon_report_id: int,
@@ -292,7 +306,10 @@ class DataEntryService:
                 entry.source = source.value if hasattr(source, "value") else source
             if created_by_id is not None:
                 entry.created_by_id = created_by_id
-        count = await self.repo.bulk_copy(data_entries)
+        count = await self.repo.bulk_copy(
+            data_entries,
+            CopyFormat.binary if get_settings().BULK_COPY_BINARY else CopyFormat.text,
+        )
         logger.info(f"COPY-inserted {count} data entries (job {sanitize(job_id)})")
         return count
 
@@ -1,10 +1,18 @@
 import asyncio
+import codecs
 import csv
+import hashlib
 import io
+import json
+import multiprocessing
 import time
 import urllib.parse
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
 from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, TypedDict
 
 from sqlmodel import col, select
@@ -29,6 +37,7 @@ from app.models.data_ingestion import (
 from app.models.module_type import MODULE_TYPE_TO_DATA_ENTRY_TYPES, ModuleTypeEnum
 from app.models.unit import Unit
 from app.models.user import User
+from app.repositories.data_entry_repo import DataEntryRepository
 from app.repositories.data_ingestion import DataIngestionRepository
 from app.repositories.unit_repo import UnitRepository
 from app.schemas.carbon_report import CarbonReportCreate
@@ -45,7 +54,10 @@ from app.services.data_entry_emission_service import (
 )
 from app.services.data_entry_service import DataEntryService
 from app.services.data_ingestion.base_provider import DataIngestionProvider
-from app.services.module_handler_service import ModuleHandlerService
+from app.services.module_handler_service import (
+    ModuleHandlerService,
+    fill_factor_defaults,
+)
 from app.services.unit_service import UnitService
 from app.services.user_service import UserService
 
@@ -57,6 +69,64 @@ logger = get_logger(__name__)
 # hammering the session.
 PROGRESS_REPORT_INTERVAL_S = 2.0
 
+# Upper bound on ``changed_entry_ids`` a row-diff upload records.  Past
+# it the chained recalc gets ``None`` (full slice), as with
+# ``CHANGED_FACTOR_IDS_META_CAP``.
+CHANGED_ENTRY_IDS_META_CAP = 10_000
+
+
+# Bytes per step of the up-front encoding check.
+_DECODE_CHECK_STEP = 1 << 16
+
+
+def open_csv(content: str | bytes) -> io.TextIOBase:
+    """Text stream over CSV ``content`` for ``csv`` readers.
+
+    Bytes are decoded incrementally (``utf-8-sig`` drops a BOM) as the
+    reader pulls lines, so no decoded copy of the whole file is built.
+    Run ``check_csv_encoding`` first when rows get written as they are
+    read.
+    """
+    if isinstance(content, str):
+        return io.StringIO(content, newline="")
+    return io.TextIOWrapper(io.BytesIO(content), encoding="utf-8-sig", newline="")
+
+
+def check_csv_encoding(content: str | bytes) -> None:
+    """Raise ``UnicodeDecodeError`` unless ``content`` is valid UTF-8.
+
+    ``open_csv`` decodes lazily, so a bad byte deep in the file would
+    only surface after earlier batches were committed.  This decodes the
+    whole file up front, step by step, and keeps none of the text.
+    """
+    if isinstance(content, str):
+        return
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    view = memoryview(content)
+    for start in range(0, len(view), _DECODE_CHECK_STEP):
+        decoder.decode(view[start : start + _DECODE_CHECK_STEP])
+    decoder.decode(b"", final=True)
+
+
+def _scan_column(content: str | bytes, column: str) -> set[str]:
+    """Distinct stripped, non-empty values of one CSV column.
+
+    Key-only pass: plain ``csv.reader`` rows, no per-row dict.  Like
+    ``DictReader``, a repeated header name resolves to its last column.
+    """
+    reader = csv.reader(open_csv(content))
+    header = next(reader, None)
+    if not header or column not in header:
+        return set()
+    index = len(header) - 1 - header[::-1].index(column)
+    values: set[str] = set()
+    for row in reader:
+        if len(row) > index:
+            value = row[index].strip()
+            if value:
+                values.add(value)
+    return values
+
 
 def _is_blank_data_row(row: Dict[str, str], required_columns: set[str]) -> bool:
     """Return True when every required column is empty or absent in the raw row."""
@@ -101,6 +171,111 @@ class StatsDict(TypedDict):
     row_errors_count: int
 
 
+@dataclass(frozen=True)
+class _PendingMember:
+    """A batched member row awaiting the database uniqueness check."""
+
+    batch_index: int
+    row_idx: int
+    carbon_report_module_id: int
+    uid: str
+    has_factor: bool
+
+
+@dataclass(frozen=True)
+class _PreparedRow:
+    """A CSV row resolved up to its ``validate_create`` payload."""
+
+    row_idx: int
+    handler: Any
+    data_entry_type: DataEntryTypeEnum
+    carbon_report_module_id: int
+    payload: Dict[str, Any]
+    primary_factor_id: int | None
+    kg_co2eq_override: float | None
+
+
+def _data_digest(data: dict) -> str:
+    """Content hash of a ``DataEntry.data`` dict, key order insensitive."""
+    encoded = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class _RowDiff:
+    """The stored rows of a per-year scope, matched against a re-upload.
+
+    Rows are keyed on (module, type, ``csv_natural_key`` values); a key
+    with several stored rows hands them out in id order, an identical
+    one first. Stored rows without a full key never match and go with
+    the rows the upload no longer has.
+    """
+
+    natural_key: tuple[str, ...]
+    stored: Dict[tuple, List[tuple[int, str]]] = field(default_factory=dict)
+    unkeyed: List[tuple[int, int]] = field(default_factory=list)
+    pending_updates: Dict[int, dict] = field(default_factory=dict)
+    updated_ids: List[int] = field(default_factory=list)
+    touched_modules: set[int] = field(default_factory=set)
+    unchanged: int = 0
+
+    def _key(self, module_id: int, type_id: int, data: dict) -> Optional[tuple]:
+        values = tuple(str(data.get(name) or "").strip() for name in self.natural_key)
+        if not all(values):
+            return None
+        return (module_id, type_id, *values)
+
+    def add_stored(
+        self, entry_id: int, module_id: int, type_id: int, data: dict
+    ) -> None:
+        key = self._key(module_id, type_id, data)
+        if key is None:
+            self.unkeyed.append((entry_id, module_id))
+            return
+        self.stored.setdefault(key, []).append((entry_id, _data_digest(data)))
+
+    def match(self, entry: DataEntry) -> bool:
+        """Whether a stored row takes ``entry`` — kept as is when its data
+        is identical, else queued as an update of that row's ``data``.
+        False for a new row, which is inserted."""
+        module_id = entry.carbon_report_module_id
+        if module_id is None or not entry.data:
+            return False
+        key = self._key(module_id, int(entry.data_entry_type_id), entry.data)
+        candidates = self.stored.get(key) if key is not None else None
+        if not candidates:
+            return False
+        digest = _data_digest(entry.data)
+        for index, (_, stored_digest) in enumerate(candidates):
+            if stored_digest == digest:
+                del candidates[index]
+                self.unchanged += 1
+                return True
+        entry_id, _ = candidates.pop(0)
+        self.pending_updates[entry_id] = entry.data
+        self.updated_ids.append(entry_id)
+        self.touched_modules.add(module_id)
+        return True
+
+    def take_updates(self) -> Dict[int, dict]:
+        updates, self.pending_updates = self.pending_updates, {}
+        return updates
+
+    def unmatched(self) -> List[tuple[int, int]]:
+        """``(id, module id)`` of the stored rows no CSV row matched."""
+        rows = list(self.unkeyed)
+        for key, candidates in self.stored.items():
+            rows.extend((entry_id, key[0]) for entry_id, _ in candidates)
+        return rows
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    """``data_entries`` timestamps are naive UTC; job timestamps are aware."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 def _get_expected_columns_from_handlers(handlers: list[Any]) -> set[str]:
     expected_columns: set[str] = set()
     for handler in handlers:
@@ -193,6 +368,8 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
         self._module_to_unit_id: Dict[int, int] = {}
         # Cache for carbon_report_module_id -> year mapping (avoid per-row DB queries)
         self._year_cache: Dict[int, int] = {}
+        # handler -> its prefetch_csv() result, loaded on first use per job
+        self._csv_caches: Dict[Any, dict] = {}
         # Progress reporting: current phase label + throttle/rate bookkeeping.
         self._phase = ""
         self._phase_started_at = 0.0
@@ -284,7 +461,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
 
     async def _validate_csv_headers(
         self,
-        csv_text: str,
+        csv_content: str | bytes,
         expected_columns: set[str],
         required_columns: set[str],
     ) -> None:
@@ -292,14 +469,21 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
         Validate CSV headers by checking first 5 rows.
         Fails if ALL first rows are missing required columns.
         In strict mode, also fails if expected columns are missing.
+        Also rejects a file that is not valid UTF-8, before any row is
+        written.
 
         Raises ValueError if validation fails.
         """
         strict_mode = self.config.get("strict_column_validation", False)
         rows_to_check = 5
 
+        try:
+            check_csv_encoding(csv_content)
+        except UnicodeDecodeError as e:
+            raise ValueError(f"CSV is not valid UTF-8: {e}")
+
         # Validate using a separate reader
-        validation_reader = csv.DictReader(io.StringIO(csv_text, newline=""))
+        validation_reader = csv.DictReader(open_csv(csv_content))
         first_rows = []
 
         try:
@@ -541,11 +725,16 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
         """
         pass
 
-    async def _resolve_carbon_report_modules(self, csv_text: str) -> Dict[str, int]:
+    async def _resolve_carbon_report_modules(
+        self, csv_content: str | bytes
+    ) -> Dict[str, int]:
         """
         Pre-scan CSV to extract unique unit_ids (institutional_ids)
         and resolve carbon_report_module_id.
 
+        The pre-scan reads only the unit column (``_scan_column``); the
+        full row parse happens once, in ``process_csv_in_batches``.
+
         Note: CSV column is named 'unit_institutional_id'
 
         For each unique institutional_id:
@@ -600,12 +789,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
 
         # Extract unique unit institutional_ids from CSV
         # (column is named 'unit_institutional_id' to be explicit)
-        csv_reader = csv.DictReader(io.StringIO(csv_text, newline=""))
-        unit_codes = set()
-        for row in csv_reader:
-            unit_code = row.get("unit_institutional_id")
-            if unit_code and unit_code.strip():
-                unit_codes.add(unit_code.strip())
+        unit_codes = _scan_column(csv_content, "unit_institutional_id")
 
         if not unit_codes:
             raise ValueError(
@@ -750,15 +934,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
             logger.info("No job module_type_id — skipping pre-import deletion")
             return
 
-        module_type = ModuleTypeEnum(self.job.module_type_id)
-        # If the job targets a specific data_entry_type_id, only delete
-        # entries for that type. Deleting all types for the module would
-        # wipe sibling submodules (e.g. uploading research_facilities
-        # data would erase mice_and_fish_animal_facilities entries).
-        if self.job.data_entry_type_id is not None:
-            valid_entry_types = [DataEntryTypeEnum(self.job.data_entry_type_id)]
-        else:
-            valid_entry_types = MODULE_TYPE_TO_DATA_ENTRY_TYPES.get(module_type, [])
+        valid_entry_types = self._replaced_entry_types()
 
         if self.year is None:
             raise ValueError("year is required for MODULE_PER_YEAR deletion")
@@ -779,6 +955,237 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
             f"(year={self.year}, {len(valid_entry_types)} types, full replace)"
         )
 
+    def _replaced_entry_types(self) -> List[DataEntryTypeEnum]:
+        """Data entry types a MODULE_PER_YEAR upload replaces.
+
+        If the job targets a specific data_entry_type_id, only that type.
+        Deleting all types for the module would wipe sibling submodules
+        (e.g. uploading research_facilities data would erase
+        mice_and_fish_animal_facilities entries).
+        """
+        if self.job is None or not self.job.module_type_id:
+            return []
+        if self.job.data_entry_type_id is not None:
+            return [DataEntryTypeEnum(self.job.data_entry_type_id)]
+        module_type = ModuleTypeEnum(self.job.module_type_id)
+        return list(MODULE_TYPE_TO_DATA_ENTRY_TYPES.get(module_type, []))
+
+    async def _load_row_diff(
+        self,
+        setup_result: Dict[str, Any],
+        data_entry_service: DataEntryService,
+    ) -> Optional[_RowDiff]:
+        """The stored rows a per-year upload is diffed against, or None to
+        replace the scope as usual.
+
+        Only with ``INGEST_ROW_DIFF`` and when every handler of the upload
+        declares the same non-empty ``csv_natural_key``.
+        """
+        handlers = setup_result["handlers"]
+        natural_keys = {tuple(h.csv_natural_key) for h in handlers}
+        if (
+            not get_settings().INGEST_ROW_DIFF
+            or self.year is None
+            or not (self.job and self.job.module_type_id)
+            or len(natural_keys) != 1
+        ):
+            return None
+        (natural_key,) = natural_keys
+        if not natural_key:
+            return None
+        self._enter_phase("Loading previous entries")
+        await self._report("Loading previous entries", force=True)
+        row_diff = _RowDiff(natural_key=natural_key)
+        async for rows in data_entry_service.repo.iter_source_year_rows(
+            year=self.year,
+            data_entry_type_ids=[t.value for t in self._replaced_entry_types()],
+            source=DataEntrySourceEnum.CSV_MODULE_PER_YEAR.value,
+        ):
+            for entry_id, module_id, type_id, data in rows:
+                row_diff.add_stored(entry_id, module_id, type_id, data)
+        return row_diff
+
+    async def _apply_row_diff(
+        self,
+        row_diff: _RowDiff,
+        data_entry_service: DataEntryService,
+    ) -> Dict[str, Any]:
+        """Write the rest of a row-diff upload and report what changed.
+
+        The pending updates are applied and the stored rows no CSV row
+        matched are deleted; the inserted rows went through the COPY
+        batches and are read back by ``created_by_id``.
+        """
+        repo = data_entry_service.repo
+        await repo.bulk_update_data(row_diff.take_updates())
+        removed = row_diff.unmatched()
+        deleted = await repo.delete_by_ids([entry_id for entry_id, _ in removed])
+        inserted_ids = await repo.list_ids_created_by(
+            created_by_id=self.job_id,
+            year=self.year,
+            source=DataEntrySourceEnum.CSV_MODULE_PER_YEAR.value,
+        )
+        changed_entry_ids = sorted({*row_diff.updated_ids, *inserted_ids})
+        changed_module_ids = row_diff.touched_modules | {m for _, m in removed}
+        logger.info(
+            f"Row diff (year={self.year}): {row_diff.unchanged} unchanged, "
+            f"{len(row_diff.updated_ids)} updated, {len(inserted_ids)} inserted, "
+            f"{deleted} deleted"
+        )
+        return {
+            "row_diff": {
+                "unchanged": row_diff.unchanged,
+                "updated": len(row_diff.updated_ids),
+                "inserted": len(inserted_ids),
+                "deleted": deleted,
+            },
+            "changed_entry_ids": (
+                changed_entry_ids
+                if len(changed_entry_ids) <= CHANGED_ENTRY_IDS_META_CAP
+                else None
+            ),
+            "changed_module_ids": sorted(changed_module_ids),
+        }
+
+    def _upload_fingerprint(self, setup_result: Dict[str, Any]) -> str:
+        """SHA-256 over everything a per-year upload's rows derive from.
+
+        The file's own SHA-256, the provider and scope (target, entity
+        type, module type, configured data entry type, year, module), the
+        formula version, and the factors loaded for the upload — their
+        map keys drive type inference and ``primary_factor_id``, their
+        values the ``factor_value_fields`` defaults.
+        """
+        settings = get_settings()
+        payload = {
+            "content_sha256": setup_result["content_sha256"],
+            "provider": type(self).__name__,
+            "target_type": self.target_type.value,
+            "entity_type": self.entity_type.value,
+            "module_type_id": self.job.module_type_id if self.job else None,
+            "data_entry_type_id": self.config.get("data_entry_type_id"),
+            "year": self.year,
+            "carbon_report_module_id": self.carbon_report_module_id,
+            "formula": settings.FORMULA_VERSION_SHA256_SHORT or settings.GIT_SHA or "",
+            "factors": sorted(
+                (key, getattr(factor, "id", None), getattr(factor, "values", None))
+                for key, factor in setup_result["factors_map"].items()
+            ),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    async def _identical_upload_source(self, fingerprint: str) -> Optional[int]:
+        """Id of the job whose rows this per-year upload would rewrite
+        unchanged, or None to ingest normally.
+
+        Only when all of these hold:
+
+        - the combo's previous finished run succeeded with the same
+          ``upload_fingerprint``;
+        - the pipeline that wrote the rows (that run's, or the original
+          ingest's when it was itself skipped) finished without error, so
+          its recalc and aggregation are in place;
+        - the replaced scope still holds exactly that job's rows, none
+          updated after the pipeline settled (no edit or delete since).
+        """
+        if self.job is None or self.job.id is None or not self.year:
+            return None
+        previous = await self.repo.get_previous_finished_in_combo(self.job)
+        if previous is None or previous.result != IngestionResult.SUCCESS:
+            return None
+        previous_meta = previous.meta or {}
+        if previous_meta.get("upload_fingerprint") != fingerprint:
+            return None
+        source: Optional[Any] = previous
+        if previous_meta.get("identical_to_job_id") is not None:
+            source = await self.repo.get_job_by_id(
+                int(previous_meta["identical_to_job_id"])
+            )
+        if source is None or source.id is None or source.pipeline_id is None:
+            return None
+        inserted = (source.meta or {}).get("inserted")
+        if inserted is None:
+            return None
+
+        pipeline_jobs = await self.repo.list_jobs_by_pipeline_id(source.pipeline_id)
+        if any(
+            j.state != IngestionState.FINISHED or j.result == IngestionResult.ERROR
+            for j in pipeline_jobs
+        ):
+            return None
+        settled_at = max(
+            (j.finished_at for j in pipeline_jobs if j.finished_at is not None),
+            default=None,
+        )
+        if settled_at is None:
+            return None
+
+        total, written_by_source, last_updated = await DataEntryRepository(
+            self.data_session
+        ).get_source_year_summary(
+            year=self.year,
+            data_entry_type_ids=[t.value for t in self._replaced_entry_types()],
+            source=DataEntrySourceEnum.CSV_MODULE_PER_YEAR.value,
+            created_by_id=source.id,
+        )
+        if total != inserted or written_by_source != total:
+            return None
+        if last_updated is not None and _as_naive_utc(last_updated) > _as_naive_utc(
+            settled_at
+        ):
+            return None
+        return source.id
+
+    async def _finish_unchanged(
+        self,
+        setup_result: Dict[str, Any],
+        stats: StatsDict,
+        source_job_id: int,
+    ) -> Dict[str, Any]:
+        """Finish an identical re-upload: file to processed/, job SUCCESS,
+        nothing parsed, deleted or written (and no recalc chained)."""
+        status_message = f"No changes: identical to the upload of job {source_job_id}"
+        logger.info(f"Job {self.job_id}: {status_message}")
+        metadata_for_job: Dict[str, Any] = {
+            k: v for k, v in stats.items() if k != "row_errors"
+        }
+        metadata_for_job["stats"] = stats
+        metadata_for_job["unchanged"] = True
+        metadata_for_job["identical_to_job_id"] = source_job_id
+        metadata_for_job.update(await self._move_to_processed(setup_result))
+        await self._update_job(
+            status_message=status_message,
+            state=IngestionState.FINISHED,
+            result=IngestionResult.SUCCESS,
+            extra_metadata=metadata_for_job,
+        )
+        return {
+            "state": IngestionState.FINISHED,
+            "result": IngestionResult.SUCCESS,
+            "status_message": status_message,
+            "inserted": 0,
+            "skipped": 0,
+            "stats": stats,
+            "unchanged": True,
+            "identical_to_job_id": source_job_id,
+        }
+
+    async def _move_to_processed(self, setup_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Move the file from processing/ to processed/; returns the
+        ``processed_file_path`` metadata."""
+        processing_path = setup_result["processing_path"]
+        filename = setup_result["filename"]
+        processed_path = f"processed/{self.job_id}/{filename}"
+        logger.info(f"Moving file from {processing_path} to {processed_path}")
+        move_result = await self.files_store.move_file(processing_path, processed_path)
+        if not move_result:
+            logger.warning(
+                f"Failed to move file from {processing_path} to {processed_path}"
+            )
+            return {"processed_file_path": processing_path}
+        return {"processed_file_path": processed_path}
+
     def _enter_phase(self, phase: str) -> None:
         """Mark the start of a pipeline phase (resets the rate/ETA baseline)."""
         self._phase = phase
@@ -869,6 +1276,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
 
     async def process_csv_in_batches(self) -> Dict[str, Any]:
         """Orchestrate CSV processing: setup → process rows → finalize"""
+        executor: Optional[Executor] = None
         try:
             # Setup: validate, load factors, move file
             setup_result = await self._setup_and_validate()
@@ -888,10 +1296,33 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                 "row_errors_count": 0,
             }
 
+            # Per-year uploads replace their whole scope, so re-ingesting
+            # the same bytes into an unchanged scope rewrites it as is:
+            # record the fingerprint, and finish right away when the last
+            # run already wrote exactly this (_identical_upload_source).
+            if self.entity_type == EntityType.MODULE_PER_YEAR:
+                fingerprint = self._upload_fingerprint(setup_result)
+                await self._update_job(
+                    status_message="Checking for an identical previous upload",
+                    state=IngestionState.RUNNING,
+                    result=None,
+                    extra_metadata={
+                        "content_sha256": setup_result["content_sha256"],
+                        "upload_fingerprint": fingerprint,
+                    },
+                )
+                if get_settings().INGEST_SKIP_IDENTICAL_UPLOADS:
+                    source_job_id = await self._identical_upload_source(fingerprint)
+                    if source_job_id is not None:
+                        return await self._finish_unchanged(
+                            setup_result, stats, source_job_id
+                        )
+
             # Initialize services early (needed for deletion)
             data_entry_service = DataEntryService(self.data_session)
             emission_service = DataEntryEmissionService(self.data_session)
 
+            row_diff: Optional[_RowDiff] = None
             if (
                 self.entity_type == EntityType.MODULE_PER_YEAR
                 and not self.carbon_report_module_id
@@ -899,24 +1330,29 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                 self._enter_phase("Resolving modules")
                 await self._report("Resolving modules", force=True)
                 unit_to_module_map = await self._resolve_carbon_report_modules(
-                    setup_result["csv_text"]
+                    setup_result["csv_content"]
                 )
                 # Store for later use in _recompute_module_stats
                 self._unit_to_module_map = unit_to_module_map
                 await self.data_session.flush()  # Flush report/module creation
 
-                # Delete existing entries from previous CSV_MODULE_PER_YEAR uploads
-                self._enter_phase("Deleting previous entries")
-                await self._report("Deleting previous entries", force=True)
-                await self._delete_existing_entries_for_module_per_year(
-                    unit_to_module_map, stats, data_entry_service
-                )
+                # Row diff (INGEST_ROW_DIFF): keep the previous entries and
+                # match the CSV rows against them instead.
+                row_diff = await self._load_row_diff(setup_result, data_entry_service)
+                if row_diff is None:
+                    # Delete existing entries from previous CSV_MODULE_PER_YEAR
+                    # uploads
+                    self._enter_phase("Deleting previous entries")
+                    await self._report("Deleting previous entries", force=True)
+                    await self._delete_existing_entries_for_module_per_year(
+                        unit_to_module_map, stats, data_entry_service
+                    )
 
             # Process CSV rows
             copy_batch_size = get_settings().INGEST_COPY_BATCH_SIZE
             # Rough row count for progress/ETA (header line excluded); the CSV
-            # text is already in memory, so counting newlines is cheap.
-            total_rows = max(setup_result["csv_text"].count("\n") - 1, 0)
+            # bytes are already in memory, so counting newlines is cheap.
+            total_rows = max(setup_result["csv_content"].count(b"\n") - 1, 0)
             self._enter_phase("Parsing rows")
             await self._report(
                 "Parsing rows", processed=0, total=total_rows, stats=stats, force=True
@@ -931,9 +1367,149 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
             batch_kg_co2eq_overrides: List[float | None] = []
             # Track seen user_institutional_ids per module to catch intra-CSV duplicates
             seen_institutional_ids: Dict[int, set] = {}
-            csv_reader = csv.DictReader(
-                io.StringIO(setup_result["csv_text"], newline="")
+            # Member rows of `batch` still to check against the database,
+            # in one query per batch (see _drop_taken_institutional_ids).
+            pending_members: List[_PendingMember] = []
+            # The one full parse: rows are decoded and read as the loop
+            # pulls them and leave memory with their COPY batch.
+            csv_reader = csv.DictReader(open_csv(setup_result["csv_content"]))
+
+            async def accept_entry(
+                data_entry: DataEntry,
+                row_idx: int,
+                factor: Any | None,
+                kg_co2eq_override: float | None,
+            ) -> None:
+                nonlocal batch, batch_kg_co2eq_overrides, pending_members
+                # Check institutional ID uniqueness for member entries:
+                # duplicates within the file here, against the database
+                # once per batch before it is written.
+                uid: Optional[str] = None
+                if (
+                    data_entry.data_entry_type_id == DataEntryTypeEnum.member
+                    and data_entry.data
+                    and data_entry.data.get("user_institutional_id")
+                ):
+                    uid = str(data_entry.data["user_institutional_id"])
+                    module_id = data_entry.carbon_report_module_id
+                    module_seen = seen_institutional_ids.setdefault(module_id, set())
+                    if uid in module_seen:
+                        error_msg = "DUPLICATE_INSTITUTIONAL_ID"
+                        self._record_row_error(
+                            stats, row_idx, error_msg, max_row_errors
+                        )
+                        return
+                    module_seen.add(uid)
+
+                # Row processed successfully
+                if factor:
+                    stats["rows_with_factors"] += 1
+                else:
+                    stats["rows_without_factors"] += 1
+                stats["rows_processed"] += 1
+
+                # Row diff: a row matching a stored entry keeps it, or
+                # updates its data in place — it is not batched for COPY.
+                if row_diff is not None:
+                    if row_diff.match(data_entry):
+                        if len(row_diff.pending_updates) >= copy_batch_size:
+                            await data_entry_service.repo.bulk_update_data(
+                                row_diff.take_updates()
+                            )
+                        return
+                    if data_entry.carbon_report_module_id is not None:
+                        row_diff.touched_modules.add(data_entry.carbon_report_module_id)
+
+                if uid is not None:
+                    pending_members.append(
+                        _PendingMember(
+                            batch_index=len(batch),
+                            row_idx=row_idx,
+                            carbon_report_module_id=module_id,
+                            uid=uid,
+                            has_factor=bool(factor),
+                        )
+                    )
+                batch.append(data_entry)
+                batch_kg_co2eq_overrides.append(kg_co2eq_override)
+
+                # Flush when the COPY batch is full
+                if len(batch) >= copy_batch_size:
+                    (
+                        batch,
+                        batch_kg_co2eq_overrides,
+                    ) = await self._drop_taken_institutional_ids(
+                        batch,
+                        batch_kg_co2eq_overrides,
+                        pending_members,
+                        data_entry_service,
+                        stats,
+                        max_row_errors,
+                    )
+                    pending_members = []
+                    await self._process_batch(
+                        batch,
+                        data_entry_service,
+                        emission_service,
+                        self.user,
+                        batch_kg_co2eq_overrides,
+                    )
+                    stats["batches_processed"] += 1
+                    logger.info(
+                        f"Processed batch {stats['batches_processed']}: "
+                        f"{stats['rows_processed']} rows total"
+                    )
+                    batch = []
+                    batch_kg_co2eq_overrides = []
+                    # Update job progress every batche
+                    if stats["batches_processed"]:
+                        await self._update_job(
+                            status_message=f"Processing: {stats['rows_processed']}",
+                            state=IngestionState.RUNNING,
+                            result=None,
+                            extra_metadata=dict(stats),
+                        )
+
+            # Process-pool validation (opt-in, see _validation_executor):
+            # rows are resolved here and validated in workers a chunk at a
+            # time; chunks are collected oldest first, so entries still
+            # reach the COPY batch in file order.
+            executor = self._validation_executor(setup_result, total_rows)
+            max_in_flight = (
+                get_settings().INGEST_VALIDATION_WORKERS * _VALIDATION_CHUNKS_PER_WORKER
             )
+            loop = asyncio.get_running_loop()
+            prepared_chunk: List[_PreparedRow] = []
+            in_flight: deque[tuple[List[_PreparedRow], asyncio.Future]] = deque()
+
+            def submit_chunk() -> None:
+                nonlocal prepared_chunk
+                future = loop.run_in_executor(
+                    executor,
+                    _validate_rows_chunk,
+                    [(p.handler, p.payload) for p in prepared_chunk],
+                )
+                in_flight.append((prepared_chunk, future))
+                prepared_chunk = []
+
+            async def collect_oldest_chunk() -> None:
+                chunk, future = in_flight.popleft()
+                # Counted under ``row`` too, so the profile's row_other
+                # stays the per-row work outside the timed sub-calls.
+                with self._timed("row"), self._timed("validate"):
+                    results = await future
+                for prepared, (data, error_msg) in zip(chunk, results):
+                    if error_msg is not None:
+                        self._record_row_error(
+                            stats, prepared.row_idx, error_msg, max_row_errors
+                        )
+                        continue
+                    await accept_entry(
+                        self._build_data_entry(prepared, data),
+                        prepared.row_idx,
+                        prepared.primary_factor_id is not None,
+                        prepared.kg_co2eq_override,
+                    )
 
             for row_idx, row in enumerate(csv_reader, start=1):
                 # Row processing is mostly CPU (parse/validate, cached
@@ -962,6 +1538,30 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                 ):
                     continue
 
+                if executor is not None:
+                    _row_t0 = time.perf_counter()
+                    prepared, error_msg = await self._prepare_row(
+                        row,
+                        row_idx,
+                        setup_result,
+                        stats,
+                        max_row_errors,
+                        unit_to_module_map,
+                    )
+                    self._seg["row"] = self._seg.get("row", 0.0) + (
+                        time.perf_counter() - _row_t0
+                    )
+                    if error_msg:
+                        continue
+                    if prepared is None:
+                        raise ValueError("Data entry is None without error message")
+                    prepared_chunk.append(prepared)
+                    if len(prepared_chunk) >= _VALIDATION_CHUNK_ROWS:
+                        submit_chunk()
+                        if len(in_flight) >= max_in_flight:
+                            await collect_oldest_chunk()
+                    continue
+
                 # Process single row, returns
                 # (data_entry, error_msg, factor, kg_co2eq_override)
                 _row_t0 = time.perf_counter()
@@ -989,73 +1589,27 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                 if data_entry is None:
                     raise ValueError("Data entry is None without error message")
 
-                # Check institutional ID uniqueness for member entries
-                # TODO: refactor, should not be done in base_csv_provider but elsewhere
-                # process or task or sql
-                if (
-                    data_entry.data_entry_type_id == DataEntryTypeEnum.member
-                    and data_entry.data
-                    and data_entry.data.get("user_institutional_id")
-                ):
-                    uid = str(data_entry.data["user_institutional_id"])
-                    module_id = data_entry.carbon_report_module_id
-                    module_seen = seen_institutional_ids.setdefault(module_id, set())
-                    if uid in module_seen:
-                        error_msg = "DUPLICATE_INSTITUTIONAL_ID"
-                        self._record_row_error(
-                            stats, row_idx, error_msg, max_row_errors
-                        )
-                        continue
-                    is_unique = await data_entry_service.check_institutional_id_unique(
-                        carbon_report_module_id=module_id,
-                        uid=uid,
-                    )
-                    if not is_unique:
-                        error_msg = "DUPLICATE_INSTITUTIONAL_ID"
-                        self._record_row_error(
-                            stats, row_idx, error_msg, max_row_errors
-                        )
-                        continue
-                    module_seen.add(uid)
+                await accept_entry(data_entry, row_idx, factor, kg_co2eq_override)
 
-                # Row processed successfully
-                batch.append(data_entry)
-                batch_kg_co2eq_overrides.append(kg_co2eq_override)
-                if factor:
-                    stats["rows_with_factors"] += 1
-                else:
-                    stats["rows_without_factors"] += 1
-                stats["rows_processed"] += 1
-
-                # Flush when the COPY batch is full
-                if len(batch) >= copy_batch_size:
-                    await self._process_batch(
-                        batch,
-                        data_entry_service,
-                        emission_service,
-                        self.user,
-                        batch_kg_co2eq_overrides,
-                    )
-                    stats["batches_processed"] += 1
-                    logger.info(
-                        f"Processed batch {stats['batches_processed']}: "
-                        f"{stats['rows_processed']} rows total"
-                    )
-                    batch = []
-                    batch_kg_co2eq_overrides = []
-                    # Update job progress every batche
-                    if stats["batches_processed"]:
-                        await self._update_job(
-                            status_message=f"Processing: {stats['rows_processed']}",
-                            state=IngestionState.RUNNING,
-                            result=None,
-                            extra_metadata=dict(stats),
-                        )
+            if executor is not None:
+                if prepared_chunk:
+                    submit_chunk()
+                while in_flight:
+                    await collect_oldest_chunk()
 
             # Diagnostic: where did the row-loop time go (DB-heavy segments
             # stand out vs CPU)? One line, real data/DB/handlers.
             self._log_row_loop_profile(time.perf_counter() - parse_start, row_idx)
 
+            batch, batch_kg_co2eq_overrides = await self._drop_taken_institutional_ids(
+                batch,
+                batch_kg_co2eq_overrides,
+                pending_members,
+                data_entry_service,
+                stats,
+                max_row_errors,
+            )
+
             # Finalize: process remaining batch, move file, update job
             self._enter_phase("Inserting")
             await self._report(
@@ -1068,6 +1622,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                 stats,
                 setup_result,
                 batch_kg_co2eq_overrides,
+                row_diff,
             )
 
         except Exception as e:
@@ -1080,6 +1635,46 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                 extra_metadata={"error": str(e)},
             )
             raise
+        finally:
+            if executor is not None:
+                # On failure, queued chunks are dropped; running ones
+                # finish in their workers and are discarded.
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _validation_executor(
+        self, setup_result: Dict[str, Any], total_rows: int
+    ) -> Optional[Executor]:
+        """The process pool for the row-validation stage, or None to
+        validate in-process.
+
+        Only for large files (``INGEST_VALIDATION_PARALLEL_MIN_ROWS``)
+        whose handlers all set ``csv_parallel_validation``: their rows
+        need nothing but ``validate_create`` and the factor-default fill,
+        which the workers do from a snapshot of the factor values.
+        """
+        settings = get_settings()
+        workers = settings.INGEST_VALIDATION_WORKERS
+        handlers = setup_result["handlers"]
+        if (
+            workers <= 1
+            or total_rows < settings.INGEST_VALIDATION_PARALLEL_MIN_ROWS
+            or not handlers
+            or not all(h.csv_parallel_validation is True for h in handlers)
+        ):
+            return None
+        factor_values: Dict[int, dict] = {}
+        if any(h.factor_value_fields for h in handlers):
+            factor_values = {
+                factor_id: dict(factor.values or {})
+                for factor_id, factor in setup_result.get(
+                    "factor_id_to_factor", {}
+                ).items()
+            }
+        logger.info(
+            f"Validating ~{total_rows} rows over {workers} worker process(es) "
+            f"({len(factor_values)} factor value sets)"
+        )
+        return _make_validation_executor(workers, factor_values)
 
     async def _setup_and_validate(
         self,
@@ -1115,10 +1710,10 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
         if not move_result:
             raise Exception(f"Failed to move file from {tmp_path} to {processing_path}")
 
-        # Download and decode CSV content
+        # Download the CSV; kept as bytes and decoded lazily by each reader
+        # (``open_csv``) instead of holding a decoded copy of the file.
         logger.info(f"Downloading CSV from {processing_path}")
         file_content, mime_type = await self.files_store.get_file(processing_path)
-        csv_text = file_content.decode("utf-8-sig")
 
         # Load handlers and factors (entity-specific)
         logger.info(f"Loading handlers and factors for {self.__class__.__name__}")
@@ -1133,7 +1728,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
         logger.info("Validating CSV headers")
         try:
             await self._validate_csv_headers(
-                csv_text, expected_columns, required_columns
+                file_content, expected_columns, required_columns
             )
             logger.info("CSV header validation passed")
         except ValueError as validation_error:
@@ -1148,7 +1743,8 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
             raise
 
         return {
-            "csv_text": csv_text,
+            "csv_content": file_content,
+            "content_sha256": hashlib.sha256(file_content).hexdigest(),
             "entity_type": self.entity_type,
             "handlers": handlers,
             "factors_map": factors_map,
@@ -1182,6 +1778,79 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                                to carbon_report_module_id
                                for MODULE_PER_YEAR imports
         """
+        prepared, error_msg = await self._prepare_row(
+            row, row_idx, setup_result, stats, max_row_errors, unit_to_module_map
+        )
+        if prepared is None:
+            return None, error_msg, None, None
+        handler = prepared.handler
+        primary_factor_id = prepared.primary_factor_id
+        try:
+            try:
+                with self._timed("validate"):
+                    validated = handler.validate_create(prepared.payload)
+            except Exception as validation_error:
+                error_msg = f"Validation error: {validation_error}"
+                self._record_row_error(stats, row_idx, error_msg, max_row_errors)
+                return None, error_msg, None, None
+
+            # Build DataEntry
+            data = dict(validated.data)
+
+            # CSV-time enrichment hook. Default no-op; the train handler uses
+            # it to resolve origin_name/destination_name → *_natural_key via
+            # a Location lookup so the recalc-time pre_compute can compute
+            # distance. Returning a non-None error_msg skips the row.
+            with self._timed("enrich"):
+                csv_cache = self._csv_caches.get(handler)
+                if csv_cache is None:
+                    csv_cache = await handler.prefetch_csv(self.data_session)
+                    self._csv_caches[handler] = csv_cache
+                data, enrich_error = await handler.enrich_csv_row(
+                    data, self.data_session, csv_cache=csv_cache
+                )
+            if enrich_error is not None:
+                self._record_row_error(stats, row_idx, enrich_error, max_row_errors)
+                return None, enrich_error, None, None
+
+            factor = None
+            with self._timed("populate"):
+                handler_service = ModuleHandlerService(self.data_session)
+                if primary_factor_id and "factor_id_to_factor" in setup_result:
+                    factor = setup_result["factor_id_to_factor"].get(primary_factor_id)
+                    if factor is not None:
+                        data = await handler_service.populate_defaults(
+                            handler, data, factor
+                        )
+
+            return (
+                self._build_data_entry(prepared, data),
+                None,
+                factor,
+                prepared.kg_co2eq_override,
+            )
+
+        except Exception as row_error:
+            logger.error(f"Row {row_idx}: Error processing row: {str(row_error)}")
+            error_msg = f"Row processing error: {row_error}"
+            self._record_row_error(stats, row_idx, error_msg, max_row_errors)
+            return None, error_msg, None, None
+
+    async def _prepare_row(
+        self,
+        row: Dict[str, str],
+        row_idx: int,
+        setup_result: Dict[str, Any],
+        stats: StatsDict,
+        max_row_errors: int,
+        unit_to_module_map: Dict[str, int] | None = None,
+    ) -> tuple["_PreparedRow | None", str | None]:
+        """
+        Resolve a CSV row up to its handler payload: blank/override
+        handling, handler and data_entry_type, factor lookup and
+        carbon_report_module_id — everything before ``validate_create``.
+        Returns (prepared_row, error_msg); errors are already recorded.
+        """
         try:
             handlers = setup_result["handlers"]
             expected_columns = setup_result["expected_columns"]
@@ -1191,7 +1860,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
             # before stripping blanks into filtered_row.
             if required_columns and _is_blank_data_row(row, required_columns):
                 stats["rows_skipped"] += 1
-                return None, None, None, None
+                return None, None
 
             # Extract kg_co2eq override from the raw row (carried out-of-band).
             # Bypasses expected_columns intentionally: not every handler lists
@@ -1232,12 +1901,12 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                 )
 
             if error_msg:
-                return None, error_msg, None, None
+                return None, error_msg
 
             if not data_entry_type or not handler:
                 error_msg = "Failed to resolve handler and data_entry_type"
                 self._record_row_error(stats, row_idx, error_msg, max_row_errors)
-                return None, error_msg, None, None
+                return None, error_msg
 
             # Resolve primary_factor_id from in-memory factors_map (NOT DB query!)
             # This avoids 100k+ DB queries - factors already loaded in setup phase
@@ -1291,7 +1960,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                 ):
                     error_msg = "Missing unit_institutional_id in row"
                     self._record_row_error(stats, row_idx, error_msg, max_row_errors)
-                    return None, error_msg, None, None
+                    return None, error_msg
 
                 unit_institutional_id = str(unit_institutional_id).strip()
 
@@ -1306,7 +1975,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                         self._missing_units_logged.add(unit_institutional_id)
                     error_msg = f"Unit '{unit_institutional_id}' not found"
                     self._record_row_error(stats, row_idx, error_msg, max_row_errors)
-                    return None, error_msg, None, None
+                    return None, error_msg
 
                 carbon_report_module_id = unit_to_module_map.get(unit_institutional_id)
                 if not carbon_report_module_id:
@@ -1315,7 +1984,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                         f"institutional_id={unit_institutional_id}"
                     )
                     self._record_row_error(stats, row_idx, error_msg, max_row_errors)
-                    return None, error_msg, None, None
+                    return None, error_msg
             elif self.carbon_report_module_id:
                 # MODULE_UNIT_SPECIFIC: use pre-configured value
                 carbon_report_module_id = self.carbon_report_module_id
@@ -1323,7 +1992,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                 # Neither mapping nor pre-configured value available
                 error_msg = "Missing carbon_report_module_id"
                 self._record_row_error(stats, row_idx, error_msg, max_row_errors)
-                return None, error_msg, None, None
+                return None, error_msg
 
             # Validate payload with handler (primary_factor_id already
             # set by ModuleHandlerService)
@@ -1333,63 +2002,44 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
             payload["status"] = DataEntryStatusEnum.VALIDATED.value
             payload["primary_factor_id"] = primary_factor_id
 
-            try:
-                with self._timed("validate"):
-                    validated = handler.validate_create(payload)
-            except Exception as validation_error:
-                error_msg = f"Validation error: {validation_error}"
-                self._record_row_error(stats, row_idx, error_msg, max_row_errors)
-                return None, error_msg, None, None
-
-            # Build DataEntry
-            data = dict(validated.data)
-
-            # CSV-time enrichment hook. Default no-op; the train handler uses
-            # it to resolve origin_name/destination_name → *_natural_key via
-            # a Location lookup so the recalc-time pre_compute can compute
-            # distance. Returning a non-None error_msg skips the row.
-            with self._timed("enrich"):
-                data, enrich_error = await handler.enrich_csv_row(
-                    data, self.data_session
-                )
-            if enrich_error is not None:
-                self._record_row_error(stats, row_idx, enrich_error, max_row_errors)
-                return None, enrich_error, None, None
-
-            with self._timed("populate"):
-                handler_service = ModuleHandlerService(self.data_session)
-                if primary_factor_id and "factor_id_to_factor" in setup_result:
-                    factor = setup_result["factor_id_to_factor"].get(primary_factor_id)
-                    if factor is not None:
-                        data = await handler_service.populate_defaults(
-                            handler, data, factor
-                        )
-
-            # Persist the override on the data
-            # entry under the reserved ``KG_CO2EQ_OVERRIDE_KEY`` carrier so
-            # the async recalc path (``upsert_by_data_entry`` →
-            # ``prepare_create``) still honors it.  The parallel list is
-            # kept for the legacy inline path's existing flow.
-            if kg_co2eq_override is not None:
-                data[KG_CO2EQ_OVERRIDE_KEY] = kg_co2eq_override
-
-            data_entry = DataEntry(
-                data_entry_type_id=data_entry_type,
-                carbon_report_module_id=carbon_report_module_id,
-                data=data,
-                # Denormalized scope columns — back the per-year
-                # full-replace delete without module resolution.
-                year=self.year,
-                unit_id=self._module_to_unit_id.get(carbon_report_module_id),
+            return (
+                _PreparedRow(
+                    row_idx=row_idx,
+                    handler=handler,
+                    data_entry_type=data_entry_type,
+                    carbon_report_module_id=carbon_report_module_id,
+                    payload=payload,
+                    primary_factor_id=primary_factor_id,
+                    kg_co2eq_override=kg_co2eq_override,
+                ),
+                None,
             )
 
-            return data_entry, None, None, kg_co2eq_override
-
         except Exception as row_error:
             logger.error(f"Row {row_idx}: Error processing row: {str(row_error)}")
             error_msg = f"Row processing error: {row_error}"
             self._record_row_error(stats, row_idx, error_msg, max_row_errors)
-            return None, error_msg, None, None
+            return None, error_msg
+
+    def _build_data_entry(self, prepared: "_PreparedRow", data: dict) -> DataEntry:
+        """The ``DataEntry`` for a prepared row and its validated data."""
+        # Persist the override on the data
+        # entry under the reserved ``KG_CO2EQ_OVERRIDE_KEY`` carrier so
+        # the async recalc path (``upsert_by_data_entry`` →
+        # ``prepare_create``) still honors it.  The parallel list is
+        # kept for the legacy inline path's existing flow.
+        if prepared.kg_co2eq_override is not None:
+            data[KG_CO2EQ_OVERRIDE_KEY] = prepared.kg_co2eq_override
+
+        return DataEntry(
+            data_entry_type_id=prepared.data_entry_type,
+            carbon_report_module_id=prepared.carbon_report_module_id,
+            data=data,
+            # Denormalized scope columns — back the per-year
+            # full-replace delete without module resolution.
+            year=self.year,
+            unit_id=self._module_to_unit_id.get(prepared.carbon_report_module_id),
+        )
 
     def _compute_ingestion_result(self, stats: StatsDict) -> IngestionResult:
         """
@@ -1425,6 +2075,7 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
         stats: StatsDict,
         setup_result: Dict[str, Any],
         batch_kg_co2eq_overrides: List[float | None],
+        row_diff: Optional[_RowDiff] = None,
     ) -> Dict[str, Any]:
         """
         Finalize: process remaining batch, move file to processed/, update job.
@@ -1444,20 +2095,13 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
                 f"{stats['rows_processed']} rows total"
             )
 
+        # Row diff: updates, deletes, and what the chained recalc targets
+        diff_result: Dict[str, Any] = {}
+        if row_diff is not None:
+            diff_result = await self._apply_row_diff(row_diff, data_entry_service)
+
         # Move file from processing/ to processed/
-        processing_path = setup_result["processing_path"]
-        filename = setup_result["filename"]
-        processed_path = f"processed/{self.job_id}/{filename}"
-        logger.info(f"Moving file from {processing_path} to {processed_path}")
-        move_result = await self.files_store.move_file(processing_path, processed_path)
-        metadata_update = {}
-        if not move_result:
-            logger.warning(
-                f"Failed to move file from {processing_path} to {processed_path}"
-            )
-            metadata_update["processed_file_path"] = processing_path
-        else:
-            metadata_update = {"processed_file_path": processed_path}
+        metadata_update = await self._move_to_processed(setup_result)
 
         # Flush all changes
         await self.data_session.flush()
@@ -1485,6 +2129,8 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
         # Add stats with row_errors for detailed reporting
         metadata_for_job["stats"] = stats
         metadata_for_job.update(metadata_update)
+        if "row_diff" in diff_result:
+            metadata_for_job["row_diff"] = diff_result["row_diff"]
         await self._update_job(
             status_message=status_message,
             state=IngestionState.FINISHED,
@@ -1498,8 +2144,49 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
             "inserted": stats["rows_processed"],
             "skipped": stats["rows_skipped"],
             "stats": stats,
+            **diff_result,
         }
 
+    async def _drop_taken_institutional_ids(
+        self,
+        batch: List[DataEntry],
+        batch_kg_co2eq_overrides: List[float | None],
+        pending_members: List[_PendingMember],
+        data_entry_service: DataEntryService,
+        stats: StatsDict,
+        max_row_errors: int,
+    ) -> tuple[List[DataEntry], List[float | None]]:
+        """Remove member rows whose user_institutional_id the module already
+        has in the database, with the same per-row error as before.
+
+        One set-based lookup for the whole batch instead of a uniqueness
+        query per row; the rows were counted as processed when batched,
+        so the counts are moved back to skipped.
+        """
+        if not pending_members:
+            return batch, batch_kg_co2eq_overrides
+        taken = await data_entry_service.get_taken_institutional_ids(
+            sorted({m.carbon_report_module_id for m in pending_members}),
+            sorted({m.uid for m in pending_members}),
+        )
+        rejected: set[int] = set()
+        for member in pending_members:
+            if (member.carbon_report_module_id, member.uid) not in taken:
+                continue
+            rejected.add(member.batch_index)
+            stats["rows_processed"] -= 1
+            if member.has_factor:
+                stats["rows_with_factors"] -= 1
+            else:
+                stats["rows_without_factors"] -= 1
+            self._record_row_error(
+                stats, member.row_idx, "DUPLICATE_INSTITUTIONAL_ID", max_row_errors
+            )
+        if not rejected:
+            return batch, batch_kg_co2eq_overrides
+        kept = [i for i in range(len(batch)) if i not in rejected]
+        return [batch[i] for i in kept], [batch_kg_co2eq_overrides[i] for i in kept]
+
     async def _process_batch(
         self,
         batch: List[DataEntry],
@@ -1634,3 +2321,69 @@ class BaseCSVProvider(DataIngestionProvider, ABC):
         logger.warning(f"Row {row_idx}: {reason}")
         if len(stats["row_errors"]) < max_row_errors:
             stats["row_errors"].append({"row": row_idx, "reason": reason})
+
+
+# ---------------------------------------------------------------------------
+# Parallel row validation — the worker-process side.
+# ---------------------------------------------------------------------------
+
+# Resolved rows per task sent to the validation pool.
+_VALIDATION_CHUNK_ROWS = 2_000
+# Chunks queued per worker before the row loop waits for the oldest.
+_VALIDATION_CHUNKS_PER_WORKER = 2
+
+# Per-process factor values snapshot (factor_id → Factor.values), set
+# once by the pool initializer instead of being pickled with every chunk.
+_worker_factor_values: Dict[int, dict] = {}
+
+
+def _make_validation_executor(workers: int, factor_values: Dict[int, dict]) -> Executor:
+    """Process pool for one CSV ingest's validation stage.
+
+    ``spawn`` for the same reason as the sharded recalc: a forked child
+    would inherit the event loop and the engine's pooled connections.
+    Workers never touch the database.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_validation_worker,
+        initargs=(factor_values,),
+    )
+
+
+def _init_validation_worker(factor_values: Dict[int, dict]) -> None:
+    global _worker_factor_values
+    _worker_factor_values = factor_values
+
+
+def _validate_rows_chunk(
+    rows: List[tuple[Any, Dict[str, Any]]],
+) -> List[tuple[dict | None, str | None]]:
+    """Worker entry point: ``validate_create`` + factor defaults for a
+    chunk of ``(handler, payload)`` pairs.
+
+    Returns ``(data, error_msg)`` per row, in input order — the same
+    data and messages the in-process ``_process_row`` produces for a
+    handler with ``csv_parallel_validation`` set.
+    """
+    results: List[tuple[dict | None, str | None]] = []
+    for handler, payload in rows:
+        try:
+            validated = handler.validate_create(payload)
+        except Exception as validation_error:
+            results.append((None, f"Validation error: {validation_error}"))
+            continue
+        try:
+            data = dict(validated.data)
+            primary_factor_id = payload.get("primary_factor_id")
+            factor_values = _worker_factor_values.get(primary_factor_id)
+            if factor_values is not None and (
+                data.get("primary_factor_id") == primary_factor_id
+            ):
+                data = fill_factor_defaults(handler, data, factor_values)
+        except Exception as row_error:
+            results.append((None, f"Row processing error: {row_error}"))
+            continue
+        results.append((data, None))
+    return results
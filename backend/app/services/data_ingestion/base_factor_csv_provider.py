@@ -27,6 +27,12 @@ from app.services.factor_service import FactorService
 
 logger = get_logger(__name__)
 
+# Upper bound on ``changed_factor_ids`` recorded in the job meta.  Past
+# it most of the factor set changed anyway, so the chained recalc gets
+# ``None`` (full slice) instead of a list that would bloat the meta and
+# select nearly every entry regardless.
+CHANGED_FACTOR_IDS_META_CAP = 10_000
+
 
 class FactorStatsDict(TypedDict):
     rows_processed: int
@@ -71,6 +77,14 @@ class BaseFactorCSVProvider(DataIngestionProvider, ABC):
         if self.source_file_path:
             _validate_file_path(self.source_file_path)
         self._files_store: Any = None
+        # Ids of factors this job inserted or whose values it changed;
+        # surfaced as ``changed_factor_ids`` for the targeted recalc.
+        self._changed_factor_ids: set[int] = set()
+        # Existing factors the file repeated with identical values — not
+        # written by the upsert (see _stamp_reasserted_factors).
+        self._unchanged_factor_ids: set[int] = set()
+        self._factors_inserted = 0
+        self._factors_updated = 0
         logger.info(
             f"Initializing {self.__class__.__name__} for job_id={self.job_id}, "
             f"file_path={self.source_file_path}"
@@ -464,12 +478,16 @@ class BaseFactorCSVProvider(DataIngestionProvider, ABC):
         self,
         batch: List[Factor],
         factor_service: FactorService,
-    ) -> None:
+    ) -> int:
         # Legacy path retained for subclasses that override (notably
         # ``LocalFactorCSVProvider`` which does delete-and-insert for dev
         # seeding). Production factor ingest goes through ``_upsert_batch``.
-        await factor_service.bulk_create(batch)
-        logger.info(f"Created {len(batch)} factors in batch")
+        # Counts the ids the INSERT's RETURNING handed back, as the upsert
+        # path counts its RETURNING rows.
+        created = await factor_service.bulk_create(batch)
+        inserted = sum(1 for factor in created if factor.id is not None)
+        logger.info(f"Created {inserted} factors in batch of {len(batch)}")
+        return inserted
 
     async def _upsert_batch(
         self,
@@ -478,20 +496,80 @@ class BaseFactorCSVProvider(DataIngestionProvider, ABC):
     ) -> int:
         """Upsert one batch keyed on the factor identity index.
 
-        Returns the number of rows affected so callers can update stats.
-        Requires ``self.job_id`` so each upserted row can be stamped with
-        ``last_seen_job_id``.
+        Returns the number of rows written (inserted + updated) so
+        callers can update stats; rows with unchanged values are only
+        counted.  Requires ``self.job_id`` so each upserted row can be
+        stamped with ``last_seen_job_id``.
         """
         if self.job_id is None:
             raise ValueError("job_id is required for factor upsert")
-        affected = await factor_repo.upsert_factors(batch, current_job_id=self.job_id)
-        # asyncpg can return rowcount=-1 for executemany ON CONFLICT
-        # statements where it can't tally the result reliably.  Fall back
-        # to the input batch size for stats so the operator-visible count
-        # isn't a confusing -1.
-        reported = affected if affected >= 0 else len(batch)
-        logger.info(f"Upserted {reported} factors in batch of {len(batch)}")
-        return reported
+        result = await factor_repo.upsert_factors(batch, current_job_id=self.job_id)
+        self._changed_factor_ids.update(result.changed_ids)
+        self._unchanged_factor_ids.update(result.unchanged_ids)
+        self._factors_inserted += len(result.inserted_ids)
+        self._factors_updated += len(result.updated_ids)
+        logger.info(
+            f"Upserted batch of {len(batch)} factors: "
+            f"{len(result.inserted_ids)} inserted, "
+            f"{len(result.updated_ids)} updated, "
+            f"{len(result.unchanged_ids)} unchanged"
+        )
+        return result.affected
+
+    async def _stamp_reasserted_factors(
+        self, factor_repo: FactorRepository
+    ) -> Dict[str, Any]:
+        """Stamp ``last_seen_job_id`` on the factors the file repeated
+        unchanged, which the guarded upsert left alone.
+
+        The stale-factor view expects every factor an upload asserts to
+        carry its job id — unless the upload changed nothing at all: no
+        factor inserted or updated, every factor of its (det, year) scope
+        in the file, and none stale already.  Then nothing is stamped and
+        the job is marked ``stamped_last_seen: False`` so the stale view
+        passes over it; a re-import without edits writes no factor row.
+
+        A partial re-import (some factors edited, the rest repeated) still
+        rewrites ``last_seen_job_id`` on every repeated row: last-seen is a
+        single column per factor, not tracked per job or scope.
+
+        Returns the job meta to add.
+        """
+        if not self._unchanged_factor_ids or self.job_id is None:
+            return {}
+        if not self._changed_factor_ids and await self._scope_fully_reasserted(
+            factor_repo
+        ):
+            return {"stamped_last_seen": False}
+        await factor_repo.stamp_last_seen(
+            sorted(self._unchanged_factor_ids), self.job_id
+        )
+        return {}
+
+    async def _scope_fully_reasserted(self, factor_repo: FactorRepository) -> bool:
+        """Whether the file repeated every factor of the job's year-scoped
+        dets unchanged, with none of them stale before this job."""
+        if self.year is None:
+            return False
+        if self.data_entry_type_id is not None:
+            dets = [DataEntryTypeEnum(self.data_entry_type_id)]
+        elif self.module_type_id is not None:
+            dets = list(
+                MODULE_TYPE_TO_DATA_ENTRY_TYPES.get(
+                    ModuleTypeEnum(self.module_type_id), []
+                )
+            )
+        else:
+            return False
+        if not dets:
+            return False
+        for det in dets:
+            ids = await factor_repo.list_id_by_data_entry_type_and_year(det, self.year)
+            if not self._unchanged_factor_ids.issuperset(ids):
+                return False
+        det_ids = {det.value for det in dets}
+        stale = await factor_repo.list_stale_for_year(self.year)
+        return not any(f.data_entry_type_id in det_ids for f in stale)
 
     def _compute_ingestion_result(self, stats: FactorStatsDict) -> IngestionResult:
         """
@@ -530,6 +608,7 @@ class BaseFactorCSVProvider(DataIngestionProvider, ABC):
         if batch:
             upserted = await self._upsert_batch(batch, factor_repo)
             stats["factors_upserted"] += upserted
+        last_seen_meta = await self._stamp_reasserted_factors(factor_repo)
 
         processing_path = setup_result["processing_path"]
         filename = setup_result["filename"]
@@ -551,13 +630,22 @@ class BaseFactorCSVProvider(DataIngestionProvider, ABC):
             f"Processed {stats['rows_processed']} rows: "
             f"{stats['rows_skipped']} skipped, "
             f"{stats['row_errors_count']} errors, "
-            f"{stats['factors_upserted']} factors upserted"
+            f"{stats['factors_upserted']} factors upserted, "
+            f"{len(self._unchanged_factor_ids)} unchanged"
         )
         result = self._compute_ingestion_result(stats)
 
         metadata_for_job = {k: v for k, v in stats.items() if k != "row_errors"}
         metadata_for_job["stats"] = stats
         metadata_for_job.update(metadata_update)
+        metadata_for_job.update(last_seen_meta)
+        metadata_for_job.update(
+            {
+                "factors_inserted": self._factors_inserted,
+                "factors_updated": self._factors_updated,
+                "factors_unchanged": len(self._unchanged_factor_ids),
+            }
+        )
         await self._update_job(
             status_message=status_message,
             state=IngestionState.FINISHED,
@@ -577,8 +665,19 @@ class BaseFactorCSVProvider(DataIngestionProvider, ABC):
             "inserted": stats["rows_processed"],
             "skipped": stats["rows_skipped"],
             "stats": stats,
+            "changed_factor_ids": self._changed_factor_ids_for_meta(),
         }
 
+    def _changed_factor_ids_for_meta(self) -> list[int] | None:
+        """``changed_factor_ids`` for the job meta; ``None`` = "assume all".
+
+        The factor_ingest handler hands it to its ``emission_recalc``
+        children, which then only revisit entries those factors feed.
+        """
+        if len(self._changed_factor_ids) > CHANGED_FACTOR_IDS_META_CAP:
+            return None
+        return sorted(self._changed_factor_ids)
+
     @abstractmethod
     async def _setup_handlers_and_context(self) -> Dict[str, Any]:
         pass
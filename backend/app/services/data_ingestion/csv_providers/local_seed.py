@@ -8,7 +8,6 @@ running file-store service or DataIngestionJob records.
 """
 
 import csv as csv_module
-import io
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
@@ -19,7 +18,7 @@ from app.core.logging import get_logger
 from app.models.data_entry import DataEntryTypeEnum
 from app.models.data_ingestion import IngestionResult, IngestionState
 from app.models.location import Location, TransportModeEnum
-from app.services.data_ingestion.base_csv_provider import StatsDict
+from app.services.data_ingestion.base_csv_provider import StatsDict, open_csv
 from app.services.data_ingestion.base_factor_csv_provider import FactorStatsDict
 from app.services.data_ingestion.csv_providers.factors import (
     ModulePerYearFactorCSVProvider,
@@ -160,8 +159,7 @@ class LocalFactorCSVProvider(ModulePerYearFactorCSVProvider):
         from app.services.factor_service import FactorService
 
         factor_service = FactorService(self.data_session)
-        await self._process_batch(batch, factor_service)
-        return len(batch)
+        return await self._process_batch(batch, factor_service)
 
     async def _finalize_and_commit(
         self,
@@ -175,7 +173,9 @@ class LocalFactorCSVProvider(ModulePerYearFactorCSVProvider):
     ) -> Dict[str, Any]:
 
         if batch:
-            await self._process_batch(batch, factor_service)
+            stats["factors_upserted"] += await self._process_batch(
+                batch, factor_service
+            )
 
         await self.data_session.flush()
 
@@ -290,7 +290,7 @@ class LocalDataEntryCSVProvider(ModulePerYearCSVProvider):
         if not local_path.is_file():
             raise FileNotFoundError(f"CSV file not found: {self._local_file_path}")
 
-        csv_text = local_path.read_text(encoding="utf-8-sig")
+        csv_content = local_path.read_bytes()
 
         # Pre-build location cache for travel CSVs before factor setup
         if self._location_fields and self._transport_mode is None:
@@ -299,19 +299,19 @@ class LocalDataEntryCSVProvider(ModulePerYearCSVProvider):
             )
         location_id_cache: dict[str, int] = {}
         if self._location_fields:
-            location_id_cache = await self._build_location_cache(csv_text)
+            location_id_cache = await self._build_location_cache(csv_content)
 
         # Setup handlers and factors (inherited from ModulePerYearCSVProvider)
         entity_setup = await self._setup_handlers_and_factors()
 
         await self._validate_csv_headers(
-            csv_text,
+            csv_content,
             entity_setup["expected_columns"],
             entity_setup["required_columns"],
         )
 
         return {
-            "csv_text": csv_text,
+            "csv_content": csv_content,
             "entity_type": self.entity_type,
             "handlers": entity_setup["handlers"],
             "factors_map": entity_setup["factors_map"],
@@ -328,14 +328,14 @@ class LocalDataEntryCSVProvider(ModulePerYearCSVProvider):
     # Location cache for travel CSVs
     # ------------------------------------------------------------------
 
-    async def _build_location_cache(self, csv_text: str) -> dict[str, int]:
+    async def _build_location_cache(self, csv_content: bytes) -> dict[str, int]:
         """Return a ``code -> location_id`` mapping for all codes in the CSV."""
         if not self._location_fields or not self._transport_mode:
             return {}
 
         source_columns = list(self._location_fields.keys())
         codes: set[str] = set()
-        reader = csv_module.DictReader(io.StringIO(csv_text, newline=""))
+        reader = csv_module.DictReader(open_csv(csv_content))
         for row in reader:
             for source_col in source_columns:
                 val = (row.get(source_col) or "").strip()
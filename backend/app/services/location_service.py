@@ -1,6 +1,6 @@
 """Location service for business logic."""
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from fastapi import HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -16,6 +16,55 @@ from app.utils.distance_geography import (
 logger = get_logger(__name__)
 
 
+def _station_match(
+    matches: List[Location], country_code: str
+) -> tuple[Optional[Location], str]:
+    """``resolve_train_station_for_csv`` result for the first (up to two)
+    name matches."""
+    if not matches:
+        return None, "not_found"
+    if len(matches) > 1:
+        return None, f"ambiguous: {len(matches)} matches in {country_code}"
+    return matches[0], "ok"
+
+
+class LocationIndex:
+    """One transport mode's ``locations`` rows, indexed in memory.
+
+    Built once per CSV ingest job (``LocationService.load_index``) so
+    per-row station resolution is a dict lookup.  Keyed by
+    ``natural_key`` and by ``(normalised name, country_code)``, the
+    normalisation matching ``find_train_stations_by_name``'s
+    ``lower(trim(name))``.
+    """
+
+    def __init__(self, locations: Iterable[Location]):
+        self._by_natural_key: dict[str, Location] = {}
+        self._by_name: dict[tuple[str, Optional[str]], List[Location]] = {}
+        for location in locations:
+            self._by_natural_key[location.natural_key] = location
+            # PostgreSQL trim() strips spaces only.
+            key = (location.name.strip(" ").lower(), location.country_code)
+            self._by_name.setdefault(key, []).append(location)
+
+    def __len__(self) -> int:
+        return len(self._by_natural_key)
+
+    def get(self, natural_key: str) -> Optional[Location]:
+        return self._by_natural_key.get(natural_key)
+
+    def find_by_name(
+        self, name: str, country_code: str, limit: int = 2
+    ) -> List[Location]:
+        return self._by_name.get((name.strip().lower(), country_code), [])[:limit]
+
+    def resolve_train_station_for_csv(
+        self, name: str, country_code: str
+    ) -> tuple[Optional[Location], str]:
+        """In-memory :meth:`LocationService.resolve_train_station_for_csv`."""
+        return _station_match(self.find_by_name(name, country_code), country_code)
+
+
 class LocationService:
     """Service for location business logic."""
 
@@ -84,6 +133,15 @@ class LocationService:
         """
         return await self.repo.get_by_natural_key(natural_key)
 
+    async def get_locations_by_natural_keys(
+        self, natural_keys: List[str]
+    ) -> List[Location]:
+        """Bulk-fetch locations for many natural_keys in one query.
+
+        Used by the train recalc slice to resolve all stations up front.
+        """
+        return await self.repo.get_by_natural_keys(natural_keys)
+
     async def get_location_by_iata(self, iata_code: str) -> Optional[Location]:
         """
         Get location by IATA code.
@@ -127,11 +185,16 @@ class LocationService:
             country_code=country_code,
             limit=2,
         )
-        if not matches:
-            return None, "not_found"
-        if len(matches) > 1:
-            return None, f"ambiguous: {len(matches)} matches in {country_code}"
-        return matches[0], "ok"
+        return _station_match(matches, country_code)
+
+    async def load_index(self, transport_mode: TransportModeEnum) -> LocationIndex:
+        """Every location of ``transport_mode`` in a :class:`LocationIndex`."""
+        locations = await self.repo.list_by_transport_mode(transport_mode)
+        logger.info(
+            f"Loaded {len(locations)} {transport_mode.value} locations into "
+            "the in-memory location index"
+        )
+        return LocationIndex(locations)
 
     async def get_location_by_id(self, location_id: int) -> Optional[Location]:
         """
@@ -20,6 +20,26 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def fill_factor_defaults(
+    handler: "ModuleHandler", data: dict, factor_values: Optional[dict]
+) -> dict:
+    """Copy the handler's ``factor_value_fields`` from the matched factor's
+    values into ``data`` where the entry leaves them empty.
+
+    Pure (no session), so the CSV provider's worker processes can apply
+    it from a factor-values snapshot.
+    """
+    if not factor_values or not getattr(handler, "factor_value_fields", None):
+        return data
+    for field_name in handler.factor_value_fields:
+        if field_name not in data or data[field_name] in (None, "", 0):
+            default_value = factor_values.get(field_name)
+            if default_value is not None:
+                data[field_name] = default_value
+                logger.debug(f"{field_name}={default_value} from factor populated")
+    return data
+
+
 class ModuleHandlerService:
     """Orchestrates factor-dependent operations for module handlers."""
 
@@ -195,22 +215,12 @@ class ModuleHandlerService:
         data: dict,
         factor: Factor,
     ) -> dict:
-        primary_factor_id = data.get("primary_factor_id")
-        if primary_factor_id == factor.id:
-            if (
-                factor
-                and hasattr(handler, "factor_value_fields")
-                and handler.factor_value_fields
-            ):
-                for field_name in handler.factor_value_fields:
-                    if field_name not in data or data[field_name] in (None, "", 0):
-                        default_value = factor.values.get(field_name)
-                        if default_value is not None:
-                            data[field_name] = default_value
-                            logger.debug(
-                                f"{field_name}={default_value} from factor populated"
-                            )
-
+        if (
+            factor
+            and data.get("primary_factor_id") == factor.id
+            and getattr(handler, "factor_value_fields", None)
+        ):
+            data = fill_factor_defaults(handler, data, factor.values)
         return data
 
     async def resolve_primary_factor_if_changed(
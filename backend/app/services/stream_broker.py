@@ -0,0 +1,213 @@
+"""Per-pod fan-out for the job and pipeline SSE streams.
+
+``GET /sync/jobs/{id}/stream`` and ``GET /sync/pipelines/{id}/stream``
+used to run one poll loop per connected browser: every subscriber
+opened its own ``SessionLocal()`` every 2 seconds and re-read the same
+rows.  Twenty admins watching one reload meant twenty identical
+queries per tick.
+
+``StreamBroker`` keeps one *topic* per watched key (``("job", id)`` /
+``("pipeline", id)``).  A topic owns the only poll loop for its key; it
+publishes a ``StreamUpdate`` to every subscriber only when the
+fingerprint of what it read changed, so database load is one query set
+per watched job per tick however many browsers are attached, and an
+idle job sends nothing.  The first subscriber starts the topic, the
+last one to leave cancels it.
+
+Each subscriber queue holds only the latest update: payloads are full
+snapshots, so a slow client skips intermediate states instead of
+buffering them.
+
+``fetch`` reads shared state only — scope checks stay in the endpoint,
+before ``watch`` — since a topic serves every subscriber with the fetch
+of whichever one started it.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+STREAM_POLL_INTERVAL_SECONDS = 2.0
+# Topics close after this many polls that saw the stream ``done`` — one
+# extra tick so a trailing ``status_message`` write still reaches clients.
+DONE_POLLS_BEFORE_CLOSE = 2
+
+
+@dataclass(frozen=True)
+class StreamState:
+    """One poll's read of a topic.
+
+    ``fingerprint`` decides whether subscribers are notified; it
+    defaults to ``payload`` but can be narrower (the pipeline stream
+    ignores progress-only changes).
+    """
+
+    payload: dict
+    done: bool = False
+    fingerprint: Any = None
+
+
+@dataclass(frozen=True)
+class StreamUpdate:
+    """What a subscriber receives.
+
+    ``version`` bumps on every fingerprint change, so a subscriber can
+    tell a new payload from the final re-send of one it already has.
+    ``payload`` is None when ``fetch`` reported the key gone; ``closed``
+    marks the topic's last update.
+    """
+
+    version: int
+    payload: Optional[dict]
+    closed: bool = False
+
+
+Fetch = Callable[[], Awaitable[Optional[StreamState]]]
+
+
+class _Topic:
+    def __init__(self, key: Hashable, fetch: Fetch, poll_interval: float):
+        self.key = key
+        self.fetch = fetch
+        self.poll_interval = poll_interval
+        self.subscribers: set[asyncio.Queue[StreamUpdate]] = set()
+        self.latest: Optional[StreamUpdate] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def publish(self, update: StreamUpdate) -> None:
+        self.latest = update
+        for queue in self.subscribers:
+            _offer(queue, update)
+
+    async def run(self) -> None:
+        version = 0
+        fingerprint: Any = None
+        done_polls = 0
+        while True:
+            try:
+                state = await self.fetch()
+            except Exception as exc:
+                logger.warning(
+                    f"Stream broker: poll for {self.key!r} failed: {exc}",
+                    exc_info=True,
+                )
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            if state is None:
+                self.publish(StreamUpdate(version + 1, None, closed=True))
+                return
+
+            current = state.payload if state.fingerprint is None else state.fingerprint
+            if version == 0 or current != fingerprint:
+                version += 1
+                fingerprint = current
+                self.publish(StreamUpdate(version, state.payload))
+
+            if state.done:
+                done_polls += 1
+                if done_polls >= DONE_POLLS_BEFORE_CLOSE:
+                    self.publish(StreamUpdate(version, state.payload, closed=True))
+                    return
+
+            await asyncio.sleep(self.poll_interval)
+
+
+def _offer(queue: asyncio.Queue[StreamUpdate], update: StreamUpdate) -> None:
+    """Replace whatever the subscriber hasn't consumed yet with ``update``."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(update)
+
+
+class StreamBroker:
+    """One poll loop per watched key, fanned out to every subscriber."""
+
+    def __init__(self, poll_interval: float = STREAM_POLL_INTERVAL_SECONDS):
+        self.poll_interval = poll_interval
+        self._topics: dict[Hashable, _Topic] = {}
+
+    def topic_count(self) -> int:
+        return len(self._topics)
+
+    def _subscribe(self, key: Hashable, fetch: Fetch) -> asyncio.Queue[StreamUpdate]:
+        topic = self._topics.get(key)
+        if topic is None:
+            topic = _Topic(key, fetch, self.poll_interval)
+            self._topics[key] = topic
+            topic.task = asyncio.create_task(self._run_topic(topic))
+        queue: asyncio.Queue[StreamUpdate] = asyncio.Queue(maxsize=1)
+        if topic.latest is not None:
+            queue.put_nowait(topic.latest)
+        topic.subscribers.add(queue)
+        return queue
+
+    async def _run_topic(self, topic: _Topic) -> None:
+        try:
+            await topic.run()
+        finally:
+            # A closed topic leaves the registry at once, so a client
+            # connecting afterwards starts a fresh poll.
+            if self._topics.get(topic.key) is topic:
+                del self._topics[topic.key]
+
+    async def _unsubscribe(
+        self, key: Hashable, queue: asyncio.Queue[StreamUpdate]
+    ) -> None:
+        topic = self._topics.get(key)
+        if topic is None or queue not in topic.subscribers:
+            return
+        topic.subscribers.discard(queue)
+        if topic.subscribers or topic.task is None:
+            return
+        del self._topics[key]
+        # Await the cancelled poll so its session is back in the pool
+        # before the last subscriber's response finishes.
+        topic.task.cancel()
+        try:
+            await topic.task
+        except asyncio.CancelledError:
+            pass
+
+    async def watch(
+        self,
+        key: Hashable,
+        fetch: Fetch,
+        is_disconnected: Callable[[], Awaitable[bool]],
+        idle_timeout: Optional[float] = None,
+    ) -> AsyncIterator[Optional[StreamUpdate]]:
+        """Yield the topic's updates until it closes or the client leaves.
+
+        With ``idle_timeout``, yields None after that many seconds
+        without an update so the caller can send a keep-alive.
+        ``is_disconnected`` is checked at least every poll interval.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._subscribe(key, fetch)
+        last_delivery = loop.time()
+        try:
+            while True:
+                if await is_disconnected():
+                    return
+                try:
+                    update = await asyncio.wait_for(queue.get(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    now = loop.time()
+                    if idle_timeout is not None and now - last_delivery >= idle_timeout:
+                        last_delivery = now
+                        yield None
+                    continue
+                last_delivery = loop.time()
+                yield update
+                if update.closed:
+                    return
+        finally:
+            await self._unsubscribe(key, queue)
+
+
+stream_broker = StreamBroker()
@@ -42,6 +42,32 @@ def fire_and_forget(coro: Coroutine, *, name: str | None = None) -> asyncio.Task
     return task
 
 
+async def wait_for_background_tasks(timeout: float) -> int:
+    """Wait up to ``timeout`` seconds for the tracked tasks to finish.
+
+    Used by a stopping worker to let in-flight jobs complete.  Returns
+    how many were still running at the deadline.
+    """
+    if not _BACKGROUND_TASKS:
+        return 0
+    _done, pending = await asyncio.wait(set(_BACKGROUND_TASKS), timeout=timeout)
+    return len(pending)
+
+
+async def cancel_background_tasks() -> None:
+    """Cancel the tracked tasks and wait until they have unwound.
+
+    Used by a stopping worker once its grace period is over, so jobs
+    cut off get to release their rows (see ``runner``) before the
+    engine is disposed.
+    """
+    pending = set(_BACKGROUND_TASKS)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+
+
 def _on_done(task: asyncio.Task) -> None:
     _BACKGROUND_TASKS.discard(task)
     if task.cancelled():
@@ -42,7 +42,10 @@ from app.models.data_ingestion import (
     IngestionState,
     TargetType,
 )
-from app.repositories.data_ingestion import DataIngestionRepository
+from app.repositories.data_ingestion import (
+    DataIngestionRepository,
+    default_job_priority,
+)
 from app.tasks._background import fire_and_forget
 
 logger = get_logger(__name__)
@@ -333,6 +336,10 @@ async def chain_job(
             # and downstream provider-scoped reads (year_configuration,
             # carbon_reports) miss the right rows.
             provider=parent.provider,
+            # Inherit the parent's dispatch priority so a user upload's
+            # recalc/aggregation stays ahead of bulk work;
+            # ``create_ingestion_job`` raises it to the type's floor.
+            priority=parent.priority,
             # ``None`` means "runnable immediately" — claim_job's WHERE
             # treats NULL run_after as eligible.  Matches the existing
             # ingestion_tasks.py recalc-job creation pattern.
@@ -490,14 +497,14 @@ async def _insert_child_with_dedup(
         INSERT INTO data_ingestion_jobs (
             job_type, module_type_id, data_entry_type_id, year,
             target_type, ingestion_method, entity_type, provider, state,
-            is_current, pipeline_id, run_after, meta
+            is_current, pipeline_id, run_after, meta, priority
         )
         VALUES (
             :job_type, :module_type_id, :data_entry_type_id, :year,
             :target_type, :ingestion_method, :entity_type, :provider,
             'NOT_STARTED'::ingestion_state_enum,
             FALSE, CAST(:pipeline_id AS UUID), NULL,
-            CAST(:meta AS JSONB)
+            CAST(:meta AS JSONB), GREATEST(:parent_priority, :default_priority)
         )
         RETURNING id
         """
@@ -528,6 +535,9 @@ async def _insert_child_with_dedup(
                 "provider": provider_value,
                 "pipeline_id": pipeline_id_str,
                 "meta": meta_json,
+                # Same rule as the ORM path: inherit, floored by type.
+                "parent_priority": parent.priority,
+                "default_priority": default_job_priority(job_type, entity_type),
             },
         )
     except IntegrityError as exc:
@@ -566,6 +576,10 @@ async def _insert_child_with_dedup(
         return None
 
     row = result.first()
+    if row is not None:
+        # The raw INSERT skips ``create_ingestion_job``'s NOTIFY — queue it
+        # here so it ships with the commit below.
+        await DataIngestionRepository(session).notify_jobs_ready([int(row[0])])
     await session.commit()
     # ``RETURNING id`` always yields a row when the INSERT succeeds
     # (the pre-check + IntegrityError catch already cover the dedup
@@ -0,0 +1,88 @@
+"""Per-pod concurrency caps per job type.
+
+``run_job`` executes on the pod's one event loop; every running job
+holds pooled connections and, for ingests and recalcs, a long
+transaction.  Without a cap a factor upload's recalc fan-out plus a CSV
+ingest all run at once and starve API requests of connections and CPU.
+
+``JOB_CONCURRENCY_LIMITS`` maps a job type to the most jobs of that
+type this pod runs at once; types it doesn't list are unbounded.  The
+runner takes a slot before ``claim_job`` and gives up the job when none
+is free — the row stays NOT_STARTED for another pod, or for this one
+once a slot frees.  Releasing a slot wakes the dispatch sweep, which
+schedules at most as many jobs per type as there are free slots.
+
+Fairness: one pipeline may hold at most ``limit -
+JOB_PIPELINE_RESERVED_SLOTS`` (never fewer than one) of a capped
+type's slots, so a year-wide reload's recalc fan-out leaves room for
+another pipeline's job of the same type.  Between pipelines, the sweep
+claims in ``priority`` order.
+
+Plain counters, no locks: every caller runs on the same event loop and
+``try_acquire_slot`` doesn't await between the check and the increment.
+"""
+
+from collections import Counter
+from typing import Optional
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.tasks._job_listener import wake_dispatcher
+
+_running: Counter[str] = Counter()
+_running_by_pipeline: Counter[tuple[str, UUID]] = Counter()
+
+
+def free_slots(job_type: str, pipeline_id: Optional[UUID] = None) -> Optional[int]:
+    """Slots left for ``job_type`` on this pod; None when it has no cap.
+
+    With a ``pipeline_id``, also bounded by that pipeline's fair share.
+    """
+    settings = get_settings()
+    limit = settings.JOB_CONCURRENCY_LIMITS.get(job_type)
+    if limit is None:
+        return None
+    free = max(0, limit - _running[job_type])
+    if pipeline_id is not None:
+        share = max(1, limit - settings.JOB_PIPELINE_RESERVED_SLOTS)
+        held = _running_by_pipeline[(job_type, pipeline_id)]
+        free = min(free, max(0, share - held))
+    return free
+
+
+def try_acquire_slot(job_type: str, pipeline_id: Optional[UUID] = None) -> bool:
+    """Take a slot for ``job_type``; False when the pod is at its cap or
+    the pipeline at its share."""
+    if free_slots(job_type, pipeline_id) == 0:
+        return False
+    _running[job_type] += 1
+    if pipeline_id is not None:
+        _running_by_pipeline[(job_type, pipeline_id)] += 1
+    return True
+
+
+def release_slot(job_type: str, pipeline_id: Optional[UUID] = None) -> None:
+    """Give back a slot taken by ``try_acquire_slot``.
+
+    For a capped type, wakes the dispatch sweep so a job left waiting
+    for the slot is picked up now rather than on the next timed sweep.
+    """
+    _running[job_type] -= 1
+    if _running[job_type] <= 0:
+        del _running[job_type]
+    if pipeline_id is not None:
+        key = (job_type, pipeline_id)
+        _running_by_pipeline[key] -= 1
+        if _running_by_pipeline[key] <= 0:
+            del _running_by_pipeline[key]
+    if job_type in get_settings().JOB_CONCURRENCY_LIMITS:
+        wake_dispatcher()
+
+
+def saturated_job_types() -> list[str]:
+    """Capped job types with no free slot on this pod."""
+    return [
+        job_type
+        for job_type in get_settings().JOB_CONCURRENCY_LIMITS
+        if free_slots(job_type) == 0
+    ]
@@ -0,0 +1,22 @@
+"""Process-wide "take no new jobs" switch for a stopping worker.
+
+``app.worker`` flips it on SIGTERM/SIGINT, before its grace period:
+``run_job`` then leaves every job it is handed unclaimed — chained
+children included — the safety poller skips its sweeps and the
+``LISTEN`` loop stops waking it.  Jobs already claimed keep running.
+Rows left NOT_STARTED are picked up by the other pods (their inserts
+already ``NOTIFY``-ed them).
+"""
+
+_draining = False
+
+
+def start_draining() -> None:
+    """Stop claiming new jobs in this process (there is no way back)."""
+    global _draining
+    _draining = True
+
+
+def is_draining() -> bool:
+    """Whether this process has stopped claiming new jobs."""
+    return _draining
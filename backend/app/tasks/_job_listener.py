@@ -0,0 +1,117 @@
+"""In-process ``LISTEN`` wake-up for the job dispatch sweep.
+
+Job inserts (``create_ingestion_job``, ``chain_job``'s dedup insert) and
+recoveries queue a ``NOTIFY`` on ``JOB_NOTIFY_CHANNEL`` inside their
+transaction; Postgres delivers it at commit.  Each pod holds one
+dedicated connection listening on that channel and, on every
+notification, wakes the safety poller's dispatch sweep instead of
+letting the job wait out ``POLLER_INTERVAL_SECONDS``.  Cross-pod
+handoff (a job created on a pod that won't run it, an orphan recovered
+by another pod's sweep) drops to the notification round-trip.
+
+The poller stays the durable fallback: a missed notification (listener
+reconnecting, pod started mid-burst) is caught by its next timed sweep.
+While the listener is connected that sweep only needs to run every
+``JOB_NOTIFY_FALLBACK_POLL_SECONDS``; while it is not, the poller keeps
+the old ``POLLER_INTERVAL_SECONDS`` cadence.
+
+Notifications are coalesced into one ``asyncio.Event`` — a chain
+fan-out that inserts fifty children in one commit wakes the sweep once,
+and the sweep's own ``SKIP LOCKED`` SELECT picks all of them up.
+
+Every pod wakes on every notification; ``claim_job`` stays the only
+arbiter of who runs a job, so a pod that loses the race to the
+creating pod's in-process ``run_job`` just no-ops.
+
+Postgres + psycopg only: other dialects (SQLite unit tests) and drivers
+without ``notifies()`` leave the listener off and the poller on its
+fast cadence.
+"""
+
+import asyncio
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db import engine
+from app.repositories.data_ingestion import JOB_NOTIFY_CHANNEL
+from app.tasks._draining import is_draining
+
+logger = get_logger(__name__)
+
+_wakeup = asyncio.Event()
+_listening = False
+
+
+def wake_dispatcher() -> None:
+    """Ask the poller to run its dispatch sweep now."""
+    _wakeup.set()
+
+
+def is_listening() -> bool:
+    """Whether this pod currently holds a live ``LISTEN`` connection."""
+    return _listening
+
+
+async def wait_for_job_notify(timeout: float) -> bool:
+    """Sleep until a job notification arrives or ``timeout`` elapses.
+
+    Returns True when woken by a notification, False on timeout.  Clears
+    the wake-up either way, so notifications that landed while the
+    caller was sweeping count as one wake-up.
+    """
+    try:
+        await asyncio.wait_for(_wakeup.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        _wakeup.clear()
+
+
+async def listen_for_jobs() -> None:
+    """Hold the ``LISTEN`` connection forever, reconnecting on failure.
+
+    The connection is checked out of the engine pool for the lifetime
+    of the loop (one pool slot per pod) in autocommit, since Postgres
+    only delivers notifications between transactions.  Each (re)connect
+    wakes the sweep once to catch anything committed while the
+    listener was down.
+
+    Cancellation: ``asyncio.CancelledError`` propagates so the lifespan
+    shutdown can await the loop; the connection goes back to the pool.
+    A stopping worker (``_draining``) wakes nothing more: the loop
+    returns on the next notification.
+    """
+    global _listening
+    settings = get_settings()
+    if engine.dialect.name != "postgresql":
+        logger.info("Job listener: not on Postgres — poller-only dispatch")
+        return
+    while True:
+        try:
+            async with engine.connect() as conn:
+                await conn.execution_options(isolation_level="AUTOCOMMIT")
+                raw = await conn.get_raw_connection()
+                driver_conn = raw.driver_connection
+                if driver_conn is None or not hasattr(driver_conn, "notifies"):
+                    logger.info(
+                        "Job listener: driver has no notifies() — poller-only dispatch"
+                    )
+                    return
+                await driver_conn.execute(f'LISTEN "{JOB_NOTIFY_CHANNEL}"')
+                _listening = True
+                logger.info(f"Job listener: listening on {JOB_NOTIFY_CHANNEL!r}")
+                wake_dispatcher()
+                async for notify in driver_conn.notifies():
+                    if is_draining():
+                        # Stopping worker: the job is another pod's.
+                        return
+                    logger.debug(f"Job listener: job {notify.payload} ready")
+                    wake_dispatcher()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning(f"Job listener connection lost: {exc}", exc_info=True)
+        finally:
+            _listening = False
+        await asyncio.sleep(settings.POLLER_INTERVAL_SECONDS)
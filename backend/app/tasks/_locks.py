@@ -20,14 +20,20 @@ Dialect-gated: on non-Postgres backends (the SQLite unit-test fixture)
 the lock call is a no-op — SQLite's single-writer model already
 serialises any concurrent writers, so the lock is unnecessary and the
 ``pg_advisory_xact_lock`` function doesn't exist there anyway.
+
+``hold_factor_recalc_lock`` is the session-level variant for a handler
+that commits its data work more than once (the checkpointed recalc):
+an xact lock would be dropped by the first intermediate commit.
 """
 
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 from sqlalchemy import text
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.logging import get_logger
+from app.db import engine
 
 logger = get_logger(__name__)
 
@@ -83,3 +89,61 @@ async def acquire_factor_recalc_lock(
         f"({_FACTOR_RECALC_LOCK_CATEGORY}, {key}) for "
         f"(module={module_type_id}, year={year})"
     )
+
+
+@asynccontextmanager
+async def hold_factor_recalc_lock(
+    *,
+    module_type_id: Optional[int],
+    year: Optional[int],
+    handler_label: str,
+) -> AsyncIterator[None]:
+    """Hold the per-``(module, year)`` mutex for the ``async with`` block,
+    across any number of commits on the caller's data session.
+
+    Takes ``pg_advisory_lock`` on a dedicated connection kept checked
+    out for the block and unlocks it on exit.  A crashed pod's
+    connection drops and the server releases the lock with it.  Shares
+    the lock space with ``acquire_factor_recalc_lock``, so a concurrent
+    ``factor_ingest`` still waits for us — and the holder must NOT also
+    take the xact variant on its data session (it would wait on itself).
+
+    Same no-op cases as ``acquire_factor_recalc_lock``.
+    """
+    if module_type_id is None or year is None:
+        logger.debug(
+            f"{handler_label}: missing module_type_id or year — "
+            "skipping factor/recalc advisory lock"
+        )
+        yield
+        return
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    params = {
+        "cat": _FACTOR_RECALC_LOCK_CATEGORY,
+        "key": _encode_module_year_key(int(module_type_id), int(year)),
+    }
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT pg_advisory_lock(:cat, :key)"), params)
+        # End the statement's transaction; the session-level lock
+        # outlives it and the connection stays checked out.
+        await conn.commit()
+        logger.debug(
+            f"{handler_label}: acquired pg_advisory_lock"
+            f"({params['cat']}, {params['key']}) for "
+            f"(module={module_type_id}, year={year})"
+        )
+        try:
+            yield
+        finally:
+            try:
+                await conn.execute(
+                    text("SELECT pg_advisory_unlock(:cat, :key)"), params
+                )
+                await conn.commit()
+            except Exception:
+                # Never hand a possibly still-locked connection back to
+                # the pool: dropping it releases the lock server-side.
+                logger.exception(f"{handler_label}: advisory unlock failed")
+                await conn.invalidate()
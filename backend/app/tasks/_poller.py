@@ -7,18 +7,29 @@ that fired ``run_job`` and then crashed before the runner claimed) and
 re-fire them.  Jobs without a ``job_type`` (legacy in-flight rows
 created pre-Plan-C) are excluded from the SELECT so they don't get
 funneled through a runner that has no handler for them.
+
+Job inserts also ``NOTIFY`` a channel that ``_job_listener`` LISTENs on;
+a notification wakes the dispatch sweep immediately, and the timed
+dispatch sweep drops to ``JOB_NOTIFY_FALLBACK_POLL_SECONDS`` while the
+listener is connected.  Stale-job recovery and deferred (``run_after``)
+jobs send no notification, so they keep their own timers.
 """
 
 import asyncio
+from datetime import datetime, timezone
+from typing import Optional, Sequence
 
 from sqlalchemy import func, or_
 from sqlmodel import col, select
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
 from app.core.logging import get_logger
 from app.db import SessionLocal
 from app.models.data_ingestion import DataIngestionJob, IngestionState
 from app.repositories.data_ingestion import DataIngestionRepository
+from app.tasks._concurrency import free_slots, saturated_job_types
+from app.tasks._draining import is_draining
+from app.tasks._job_listener import is_listening, wait_for_job_notify
 from app.tasks._pod_id import POD_ID
 from app.tasks.runner import run_job
 
@@ -57,7 +68,7 @@ async def dispatch_job(job: DataIngestionJob, pod_id: str) -> None:
     await run_job(jid)
 
 
-def _pending_runner_jobs_query(limit: int = 10):
+def _pending_runner_jobs_query(limit: int = 10, exclude_job_types: Sequence[str] = ()):
     """Pending-jobs query for the runner cutover.
 
     Same predicates as ``DataIngestionRepository._pending_jobs_query``,
@@ -66,19 +77,27 @@ def _pending_runner_jobs_query(limit: int = 10):
     through a runner that has no registered handler for them.  The
     runner itself defends in depth (refuses to dispatch a NULL row),
     but filtering at SELECT time avoids per-iteration noise in the logs.
+
+    ``exclude_job_types`` drops the types this pod is at its concurrency
+    cap for, so a backlog of one type doesn't fill the batch limit.
+
+    Ordered by ``priority`` (highest first), then id: a user's upload
+    and its chained jobs jump ahead of a bulk reload's backlog.
     """
+    stmt = select(DataIngestionJob).where(
+        col(DataIngestionJob.state) == IngestionState.NOT_STARTED,
+        col(DataIngestionJob.job_type).is_not(None),
+        or_(
+            col(DataIngestionJob.run_after).is_(None),
+            col(DataIngestionJob.run_after) <= func.now(),
+        ),
+        col(DataIngestionJob.locked_by).is_(None),
+        col(DataIngestionJob.attempts) < col(DataIngestionJob.max_attempts),
+    )
+    if exclude_job_types:
+        stmt = stmt.where(col(DataIngestionJob.job_type).not_in(exclude_job_types))
     return (
-        select(DataIngestionJob)
-        .where(
-            col(DataIngestionJob.state) == IngestionState.NOT_STARTED,
-            col(DataIngestionJob.job_type).is_not(None),
-            or_(
-                col(DataIngestionJob.run_after).is_(None),
-                col(DataIngestionJob.run_after) <= func.now(),
-            ),
-            col(DataIngestionJob.locked_by).is_(None),
-            col(DataIngestionJob.attempts) < col(DataIngestionJob.max_attempts),
-        )
+        stmt.order_by(col(DataIngestionJob.priority).desc(), col(DataIngestionJob.id))
         .with_for_update(skip_locked=True)
         .limit(limit)
     )
@@ -87,48 +106,133 @@ def _pending_runner_jobs_query(limit: int = 10):
 async def poll_pending_jobs() -> None:
     """Pick up jobs that were created but never scheduled (e.g. crashed pod).
 
-    Two sweeps per iteration:
+    Two sweeps:
 
     1. ``sweep_stuck_running_jobs`` — auto-recovery for jobs stuck in
        RUNNING past the stale-timeout window (a pod crashed mid-execution).
        Recoverable rows go back to NOT_STARTED; rows out of retries are
-       moved to FINISHED+ERROR so operators see them.
+       moved to FINISHED+ERROR so operators see them.  Runs on the timed
+       cadence only, not on every job notification.
 
     2. NOT_STARTED dispatch sweep — pick up rows the endpoint fired but
        the in-process Task never reached (pod crashed in the gap between
-       commit and ``fire_and_forget``).  Filtered to ``job_type IS NOT
-       NULL`` so legacy rows don't trip on the missing handler path.
+       commit and ``fire_and_forget``), or that another pod created.
+       Filtered to ``job_type IS NOT NULL`` so legacy rows don't trip on
+       the missing handler path.
+
+    Sweep 1 runs every ``POLLER_INTERVAL_SECONDS`` whatever the
+    listener's state: a crashed pod sends no notification.  Sweep 2 runs
+    on each job notification and otherwise every
+    ``POLLER_INTERVAL_SECONDS`` — or ``JOB_NOTIFY_FALLBACK_POLL_SECONDS``
+    while the listener is connected — and also wakes when the earliest
+    deferred job's ``run_after`` comes due, which no notification
+    announces either.  The loop returns once the worker is stopping
+    (``_draining``): both sweeps are left to the other pods.
     """
     settings = get_settings()
-    while True:
+    loop = asyncio.get_running_loop()
+    next_recovery_at = next_dispatch_at = loop.time()
+    notified = False
+    while not is_draining():
         try:
             async with SessionLocal() as session:
                 repo = DataIngestionRepository(session)
 
                 # Sweep 1: pod-crash auto-recovery.
-                recovered, abandoned = await repo.sweep_stuck_running_jobs(
-                    settings.STALE_JOB_TIMEOUT_MINUTES
-                )
-                if recovered:
-                    logger.warning(
-                        f"Poller: auto-recovered {recovered} stuck RUNNING job(s) "
-                        "(state→NOT_STARTED, attempts preserved for max-retry guard)"
-                    )
-                if abandoned:
-                    logger.error(
-                        f"Poller: abandoned {abandoned} stuck RUNNING job(s) — "
-                        "exhausted max_attempts retries, marked FINISHED+ERROR"
+                if loop.time() >= next_recovery_at:
+                    next_recovery_at = loop.time() + settings.POLLER_INTERVAL_SECONDS
+                    recovered, abandoned = await repo.sweep_stuck_running_jobs(
+                        settings.STALE_JOB_TIMEOUT_MINUTES
                     )
+                    if recovered:
+                        logger.warning(
+                            f"Poller: auto-recovered {recovered} stuck RUNNING "
+                            "job(s) (state→NOT_STARTED, attempts preserved for "
+                            "max-retry guard)"
+                        )
+                        notified = True
+                    if abandoned:
+                        logger.error(
+                            f"Poller: abandoned {abandoned} stuck RUNNING job(s) — "
+                            "exhausted max_attempts retries, marked FINISHED+ERROR"
+                        )
 
                 # Sweep 2: dispatch NOT_STARTED jobs through the unified runner.
-                stmt = _pending_runner_jobs_query(settings.POLLER_BATCH_LIMIT)
-                jobs = (await session.execute(stmt)).scalars().all()
-                for job in jobs:
-                    logger.info(f"Poller: scheduling orphaned job {job.id}")
-                    schedule_job(job, POD_ID)
+                if notified or loop.time() >= next_dispatch_at:
+                    stmt = _pending_runner_jobs_query(
+                        settings.POLLER_BATCH_LIMIT, saturated_job_types()
+                    )
+                    jobs = (await session.execute(stmt)).scalars().all()
+                    for job in _within_free_slots(jobs):
+                        logger.info(f"Poller: scheduling pending job {job.id}")
+                        schedule_job(job, POD_ID)
+                    next_dispatch_at = loop.time() + _poll_interval(settings)
+                    run_after = (
+                        await session.execute(_next_run_after_query())
+                    ).scalar_one_or_none()
+                    if run_after is not None:
+                        next_dispatch_at = min(
+                            next_dispatch_at, loop.time() + _seconds_until(run_after)
+                        )
         except Exception as exc:
             logger.warning(f"Poller iteration failed: {exc}", exc_info=True)
-        await asyncio.sleep(settings.POLLER_INTERVAL_SECONDS)
+            next_dispatch_at = loop.time() + _poll_interval(settings)
+        notified = await wait_for_job_notify(
+            max(0.0, min(next_recovery_at, next_dispatch_at) - loop.time())
+        )
+
+
+def _within_free_slots(jobs: Sequence[DataIngestionJob]) -> list[DataIngestionJob]:
+    """Keep, per capped job type and per pipeline, only as many jobs as
+    this pod has free slots for; ``run_job`` would just turn the rest
+    away.  ``jobs`` is in priority order, so the slots go to the
+    highest-priority jobs, within each pipeline's fair share."""
+    type_budget: dict[str, Optional[int]] = {}
+    pipeline_budget: dict[tuple, Optional[int]] = {}
+    kept = []
+    for job in jobs:
+        job_type = job.job_type or ""
+        key = (job_type, job.pipeline_id)
+        if job_type not in type_budget:
+            type_budget[job_type] = free_slots(job_type)
+        if key not in pipeline_budget:
+            pipeline_budget[key] = free_slots(job_type, job.pipeline_id)
+        left, pipeline_left = type_budget[job_type], pipeline_budget[key]
+        if left == 0 or pipeline_left == 0:
+            continue
+        if left is not None:
+            type_budget[job_type] = left - 1
+        if pipeline_left is not None:
+            pipeline_budget[key] = pipeline_left - 1
+        kept.append(job)
+    return kept
+
+
+def _next_run_after_query():
+    """Earliest ``run_after`` still in the future among the jobs
+    ``_pending_runner_jobs_query`` will pick up once it passes."""
+    return select(func.min(col(DataIngestionJob.run_after))).where(
+        col(DataIngestionJob.state) == IngestionState.NOT_STARTED,
+        col(DataIngestionJob.job_type).is_not(None),
+        col(DataIngestionJob.run_after) > func.now(),
+        col(DataIngestionJob.locked_by).is_(None),
+        col(DataIngestionJob.attempts) < col(DataIngestionJob.max_attempts),
+    )
+
+
+def _seconds_until(moment: datetime) -> float:
+    """Seconds from now to ``moment`` (naive values are UTC, as SQLite
+    returns them), never negative."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+
+def _poll_interval(settings: Settings) -> int:
+    """Timed-sweep cadence: slow while notifications wake the sweep."""
+    if is_listening():
+        return settings.JOB_NOTIFY_FALLBACK_POLL_SECONDS
+    return settings.POLLER_INTERVAL_SECONDS
 
 
 # Safety poller task is managed in main.py lifespan context manager,
@@ -0,0 +1,72 @@
+"""Start/stop the background loops of a job-running process.
+
+Shared by the API lifespan (``app.main``, when ``API_RUNS_JOBS``) and
+the standalone worker (``app.worker``) so both run the same set of
+loops under the same ``RUN_*`` flags:
+
+* the safety poller (Plan 310A) plus its ``LISTEN`` wake-up;
+* the pipeline reconciliation sweep (#1236 Phase 3) — durable backstop
+  for the runner's log-and-skip post-``finish_job`` write;
+* the pod heartbeat writer (#1080 sprint-9) — registers this pod in the
+  ``pods`` table so the workers view shows who's claiming work.
+  Motivating incident: a dev branch running locally against the stage
+  DB silently collided with the deployed stage app — no UI surfaced
+  two pods.
+"""
+
+import asyncio
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.tasks._pod_id import POD_ID
+
+logger = get_logger(__name__)
+
+
+def start_job_services() -> dict[str, asyncio.Task]:
+    """Start the enabled loops; returns them by display name."""
+    settings = get_settings()
+    tasks: dict[str, asyncio.Task] = {}
+
+    if settings.RUN_BACKGROUND_POLLER:
+        from app.tasks._poller import poll_pending_jobs
+
+        logger.info(f"Starting safety poller on pod {POD_ID}")
+        tasks["safety poller"] = asyncio.create_task(poll_pending_jobs())
+        if settings.JOB_NOTIFY_ENABLED:
+            from app.tasks._job_listener import listen_for_jobs
+
+            tasks["job listener"] = asyncio.create_task(listen_for_jobs())
+
+    if settings.RUN_PIPELINE_RECONCILER:
+        from app.tasks._pipeline_reconciler import reconcile_pipeline_statuses_loop
+
+        logger.info(
+            "Starting pipeline reconciler (every %ss)",
+            settings.PIPELINE_RECONCILER_INTERVAL_SECONDS,
+        )
+        tasks["pipeline reconciler"] = asyncio.create_task(
+            reconcile_pipeline_statuses_loop()
+        )
+
+    if settings.RUN_POD_HEARTBEAT:
+        from app.tasks._pod_heartbeat import pod_heartbeat_loop
+
+        logger.info(
+            "Starting pod heartbeat (every %ss)",
+            settings.POD_HEARTBEAT_INTERVAL_SECONDS,
+        )
+        tasks["pod heartbeat"] = asyncio.create_task(pod_heartbeat_loop())
+
+    return tasks
+
+
+async def stop_job_services(tasks: dict[str, asyncio.Task]) -> None:
+    """Cancel the loops started by ``start_job_services`` and await them."""
+    for name, task in tasks.items():
+        logger.info(f"Cancelling {name}")
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            logger.info(f"{name.capitalize()} cancelled successfully")
@@ -12,12 +12,14 @@ preemption check, and the FINISHED-state write — these handlers
 only contain the work itself.
 """
 
+from contextlib import AsyncExitStack
 from typing import Optional
 from uuid import UUID
 
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.db import SessionLocal
 from app.models.data_entry import DataEntryTypeEnum
@@ -32,13 +34,24 @@ from app.models.data_ingestion import (
 )
 from app.repositories.data_ingestion import DataIngestionRepository
 from app.tasks._chain import AGGREGATION_DEDUP, chain_job
-from app.tasks._locks import acquire_factor_recalc_lock
+from app.tasks._locks import acquire_factor_recalc_lock, hold_factor_recalc_lock
+from app.tasks._pod_id import POD_ID
 from app.tasks.registry import register
-from app.workflows.emission_recalculation import EmissionRecalculationWorkflow
+from app.workflows.emission_recalculation import (
+    EmissionRecalculationWorkflow,
+    RecalcCheckpoint,
+)
 
 logger = get_logger(__name__)
 
 
+def _int_list(raw: object) -> Optional[list[int]]:
+    """The ints of a job-config list, or None when it is not a list."""
+    if not isinstance(raw, list):
+        return None
+    return [int(i) for i in raw if isinstance(i, int)]
+
+
 # ---------------------------------------------------------------------------
 # Plan 310-C registered handlers (additive — coexist with the legacy
 # functions below until the endpoint+poller cutover PR removes them).
@@ -298,6 +311,13 @@ async def emission_recalc_handler(
     Returns the ``meta`` dict the runner will persist to
     ``DataIngestionJob.meta``.  ``status_message`` and ``result``
     keys are read by the runner for the FINISHED-state write.
+
+    With ``EMISSION_RECALC_CHECKPOINTED`` each chunk is committed on
+    ``data_session`` as soon as it is written, followed by its cursor in
+    ``meta.recalc_checkpoint``; a retry of this job (stale-job sweep →
+    NOT_STARTED → re-claimed) resumes after that cursor, provided its
+    scope is unchanged and no factor ingest has dropped the checkpoint
+    since (``widen_active_recalc_targeting``).
     """
     if job.id is None:
         raise ValueError("emission_recalc: job has no id")
@@ -319,18 +339,7 @@ async def emission_recalc_handler(
     )
     await job_session.commit()
 
-    # 4B — per-``(module, year)`` advisory lock: blocks while any
-    # concurrent ``factor_ingest`` for the same scope is mid-write,
-    # so this recalc reads complete factor values instead of the
-    # half-loaded state. Held until ``data_session`` commits (runner
-    # does that after this handler returns) — covers the whole
-    # factor-read window inside the workflow.
-    await acquire_factor_recalc_lock(
-        data_session,
-        module_type_id=job.module_type_id,
-        year=job.year,
-        handler_label=f"emission_recalc job {job.id}",
-    )
+    checkpointed = get_settings().EMISSION_RECALC_CHECKPOINTED
 
     logger.info(
         f"emission_recalc handler (job {job.id}): "
@@ -351,21 +360,101 @@ async def emission_recalc_handler(
         )
         await job_session.commit()
 
-    # Unit-specific ingests pin their module scope at chain time so a
-    # 20-row upload doesn't recompute the whole (det, year) slice.
-    config = (job.meta or {}).get("config") or {}
-    raw_scope = config.get("carbon_report_module_ids")
-    module_scope: Optional[list[int]] = None
-    if isinstance(raw_scope, list):
-        module_scope = [int(i) for i in raw_scope if isinstance(i, int)]
+    # 4B — per-``(module, year)`` advisory lock: blocks while any
+    # concurrent ``factor_ingest`` for the same scope is mid-write,
+    # so this recalc reads complete factor values instead of the
+    # half-loaded state. Held until ``data_session`` commits (runner
+    # does that after this handler returns) — covers the whole
+    # factor-read window inside the workflow.  A checkpointed run
+    # commits per chunk, which would drop that xact lock after the
+    # first chunk, so it holds the session-level variant until the
+    # workflow returns instead.
+    factor_lock = AsyncExitStack()
+    if checkpointed:
+        await factor_lock.enter_async_context(
+            hold_factor_recalc_lock(
+                module_type_id=job.module_type_id,
+                year=job.year,
+                handler_label=f"emission_recalc job {job.id}",
+            )
+        )
+    else:
+        await acquire_factor_recalc_lock(
+            data_session,
+            module_type_id=job.module_type_id,
+            year=job.year,
+            handler_label=f"emission_recalc job {job.id}",
+        )
 
     try:
+        # Unit-specific ingests pin their module scope at chain time so a
+        # 20-row upload doesn't recompute the whole (det, year) slice.
+        # Factor-ingest children carry the ids of the factors that
+        # changed, row-diff CSV ingests the ids of the entries they
+        # wrote, so only those entries are revisited.  A later ingest
+        # deduped into this job may have widened (or dropped) any of
+        # these — or scoped a job chained without them — while we waited
+        # on the lock above, so the config is always re-read now that no
+        # factor write can interleave any more.
+        fresh = await job_repo.get_job_by_id(job.id)
+        config = ((fresh or job).meta or {}).get("config") or {}
+        module_scope = _int_list(config.get("carbon_report_module_ids"))
+        changed_factor_ids = _int_list(config.get("changed_factor_ids"))
+        changed_entry_ids = _int_list(config.get("changed_entry_ids"))
+
+        checkpoint_scope = {
+            "carbon_report_module_ids": module_scope,
+            "changed_factor_ids": changed_factor_ids,
+            "changed_entry_ids": changed_entry_ids,
+        }
+        resume_from: Optional[RecalcCheckpoint] = None
+        if checkpointed:
+            saved = (job.meta or {}).get("recalc_checkpoint")
+            if isinstance(saved, dict) and saved.get("scope") == checkpoint_scope:
+                resume_from = RecalcCheckpoint.from_meta(saved)
+            elif saved is not None:
+                logger.info(
+                    f"emission_recalc job {job.id}: discarding checkpoint "
+                    "taken under a different scope — recalculating the slice"
+                )
+
+        async def _checkpoint(progress: RecalcCheckpoint) -> None:
+            # Chunk first, cursor second: a crash in between replays one
+            # chunk (its DELETE + COPY and relinks are idempotent)
+            # rather than skipping it.
+            await data_session.commit()
+            saved = await job_repo.save_recalc_checkpoint(
+                job_id, POD_ID, {**progress.to_meta(), "scope": checkpoint_scope}
+            )
+            await job_session.commit()
+            if not saved:
+                raise RuntimeError(
+                    f"emission_recalc job {job_id}: no longer owns the job "
+                    "row — stopping the checkpointed recalc"
+                )
+
+        # Large slices shard their compute across worker processes;
+        # every write still lands on ``data_session`` under the lock
+        # taken above, so the runner's commit stays the only one
+        # (checkpointed runs: one commit per chunk, in-process).
         stats = await svc.recalculate_for_data_entry_type(
             data_entry_type,
             job.year,
             progress_callback=_progress,
             carbon_report_module_ids=module_scope,
+            parallel_workers=get_settings().EMISSION_RECALC_WORKERS,
+            changed_factor_ids=changed_factor_ids,
+            checkpoint=_checkpoint if checkpointed else None,
+            resume_from=resume_from,
+            data_entry_ids=changed_entry_ids,
         )
+        # Modules a row-diff ingest only removed entries from have nothing
+        # left to recalculate, but their stats are stale all the same.
+        changed_module_ids = _int_list(config.get("changed_module_ids"))
+        if changed_module_ids:
+            stats["affected_module_ids"] = sorted(
+                set(stats.get("affected_module_ids") or []) | set(changed_module_ids)
+            )
     except Exception:
         # Stamp the coalescing flag BEFORE re-raising so surviving
         # siblings can still discover themselves as "last" and fire
@@ -378,6 +467,8 @@ async def emission_recalc_handler(
         # the stamp.
         await _stamp_recalc_work_complete(job)
         raise
+    finally:
+        await factor_lock.aclose()
 
     result = (
         IngestionResult.SUCCESS if stats["errors"] == 0 else IngestionResult.WARNING
@@ -452,11 +543,15 @@ async def emission_recalc_handler(
     # Phase 5B (#1236) — ``aggregation_job_id`` dropped from meta;
     # ``compute_pipeline_progress`` reads aggregation completion
     # directly from the aggregation job rows in this pipeline.
-    return {
+    meta: dict = {
         "status_message": "Emission recalculation completed",
         "result": result,
         "recalculation": stats,
     }
+    if checkpointed:
+        # The slice is done; a later run of this job must not resume.
+        meta["recalc_checkpoint"] = None
+    return meta
 
 
 @register("module_emission_recalc")
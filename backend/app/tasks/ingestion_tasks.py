@@ -79,13 +79,33 @@ async def csv_ingest_handler(
         # No data_entries committed (or partial state we don't trust)
         # — nothing to recalc against.  Runner will mark FINISHED+ERROR.
         return meta
+    if meta.get("unchanged"):
+        # Identical per-year re-upload: nothing was written, and the
+        # rows' emissions are the ones the original pipeline computed.
+        return meta
+    # A row-diff ingest reports what it touched: the modules (``[]`` —
+    # nothing inserted, updated or deleted, so nothing to chain) and,
+    # up to a cap, the entries it wrote, for a targeted recalc.
+    raw_modules = meta.get("changed_module_ids")
+    if isinstance(raw_modules, list) and not raw_modules:
+        return meta
+    raw_entries = meta.get("changed_entry_ids")
 
     # Phase 5B (#1236) — chained count no longer threaded through
     # ``meta.recalc_jobs_chained``; ``recompute_pipeline_status``
     # derives the same value from the live job count and writes it to
     # ``pipelines.expected_recalc``.  The call remains for its
     # side-effect of dispatching the recalc fan-out.
-    await _chain_emission_recalc_for_data_ingest(job, job_session)
+    await _chain_emission_recalc_for_data_ingest(
+        job,
+        job_session,
+        changed_entry_ids=(
+            [int(i) for i in raw_entries] if isinstance(raw_entries, list) else None
+        ),
+        changed_module_ids=(
+            [int(i) for i in raw_modules] if isinstance(raw_modules, list) else None
+        ),
+    )
     return meta
 
 
@@ -139,6 +159,11 @@ async def factor_ingest_handler(
       factor file).
     - Both NULL → consult ``get_recalculation_status_by_year`` for
       anything stale (admin-style trigger).
+
+    The provider reports the factors it inserted or re-valued as
+    ``meta.changed_factor_ids``; each child carries that list so its
+    recalc only revisits the entries those factors feed.  An empty list
+    (a re-import without edits) chains nothing.
     """
     # 4B — per-``(module, year)`` advisory lock acquired BEFORE the
     # factor write begins, so any concurrent ``emission_recalc`` for
@@ -166,7 +191,21 @@ async def factor_ingest_handler(
     # Phase 5B (#1236) — see csv_ingest_handler; chained count derived
     # from job rows via ``recompute_pipeline_status``, not threaded
     # through meta.
-    await _chain_recalc_for_stale(job, job_session)
+    raw_changed = meta.get("changed_factor_ids")
+    changed_factor_ids: Optional[list[int]] = (
+        [int(i) for i in raw_changed] if isinstance(raw_changed, list) else None
+    )
+    if changed_factor_ids == []:
+        # Every factor in the file was already stored with the same
+        # values: no entry's emissions can move.
+        logger.info(
+            f"factor_ingest job {job.id}: no factor inserted or changed — "
+            "skipping recalc fan-out"
+        )
+        return meta
+    await _chain_recalc_for_stale(
+        job, job_session, changed_factor_ids=changed_factor_ids
+    )
     return meta
 
 
@@ -314,6 +353,8 @@ async def _run_ingest(
 async def _chain_recalc_for_stale(
     job: DataIngestionJob,
     session: AsyncSession,
+    *,
+    changed_factor_ids: Optional[list[int]] = None,
 ) -> int:
     """Fan out one ``emission_recalc`` child per stale ``(module, det)``.
 
@@ -328,6 +369,13 @@ async def _chain_recalc_for_stale(
     into a single pending recalc.  Without this, a user re-uploading
     a corrected factors CSV seconds after the first upload would queue
     a redundant recalc on top of the already-pending one.
+
+    ``changed_factor_ids`` (``None`` = unknown, recalc everything)
+    becomes each child's ``config.changed_factor_ids``: the recalc then
+    only selects entries linked to, or rematching onto, those factors.
+    When dedup folds this fan-out into an already-active recalc, that
+    row's targeting is widened to include these ids instead
+    (``widen_active_recalc_targeting``), so no change is left behind.
     """
     # Late import to avoid circular: module_type → data_ingestion → tasks.
     from app.models.module_type import (
@@ -408,14 +456,19 @@ async def _chain_recalc_for_stale(
     # ingestion_method=computed, entity_type=MODULE_PER_YEAR — exactly
     # what an emission_recalc child needs — so we don't pass them.
     # ``emission_recalc_handler`` reads scope from the row's columns
-    # (data_entry_type_id, year), not from meta.config, so the config
-    # is intentionally minimal.
+    # (data_entry_type_id, year), not from meta.config; the config only
+    # carries the optional ``changed_factor_ids`` targeting.
     # Count only children this pipeline actually created — a
     # dedup-skipped target (``chain_job`` returns ``None``) means an
     # earlier active pipeline already owns that recalc, so it must NOT
     # count toward THIS pipeline's expected fan-out (the
     # pipeline-progress contract keys phase 2 off this number; counting
     # skipped targets would make completion wait forever).
+    child_config: Optional[dict[str, Any]] = (
+        {"changed_factor_ids": changed_factor_ids}
+        if changed_factor_ids is not None
+        else None
+    )
     chained = 0
     for row in targets:
         child_id = await chain_job(
@@ -425,10 +478,20 @@ async def _chain_recalc_for_stale(
             data_entry_type_id=row["data_entry_type_id"],
             year=year,
             session=session,
+            config=child_config,
             dedup_config=EMISSION_RECALC_DEDUP,
         )
         if child_id is not None:
             chained += 1
+            continue
+        widened = await repo.widen_active_recalc_targeting(
+            module_type_id=row["module_type_id"],
+            data_entry_type_id=row["data_entry_type_id"],
+            year=year,
+            changed_factor_ids=changed_factor_ids,
+        )
+        if widened:
+            await session.commit()
     logger.info(
         f"factor_ingest job {job.id}: chained {chained}/{len(targets)} "
         f"emission_recalc child(ren) for year={year}"
@@ -444,6 +507,9 @@ async def _chain_recalc_for_stale(
 async def _chain_emission_recalc_for_data_ingest(
     job: DataIngestionJob,
     session: AsyncSession,
+    *,
+    changed_entry_ids: Optional[list[int]] = None,
+    changed_module_ids: Optional[list[int]] = None,
 ) -> int:
     """Fan out ``emission_recalc`` children for a successful data-entry ingest.
 
@@ -463,6 +529,15 @@ async def _chain_emission_recalc_for_data_ingest(
       pins module_type_id).  Leaving the data un-recalculated is
       preferable to crashing the parent's FINISHED write.
 
+    A row-diff CSV ingest passes the modules it touched
+    (``changed_module_ids``) and, when it could list them, the entries
+    it inserted or updated (``changed_entry_ids``); both go on each
+    child's config so its recalc revisits only those entries and its
+    aggregation refreshes those modules.  A child deduped into an
+    active recalc widens that recalc's targeting and module scope
+    instead (``widen_active_recalc_targeting``), whatever kind of
+    ingest this was.
+
     Returns the number of children chained (0 on the defensive
     skip).  Year is mandatory for ``emission_recalc`` (the workflow
     queries by ``(data_entry_type_id, year)``); raise rather than
@@ -533,13 +608,20 @@ async def _chain_emission_recalc_for_data_ingest(
     # that scope on the child so its recalc touches one module's
     # entries instead of the whole (det, year) slice (a 20-row upload
     # was recomputing 15k+ entries).  Per-year ingests leave it None:
-    # full-slice recalc is their contract.
+    # full-slice recalc is their contract, unless they ran as a row
+    # diff and report what they changed.
     parent_config = (job.meta or {}).get("config") or {}
     raw_module_id = parent_config.get("carbon_report_module_id")
     child_config: Optional[dict[str, Any]] = None
-    if raw_module_id is not None:
+    module_scope: Optional[list[int]] = None
+    if changed_module_ids is not None:
+        child_config = {"changed_module_ids": changed_module_ids}
+        if changed_entry_ids is not None:
+            child_config["changed_entry_ids"] = changed_entry_ids
+    elif raw_module_id is not None:
         try:
-            child_config = {"carbon_report_module_ids": [int(raw_module_id)]}
+            module_scope = [int(raw_module_id)]
+            child_config = {"carbon_report_module_ids": module_scope}
         except (TypeError, ValueError):
             logger.warning(
                 f"data ingest job {job.id}: non-int carbon_report_module_id="
@@ -565,6 +647,17 @@ async def _chain_emission_recalc_for_data_ingest(
         )
         if child_id is not None:
             chained += 1
+            continue
+        widened = await DataIngestionRepository(session).widen_active_recalc_targeting(
+            module_type_id=row["module_type_id"],
+            data_entry_type_id=row["data_entry_type_id"],
+            year=year,
+            changed_entry_ids=changed_entry_ids,
+            changed_module_ids=changed_module_ids,
+            carbon_report_module_ids=module_scope,
+        )
+        if widened:
+            await session.commit()
     logger.info(
         f"data ingest job {job.id}: chained {chained}/{len(targets)} "
         f"emission_recalc child(ren) for "
@@ -33,6 +33,8 @@ Concurrency model per ``run_job`` invocation:
 
 import asyncio
 
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.db import SessionLocal
@@ -40,11 +42,23 @@ from app.models.data_ingestion import (
     IngestionResult,
 )
 from app.repositories.data_ingestion import DataIngestionRepository
+from app.tasks._concurrency import release_slot, try_acquire_slot
+from app.tasks._draining import is_draining
 from app.tasks._pod_id import POD_ID
 from app.tasks.registry import get_handler
 
 logger = get_logger(__name__)
 
+# Set by ``app.worker`` at startup.  A worker process always runs jobs;
+# the API process only when ``API_RUNS_JOBS`` is on.
+_in_worker_process = False
+
+
+def mark_worker_process() -> None:
+    """Declare this process a dedicated job worker (see ``app.worker``)."""
+    global _in_worker_process
+    _in_worker_process = True
+
 
 async def run_job(job_id: int) -> None:
     """Dispatch a job through its registered handler.
@@ -54,11 +68,17 @@ async def run_job(job_id: int) -> None:
       - ``app.tasks._chain.chain_job`` (parent handler chains a child)
       - the safety poller (orphan recovery)
 
+    In an API process with ``API_RUNS_JOBS`` off it returns at once: a
+    dedicated ``app.worker`` process claims the job instead.
+
     Lifecycle:
 
       1. Open job_session + data_session.
       2. Resolve job → reject if missing or ``job_type IS NULL``.
-      3. ``claim_job`` (atomic RUNNING + attempts++ + ``started_at``).
+      3. Take a per-job-type concurrency slot (``_concurrency``); at
+         capacity, exit without claiming so another pod can.  A
+         stopping worker (``_draining``) does the same.  Then
+         ``claim_job`` (atomic RUNNING + attempts++ + ``started_at``).
          Returns False if the job was already claimed / finished /
          out of retries — in which case run_job is a silent no-op.
       4. Spawn heartbeat task (refreshes ``locked_at`` periodically).
@@ -75,13 +95,22 @@ async def run_job(job_id: int) -> None:
       8. ``finish_job`` stamps ``finished_at`` via ``coalesce``
          (Plan 310-C observability), so the dashboard duration
          query (finished_at - started_at) closes cleanly.
-      9. Cancel heartbeat task in ``finally``.
+      9. Cancel heartbeat task and release the slot in ``finally``.
 
     Errors raised by the handler are caught and persisted as
     FINISHED+ERROR.  Errors raised by the runner itself (claim
     contention, preemption) are logged and the job state is left for
-    the next claimer.
+    the next claimer.  Cancellation while the handler runs (a stopping
+    worker cutting the job off) rolls its writes back and hands the
+    row back to NOT_STARTED (``_release_cut_off_job``); cancelled at
+    any other point, the row stays RUNNING for the stale-job sweep.
     """
+    # API process with dedicated workers: the endpoint's dispatch is a
+    # no-op — the job insert's NOTIFY already woke a worker to claim it.
+    if not (_in_worker_process or get_settings().API_RUNS_JOBS):
+        logger.debug(f"run_job: job {job_id} left for the worker processes")
+        return
+
     # Plan 310-C: ensure every handler module has been imported so the
     # registry is populated before lookup.  Idempotent — first call
     # imports, subsequent calls are a no-op.  Lazy import (here, not at
@@ -111,54 +140,75 @@ async def run_job(job_id: int) -> None:
         # is a type-narrowing convenience, not a behavior change).
         job_type: str = job.job_type
 
-        if not await repo.claim_job(job_id, POD_ID):
-            # Another pod beat us, attempts exhausted, or the row is
-            # already FINISHED.  Either way: not ours to run.
+        # Per-pod concurrency cap (and per-pipeline fair share, see
+        # ``_concurrency``): at capacity, leave the row unclaimed
+        # for another pod (or for this one once a slot frees — releasing
+        # wakes the dispatch sweep).  Taken before ``claim_job`` and
+        # released in the ``finally`` below, whatever happens after.
+        slot_pipeline_id = job.pipeline_id
+        if not try_acquire_slot(job_type, slot_pipeline_id):
+            logger.info(
+                f"run_job: pod at {job_type!r} concurrency cap (or pipeline "
+                f"share) — leaving job {job_id} for the next free slot"
+            )
             return
 
-        # ``claim_job`` ran a raw SQL UPDATE (state=RUNNING, attempts++,
-        # locked_by, locked_at, and — via the func.coalesce from PR #1026
-        # — started_at).  The in-memory ``job`` instance from the pre-claim
-        # ``get_job_by_id`` still reflects the OLD row, so re-fetch to
-        # hand handlers the authoritative post-claim state (state, attempts,
-        # locked_by, started_at).  ``get_job_by_id`` already calls refresh.
-        job = await repo.get_job_by_id(job_id)
-        if job is None:
-            # Race: claimed but row vanished before the re-read.  Treat
-            # as preempted and exit; no state to write since there's no
-            # row to write to.
-            logger.warning(f"run_job: job {job_id} disappeared after claim — exiting")
-            return
+        heartbeat_task: asyncio.Task[None] | None = None
+        try:
+            if is_draining():
+                logger.info(
+                    f"run_job: worker stopping — leaving job {job_id} for another pod"
+                )
+                return
+            if not await repo.claim_job(job_id, POD_ID):
+                # Another pod beat us, attempts exhausted, or the row is
+                # already FINISHED.  Either way: not ours to run.
+                return
 
-        # #1236 — capture pipeline_id as a plain value now (immutable
-        # for the job's life). Read post-``finish_job`` from a fresh /
-        # post-commit ``job_session`` would risk an expired-instance
-        # lazy load; a local value sidesteps that entirely.
-        pipeline_id_for_status = job.pipeline_id
-
-        # Plain ``asyncio.create_task`` (not ``fire_and_forget``): the
-        # local ``heartbeat_task`` ref keeps the task alive for the
-        # lifetime of this function, and we cancel + await it in the
-        # ``finally`` block so the cancellation is observed cleanly.
-        # Routing through ``fire_and_forget`` would trip its deliberate
-        # cancellation-WARNING (kept loud for diagnosing the 310-B
-        # incident) on every successful run, drowning out genuine
-        # cancellations.
-        #
-        # B-H3: ``abort_event`` is set by the heartbeat loop when
-        # heartbeats have failed for long enough that the auto-recovery
-        # sweep on another pod has almost certainly preempted us
-        # (consecutive failures spanning ``STALE_JOB_TIMEOUT_MINUTES``).
-        # The runner races handler completion against this event and,
-        # if the event wins, cancels the handler so we stop burning
-        # work on a row we no longer own.
-        abort_event = asyncio.Event()
-        heartbeat_task = asyncio.create_task(
-            _heartbeat_loop(job_id, abort_event),
-            name=f"heartbeat-{job_id}",
-        )
+            # ``claim_job`` ran a raw SQL UPDATE (state=RUNNING, attempts++,
+            # locked_by, locked_at, and — via the func.coalesce from PR #1026
+            # — started_at).  The in-memory ``job`` instance from the pre-claim
+            # ``get_job_by_id`` still reflects the OLD row, so re-fetch to
+            # hand handlers the authoritative post-claim state (state, attempts,
+            # locked_by, started_at).  ``get_job_by_id`` already calls refresh.
+            job = await repo.get_job_by_id(job_id)
+            if job is None:
+                # Race: claimed but row vanished before the re-read.  Treat
+                # as preempted and exit; no state to write since there's no
+                # row to write to.
+                logger.warning(
+                    f"run_job: job {job_id} disappeared after claim — exiting"
+                )
+                return
+
+            # #1236 — capture pipeline_id as a plain value now (immutable
+            # for the job's life). Read post-``finish_job`` from a fresh /
+            # post-commit ``job_session`` would risk an expired-instance
+            # lazy load; a local value sidesteps that entirely.
+            pipeline_id_for_status = job.pipeline_id
+
+            # Plain ``asyncio.create_task`` (not ``fire_and_forget``): the
+            # local ``heartbeat_task`` ref keeps the task alive for the
+            # lifetime of this function, and we cancel + await it in the
+            # ``finally`` block so the cancellation is observed cleanly.
+            # Routing through ``fire_and_forget`` would trip its deliberate
+            # cancellation-WARNING (kept loud for diagnosing the 310-B
+            # incident) on every successful run, drowning out genuine
+            # cancellations.
+            #
+            # B-H3: ``abort_event`` is set by the heartbeat loop when
+            # heartbeats have failed for long enough that the auto-recovery
+            # sweep on another pod has almost certainly preempted us
+            # (consecutive failures spanning ``STALE_JOB_TIMEOUT_MINUTES``).
+            # The runner races handler completion against this event and,
+            # if the event wins, cancels the handler so we stop burning
+            # work on a row we no longer own.
+            abort_event = asyncio.Event()
+            heartbeat_task = asyncio.create_task(
+                _heartbeat_loop(job_id, abort_event),
+                name=f"heartbeat-{job_id}",
+            )
 
-        try:
             handler_aborted = False
             # #1236 — initialise the chain_job deferred-dispatch queue
             # for this handler.  ``chain_job`` appends child_ids here
@@ -171,6 +221,7 @@ async def run_job(job_id: int) -> None:
             )
 
             reset_pending_dispatches()
+            handler_task: asyncio.Task[dict] | None = None
             try:
                 handler = get_handler(job_type)
                 # mypy: handlers return ``Awaitable[dict]`` (registry-typed),
@@ -178,7 +229,7 @@ async def run_job(job_id: int) -> None:
                 # registered handlers are async functions, so the runtime
                 # value IS a coroutine — the registry's structural type just
                 # widens it.
-                handler_task: asyncio.Task[dict] = asyncio.create_task(
+                handler_task = asyncio.create_task(
                     handler(job, job_session, data_session),  # type: ignore[arg-type]
                     name=f"handler-{job_id}",
                 )
@@ -231,6 +282,11 @@ async def run_job(job_id: int) -> None:
                     metadata = {}
                     result = IngestionResult.ERROR
                     handler_succeeded = False
+            except asyncio.CancelledError:
+                await _release_cut_off_job(
+                    job_id, handler_task, job_session, data_session
+                )
+                raise
             except Exception as exc:
                 logger.exception(
                     f"run_job: handler for job_type={job_type!r} failed (job {job_id})"
@@ -347,12 +403,55 @@ async def run_job(job_id: int) -> None:
                     )
                     await job_session.rollback()
         finally:
-            heartbeat_task.cancel()
-            try:
-                await heartbeat_task
-            except asyncio.CancelledError:
-                # Expected — we cancelled it ourselves.
-                pass
+            if heartbeat_task is not None:
+                heartbeat_task.cancel()
+                try:
+                    await heartbeat_task
+                except asyncio.CancelledError:
+                    # Expected — we cancelled it ourselves.
+                    pass
+            release_slot(job_type, slot_pipeline_id)
+
+
+async def _release_cut_off_job(
+    job_id: int,
+    handler_task: asyncio.Task | None,
+    job_session: AsyncSession,
+    data_session: AsyncSession,
+) -> None:
+    """Unwind a job cancelled mid-handler.
+
+    ``asyncio.wait`` does not cancel the handler task with us, so stop
+    it first; then drop its writes and queued children and hand the row
+    back (``release_job``) so another pod retries it now instead of
+    after ``STALE_JOB_TIMEOUT_MINUTES``.  Best-effort: if the release
+    fails the row stays RUNNING and the stale-job sweep recovers it.
+    """
+    if handler_task is not None and not handler_task.done():
+        handler_task.cancel()
+        try:
+            await handler_task
+        except (asyncio.CancelledError, Exception):
+            # Its result is being discarded either way.
+            pass
+    from app.tasks._chain import discard_pending_dispatches
+
+    discard_pending_dispatches()
+    try:
+        await data_session.rollback()
+        await job_session.rollback()
+        async with SessionLocal() as session:
+            released = await DataIngestionRepository(session).release_job(
+                job_id, POD_ID
+            )
+    except Exception:
+        logger.exception(
+            f"run_job: job {job_id} cut off and could not be released — "
+            "the stale-job sweep will recover it"
+        )
+        return
+    if released:
+        logger.warning(f"run_job: job {job_id} cut off — released for retry")
 
 
 async def _heartbeat_loop(job_id: int, abort_event: asyncio.Event) -> None:
@@ -16,6 +16,7 @@ This module is the backend contract for chart-related category semantics:
 from typing import Any, NotRequired, Sequence, TypedDict
 
 from app.models.data_entry_emission import (
+    EMISSION_TYPE_TREE,
     EmissionCategory,
     EmissionType,
 )
@@ -25,13 +26,11 @@ from app.utils.it_breakdown import IT_EMISSION_TYPES
 
 def additional_value_unit(emission_type: EmissionType) -> str | None:
     """Unit of the additional_value column for a given EmissionType."""
-    node: EmissionType | None = emission_type
-    while node is not None:
+    for node in (emission_type, *EMISSION_TYPE_TREE.ancestors(emission_type)):
         if node is EmissionType.commuting or node is EmissionType.professional_travel:
             return "km"
         if node is EmissionType.food or node is EmissionType.waste:
             return "kg"
-        node = node.parent
     return None
 
 
@@ -0,0 +1,81 @@
+"""Standalone job worker: ``python -m app.worker`` (or ``co2-worker``).
+
+Runs the job loops of ``app.tasks._services`` — safety poller with its
+``LISTEN`` wake-up, pipeline reconciler, pod heartbeat — without the
+HTTP app, so ingests and recalcs stop competing with API requests for
+the API pods' event loop, CPU and pool connections.
+
+Deploy it alongside API pods started with ``API_RUNS_JOBS=false``:
+endpoints then only insert the job row, its ``NOTIFY`` wakes a worker,
+and the worker's dispatch sweep claims and runs it.  Workers scale
+independently of the API; ``claim_job`` already arbitrates between any
+number of them, and ``JOB_CONCURRENCY_LIMITS`` caps each one.
+
+Shutdown (SIGTERM/SIGINT): stop claiming (``_draining`` — covers the
+poller, the listener and chained children alike), give in-flight jobs
+``WORKER_SHUTDOWN_GRACE_SECONDS`` to finish, then cancel the rest and
+exit.  A job cut off mid-handler has its writes rolled back and its
+row handed back to NOT_STARTED for another pod; one cut off anywhere
+else stays RUNNING until the stale-job sweep recovers it.
+"""
+
+import asyncio
+import signal
+
+from app.core.config import get_settings
+from app.core.logging import get_logger, setup_logging
+
+setup_logging()
+logger = get_logger(__name__)
+
+
+async def run_worker() -> None:
+    """Run the job loops until SIGTERM/SIGINT, then drain and exit."""
+    from app.db import engine
+    from app.tasks import runner
+    from app.tasks._background import (
+        cancel_background_tasks,
+        wait_for_background_tasks,
+    )
+    from app.tasks._draining import start_draining
+    from app.tasks._services import start_job_services, stop_job_services
+    from app.tasks.bootstrap import bootstrap_handlers
+
+    settings = get_settings()
+    runner.mark_worker_process()
+    bootstrap_handlers()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    services = start_job_services()
+    if not services:
+        logger.warning("Worker started with every job loop disabled")
+    logger.info("Worker ready", extra={settings.APP_NAME: settings.APP_VERSION})
+
+    await stop.wait()
+    start_draining()
+    logger.info("Worker stopping — no new jobs will be claimed")
+    await stop_job_services(services)
+
+    remaining = await wait_for_background_tasks(settings.WORKER_SHUTDOWN_GRACE_SECONDS)
+    if remaining:
+        logger.warning(
+            f"Worker cutting off {remaining} job(s) still running; "
+            "they are released for another pod to retry"
+        )
+        # Before the dispose: the cut-off jobs release their rows on
+        # the way out.
+        await cancel_background_tasks()
+    await engine.dispose()
+    logger.info("Worker stopped")
+
+
+def main() -> None:
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
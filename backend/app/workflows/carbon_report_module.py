@@ -105,8 +105,8 @@ class CarbonReportModuleWorkflow:
             await DataEntryEmissionService(self.session).upsert_by_data_entry(
                 data_entry_response=item,
             )
-            await CarbonReportModuleService(self.session).recompute_stats(
-                carbon_report_module.id
+            await CarbonReportModuleService(self.session).apply_entry_stats_delta(
+                carbon_report_module.id, item.id, [], entry_count_delta=1
             )
             await self.session.commit()
         except IntegrityError as e:
@@ -209,6 +209,10 @@ class CarbonReportModuleWorkflow:
                 detail="Current user ID is required to update item",
             )
         try:
+            module_service = CarbonReportModuleService(self.session)
+            emissions_before = await module_service.snapshot_entry_emissions(
+                carbon_report_module.id, item_id
+            )
             item = await DataEntryService(self.session).update(
                 id=item_id,
                 data=data_entry_update,
@@ -226,8 +230,8 @@ class CarbonReportModuleWorkflow:
             await DataEntryEmissionService(self.session).upsert_by_data_entry(
                 data_entry_response=item,
             )
-            await CarbonReportModuleService(self.session).recompute_stats(
-                carbon_report_module.id
+            await module_service.apply_entry_stats_delta(
+                carbon_report_module.id, item_id, emissions_before
             )
             # upsert could fail if emission factor lookup fails, but we still want to
             # return the updated item
@@ -253,13 +257,21 @@ class CarbonReportModuleWorkflow:
         request_context: dict,
         background_tasks: BackgroundTasks,
     ) -> None:
+        module_service = CarbonReportModuleService(self.session)
+        emissions_before = await module_service.snapshot_entry_emissions(
+            carbon_report_module.id, data_entry_id
+        )
         await DataEntryService(self.session).delete(
             id=data_entry_id,
             current_user=current_user,
             request_context=request_context,
             background_tasks=background_tasks,
         )
-        await CarbonReportModuleService(self.session).recompute_stats(
-            carbon_report_module.id
+        await module_service.apply_entry_stats_delta(
+            carbon_report_module.id,
+            data_entry_id,
+            emissions_before,
+            after=[],
+            entry_count_delta=-1,
         )
         await self.session.commit()
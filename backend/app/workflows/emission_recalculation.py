@@ -5,27 +5,197 @@ Re-runs emission calculations for all DataEntries of a given
 """
 
 import asyncio
+import multiprocessing
 import time
-from typing import Awaitable, Callable, Optional
+from bisect import bisect_right
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 from sqlalchemy.exc import DBAPIError, InvalidRequestError
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
-from app.models.data_entry import DataEntryTypeEnum
+from app.models.data_entry import DataEntry, DataEntryTypeEnum
 from app.models.factor import Factor
-from app.repositories.data_entry_repo import DataEntryRepository
+from app.repositories.data_entry_repo import ChangedFactorScope, DataEntryRepository
 from app.repositories.factor_repo import FactorRepository
-from app.schemas.data_entry import BaseModuleHandler, DataEntryResponse
-from app.services.data_entry_emission_service import DataEntryEmissionService
+from app.schemas.data_entry import (
+    BaseModuleHandler,
+    DataEntryResponse,
+    ModuleHandler,
+)
+from app.services.data_entry_emission_service import (
+    DataEntryEmissionService,
+    EmissionPlan,
+    evaluate_emission_plans,
+)
 
 logger = get_logger(__name__)
 
+_T = TypeVar("_T")
+
 # Emit a progress log line (and invoke the caller's progress callback)
 # every N computed entries.
 PROGRESS_INTERVAL = 5000
 
 
+@dataclass
+class _SliceFactors:
+    """Slice-constant factor state shared by every chunk of one recalc."""
+
+    # id → Factor; short-circuits Strategy A lookups in ``prepare_create``.
+    factor_cache: dict[int, Factor]
+    # Strategy-B classification-query memo (see ``prepare_create``).
+    factor_query_cache: dict
+    # (kind, subkind) → factor_id rematch index.
+    factor_lookup: dict[tuple[str, str | None], int]
+    # override_code → [(factor_id, kind_value)]
+    override_lookup: dict[str, list[tuple[int, str]]]
+    # kind_value → [(factor_id, override_code | None)]
+    kind_lookup: dict[str, list[tuple[int, str | None]]]
+
+
+@dataclass
+class _ChunkResult:
+    """Compute output of one streamed chunk, before it is written."""
+
+    processed_entry_ids: list[int] = field(default_factory=list)
+    # COPY rows (``DataEntryEmissionRepository.copy_row`` order).
+    rows: list[tuple] = field(default_factory=list)
+    # ``calculation_inputs`` payloads ``rows`` reference (``EmissionBatch.inputs``).
+    inputs: dict[str, tuple[str, dict]] = field(default_factory=dict)
+    # data_entry_id → refreshed ``data`` for entries whose factor relink
+    # changed ``primary_factor_id`` (successful entries only).
+    relinked: dict[int, dict] = field(default_factory=dict)
+    recalculated: int = 0
+    # Of ``recalculated``: entries whose inputs fingerprint matched the
+    # stored one, so their emissions were left in place.
+    unchanged: int = 0
+    errors: int = 0
+    error_details: list[dict] = field(default_factory=list)
+    affected_module_ids: set[int] = field(default_factory=set)
+
+
+@dataclass
+class RecalcCheckpoint:
+    """Durable progress of a checkpointed recalc.
+
+    Everything up to and including ``after_id`` (the keyset cursor: the
+    last data_entry id of the last committed chunk) is written; the
+    counters and ``affected_module_ids`` cover exactly those entries,
+    so a resumed run reports — and chains aggregation for — the whole
+    slice.  Stored in the job meta as ``to_meta()``.
+    """
+
+    after_id: int = 0
+    recalculated: int = 0
+    unchanged: int = 0
+    errors: int = 0
+    error_details: list[dict] = field(default_factory=list)
+    affected_module_ids: list[int] = field(default_factory=list)
+
+    def to_meta(self) -> dict:
+        return {
+            "after_id": self.after_id,
+            "recalculated": self.recalculated,
+            "unchanged": self.unchanged,
+            "errors": self.errors,
+            "error_details": self.error_details,
+            "affected_module_ids": self.affected_module_ids,
+        }
+
+    @classmethod
+    def from_meta(cls, raw: Any) -> Optional["RecalcCheckpoint"]:
+        """Inverse of ``to_meta``; ``None`` for anything malformed."""
+        if not isinstance(raw, dict) or not isinstance(raw.get("after_id"), int):
+            return None
+        try:
+            return cls(
+                after_id=raw["after_id"],
+                recalculated=int(raw.get("recalculated") or 0),
+                unchanged=int(raw.get("unchanged") or 0),
+                errors=int(raw.get("errors") or 0),
+                error_details=list(raw.get("error_details") or []),
+                affected_module_ids=[
+                    i
+                    for i in raw.get("affected_module_ids") or []
+                    if isinstance(i, int)
+                ],
+            )
+        except (TypeError, ValueError):
+            return None
+
+
+class _ChunkWriter:
+    """Write-behind for the in-process recalc's chunk replaces.
+
+    ``submit`` parks a computed chunk instead of writing it.  The next
+    chunk's ``_compute_chunk`` hands its formula pass to ``overlap``,
+    which starts the parked write (one DELETE + one COPY) on the
+    session while the formula pass runs in a worker thread, then waits
+    for both — so chunk N is written while chunk N+1 computes, with at
+    most those two in flight.  The session never runs two statements
+    at once: the formula pass does no I/O, and the write is done before
+    the next chunk is read.  ``flush`` writes the last parked chunk.
+
+    With ``write_behind`` off, ``submit`` writes immediately (the
+    pre-pipelining behaviour).  Either way every write is a statement
+    on the caller's session; COMMIT stays with the runner.
+    """
+
+    def __init__(
+        self, emission_svc: DataEntryEmissionService, *, write_behind: bool
+    ) -> None:
+        self._emission_svc = emission_svc
+        self._write_behind = write_behind
+        self._parked: Optional[_ChunkResult] = None
+        self.written = 0
+        self.replaced = 0
+
+    async def submit(self, result: _ChunkResult) -> None:
+        if not self._write_behind:
+            await self._write(result)
+            return
+        # ``overlap`` (or ``flush``) consumed the previous chunk before
+        # this one finished computing.
+        await self.flush()
+        self._parked = result
+
+    async def overlap(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Run ``fn(*args)`` — CPU only, no session use — alongside the
+        parked chunk's write; inline when nothing is parked."""
+        parked, self._parked = self._parked, None
+        if parked is None:
+            return fn(*args)
+        write = asyncio.create_task(self._write(parked))
+        try:
+            out = await asyncio.to_thread(fn, *args)
+        except BaseException:
+            # Let the write settle before unwinding: the runner's
+            # rollback needs the connection out of COPY.
+            await asyncio.gather(write, return_exceptions=True)
+            raise
+        await write
+        return out
+
+    async def flush(self) -> None:
+        parked, self._parked = self._parked, None
+        if parked is not None:
+            await self._write(parked)
+
+    async def _write(self, result: _ChunkResult) -> None:
+        self.written += await self._emission_svc.bulk_replace_rows_for_entries(
+            result.processed_entry_ids, result.rows, result.inputs
+        )
+        self.replaced += len(result.processed_entry_ids)
+
+
+def _new_profile() -> dict[str, float]:
+    return {"rematch": 0.0, "validate": 0.0, "prepare": 0.0}
+
+
 class EmissionRecalculationWorkflow:
     """Recalculate emissions for a cross-module data_entry_type / year slice.
 
@@ -42,12 +212,43 @@ class EmissionRecalculationWorkflow:
         year: int,
         progress_callback: Optional[Callable[[int, int], Awaitable[None]]] = None,
         carbon_report_module_ids: Optional[list[int]] = None,
+        parallel_workers: int = 1,
+        changed_factor_ids: Optional[list[int]] = None,
+        checkpoint: Optional[Callable[[RecalcCheckpoint], Awaitable[None]]] = None,
+        resume_from: Optional[RecalcCheckpoint] = None,
+        data_entry_ids: Optional[list[int]] = None,
     ) -> dict:
         """Recalculate emissions for every DataEntry of the given type and year.
 
-        Iterates all matching DataEntry rows (across all CarbonReportModules /
-        units), calls ``DataEntryEmissionService.upsert_by_data_entry`` for each,
-        and recomputes module stats once per distinct CarbonReportModule at the end.
+        Streams all matching DataEntry rows (across all CarbonReportModules /
+        units) in keyset-ordered chunks of ``PROGRESS_INTERVAL``, computes
+        each entry's emissions and replaces them chunk by chunk; only one
+        chunk of ORM rows is ever resident.  With
+        ``EMISSION_RECALC_WRITE_BEHIND`` a chunk is written while the
+        next one computes (see ``_ChunkWriter``).  Stats are left to the
+        chained aggregation job (see ``affected_module_ids``).
+
+        With ``parallel_workers`` > 1 and a slice of at least
+        ``EMISSION_RECALC_PARALLEL_MIN_ENTRIES`` entries, the compute is
+        sharded by ``carbon_report_module_id`` across worker processes
+        (see ``_recalculate_sharded``); every write still goes through
+        this session.
+
+        With ``changed_factor_ids`` (set by a factor ingest that tracked
+        which factors it inserted or changed), the slice narrows to the
+        entries those factors can feed — see ``ChangedFactorScope``.
+        ``None`` means "unknown", i.e. the whole slice.
+
+        With ``data_entry_ids`` (set by a row-diff CSV ingest from the
+        entries it inserted or updated) only those entries of the slice
+        are recalculated.
+
+        With ``checkpoint``, every chunk is written inline and then handed
+        to ``checkpoint`` as a ``RecalcCheckpoint`` — the caller commits
+        the chunk and persists the cursor.  Such a run stays in-process
+        (a sharded slice has no single keyset cursor).  ``resume_from``
+        continues a previous run after its cursor, seeding the counters
+        and ``affected_module_ids`` from it.
 
         Per-entry errors are caught and accumulated; a single failing entry never
         aborts the remaining ones.
@@ -55,40 +256,399 @@ class EmissionRecalculationWorkflow:
         Args:
             data_entry_type_id: The data entry type whose emissions to recalculate.
             year: The report year to scope the query.
+            parallel_workers: Upper bound on worker processes; 1 computes
+                in-process.
+            changed_factor_ids: Optional factor-level scope; ``[]`` skips
+                every entry that links a factor.
+            checkpoint: Optional per-chunk commit hook (see above).
+            resume_from: Optional progress of an earlier run to continue.
+            data_entry_ids: Optional entry-level scope; ``[]`` skips every
+                entry.
 
         Returns:
-            Dict with keys: recalculated, modules_refreshed, errors, error_details.
+            Dict with keys: recalculated, unchanged, modules_refreshed,
+            errors, error_details.
         """
         repo = DataEntryRepository(self.session)
-        entries = await repo.list_by_data_entry_type_and_year(
-            data_entry_type_id, year, carbon_report_module_ids
+        handler = BaseModuleHandler.get_by_type(data_entry_type_id)
+        changed_factors = (
+            await self._changed_factor_scope(
+                handler, data_entry_type_id, year, changed_factor_ids
+            )
+            if changed_factor_ids is not None
+            else None
+        )
+        total = await repo.count_by_data_entry_type_and_year(
+            data_entry_type_id,
+            year,
+            carbon_report_module_ids,
+            changed_factors,
+            data_entry_ids,
         )
         scope_label = (
             f" (scoped to {len(carbon_report_module_ids)} module(s))"
             if carbon_report_module_ids
             else ""
         )
+        if changed_factors is not None:
+            scope_label += (
+                f" (targeted at {len(changed_factors.factor_ids)} changed factor(s))"
+            )
+        if data_entry_ids is not None:
+            scope_label += f" (targeted at {len(data_entry_ids)} changed entries)"
+        if resume_from is not None:
+            scope_label += f" (resuming after data_entry_id={resume_from.after_id})"
         logger.info(
             f"Recalc {data_entry_type_id.name}/{year}: "
-            f"{len(entries)} data entries to process{scope_label}"
+            f"{total} data entries to process{scope_label}"
         )
 
         # Early-exit: nothing to recalculate.  Keeps the recalc task off the
         # handler / factor lookup paths entirely when the slice is empty,
         # which is the dominant case right after a factor reupload for a
         # det that has no data entries yet.
-        if not entries:
+        if not total:
             return {
                 "recalculated": 0,
+                "unchanged": 0,
                 "modules_refreshed": 0,
                 "affected_module_ids": [],
                 "errors": 0,
                 "error_details": [],
             }
 
+        if (
+            checkpoint is None
+            and parallel_workers > 1
+            and total >= get_settings().EMISSION_RECALC_PARALLEL_MIN_ENTRIES
+        ):
+            return await self._recalculate_sharded(
+                data_entry_type_id,
+                year,
+                carbon_report_module_ids,
+                total=total,
+                workers=parallel_workers,
+                progress_callback=progress_callback,
+                changed_factors=changed_factors,
+                data_entry_ids=data_entry_ids,
+            )
+
         emission_svc = DataEntryEmissionService(self.session)
+        factors = await self._load_slice_factors(handler, data_entry_type_id, year)
+
+        progress = resume_from or RecalcCheckpoint()
+        recalculated = progress.recalculated
+        unchanged = progress.unchanged
+        errors = progress.errors
+        error_details: list[dict] = list(progress.error_details)
+        affected_module_ids: set[int] = set(progress.affected_module_ids)
+        # A checkpoint must cover a chunk that is already written, so
+        # checkpointed runs write inline.
+        writer = _ChunkWriter(
+            emission_svc,
+            write_behind=checkpoint is None
+            and get_settings().EMISSION_RECALC_WRITE_BEHIND,
+        )
+        slice_started = time.perf_counter()
+        # Per-segment wall time for a recalc profile line (diagnostic, the
+        # analog of ingestion's row-loop profile): localises where per-entry
+        # time goes so a slow slice is measured, not guessed.
+        seg = _new_profile()
+
+        # Stream the slice in keyset-ordered chunks of PROGRESS_INTERVAL
+        # entries: each chunk is computed, its relinks flushed and its rows
+        # detached before the next chunk is read, and its emissions are
+        # replaced (one DELETE + one COPY) during the next chunk's formula
+        # pass — peak memory tracks PROGRESS_INTERVAL, not the slice size.
+        async for chunk in repo.iter_by_data_entry_type_and_year(
+            data_entry_type_id,
+            year,
+            carbon_report_module_ids,
+            chunk_size=PROGRESS_INTERVAL,
+            after_id=progress.after_id,
+            changed_factors=changed_factors,
+            data_entry_ids=data_entry_ids,
+        ):
+            last_id = chunk[-1].id or progress.after_id
+            result = await self._compute_chunk(
+                chunk,
+                handler,
+                factors,
+                emission_svc,
+                year=year,
+                seg=seg,
+                writer=writer,
+            )
+            recalculated += result.recalculated
+            unchanged += result.unchanged
+            errors += result.errors
+            error_details.extend(result.error_details)
+            affected_module_ids |= result.affected_module_ids
+
+            # Hand this chunk's writes (one DELETE + one COPY) to the
+            # writer so neither the emission buffer nor a single
+            # statement ever spans more than ~PROGRESS_INTERVAL entries.
+            # Statements only — COMMIT stays with the runner, so a
+            # preempted or failed job persists nothing.
+            await writer.submit(result)
+            # Flush the chunk's factor relinks and drop its rows from the
+            # identity map before the next chunk loads.
+            await repo.release_chunk(chunk)
+            if checkpoint is not None:
+                await checkpoint(
+                    RecalcCheckpoint(
+                        after_id=last_id,
+                        recalculated=recalculated,
+                        unchanged=unchanged,
+                        errors=errors,
+                        error_details=list(error_details),
+                        affected_module_ids=sorted(affected_module_ids),
+                    )
+                )
+            processed = recalculated + errors
+            logger.info(
+                f"Recalc {data_entry_type_id.name}/{year}: "
+                f"{processed}/{total} entries computed "
+                f"({writer.written} emissions written, {errors} errors)"
+            )
+            if progress_callback is not None:
+                await progress_callback(processed, total)
+        await writer.flush()
+
+        self._log_profile(
+            data_entry_type_id,
+            year,
+            total=total,
+            total_replaced=writer.replaced,
+            total_written=writer.written,
+            slice_elapsed=time.perf_counter() - slice_started,
+            seg=seg,
+            unchanged=unchanged,
+        )
+
+        # Plan 310-D — stats recompute moves out of this workflow and
+        # into the runner-driven ``aggregation`` handler that the
+        # ``emission_recalc`` task chains on success.  Keeping the
+        # ``modules_refreshed`` and ``affected_module_ids`` keys in the
+        # return shape so callers (and the runner-persisted meta) keep
+        # the same field set; ``modules_refreshed`` is now always 0
+        # from this layer because the writer is the aggregation
+        # handler, not us.
+        return {
+            "recalculated": recalculated,
+            "unchanged": unchanged,
+            "modules_refreshed": 0,
+            "affected_module_ids": sorted(affected_module_ids),
+            "errors": errors,
+            "error_details": error_details,
+        }
+
+    async def _recalculate_sharded(
+        self,
+        data_entry_type_id: DataEntryTypeEnum,
+        year: int,
+        carbon_report_module_ids: Optional[list[int]],
+        *,
+        total: int,
+        workers: int,
+        progress_callback: Optional[Callable[[int, int], Awaitable[None]]],
+        changed_factors: Optional[ChangedFactorScope] = None,
+        data_entry_ids: Optional[list[int]] = None,
+    ) -> dict:
+        """Sharded variant of the streamed recalc: compute in worker
+        processes, write from this session.
+
+        The slice is split into at most ``workers`` shards of whole
+        ``carbon_report_module_id`` groups, balanced by entry count.  Each
+        worker streams its shard in ``PROGRESS_INTERVAL`` chunks on its
+        own read-only session (``_compute_shard_chunk``) and returns the
+        chunk's emissions as COPY rows plus its factor relinks; nothing
+        is written out of process.  This session applies every result
+        (one UPDATE for the relinks, one DELETE + one COPY for the
+        emissions), so:
+
+        * the caller's ``acquire_factor_recalc_lock`` still pins the
+          factor table for the whole read window — workers read the
+          same committed factors the lock protects;
+        * the runner's single COMMIT (or rollback on failure /
+          preemption) still covers every write of the slice.
+
+        The next chunk of a shard is submitted before the current one is
+        written, so the write of one chunk overlaps the compute of the
+        others and wall time scales with the worker count until the
+        single writer saturates.
+        """
+        repo = DataEntryRepository(self.session)
+        emission_svc = DataEntryEmissionService(self.session)
+        module_counts = await repo.count_by_module_for_data_entry_type_and_year(
+            data_entry_type_id,
+            year,
+            carbon_report_module_ids,
+            changed_factors,
+            data_entry_ids,
+        )
+        shards = _partition_modules(module_counts, workers)
+        logger.info(
+            f"Recalc {data_entry_type_id.name}/{year}: sharding {total} entries "
+            f"over {len(shards)} worker process(es)"
+        )
+
+        recalculated = 0
+        unchanged = 0
+        errors = 0
+        error_details: list[dict] = []
+        affected_module_ids: set[int] = set()
+        total_written = 0
+        total_replaced = 0
+        slice_started = time.perf_counter()
+        # Summed across workers, so these are CPU-seconds rather than
+        # wall time — still the right split for "where did it go".
+        seg = _new_profile()
+
+        # Targeted recalcs: each worker gets only its own modules' ids,
+        # and only those past its cursor, instead of the whole id list
+        # pickled with every chunk.
+        shard_entry_ids: dict[tuple[int, ...], list[int]] = {}
+        if data_entry_ids is not None:
+            ids_by_module = await repo.group_ids_by_module(data_entry_ids)
+            for shard in shards:
+                shard_entry_ids[tuple(shard)] = sorted(
+                    entry_id
+                    for module_id in shard
+                    for entry_id in ids_by_module.get(module_id, [])
+                )
+
+        loop = asyncio.get_running_loop()
+        executor = _make_shard_executor(len(shards))
+        in_flight: dict[asyncio.Future, list[int]] = {}
+
+        def _submit(shard: list[int], after_id: int) -> None:
+            ids: Optional[list[int]] = None
+            if data_entry_ids is not None:
+                own = shard_entry_ids[tuple(shard)]
+                ids = own[bisect_right(own, after_id) :]
+            future = loop.run_in_executor(
+                executor,
+                _compute_shard_chunk,
+                data_entry_type_id.value,
+                year,
+                shard,
+                after_id,
+                PROGRESS_INTERVAL,
+                changed_factors,
+                ids,
+            )
+            in_flight[future] = shard
+
+        try:
+            for shard in shards:
+                _submit(shard, 0)
+            while in_flight:
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    shard = in_flight.pop(future)
+                    # Re-raises a worker's session/connection-fatal error
+                    # here, so the runner rolls the whole slice back.
+                    part = future.result()
+                    if not part["exhausted"]:
+                        _submit(shard, part["last_id"])
+                    recalculated += part["recalculated"]
+                    unchanged += part["unchanged"]
+                    errors += part["errors"]
+                    error_details.extend(part["error_details"])
+                    affected_module_ids.update(part["affected_module_ids"])
+                    for key, value in part["seg"].items():
+                        seg[key] += value
+
+                    await repo.bulk_update_data(part["relinked"])
+                    total_written += await emission_svc.bulk_replace_rows_for_entries(
+                        part["entry_ids"], part["rows"], part["inputs"]
+                    )
+                    total_replaced += len(part["entry_ids"])
+                    processed = recalculated + errors
+                    logger.info(
+                        f"Recalc {data_entry_type_id.name}/{year}: "
+                        f"{processed}/{total} entries computed "
+                        f"({total_written} emissions written, {errors} errors)"
+                    )
+                    if progress_callback is not None:
+                        await progress_callback(processed, total)
+        finally:
+            # On failure, queued chunks are dropped; running ones finish
+            # on their own read-only sessions and are discarded.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self._log_profile(
+            data_entry_type_id,
+            year,
+            total=total,
+            total_replaced=total_replaced,
+            total_written=total_written,
+            slice_elapsed=time.perf_counter() - slice_started,
+            seg=seg,
+            unchanged=unchanged,
+        )
+        return {
+            "recalculated": recalculated,
+            "unchanged": unchanged,
+            "modules_refreshed": 0,
+            "affected_module_ids": sorted(affected_module_ids),
+            "errors": errors,
+            "error_details": error_details,
+        }
+
+    async def _changed_factor_scope(
+        self,
+        handler: ModuleHandler,
+        data_entry_type_id: DataEntryTypeEnum,
+        year: int,
+        changed_factor_ids: list[int],
+    ) -> ChangedFactorScope:
+        """Resolve a factor ingest's changed ids into a slice filter.
+
+        Only the slice's own ``(data_entry_type, year)`` factors count —
+        the ingest may have touched other years.  Besides the ids, the
+        scope carries the changed factors' ``kind_field`` (and override)
+        values: an entry whose rematch key points at a new or edited
+        factor must be recomputed even though it links another id today.
+        """
+        factors = [
+            f
+            for f in await FactorRepository(self.session).list_by_ids(
+                changed_factor_ids
+            )
+            if f.id is not None
+            and f.data_entry_type_id == data_entry_type_id
+            and f.year == year
+        ]
+        kinds: set[str] = set()
+        override_codes: set[str] = set()
+        for factor in factors:
+            classification = factor.classification or {}
+            if handler.kind_field and classification.get(handler.kind_field):
+                kinds.add(str(classification[handler.kind_field]))
+            if handler.kind_field_override and classification.get(
+                handler.kind_field_override
+            ):
+                override_codes.add(str(classification[handler.kind_field_override]))
+        return ChangedFactorScope(
+            factor_ids=tuple(sorted(f.id for f in factors if f.id is not None)),
+            kind_field=handler.kind_field,
+            kinds=tuple(sorted(kinds)),
+            override_field=handler.kind_field_override,
+            override_codes=tuple(sorted(override_codes)),
+        )
+
+    async def _load_slice_factors(
+        self,
+        handler: ModuleHandler,
+        data_entry_type_id: DataEntryTypeEnum,
+        year: int,
+    ) -> _SliceFactors:
+        """Bulk-load the slice's factors and build the rematch indexes."""
         factor_repo = FactorRepository(self.session)
-        handler = BaseModuleHandler.get_by_type(data_entry_type_id)
 
         # Plan 310D — batch the rematch.  Pre-load all factors for
         # (data_entry_type_id, year) once into a dict keyed by
@@ -123,9 +683,12 @@ class EmissionRecalculationWorkflow:
         # (kind, subkind, context, year) criteria recur across entries, so a
         # slice-scoped memo collapses it to one query per distinct criteria.
         factor_query_cache: dict = {}
-        if handler.kind_field is not None and any(
-            handler.kind_field in e.data for e in entries
-        ):
+        # The slice is streamed, so whether any entry carries ``kind_field``
+        # is not known up front; the lookup dicts are built from the factor
+        # set alone (cheap — one pass over the slice's factors) and the
+        # per-entry ``kind_field in entry.data`` gate in ``_compute_chunk``
+        # still keeps Strategy-B handlers off the rematch.
+        if handler.kind_field is not None:
             kind_field = handler.kind_field
             if handler.kind_field_override is not None:
                 # Override-key-first path: mirrors _resolve_with_kind_override.
@@ -164,32 +727,50 @@ class EmissionRecalculationWorkflow:
                     # callers don't depend on ordering when the index is consistent.
                     factor_lookup.setdefault((kind_value, subkind_value), factor.id)
 
-        # Plan 310D — per-slice prefetch: handlers that otherwise re-query
-        # slice-constant data per entry (plane reloads airports + the full
-        # plane-factor set on every entry) bulk-load it once here; pre_compute
-        # then reads it from slice_cache in-memory. Empty for handlers that
-        # don't override the hook, so their per-entry path is unchanged.
-        slice_cache = await handler.prefetch_slice(entries, self.session, year=year)
+        return _SliceFactors(
+            factor_cache=factor_cache,
+            factor_query_cache=factor_query_cache,
+            factor_lookup=factor_lookup,
+            override_lookup=override_lookup,
+            kind_lookup=kind_lookup,
+        )
 
-        recalculated = 0
-        errors = 0
-        error_details: list[dict] = []
-        affected_module_ids: set[int] = set()
-        # Batched write buffers: per-entry work below is compute-only
-        # (reads); all emission writes happen in ONE set-based replace
-        # after the loop.  Entries that computed to zero emissions stay
-        # in ``processed_entry_ids`` so their stale rows get deleted.
-        processed_entry_ids: list[int] = []
-        prepared_emissions: list = []
-        total_written = 0
-        total_replaced = 0
-        slice_started = time.perf_counter()
-        # Per-segment wall time for a recalc profile line (diagnostic, the
-        # analog of ingestion's row-loop profile): localises where per-entry
-        # time goes so a slow slice is measured, not guessed.
-        seg = {"rematch": 0.0, "validate": 0.0, "prepare": 0.0}
+    async def _compute_chunk(
+        self,
+        chunk: list[DataEntry],
+        handler: ModuleHandler,
+        factors: _SliceFactors,
+        emission_svc: DataEntryEmissionService,
+        *,
+        year: int,
+        seg: dict[str, float],
+        writer: Optional[_ChunkWriter] = None,
+    ) -> _ChunkResult:
+        """Relink and compute one chunk's emissions; no emission writes.
 
-        for entry in entries:
+        Shared by the in-process loop and the sharded workers, so both
+        paths produce identical rows for the same entries.  The in-process
+        loop passes its ``writer`` so the previous chunk is written during
+        this chunk's formula pass (``_ChunkWriter.overlap``).
+        """
+        result = _ChunkResult()
+
+        # Plan 310D — per-slice prefetch: handlers that otherwise
+        # re-query reference data per entry (airports, train stations,
+        # building rooms, the plane-factor set) bulk-load it here from
+        # their declared ``slice_references``; pre_compute then reads
+        # it from slice_cache in-memory.  Built per chunk, so it only
+        # holds the reference data the resident chunk needs.  Empty for
+        # handlers that declare nothing, so their per-entry path is
+        # unchanged.
+        slice_cache = await handler.prefetch_slice(chunk, self.session, year=year)
+
+        # Entries whose plan resolved, with their pre-rematch ``data`` so
+        # a formula failure in the batched evaluation can still revert
+        # the relink.
+        planned: list[tuple[DataEntry, dict, EmissionPlan | None]] = []
+
+        for position, entry in enumerate(chunk, 1):
             # Plan 310B Part 6 — refresh primary_factor_id against current
             # factors before computing.  Strategy A entries (equipment,
             # purchases, …) need this so a CSV reupload that changes a
@@ -218,8 +799,8 @@ class EmissionRecalculationWorkflow:
             # Bind to a local with an explicit ``Optional[str]`` annotation
             # so the ``is not None`` check below narrows it to ``str`` at
             # the ``_lookup_factor_id`` call site.  The name differs from
-            # ``kind_field`` used in the prefetch block above to avoid a
-            # mypy scope-collision (the prefetch binding lives inside an
+            # ``kind_field`` used in ``_load_slice_factors`` to avoid a
+            # mypy scope-collision (that binding lives inside an
             # ``if handler.kind_field is not None`` block, so mypy infers
             # the narrower ``str`` and then refuses the wider re-bind here).
             # Also avoids an ``assert`` (bandit B101 — asserts are stripped
@@ -228,7 +809,7 @@ class EmissionRecalculationWorkflow:
             entry_kind_field_override: str | None = handler.kind_field_override
             old_data = entry.data
             try:
-                # Compute-only: ``prepare_create`` does reads (handler
+                # Compute-only: ``plan_create`` does reads (handler
                 # pre_compute, Strategy-B factor queries) but never
                 # writes, so a per-entry failure needs no SAVEPOINT —
                 # there is nothing to roll back; the ``except`` just
@@ -240,19 +821,19 @@ class EmissionRecalculationWorkflow:
                             entry_data=entry.data,
                             kind_field=entry_kind_field,
                             override_field=entry_kind_field_override,
-                            override_lookup=override_lookup,
-                            kind_lookup=kind_lookup,
+                            override_lookup=factors.override_lookup,
+                            kind_lookup=factors.kind_lookup,
                         )
                     else:
                         new_factor_id = self._lookup_factor_id(
                             entry_data=entry.data,
                             kind_field=entry_kind_field,
                             subkind_field=handler.subkind_field,
-                            factor_lookup=factor_lookup,
+                            factor_lookup=factors.factor_lookup,
                         )
                     if new_factor_id != entry.data.get("primary_factor_id"):
                         # Tentative swap so DataEntryResponse +
-                        # prepare_create see the refreshed factor (or
+                        # plan_create see the refreshed factor (or
                         # ``None`` on a drop); the outer commit persists
                         # the relink alongside the new emissions.
                         entry.data = {
@@ -265,21 +846,18 @@ class EmissionRecalculationWorkflow:
                 entry_response = DataEntryResponse.model_validate(entry)
                 seg["validate"] += time.perf_counter() - _t
 
+                # Reads + factor resolution only; the formula arithmetic
+                # runs once for the whole chunk below.
                 _t = time.perf_counter()
-                emissions = await emission_svc.prepare_create(
+                plan = await emission_svc.plan_create(
                     entry_response,
                     year=year,
-                    factor_cache=factor_cache,
-                    factor_query_cache=factor_query_cache,
+                    factor_cache=factors.factor_cache,
+                    factor_query_cache=factors.factor_query_cache,
                     slice_cache=slice_cache,
                 )
                 seg["prepare"] += time.perf_counter() - _t
-                if entry.id is not None:
-                    processed_entry_ids.append(entry.id)
-                prepared_emissions.extend(emissions)
-                recalculated += 1
-                if entry.carbon_report_module_id is not None:
-                    affected_module_ids.add(entry.carbon_report_module_id)
+                planned.append((entry, old_data, plan))
             except Exception as exc:
                 # Revert the in-memory factor swap (no DB writes happened
                 # during compute) so the outer commit doesn't persist a
@@ -308,12 +886,12 @@ class EmissionRecalculationWorkflow:
                     logger.error(
                         f"emission recalc: session/connection unusable at "
                         f"data_entry_id={entry.id} ({type(exc).__name__}); "
-                        f"aborting batch ({recalculated} recalculated, "
-                        f"{errors} errored, {len(entries)} total)"
+                        f"aborting batch ({len(planned)} planned, "
+                        f"{result.errors} errored in this chunk)"
                     )
                     raise
-                errors += 1
-                error_details.append(
+                result.errors += 1
+                result.error_details.append(
                     {
                         "data_entry_id": entry.id,
                         "error": str(exc),
@@ -323,77 +901,122 @@ class EmissionRecalculationWorkflow:
                     f"Error recalculating emissions for data_entry_id={entry.id}: {exc}"
                 )
 
-            processed = recalculated + errors
             # With cached factors/year, per-entry compute can be pure
             # CPU — yield regularly so the event loop (API, SSE,
             # heartbeats) never starves during a 50k-entry slice.
-            if processed % 1000 == 0:
+            if position % 1000 == 0:
                 await asyncio.sleep(0)
-            if processed % PROGRESS_INTERVAL == 0:
-                # Flush this chunk's writes (one DELETE + one COPY) so
-                # neither the emission buffer nor a single statement
-                # ever spans more than ~PROGRESS_INTERVAL entries.
-                # Statements only — COMMIT stays with the runner, so a
-                # preempted or failed job persists nothing.
-                total_written += await emission_svc.bulk_replace_for_entries(
-                    processed_entry_ids, prepared_emissions
+
+        # Skip-unchanged: a plan whose inputs fingerprint equals the one
+        # stamped on the entry's stored emissions would rewrite identical
+        # rows, so it is neither evaluated nor replaced.  A relinked entry
+        # changed its ``data`` and therefore its fingerprint; entries with
+        # no stored rows (or rows predating the column) never match.
+        unchanged: set[int] = set()
+        if get_settings().EMISSION_RECALC_SKIP_UNCHANGED:
+            fingerprinted = {
+                plan.data_entry_id: plan.fingerprint
+                for _, _, plan in planned
+                if plan is not None and plan.fingerprint is not None
+            }
+            if fingerprinted:
+                stored = await emission_svc.get_inputs_fingerprints(list(fingerprinted))
+                unchanged = {
+                    data_entry_id
+                    for data_entry_id, fingerprint in fingerprinted.items()
+                    if stored.get(data_entry_id) == fingerprint
+                }
+
+        # Batched formula pass: key-based computations of the whole chunk
+        # are evaluated per (emission_type, keys) group and come back as
+        # COPY rows — no DataEntryEmission object per row.  Counted in
+        # the "prepare" segment it was split out of (with write-behind,
+        # that includes any wait for the previous chunk's write).
+        plans = [
+            plan
+            for _, _, plan in planned
+            if plan is not None and plan.data_entry_id not in unchanged
+        ]
+        _t = time.perf_counter()
+        if writer is not None:
+            batch = await writer.overlap(evaluate_emission_plans, plans)
+        else:
+            batch = evaluate_emission_plans(plans)
+        seg["prepare"] += time.perf_counter() - _t
+
+        for entry, old_data, plan in planned:
+            exc = batch.failed.get(plan.data_entry_id) if plan is not None else None
+            if exc is not None:
+                # Same per-entry isolation as a failing plan: revert the
+                # relink, keep the entry's previous emissions.
+                entry.data = old_data
+                result.errors += 1
+                result.error_details.append(
+                    {
+                        "data_entry_id": entry.id,
+                        "error": str(exc),
+                    }
                 )
-                total_replaced += len(processed_entry_ids)
-                processed_entry_ids = []
-                prepared_emissions = []
-                logger.info(
-                    f"Recalc {data_entry_type_id.name}/{year}: "
-                    f"{processed}/{len(entries)} entries computed "
-                    f"({total_written} emissions written, {errors} errors)"
+                logger.error(
+                    f"Error recalculating emissions for data_entry_id={entry.id}: {exc}"
                 )
-                if progress_callback is not None:
-                    await progress_callback(processed, len(entries))
+                continue
+            if plan is not None and plan.data_entry_id in unchanged:
+                # Stored rows already are this plan's output.  Still an
+                # affected module: aggregation stays conservative.
+                result.unchanged += 1
+            elif entry.id is not None:
+                # Entries that computed to zero emissions stay in
+                # ``processed_entry_ids`` so their stale rows get
+                # deleted by the chunk's replace.
+                result.processed_entry_ids.append(entry.id)
+                if entry.data is not old_data:
+                    result.relinked[entry.id] = entry.data
+            result.recalculated += 1
+            if entry.carbon_report_module_id is not None:
+                result.affected_module_ids.add(entry.carbon_report_module_id)
+        result.rows = batch.rows
+        result.inputs = batch.inputs
 
-        # Final chunk (remaining entries below the interval).
-        total_written += await emission_svc.bulk_replace_for_entries(
-            processed_entry_ids, prepared_emissions
-        )
-        total_replaced += len(processed_entry_ids)
-        slice_elapsed = time.perf_counter() - slice_started
+        return result
+
+    @staticmethod
+    def _log_profile(
+        data_entry_type_id: DataEntryTypeEnum,
+        year: int,
+        *,
+        total: int,
+        total_replaced: int,
+        total_written: int,
+        slice_elapsed: float,
+        seg: dict[str, float],
+        unchanged: int = 0,
+    ) -> None:
         logger.info(
             f"Recalc {data_entry_type_id.name}/{year}: replaced emissions for "
             f"{total_replaced} entries ({total_written} emission rows, "
+            f"{unchanged} unchanged entries skipped, "
             f"{slice_elapsed:.1f}s compute+write)"
         )
         # Recalc profile: where the per-entry time went (rematch = in-memory
-        # factor relink, validate = Pydantic, prepare = prepare_create incl. any
-        # handler DB reads). remainder = bulk writes + loop overhead.
+        # factor relink, validate = Pydantic, prepare = plan_create incl. any
+        # handler DB reads, plus the batched formula pass). remainder = bulk
+        # writes + loop overhead.
         accounted = seg["rematch"] + seg["validate"] + seg["prepare"]
         logger.info(
             "Recalc profile %s/%s: %d entries in %.1fs (%.2f ms/entry) | "
             "rematch=%.1f validate=%.1f prepare=%.1f remainder=%.1f",
             data_entry_type_id.name,
             year,
-            len(entries),
+            total,
             slice_elapsed,
-            slice_elapsed / len(entries) * 1000,
+            slice_elapsed / total * 1000,
             seg["rematch"],
             seg["validate"],
             seg["prepare"],
             slice_elapsed - accounted,
         )
 
-        # Plan 310-D — stats recompute moves out of this workflow and
-        # into the runner-driven ``aggregation`` handler that the
-        # ``emission_recalc`` task chains on success.  Keeping the
-        # ``modules_refreshed`` and ``affected_module_ids`` keys in the
-        # return shape so callers (and the runner-persisted meta) keep
-        # the same field set; ``modules_refreshed`` is now always 0
-        # from this layer because the writer is the aggregation
-        # handler, not us.
-        return {
-            "recalculated": recalculated,
-            "modules_refreshed": 0,
-            "affected_module_ids": sorted(affected_module_ids),
-            "errors": errors,
-            "error_details": error_details,
-        }
-
     @staticmethod
     def _lookup_factor_id(
         entry_data: dict,
@@ -497,3 +1120,173 @@ class EmissionRecalculationWorkflow:
             f"{kind_field}={kind!r} with {len(averages)} average rows "
             f"(need exactly 1)"
         )
+
+
+# ---------------------------------------------------------------------------
+# Sharded recalc — partitioning and the worker-process side.
+# ---------------------------------------------------------------------------
+
+
+def _partition_modules(
+    module_counts: list[tuple[int, int]], workers: int
+) -> list[list[int]]:
+    """Split ``(module_id, entry_count)`` pairs into ≤ ``workers`` shards.
+
+    Greedy longest-first: each module (heaviest first) goes to the
+    currently lightest shard, which keeps shard sizes within one
+    module's weight of each other.  A module is never split, so one
+    worker owns all of a module's entries.
+    """
+    shard_count = max(1, min(workers, len(module_counts)))
+    shards: list[list[int]] = [[] for _ in range(shard_count)]
+    loads = [0] * shard_count
+    for module_id, count in sorted(module_counts, key=lambda mc: (-mc[1], mc[0])):
+        lightest = loads.index(min(loads))
+        shards[lightest].append(module_id)
+        loads[lightest] += count
+    return [sorted(shard) for shard in shards if shard]
+
+
+def _make_shard_executor(workers: int) -> Executor:
+    """Process pool for one sharded recalc.
+
+    ``spawn`` rather than ``fork``: a forked child would inherit the
+    parent's event loop and the async engine's pooled connections,
+    which must never be shared across processes.  Spawned workers
+    import the app fresh and open their own engine from the same
+    settings.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_shard_worker,
+    )
+
+
+# Per-process state: one event loop for the worker's lifetime (the async
+# engine's pooled connections are bound to the loop that opened them) and
+# the slice factors, loaded on the worker's first chunk.  The pool lives
+# for a single recalc, so the cache never outlives the advisory lock.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_slice_factors: dict[tuple[int, int], _SliceFactors] = {}
+
+
+def _init_shard_worker() -> asyncio.AbstractEventLoop:
+    global _worker_loop
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+def _compute_shard_chunk(
+    data_entry_type_id: int,
+    year: int,
+    module_ids: list[int],
+    after_id: int,
+    chunk_size: int,
+    changed_factors: Optional[ChangedFactorScope] = None,
+    data_entry_ids: Optional[list[int]] = None,
+) -> dict[str, Any]:
+    """Worker entry point: compute the next chunk of one shard.
+
+    Plain, picklable arguments and return value — see
+    ``_compute_shard_chunk_async`` for the payload.
+    """
+    loop = _worker_loop if _worker_loop is not None else _init_shard_worker()
+    return loop.run_until_complete(
+        _compute_shard_chunk_async(
+            data_entry_type_id,
+            year,
+            module_ids,
+            after_id,
+            chunk_size,
+            changed_factors,
+            data_entry_ids,
+        )
+    )
+
+
+async def _compute_shard_chunk_async(
+    data_entry_type_id: int,
+    year: int,
+    module_ids: list[int],
+    after_id: int,
+    chunk_size: int,
+    changed_factors: Optional[ChangedFactorScope] = None,
+    data_entry_ids: Optional[list[int]] = None,
+) -> dict[str, Any]:
+    """Read the shard's next keyset chunk after ``after_id`` and compute it.
+
+    Runs on a session of its own that is never committed: reads only.
+    The chunk's relinks and emissions come back as data (emissions
+    encoded by ``DataEntryEmissionRepository.copy_row``) for the parent
+    to write inside the job's transaction.
+    """
+    # Imported here so only worker processes open a second engine; the
+    # parent never touches it.
+    from app.db import SessionLocal
+
+    det = DataEntryTypeEnum(data_entry_type_id)
+    handler = BaseModuleHandler.get_by_type(det)
+    seg = _new_profile()
+    async with SessionLocal() as session:
+        workflow = EmissionRecalculationWorkflow(session)
+        factors = _worker_slice_factors.get((data_entry_type_id, year))
+        if factors is None:
+            factors = await workflow._load_slice_factors(handler, det, year)
+            _worker_slice_factors[(data_entry_type_id, year)] = factors
+
+        chunks = DataEntryRepository(session).iter_by_data_entry_type_and_year(
+            det,
+            year,
+            module_ids,
+            chunk_size=chunk_size,
+            after_id=after_id,
+            changed_factors=changed_factors,
+            data_entry_ids=data_entry_ids,
+        )
+        chunk: list[DataEntry] = await anext(chunks, [])
+        await chunks.aclose()
+        if not chunk:
+            return {
+                "last_id": after_id,
+                "exhausted": True,
+                "entry_ids": [],
+                "rows": [],
+                "inputs": {},
+                "relinked": {},
+                "recalculated": 0,
+                "unchanged": 0,
+                "errors": 0,
+                "error_details": [],
+                "affected_module_ids": [],
+                "seg": seg,
+            }
+
+        # The relink mutates ``entry.data`` in memory; keep autoflush from
+        # turning that into an UPDATE on this read-only session — the
+        # parent applies relinks from ``relinked``.
+        with session.no_autoflush:
+            result = await workflow._compute_chunk(
+                chunk,
+                handler,
+                factors,
+                DataEntryEmissionService(session),
+                year=year,
+                seg=seg,
+            )
+
+    return {
+        "last_id": chunk[-1].id or after_id,
+        "exhausted": len(chunk) < chunk_size,
+        "entry_ids": result.processed_entry_ids,
+        "rows": result.rows,
+        "inputs": result.inputs,
+        "relinked": result.relinked,
+        "recalculated": result.recalculated,
+        "unchanged": result.unchanged,
+        "errors": result.errors,
+        "error_details": result.error_details,
+        "affected_module_ids": sorted(result.affected_module_ids),
+        "seg": seg,
+    }
@@ -0,0 +1,141 @@
+"""Opt-in text vs binary COPY benchmark for the two bulk-written tables.
+
+Skipped unless ``BULK_COPY_BENCH=1``; prints rows/s per format at 50k
+and 500k rows for ``data_entries`` (ingest) and ``data_entry_emissions``
+(recalc).  Each run is rolled back, so the container stays clean::
+
+    BULK_COPY_BENCH=1 pytest -s \\
+        tests/integration/services/data_ingestion/test_bulk_copy_bench_pg.py
+
+Requires Docker — see ``conftest.py``'s ``postgres_container`` fixture.
+"""
+
+import os
+import time
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.data_entry import DataEntry, DataEntryStatusEnum, DataEntryTypeEnum
+from app.models.data_entry_emission import EmissionType
+from app.repositories.copy_writer import CopyFormat
+from app.repositories.data_entry_emission_repo import DataEntryEmissionRepository
+from app.repositories.data_entry_repo import DataEntryRepository
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.skipif(
+        os.environ.get("BULK_COPY_BENCH") != "1",
+        reason="benchmark; set BULK_COPY_BENCH=1 to run",
+    ),
+]
+
+
+@pytest_asyncio.fixture(scope="function")
+async def psycopg_session(pg_dsn):
+    url = pg_dsn.replace("postgresql+asyncpg", "postgresql+psycopg")
+    engine = create_async_engine(url, future=True)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+    await engine.dispose()
+
+
+def _report(table: str, n: int, fmt: CopyFormat, elapsed: float) -> None:
+    print(f"\n{table:<22} {n:>7} rows  {fmt.value:<6} {n / elapsed:>12,.0f} rows/s")
+
+
+async def _seed_module_id(
+    session, make_unit, make_carbon_report, make_carbon_report_module
+) -> int:
+    unit = await make_unit(session)
+    report = await make_carbon_report(session, unit_id=unit.id, year=2026)
+    module = await make_carbon_report_module(
+        session, carbon_report_id=report.id, module_type_id=1
+    )
+    await session.commit()
+    return module.id
+
+
+def _entries(module_id: int, n: int) -> list[DataEntry]:
+    return [
+        DataEntry(
+            data_entry_type_id=DataEntryTypeEnum.member.value,
+            carbon_report_module_id=module_id,
+            data={"name": f"row-{i}", "fte": 0.5, "function": "Professor"},
+            status=DataEntryStatusEnum.PENDING,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("n", [50_000, 500_000])
+@pytest.mark.parametrize("fmt", list(CopyFormat))
+async def test_bench_data_entries(
+    psycopg_session, make_unit, make_carbon_report, make_carbon_report_module, n, fmt
+):
+    module_id = await _seed_module_id(
+        psycopg_session, make_unit, make_carbon_report, make_carbon_report_module
+    )
+    entries = _entries(module_id, n)
+    repo = DataEntryRepository(psycopg_session)
+
+    start = time.perf_counter()
+    assert await repo.bulk_copy(entries, fmt) == n
+    _report("data_entries", n, fmt, time.perf_counter() - start)
+    await psycopg_session.rollback()
+
+
+@pytest.mark.parametrize("n", [50_000, 500_000])
+@pytest.mark.parametrize("fmt", list(CopyFormat))
+async def test_bench_data_entry_emissions(
+    psycopg_session, make_unit, make_carbon_report, make_carbon_report_module, n, fmt
+):
+    module_id = await _seed_module_id(
+        psycopg_session, make_unit, make_carbon_report, make_carbon_report_module
+    )
+    repo = DataEntryRepository(psycopg_session)
+    emission_repo = DataEntryEmissionRepository(psycopg_session)
+    # Spread the rows over 1000 parent entries (data_entry_id FK).
+    await repo.bulk_copy(_entries(module_id, 1000))
+    entry_ids = (
+        (
+            await psycopg_session.execute(
+                select(col(DataEntry.id)).where(
+                    col(DataEntry.carbon_report_module_id) == module_id
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    emission_type = EmissionType.professional_travel__plane__business
+    now = datetime.utcnow()
+    rows = [
+        (
+            entry_ids[i % len(entry_ids)],
+            emission_type.value,
+            None,
+            12.5 + i,
+            None,
+            emission_type.scope,
+            {
+                "factors_used": [{"id": 1, "values_id": "0" * 32}],
+                "quantity": 100.0,
+                "quantity_unit": "km",
+            },
+            "1" * 32,
+            now,
+            "2" * 32,
+        )
+        for i in range(n)
+    ]
+
+    start = time.perf_counter()
+    assert await emission_repo.bulk_copy_rows(rows, fmt) == n
+    _report("data_entry_emissions", n, fmt, time.perf_counter() - start)
+    await psycopg_session.rollback()
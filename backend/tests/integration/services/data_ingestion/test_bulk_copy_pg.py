@@ -174,3 +174,99 @@ async def test_year_delete_replaces_only_matching_source_and_year(
         (2026, DataEntrySourceEnum.USER_MANUAL.value),
         (2025, DataEntrySourceEnum.CSV_MODULE_PER_YEAR.value),
     }
+
+
+async def test_binary_copy_matches_text_copy(
+    psycopg_session, make_unit, make_carbon_report, make_carbon_report_module
+):
+    """Both wire formats land identical ``data_entries`` and
+    ``data_entry_emissions`` rows (JSON, enum, timestamps, NULLs)."""
+    from app.models.data_entry_emission import DataEntryEmission, EmissionType
+    from app.repositories.copy_writer import CopyFormat
+    from app.repositories.data_entry_emission_repo import (
+        DataEntryEmissionRepository,
+    )
+
+    module = await _seed_module(
+        psycopg_session, make_unit, make_carbon_report, make_carbon_report_module
+    )
+    module_id = module.id
+    repo = DataEntryRepository(psycopg_session)
+    emission_repo = DataEntryEmissionRepository(psycopg_session)
+    emission_type = EmissionType.professional_travel__plane__business
+
+    for fmt in (CopyFormat.text, CopyFormat.binary):
+        entries = _entries(module_id, 3)
+        for entry in entries:
+            entry.data["format"] = fmt.value
+            entry.data["unicode"] = "Lausanne – Genève"
+        assert await repo.bulk_copy(entries, fmt) == 3
+    await psycopg_session.commit()
+
+    rows = (
+        (
+            await psycopg_session.execute(
+                select(DataEntry)
+                .where(col(DataEntry.carbon_report_module_id) == module_id)
+                .order_by(col(DataEntry.id))
+            )
+        )
+        .scalars()
+        .all()
+    )
+    by_format = {
+        fmt: [r for r in rows if r.data["format"] == fmt.value] for fmt in CopyFormat
+    }
+
+    def _entry_view(r):
+        return (r.data_entry_type_id, r.status, r.data | {"format": None}, r.year)
+
+    assert [_entry_view(r) for r in by_format[CopyFormat.text]] == [
+        _entry_view(r) for r in by_format[CopyFormat.binary]
+    ]
+
+    for fmt in CopyFormat:
+        emission_rows = [
+            emission_repo.copy_row(
+                DataEntryEmission(
+                    data_entry_id=entry.id,
+                    emission_type_id=emission_type,
+                    kg_co2eq=1.25,
+                    scope=emission_type.scope,
+                    meta={"factors_used": [{"id": 1, "values_id": "ab"}], "q": None},
+                    inputs_id=None,
+                )
+            )
+            for entry in by_format[fmt]
+        ]
+        assert await emission_repo.bulk_copy_rows(emission_rows, fmt) == 3
+    await psycopg_session.commit()
+
+    def _emission_view(e):
+        return (e.emission_type_id, e.kg_co2eq, e.scope, e.meta, e.inputs_id)
+
+    for fmt in CopyFormat:
+        emissions = (
+            (
+                await psycopg_session.execute(
+                    select(DataEntryEmission).where(
+                        col(DataEntryEmission.data_entry_id).in_(
+                            [r.id for r in by_format[fmt]]
+                        )
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        assert len(emissions) == 3
+        assert all(e.computed_at is not None for e in emissions)
+        assert {_emission_view(e) for e in emissions} == {
+            (
+                emission_type.value,
+                1.25,
+                emission_type.scope,
+                {"factors_used": [{"id": 1, "values_id": "ab"}], "q": None},
+                None,
+            )
+        }
@@ -267,9 +267,9 @@ async def test_new_factor_matches_unmatched_entries_strategy_a(
                 year=2025,
             )
             repo = FactorRepository(s)
-            affected = await repo.upsert_factors([new_factor], current_job_id=job_id)
+            upserted = await repo.upsert_factors([new_factor], current_job_id=job_id)
             await s.commit()
-            assert affected == 1, "fresh factor row should insert"
+            assert upserted.affected == 1, "fresh factor row should insert"
 
         # Trigger the recalc the way ``factor_ingest`` would on success.
         async with Sf() as s:
@@ -421,9 +421,9 @@ async def test_new_factor_matches_unmatched_entries_strategy_b(
                 year=2025,
             )
             repo = FactorRepository(s)
-            affected = await repo.upsert_factors([new_factor], current_job_id=job_id)
+            upserted = await repo.upsert_factors([new_factor], current_job_id=job_id)
             await s.commit()
-            assert affected == 1
+            assert upserted.affected == 1
 
         # Trigger the recalc.
         async with Sf() as s:
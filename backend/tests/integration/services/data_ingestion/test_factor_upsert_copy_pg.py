@@ -12,6 +12,7 @@ Requires Docker — see ``conftest.py``'s ``postgres_container`` fixture.
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -84,13 +85,14 @@ async def test_copy_upsert_inserts_and_stamps_job(psycopg_session):
     repo = FactorRepository(psycopg_session)
 
     job_id = await _make_job(psycopg_session)
-    affected = await repo.upsert_factors(
+    upserted = await repo.upsert_factors(
         [_factor("lab", 1.0), _factor("it", 2.0), _factor("no-year", 3.0, year=None)],
         current_job_id=job_id,
     )
     await psycopg_session.commit()
 
-    assert affected == 3
+    assert len(upserted.inserted_ids) == 3
+    assert upserted.updated_ids == upserted.unchanged_ids == []
     rows = await _all_factors(psycopg_session)
     assert len(rows) == 3
     assert all(r.last_seen_job_id == job_id for r in rows)
@@ -109,13 +111,13 @@ async def test_copy_upsert_updates_in_place_preserving_id(psycopg_session):
     original_id = original.id
 
     job_b = await _make_job(psycopg_session)
-    affected = await repo.upsert_factors([_factor("lab", 9.9)], current_job_id=job_b)
+    upserted = await repo.upsert_factors([_factor("lab", 9.9)], current_job_id=job_b)
     await psycopg_session.commit()
     # The upsert is raw SQL — expire the identity map so the re-read
     # below reflects the DB row, not the cached pre-update instance.
     psycopg_session.expire_all()
 
-    assert affected == 1
+    assert upserted.updated_ids == [original_id]
     rows = await _all_factors(psycopg_session)
     assert len(rows) == 1  # updated, not duplicated
     assert rows[0].id == original_id
@@ -135,3 +137,75 @@ async def test_copy_upsert_multiple_batches_same_transaction(psycopg_session):
 
     rows = await _all_factors(psycopg_session)
     assert {r.classification["purchase_kind"] for r in rows} == {"a", "b"}
+
+
+async def test_copy_upsert_reports_changed_and_unchanged_ids(psycopg_session):
+    """Inserted rows and rows whose values moved are reported as changed;
+    a byte-identical reupload of an existing factor is left unwritten
+    and reported as unchanged."""
+    repo = FactorRepository(psycopg_session)
+
+    job_a = await _make_job(psycopg_session)
+    first = await repo.upsert_factors(
+        [_factor("lab", 1.0), _factor("it", 2.0)], current_job_id=job_a
+    )
+    await psycopg_session.commit()
+    ids = {
+        r.classification["purchase_kind"]: r.id
+        for r in await _all_factors(psycopg_session)
+    }
+    assert set(first.changed_ids) == set(ids.values())
+
+    job_b = await _make_job(psycopg_session)
+    second = await repo.upsert_factors(
+        [_factor("lab", 1.0), _factor("it", 7.0), _factor("new", 3.0)],
+        current_job_id=job_b,
+    )
+    await psycopg_session.commit()
+    psycopg_session.expire_all()
+    rows = {
+        r.classification["purchase_kind"]: r
+        for r in await _all_factors(psycopg_session)
+    }
+    assert set(second.changed_ids) == {rows["it"].id, rows["new"].id}
+    assert second.unchanged_ids == [rows["lab"].id]
+    assert rows["lab"].last_seen_job_id == job_a
+    assert rows["it"].last_seen_job_id == job_b
+
+
+async def test_copy_upsert_identical_reupload_writes_no_row(psycopg_session):
+    """A re-import without edits leaves every tuple in place (same
+    ``xmin``) until ``stamp_last_seen`` records the new job."""
+    repo = FactorRepository(psycopg_session)
+
+    job_a = await _make_job(psycopg_session)
+    await repo.upsert_factors(
+        [_factor("lab", 1.0), _factor("no-year", 2.0, year=None)],
+        current_job_id=job_a,
+    )
+    await psycopg_session.commit()
+
+    async def xmins() -> dict:
+        result = await psycopg_session.execute(
+            text("SELECT id, xmin::text FROM factors WHERE data_entry_type_id = :d"),
+            {"d": DET},
+        )
+        return dict(result.all())
+
+    before = await xmins()
+    job_b = await _make_job(psycopg_session)
+    upserted = await repo.upsert_factors(
+        [_factor("no-year", 2.0, year=None), _factor("lab", 1.0)],
+        current_job_id=job_b,
+    )
+    await psycopg_session.commit()
+
+    assert upserted.changed_ids == []
+    assert upserted.unchanged_ids == sorted(before)
+    assert await xmins() == before
+
+    await repo.stamp_last_seen(upserted.unchanged_ids, job_b)
+    await psycopg_session.commit()
+    psycopg_session.expire_all()
+    stamped = {r.last_seen_job_id for r in await _all_factors(psycopg_session)}
+    assert stamped == {job_b}
@@ -79,13 +79,13 @@ async def test_upsert_factors_inserts_new_row_with_last_seen_job_id(pg_dsn):
         job_id: int = job.id
 
         repo = FactorRepository(session)
-        affected = await repo.upsert_factors(
+        upserted = await repo.upsert_factors(
             [_make_factor({"kind": "food", "subkind": None})],
             current_job_id=job_id,
         )
         await session.commit()
 
-        assert affected == 1
+        assert upserted.affected == 1
 
         # Verify the row landed and is stamped with the job id.
         from sqlmodel import col, select
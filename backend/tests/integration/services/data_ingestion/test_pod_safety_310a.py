@@ -28,6 +28,7 @@ from app.models.data_ingestion import (
     IngestionMethod,
     IngestionResult,
     IngestionState,
+    JobPriority,
     TargetType,
 )
 from app.models.user import UserProvider
@@ -273,6 +274,54 @@ async def test_recover_job_none_id(db_session: AsyncSession):
     assert recovered is None
 
 
+# ======================================================================
+# release_job tests (stopping worker hands a cut-off job back)
+# ======================================================================
+
+
+@pytest.mark.asyncio
+async def test_release_job_resets_own_running_job(db_session: AsyncSession):
+    job = _make_job(
+        state=IngestionState.RUNNING,
+        locked_by="pod-stopping",
+        locked_at=datetime.now(timezone.utc),
+        attempts=1,
+        is_current=True,
+    )
+    db_session.add(job)
+    await db_session.flush()
+    job_id = job.id
+
+    repo = DataIngestionRepository(db_session)
+    assert await repo.release_job(job_id, "pod-stopping") is True
+
+    await db_session.refresh(job)
+    assert job.state == IngestionState.NOT_STARTED
+    assert job.locked_by is None
+    assert job.locked_at is None
+    assert job.is_current is False
+    # attempts preserved, as in the stale-job sweep
+    assert job.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_release_job_leaves_other_pods_job(db_session: AsyncSession):
+    job = _make_job(
+        state=IngestionState.RUNNING,
+        locked_by="pod-other",
+        locked_at=datetime.now(timezone.utc),
+    )
+    db_session.add(job)
+    await db_session.flush()
+
+    repo = DataIngestionRepository(db_session)
+    assert await repo.release_job(job.id, "pod-stopping") is False
+
+    await db_session.refresh(job)
+    assert job.state == IngestionState.RUNNING
+    assert job.locked_by == "pod-other"
+
+
 # ======================================================================
 # sweep_stuck_running_jobs tests (poller's pod-crash auto-recovery)
 # ======================================================================
@@ -655,6 +704,54 @@ async def test_pending_runner_jobs_query_excludes_null_job_type(
     assert typed.id in job_ids
 
 
+@pytest.mark.asyncio
+async def test_pending_runner_jobs_query_skips_saturated_job_types(
+    db_session: AsyncSession,
+):
+    """Job types the pod is at its concurrency cap for stay in the queue
+    for another pod instead of filling this sweep's batch."""
+    from app.tasks._poller import _pending_runner_jobs_query
+
+    recalc = _make_job(
+        state=IngestionState.NOT_STARTED,
+        job_type="emission_recalc",
+        data_entry_type_id=1,
+    )
+    ingest = _make_job(
+        state=IngestionState.NOT_STARTED,
+        job_type="csv_ingest",
+        data_entry_type_id=2,
+    )
+    db_session.add_all([recalc, ingest])
+    await db_session.flush()
+
+    stmt = _pending_runner_jobs_query(limit=10, exclude_job_types=["emission_recalc"])
+    job_ids = {j.id for j in (await db_session.execute(stmt)).scalars().all()}
+    assert recalc.id not in job_ids
+    assert ingest.id in job_ids
+
+
+@pytest.mark.asyncio
+async def test_pending_runner_jobs_query_claims_higher_priority_first(
+    db_session: AsyncSession,
+):
+    """A user's upload queued behind a bulk backlog is picked first."""
+    from app.tasks._poller import _pending_runner_jobs_query
+
+    backlog = [
+        _make_job(job_type="emission_recalc", data_entry_type_id=det)
+        for det in (1, 2, 3)
+    ]
+    interactive = _make_job(job_type="csv_ingest", data_entry_type_id=4)
+    interactive.priority = JobPriority.INTERACTIVE
+    db_session.add_all([*backlog, interactive])
+    await db_session.flush()
+
+    stmt = _pending_runner_jobs_query(limit=2)
+    jobs = (await db_session.execute(stmt)).scalars().all()
+    assert [j.id for j in jobs] == [interactive.id, backlog[0].id]
+
+
 # ======================================================================
 # _check_job_scope tests — regression gate for the #1078 tenant-scope fallout
 # ======================================================================
@@ -0,0 +1,72 @@
+"""Unit tests for the precompiled ``EmissionType`` tree index."""
+
+from app.models.data_entry_emission import (
+    _PARENT_MAP,
+    EMISSION_TYPE_TREE,
+    EmissionType,
+    get_all_nodes,
+    get_children,
+    get_subtree_leaves,
+)
+
+
+def _scan_children(node: EmissionType) -> list[EmissionType]:
+    return [e for e in EmissionType if _PARENT_MAP.get(e.value) == node.value]
+
+
+def _scan_leaves(node: EmissionType) -> list[int]:
+    kids = _scan_children(node)
+    if not kids:
+        return [node.value]
+    return [leaf for kid in kids for leaf in _scan_leaves(kid)]
+
+
+def test_index_matches_parent_map_walk():
+    """Every helper returns what a scan of ``_PARENT_MAP`` would, in
+    the same order."""
+    for node in EmissionType:
+        assert get_children(node) == _scan_children(node)
+        assert get_subtree_leaves(node) == _scan_leaves(node)
+        assert get_all_nodes(node)[0] is node
+        assert sorted(n.value for n in get_all_nodes(node)[1:]) == sorted(
+            n.value for n in EmissionType if node in EMISSION_TYPE_TREE.ancestors(n)
+        )
+        parent_value = _PARENT_MAP.get(node.value)
+        assert node.parent == (
+            EmissionType(parent_value) if parent_value is not None else None
+        )
+
+
+def test_depth_and_ancestors():
+    node = EmissionType.waste__recycling__paper
+    assert EMISSION_TYPE_TREE.ancestors(node) == (
+        EmissionType.waste__recycling,
+        EmissionType.waste,
+    )
+    assert EMISSION_TYPE_TREE.depth(node) == 2
+    assert EMISSION_TYPE_TREE.depth(EmissionType.waste) == 0
+    assert EMISSION_TYPE_TREE.is_leaf(node)
+    assert not EMISSION_TYPE_TREE.is_leaf(EmissionType.waste)
+
+
+def test_ordinals_are_dense_in_declaration_order():
+    ordinals = [EMISSION_TYPE_TREE.ordinal(node) for node in EmissionType]
+    assert ordinals == list(range(len(EMISSION_TYPE_TREE.nodes)))
+
+
+def test_rollup_leaves_sums_every_level():
+    tree = EMISSION_TYPE_TREE
+    totals = tree.rollup_leaves(
+        {
+            EmissionType.waste__recycling__paper.value: 2.0,
+            EmissionType.waste__recycling__cardboard.value: 3.0,
+            EmissionType.waste__incineration.value: 5.0,
+            # Non-leaf ids are ignored, like a sum over subtree leaves.
+            EmissionType.waste__recycling.value: 100.0,
+            -1: 7.0,
+        }
+    )
+    assert totals[tree.ordinal(EmissionType.waste__recycling)] == 5.0
+    assert totals[tree.ordinal(EmissionType.waste)] == 10.0
+    assert totals[tree.ordinal(EmissionType.waste__recycling__paper)] == 2.0
+    assert totals[tree.ordinal(EmissionType.food)] == 0.0
@@ -12,6 +12,9 @@ conversion_factor rules (only applies when kwh_field == "heating_kwh_per_square_
 For non-heating fields, conversion_factor is always 1.0.
 """
 
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from app.models.data_entry_emission import EmissionType
@@ -247,3 +250,34 @@ def test_heating_elec_top_level_emission_type_gives_zero() -> None:
     assert _HANDLER._compute_kwh_emission(
         ctx, fv, "heating_kwh_per_square_meter"
     ) == pytest.approx(0.0)
+
+
+# ---------------------------------------------------------------------------
+# Slice prefetch — rooms bulk-loaded once, read from slice_cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_prefetch_slice_loads_rooms_once_for_pre_compute() -> None:
+    entries = [
+        SimpleNamespace(id=i, data={"building_name": "BC", "room_name": name})
+        for i, name in enumerate(["BC 410", "BC 410", "BC 420", None])
+    ]
+    first = SimpleNamespace(room_name="BC 410", room_surface_square_meter=20.0)
+    duplicate = SimpleNamespace(room_name="BC 410", room_surface_square_meter=99.0)
+    service = MagicMock()
+    service.get_rooms_by_names = AsyncMock(return_value=[first, duplicate])
+    service.get_room = AsyncMock()
+
+    with patch(
+        "app.modules.buildings.schemas.BuildingRoomService", return_value=service
+    ):
+        cache = await _HANDLER.prefetch_slice(entries, MagicMock(), year=2025)
+        found = await _HANDLER.pre_compute(entries[0], MagicMock(), slice_cache=cache)
+        missing = await _HANDLER.pre_compute(entries[2], MagicMock(), slice_cache=cache)
+
+    service.get_rooms_by_names.assert_awaited_once_with(["BC 410", "BC 420"])
+    service.get_room.assert_not_awaited()
+    assert cache["year"] == 2025
+    assert found == {"room_surface_square_meter": 20.0}
+    assert missing == {"room_surface_square_meter": None}
@@ -0,0 +1,63 @@
+"""Unit tests for CalculationInputRepository."""
+
+import pytest
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.calculation_input import CalculationInput, calculation_input_id
+from app.repositories.calculation_input_repo import CalculationInputRepository
+
+
+def test_calculation_input_id_ignores_key_order():
+    first = calculation_input_id({"fte": 0.8, "_year": 2025})
+    second = calculation_input_id({"_year": 2025, "fte": 0.8})
+    assert first == second
+    assert len(first) == 32
+    assert calculation_input_id({"fte": 0.9, "_year": 2025}) != first
+
+
+@pytest.mark.asyncio
+async def test_store_many_skips_existing_ids(db_session: AsyncSession):
+    repo = CalculationInputRepository(db_session)
+    ctx = {"fte": 0.8}
+    values = {"ef": 2.0}
+    ctx_id = calculation_input_id(ctx)
+    values_id = calculation_input_id(values)
+
+    await repo.store_many({ctx_id: ("context", ctx)})
+    await repo.store_many(
+        {ctx_id: ("context", ctx), values_id: ("factor_values", values)}
+    )
+
+    stored = (await db_session.execute(select(CalculationInput))).scalars().all()
+    assert sorted(row.id for row in stored) == sorted([ctx_id, values_id])
+    assert await repo.get_many([ctx_id, values_id, "missing"]) == {
+        ctx_id: ctx,
+        values_id: values,
+    }
+
+
+@pytest.mark.asyncio
+async def test_expand_metas_resolves_references(db_session: AsyncSession):
+    repo = CalculationInputRepository(db_session)
+    ctx = {"room_surface_square_meter": 50.0}
+    values = {"ef_kgco2eq_per_m2": 2.0}
+    ctx_id = calculation_input_id(ctx)
+    values_id = calculation_input_id(values)
+    await repo.store_many(
+        {ctx_id: ("context", ctx), values_id: ("factor_values", values)}
+    )
+    legacy = {"factors_used": [{"id": 3, "values": {"ef": 1.0}}], "fte": 1.0}
+
+    compact, inline = await repo.expand_metas(
+        [
+            ({"factors_used": [{"id": 7, "values_id": values_id}]}, ctx_id),
+            (legacy, None),
+        ]
+    )
+
+    assert compact == {
+        "factors_used": [{"id": 7, "values": values}],
+        "room_surface_square_meter": 50.0,
+    }
+    assert inline == legacy
@@ -3,6 +3,7 @@
 import pytest
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import get_settings
 from app.core.constants import ModuleStatus
 from app.models.carbon_project import CarbonProject
 from app.models.carbon_report import CarbonReport, CarbonReportModule, CarbonReportType
@@ -13,6 +14,16 @@ from app.models.unit import Unit
 from app.repositories.data_entry_emission_repo import DataEntryEmissionRepository
 from app.utils.emission_category import is_additional_breakdown_emission
 
+
+@pytest.fixture(autouse=True)
+def _raw_emission_totals(monkeypatch):
+    """These tests seed ``data_entry_emissions`` directly, around the write
+    paths that keep ``module_emission_totals`` in step, so the readers must
+    aggregate the raw rows (the summary is covered by
+    ``test_module_emission_total_repo``)."""
+    monkeypatch.setattr(get_settings(), "EMISSION_TOTALS_SUMMARY", False)
+
+
 # ======================================================================
 # CRUD Operation Tests
 # ======================================================================
@@ -242,6 +253,99 @@ async def test_bulk_create_emissions(db_session: AsyncSession):
 # ======================================================================
 
 
+@pytest.mark.asyncio
+async def test_bulk_copy_rows_round_trips_copy_row(db_session: AsyncSession):
+    """Rows encoded by ``copy_row`` insert the same emissions (ORM
+    fallback path on the SQLite harness)."""
+    repo = DataEntryEmissionRepository(db_session)
+
+    module = CarbonReportModule(
+        carbon_report_id=1,
+        module_type_id=ModuleTypeEnum.professional_travel.value,
+        status="in_progress",
+    )
+    db_session.add(module)
+    await db_session.flush()
+    data_entry = DataEntry(
+        carbon_report_module_id=module.id,
+        data_entry_type_id=DataEntryTypeEnum.plane,
+        status=DataEntryStatusEnum.PENDING,
+        data={"name": "Test Trip"},
+    )
+    db_session.add(data_entry)
+    await db_session.flush()
+
+    emission = DataEntryEmission(
+        data_entry_id=data_entry.id,
+        emission_type_id=EmissionType.professional_travel__plane__business,
+        kg_co2eq=12.5,
+        scope=EmissionType.professional_travel__plane__business.scope,
+        meta={"distance_km": 100},
+    )
+
+    written = await repo.bulk_copy_rows([repo.copy_row(emission)])
+
+    assert written == 1
+    stored = await repo.get_by_data_entry_id(data_entry.id)
+    assert len(stored) == 1
+    assert stored[0].kg_co2eq == 12.5
+    assert stored[0].meta == {"distance_km": 100}
+
+
+@pytest.mark.asyncio
+async def test_get_inputs_fingerprints_requires_one_shared_value(
+    db_session: AsyncSession,
+):
+    """Only entries whose rows all carry the same fingerprint report one."""
+    repo = DataEntryEmissionRepository(db_session)
+
+    module = CarbonReportModule(
+        carbon_report_id=1,
+        module_type_id=ModuleTypeEnum.professional_travel.value,
+        status="in_progress",
+    )
+    db_session.add(module)
+    await db_session.flush()
+    entries = [
+        DataEntry(
+            carbon_report_module_id=module.id,
+            data_entry_type_id=DataEntryTypeEnum.plane,
+            status=DataEntryStatusEnum.PENDING,
+            data={"name": f"Trip {i}"},
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(entries)
+    await db_session.flush()
+    consistent, mixed, legacy = (e.id for e in entries)
+    business = EmissionType.professional_travel__plane__business
+
+    def _emission(data_entry_id: int, fingerprint: str | None) -> DataEntryEmission:
+        return DataEntryEmission(
+            data_entry_id=data_entry_id,
+            emission_type_id=business,
+            kg_co2eq=1.0,
+            scope=business.scope,
+            inputs_fingerprint=fingerprint,
+        )
+
+    await repo.bulk_create(
+        [
+            _emission(consistent, "a" * 32),
+            _emission(consistent, "a" * 32),
+            _emission(mixed, "a" * 32),
+            _emission(mixed, "b" * 32),
+            _emission(legacy, "a" * 32),
+            _emission(legacy, None),
+        ]
+    )
+
+    stored = await repo.get_inputs_fingerprints([consistent, mixed, legacy, 999])
+
+    assert stored == {consistent: "a" * 32}
+    assert await repo.get_inputs_fingerprints([]) == {}
+
+
 @pytest.mark.asyncio
 async def test_get_stats_by_emission_type(db_session: AsyncSession):
     """Test aggregating emissions by emission_type_id."""
@@ -3,13 +3,23 @@
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.carbon_project import CarbonProject
 from app.models.carbon_report import CarbonReport, CarbonReportModule, CarbonReportType
-from app.models.data_entry import DataEntry, DataEntryStatusEnum, DataEntryTypeEnum
+from app.models.data_entry import (
+    DataEntry,
+    DataEntrySourceEnum,
+    DataEntryStatusEnum,
+    DataEntryTypeEnum,
+)
 from app.models.module_type import ModuleTypeEnum
-from app.repositories.data_entry_repo import DEFAULT_FILTER_MAP, DataEntryRepository
+from app.repositories.data_entry_repo import (
+    DEFAULT_FILTER_MAP,
+    ChangedFactorScope,
+    DataEntryRepository,
+)
 from app.schemas.data_entry import DataEntryUpdate
 
 # ======================================================================
@@ -1102,6 +1112,328 @@ async def test_list_by_data_entry_type_and_year_filters_by_type(
     assert results[0].data_entry_type_id == DataEntryTypeEnum.plane
 
 
+@pytest.mark.asyncio
+async def test_iter_by_data_entry_type_and_year_streams_keyset_chunks(
+    db_session: AsyncSession,
+):
+    """The streaming reader yields the same slice as the list reader,
+    in id order, ``chunk_size`` rows at a time."""
+    repo = DataEntryRepository(db_session)
+
+    project = CarbonProject(unit_id=1, carbon_report_type=CarbonReportType.CALCULATOR)
+    db_session.add(project)
+    await db_session.flush()
+    report = CarbonReport(
+        year=2025, unit_id=1, overall_status=0, carbon_project_id=project.id
+    )
+    db_session.add(report)
+    await db_session.flush()
+
+    module = CarbonReportModule(
+        carbon_report_id=report.id,
+        module_type_id=ModuleTypeEnum.professional_travel.value,
+        status="in_progress",
+    )
+    db_session.add(module)
+    await db_session.flush()
+
+    for i in range(5):
+        db_session.add(
+            DataEntry(
+                carbon_report_module_id=module.id,
+                data_entry_type_id=DataEntryTypeEnum.plane,
+                status=DataEntryStatusEnum.PENDING,
+                data={"name": f"Trip {i}"},
+            )
+        )
+    db_session.add(
+        DataEntry(
+            carbon_report_module_id=module.id,
+            data_entry_type_id=DataEntryTypeEnum.train,
+            status=DataEntryStatusEnum.PENDING,
+            data={"name": "Train Trip"},
+        )
+    )
+    await db_session.flush()
+
+    expected = sorted(
+        e.id
+        for e in await repo.list_by_data_entry_type_and_year(
+            DataEntryTypeEnum.plane, 2025
+        )
+    )
+    assert (
+        await repo.count_by_data_entry_type_and_year(DataEntryTypeEnum.plane, 2025) == 5
+    )
+
+    chunks = [
+        [e.id for e in chunk]
+        async for chunk in repo.iter_by_data_entry_type_and_year(
+            DataEntryTypeEnum.plane, 2025, chunk_size=2
+        )
+    ]
+
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert [i for c in chunks for i in c] == expected
+
+
+@pytest.mark.asyncio
+async def test_release_chunk_flushes_and_detaches(db_session: AsyncSession):
+    """``release_chunk`` persists pending edits, then expunges the rows."""
+    repo = DataEntryRepository(db_session)
+
+    module = CarbonReportModule(
+        carbon_report_id=1,
+        module_type_id=ModuleTypeEnum.professional_travel.value,
+        status="in_progress",
+    )
+    db_session.add(module)
+    await db_session.flush()
+    entry = DataEntry(
+        carbon_report_module_id=module.id,
+        data_entry_type_id=DataEntryTypeEnum.plane,
+        status=DataEntryStatusEnum.PENDING,
+        data={"name": "Trip A"},
+    )
+    db_session.add(entry)
+    await db_session.flush()
+
+    entry.data = {**entry.data, "primary_factor_id": 42}
+    await repo.release_chunk([entry])
+
+    assert entry not in db_session
+    reloaded = await repo.get(entry.id)
+    assert reloaded is not None
+    assert reloaded.data["primary_factor_id"] == 42
+
+
+@pytest.mark.asyncio
+async def test_count_by_module_for_data_entry_type_and_year(db_session: AsyncSession):
+    """Per-module counts cover the slice only (type + year), one row per module."""
+    repo = DataEntryRepository(db_session)
+
+    project = CarbonProject(unit_id=1, carbon_report_type=CarbonReportType.CALCULATOR)
+    db_session.add(project)
+    await db_session.flush()
+    report = CarbonReport(
+        year=2025, unit_id=1, overall_status=0, carbon_project_id=project.id
+    )
+    db_session.add(report)
+    await db_session.flush()
+    modules = [
+        CarbonReportModule(
+            carbon_report_id=report.id,
+            module_type_id=module_type.value,
+            status="in_progress",
+        )
+        for module_type in (
+            ModuleTypeEnum.professional_travel,
+            ModuleTypeEnum.equipment,
+        )
+    ]
+    db_session.add_all(modules)
+    await db_session.flush()
+
+    for module, n in zip(modules, (3, 1)):
+        for i in range(n):
+            db_session.add(
+                DataEntry(
+                    carbon_report_module_id=module.id,
+                    data_entry_type_id=DataEntryTypeEnum.plane,
+                    status=DataEntryStatusEnum.PENDING,
+                    data={"name": f"Trip {i}"},
+                )
+            )
+    db_session.add(
+        DataEntry(
+            carbon_report_module_id=modules[1].id,
+            data_entry_type_id=DataEntryTypeEnum.train,
+            status=DataEntryStatusEnum.PENDING,
+            data={"name": "Train Trip"},
+        )
+    )
+    await db_session.flush()
+
+    counts = await repo.count_by_module_for_data_entry_type_and_year(
+        DataEntryTypeEnum.plane, 2025
+    )
+    assert counts == [(modules[0].id, 3), (modules[1].id, 1)]
+    assert await repo.count_by_module_for_data_entry_type_and_year(
+        DataEntryTypeEnum.plane, 2025, [modules[1].id]
+    ) == [(modules[1].id, 1)]
+
+
+@pytest.mark.asyncio
+async def test_changed_factor_scope_narrows_slice(db_session: AsyncSession):
+    """Kept: entries without a primary factor, entries linking a changed
+    factor, and entries whose kind / override value a changed factor
+    carries.  Everything else is left out of the count and the stream."""
+    repo = DataEntryRepository(db_session)
+
+    project = CarbonProject(unit_id=1, carbon_report_type=CarbonReportType.CALCULATOR)
+    db_session.add(project)
+    await db_session.flush()
+    report = CarbonReport(
+        year=2025, unit_id=1, overall_status=0, carbon_project_id=project.id
+    )
+    db_session.add(report)
+    await db_session.flush()
+    module = CarbonReportModule(
+        carbon_report_id=report.id,
+        module_type_id=ModuleTypeEnum.purchase.value,
+        status="in_progress",
+    )
+    db_session.add(module)
+    await db_session.flush()
+
+    payloads = {
+        "unlinked": {"kind": "Z"},
+        "linked": {"primary_factor_id": 7, "kind": "Z"},
+        "by_kind": {"primary_factor_id": 1, "kind": "A1"},
+        "by_code": {"primary_factor_id": 2, "kind": "Z", "code": "X9"},
+        "untouched": {"primary_factor_id": 3, "kind": "Z", "code": "Y0"},
+    }
+    entries = {}
+    for name, data in payloads.items():
+        entries[name] = DataEntry(
+            carbon_report_module_id=module.id,
+            data_entry_type_id=DataEntryTypeEnum.plane,
+            status=DataEntryStatusEnum.PENDING,
+            data={"name": name, **data},
+        )
+        db_session.add(entries[name])
+    await db_session.flush()
+
+    scope = ChangedFactorScope(
+        factor_ids=(7,),
+        kind_field="kind",
+        kinds=("A1",),
+        override_field="code",
+        override_codes=("X9",),
+    )
+    assert (
+        await repo.count_by_data_entry_type_and_year(
+            DataEntryTypeEnum.plane, 2025, changed_factors=scope
+        )
+        == 4
+    )
+    streamed = [
+        entry.data["name"]
+        async for chunk in repo.iter_by_data_entry_type_and_year(
+            DataEntryTypeEnum.plane, 2025, changed_factors=scope
+        )
+        for entry in chunk
+    ]
+    assert streamed == ["unlinked", "linked", "by_kind", "by_code"]
+    assert await repo.count_by_module_for_data_entry_type_and_year(
+        DataEntryTypeEnum.plane, 2025, changed_factors=ChangedFactorScope(())
+    ) == [(module.id, 1)]
+
+
+@pytest.mark.asyncio
+async def test_data_entry_ids_narrow_slice(db_session: AsyncSession):
+    """An explicit id set keeps only those entries of the slice; ``[]``
+    keeps none."""
+    repo = DataEntryRepository(db_session)
+    project = CarbonProject(unit_id=1, carbon_report_type=CarbonReportType.CALCULATOR)
+    db_session.add(project)
+    await db_session.flush()
+    report = CarbonReport(
+        year=2025, unit_id=1, overall_status=0, carbon_project_id=project.id
+    )
+    db_session.add(report)
+    await db_session.flush()
+    module = CarbonReportModule(
+        carbon_report_id=report.id,
+        module_type_id=ModuleTypeEnum.purchase.value,
+        status="in_progress",
+    )
+    db_session.add(module)
+    await db_session.flush()
+    entries = [
+        DataEntry(
+            carbon_report_module_id=module.id,
+            data_entry_type_id=DataEntryTypeEnum.plane,
+            status=DataEntryStatusEnum.PENDING,
+            data={"name": f"e{i}"},
+        )
+        for i in range(4)
+    ]
+    db_session.add_all(entries)
+    await db_session.flush()
+    ids = [entries[3].id, entries[1].id, 999_999]
+
+    assert (
+        await repo.count_by_data_entry_type_and_year(
+            DataEntryTypeEnum.plane, 2025, data_entry_ids=ids
+        )
+        == 2
+    )
+    streamed = [
+        entry.data["name"]
+        async for chunk in repo.iter_by_data_entry_type_and_year(
+            DataEntryTypeEnum.plane, 2025, chunk_size=1, data_entry_ids=ids
+        )
+        for entry in chunk
+    ]
+    assert streamed == ["e1", "e3"]
+    assert (
+        await repo.count_by_data_entry_type_and_year(
+            DataEntryTypeEnum.plane, 2025, data_entry_ids=[]
+        )
+        == 0
+    )
+
+
+def test_data_entry_ids_bind_one_array_on_postgres():
+    """On PostgreSQL the id set is one ``= ANY`` array param, not an
+    ``IN`` list of one bind per id."""
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    statement = DataEntryRepository(session)._slice_statement(
+        DataEntryTypeEnum.plane, 2025, data_entry_ids=list(range(10_000))
+    )
+
+    compiled = statement.compile(dialect=postgresql.dialect())
+    assert "data_entries.id = ANY (%(data_entry_ids)s" in str(compiled)
+    assert compiled.params["data_entry_ids"] == list(range(10_000))
+    assert " IN " not in str(compiled)
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_data_overwrites_by_id(db_session: AsyncSession):
+    """``bulk_update_data`` rewrites ``data`` for exactly the given ids."""
+    repo = DataEntryRepository(db_session)
+
+    module = CarbonReportModule(
+        carbon_report_id=1,
+        module_type_id=ModuleTypeEnum.professional_travel.value,
+        status="in_progress",
+    )
+    db_session.add(module)
+    await db_session.flush()
+    entries = [
+        DataEntry(
+            carbon_report_module_id=module.id,
+            data_entry_type_id=DataEntryTypeEnum.plane,
+            status=DataEntryStatusEnum.PENDING,
+            data={"name": f"Trip {i}", "primary_factor_id": 1},
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(entries)
+    await db_session.flush()
+    ids = [e.id for e in entries]
+    repo._detach(*entries)
+
+    await repo.bulk_update_data({ids[0]: {"name": "Trip 0", "primary_factor_id": 42}})
+
+    first = await repo.get(ids[0])
+    second = await repo.get(ids[1])
+    assert first is not None and first.data["primary_factor_id"] == 42
+    assert second is not None and second.data["primary_factor_id"] == 1
+
+
 # ======================================================================
 # Regression: read path must not persist computed fields back to data
 # ======================================================================
@@ -1242,3 +1574,202 @@ async def test_detach_handles_none_attached_and_already_detached(
     await db_session.flush()
     repo._detach(None, entry, other)
     assert other not in db_session.sync_session
+
+
+@pytest.mark.asyncio
+async def test_get_taken_json_field_values_matches_per_value_check(
+    db_session: AsyncSession,
+):
+    """The batched lookup returns exactly the pairs the per-value
+    ``check_json_field_unique`` would reject."""
+    repo = DataEntryRepository(db_session)
+    # One headcount module per report: (report, module type) is unique.
+    modules = [
+        CarbonReportModule(
+            carbon_report_id=carbon_report_id,
+            module_type_id=ModuleTypeEnum.headcount.value,
+            status="in_progress",
+        )
+        for carbon_report_id in (1, 2)
+    ]
+    db_session.add_all(modules)
+    await db_session.flush()
+    first, second = (module.id for module in modules)
+    for module_id, entry_type, uid in [
+        (first, DataEntryTypeEnum.member, "100"),
+        (first, DataEntryTypeEnum.member, "101"),
+        (second, DataEntryTypeEnum.member, "100"),
+        (second, DataEntryTypeEnum.student, "102"),
+    ]:
+        db_session.add(
+            DataEntry(
+                carbon_report_module_id=module_id,
+                data_entry_type_id=entry_type,
+                status=DataEntryStatusEnum.PENDING,
+                data={"user_institutional_id": uid},
+            )
+        )
+    await db_session.flush()
+
+    uids = ["100", "101", "102", "103"]
+    taken = await repo.get_taken_json_field_values(
+        [first, second], DataEntryTypeEnum.member.value, "user_institutional_id", uids
+    )
+
+    assert taken == {(first, "100"), (first, "101"), (second, "100")}
+    for module_id in (first, second):
+        for uid in uids:
+            is_unique = await repo.check_json_field_unique(
+                module_id, DataEntryTypeEnum.member.value, "user_institutional_id", uid
+            )
+            assert ((module_id, uid) in taken) == (not is_unique)
+    assert await repo.get_taken_json_field_values([first], 1, "x", []) == set()
+
+
+@pytest.mark.asyncio
+async def test_get_source_year_summary_counts_replaced_scope(
+    db_session: AsyncSession,
+):
+    """Counts only the (year, types, source) scope a per-year upload
+    replaces, split by the creating job."""
+    repo = DataEntryRepository(db_session)
+    module = CarbonReportModule(
+        carbon_report_id=1,
+        module_type_id=ModuleTypeEnum.equipment.value,
+        status="in_progress",
+    )
+    db_session.add(module)
+    await db_session.flush()
+    per_year = DataEntrySourceEnum.CSV_MODULE_PER_YEAR.value
+    manual = DataEntrySourceEnum.USER_MANUAL.value
+    for year, source, created_by_id in [
+        (2025, per_year, 7),
+        (2025, per_year, 7),
+        (2025, per_year, 8),
+        (2025, manual, 7),
+        (2024, per_year, 7),
+    ]:
+        db_session.add(
+            DataEntry(
+                carbon_report_module_id=module.id,
+                data_entry_type_id=DataEntryTypeEnum.it,
+                status=DataEntryStatusEnum.PENDING,
+                data={},
+                year=year,
+                source=source,
+                created_by_id=created_by_id,
+            )
+        )
+    await db_session.flush()
+
+    total, created, last_updated = await repo.get_source_year_summary(
+        year=2025,
+        data_entry_type_ids=[DataEntryTypeEnum.it.value],
+        source=per_year,
+        created_by_id=7,
+    )
+
+    assert (total, created) == (3, 2)
+    assert last_updated is not None
+    assert await repo.get_source_year_summary(2025, [], per_year, 7) == (0, 0, None)
+
+
+async def _seed_source_year_entries(
+    db_session: AsyncSession,
+) -> tuple[int, int, list[int]]:
+    """Two modules of per-year rows (2025, creator 7 and 8), plus a
+    manual row and a 2024 row outside that scope."""
+    modules = []
+    for report_id in (1, 2):
+        module = CarbonReportModule(
+            carbon_report_id=report_id,
+            module_type_id=ModuleTypeEnum.equipment.value,
+            status="in_progress",
+        )
+        db_session.add(module)
+        modules.append(module)
+    await db_session.flush()
+    per_year = DataEntrySourceEnum.CSV_MODULE_PER_YEAR.value
+    entries = []
+    for module, year, source, created_by_id in [
+        (modules[0], 2025, per_year, 7),
+        (modules[1], 2025, per_year, 7),
+        (modules[0], 2025, per_year, 8),
+        (modules[0], 2025, DataEntrySourceEnum.USER_MANUAL.value, 7),
+        (modules[1], 2024, per_year, 7),
+    ]:
+        entry = DataEntry(
+            carbon_report_module_id=module.id,
+            data_entry_type_id=DataEntryTypeEnum.it,
+            status=DataEntryStatusEnum.PENDING,
+            data={"name": f"row-{len(entries)}"},
+            year=year,
+            source=source,
+            created_by_id=created_by_id,
+        )
+        db_session.add(entry)
+        entries.append(entry)
+    await db_session.flush()
+    return modules[0].id, modules[1].id, [e.id for e in entries]
+
+
+@pytest.mark.asyncio
+async def test_iter_source_year_rows_streams_replaced_scope(
+    db_session: AsyncSession,
+):
+    first, second, ids = await _seed_source_year_entries(db_session)
+    repo = DataEntryRepository(db_session)
+    per_year = DataEntrySourceEnum.CSV_MODULE_PER_YEAR.value
+
+    chunks = [
+        chunk
+        async for chunk in repo.iter_source_year_rows(
+            2025, [DataEntryTypeEnum.it.value], per_year, chunk_size=2
+        )
+    ]
+
+    it = DataEntryTypeEnum.it.value
+    assert chunks == [
+        [
+            (ids[0], first, it, {"name": "row-0"}),
+            (ids[1], second, it, {"name": "row-1"}),
+        ],
+        [(ids[2], first, it, {"name": "row-2"})],
+    ]
+    assert [c async for c in repo.iter_source_year_rows(2025, [], per_year)] == []
+
+
+@pytest.mark.asyncio
+async def test_list_ids_created_by_scopes_creator_year_and_source(
+    db_session: AsyncSession,
+):
+    _, _, ids = await _seed_source_year_entries(db_session)
+    repo = DataEntryRepository(db_session)
+    per_year = DataEntrySourceEnum.CSV_MODULE_PER_YEAR.value
+
+    assert await repo.list_ids_created_by(7, 2025, per_year) == ids[:2]
+    assert await repo.list_ids_created_by(8, 2025, per_year) == [ids[2]]
+    assert await repo.list_ids_created_by(9, 2025, per_year) == []
+
+
+@pytest.mark.asyncio
+async def test_delete_by_ids_deletes_in_chunks(db_session: AsyncSession):
+    _, _, ids = await _seed_source_year_entries(db_session)
+    repo = DataEntryRepository(db_session)
+
+    assert await repo.delete_by_ids([ids[0], ids[2], ids[4]], chunk_size=2) == 3
+    assert await repo.delete_by_ids([]) == 0
+    db_session.expunge_all()
+    kept = [entry_id for entry_id in ids if await repo.get(entry_id) is not None]
+    assert kept == [ids[1], ids[3]]
+
+
+@pytest.mark.asyncio
+async def test_group_ids_by_module_skips_unknown_ids(db_session: AsyncSession):
+    first, second, ids = await _seed_source_year_entries(db_session)
+    repo = DataEntryRepository(db_session)
+
+    grouped = await repo.group_ids_by_module([ids[2], ids[0], ids[1], 999_999])
+
+    assert grouped == {first: [ids[0], ids[2]], second: [ids[1]]}
+    assert await repo.group_ids_by_module([]) == {}
@@ -5,6 +5,7 @@ Covers:
 - ``set_started_at`` plus state-driven ``finished_at`` auto-stamping in
   ``update_ingestion_job`` (Plan 310C observability columns)
 - ``get_current_pipeline_id_for_module`` (Plan 310D stale-stats UX)
+- ``create_ingestion_job``'s dispatch-priority floor
 """
 
 from uuid import uuid4
@@ -19,6 +20,7 @@ from app.models.data_ingestion import (
     IngestionMethod,
     IngestionResult,
     IngestionState,
+    JobPriority,
     Pipeline,
     PipelineStatus,
     TargetType,
@@ -1739,3 +1741,222 @@ async def test_claim_unit_specific_does_not_demote_or_claim_current(
     unit_specific = await _reload_job(db_session, unit_specific_id)
     assert unit_specific.is_current is False  # RUNNING but never current
     assert unit_specific.state == IngestionState.RUNNING
+
+
+@pytest.mark.asyncio
+async def test_save_recalc_checkpoint_requires_job_ownership(
+    db_session: AsyncSession,
+):
+    """Only the pod holding the RUNNING job can store its checkpoint."""
+    repo = DataIngestionRepository(db_session)
+    job = _make_pending_job()
+    job.job_type = "emission_recalc"
+    job.meta = {"config": {"data_entry_type_id": 10}}
+    db_session.add(job)
+    await db_session.flush()
+    job_id = job.id
+    assert await repo.claim_job(job_id, pod_id="pod-test") is True
+
+    assert (
+        await repo.save_recalc_checkpoint(job_id, "pod-other", {"after_id": 7}) is False
+    )
+    assert await repo.save_recalc_checkpoint(job_id, "pod-test", {"after_id": 7})
+    await db_session.commit()
+
+    meta = (await _reload_job(db_session, job_id)).meta
+    assert meta["recalc_checkpoint"] == {"after_id": 7}
+    assert meta["config"] == {"data_entry_type_id": 10}
+
+
+@pytest.mark.asyncio
+async def test_widen_active_recalc_targeting_drops_checkpoint(
+    db_session: AsyncSession,
+):
+    """A factor ingest deduped into an untargeted recalc leaves its
+    targeting alone but discards its checkpoint."""
+    repo = DataIngestionRepository(db_session)
+    job = _make_pending_job()
+    job.job_type = "emission_recalc"
+    job.meta = {"config": {}, "recalc_checkpoint": {"after_id": 7}}
+    db_session.add(job)
+    await db_session.flush()
+
+    widened = await repo.widen_active_recalc_targeting(
+        module_type_id=1, data_entry_type_id=10, year=2025, changed_factor_ids=[3]
+    )
+
+    assert widened == 1
+    assert job.meta == {"config": {}}
+
+
+async def _add_active_recalc(db_session: AsyncSession, meta: dict) -> DataIngestionJob:
+    job = _make_pending_job()
+    job.job_type = "emission_recalc"
+    job.meta = meta
+    db_session.add(job)
+    await db_session.flush()
+    return job
+
+
+@pytest.mark.asyncio
+async def test_widen_active_recalc_targeting_merges_changed_entry_ids(
+    db_session: AsyncSession,
+):
+    """A row diff deduped into a row-diff recalc: entry ids and modules
+    become the unions, and the checkpoint goes."""
+    repo = DataIngestionRepository(db_session)
+    job = await _add_active_recalc(
+        db_session,
+        {
+            "config": {"changed_entry_ids": [5, 1], "changed_module_ids": [30]},
+            "recalc_checkpoint": {"after_id": 1},
+        },
+    )
+
+    widened = await repo.widen_active_recalc_targeting(
+        module_type_id=1,
+        data_entry_type_id=10,
+        year=2025,
+        changed_entry_ids=[9, 5],
+        changed_module_ids=[31],
+    )
+
+    assert widened == 1
+    assert job.meta == {
+        "config": {"changed_entry_ids": [1, 5, 9], "changed_module_ids": [30, 31]}
+    }
+
+
+@pytest.mark.asyncio
+async def test_widen_active_recalc_targeting_drops_other_kind_of_targeting(
+    db_session: AsyncSession,
+):
+    """Entry ids cannot narrow a factor-targeted recalc (nor the other
+    way round): the recalc falls back to the whole slice."""
+    repo = DataIngestionRepository(db_session)
+    job = await _add_active_recalc(db_session, {"config": {"changed_factor_ids": [3]}})
+
+    await repo.widen_active_recalc_targeting(
+        module_type_id=1,
+        data_entry_type_id=10,
+        year=2025,
+        changed_entry_ids=[9],
+        changed_module_ids=[31],
+    )
+
+    assert job.meta == {"config": {"changed_module_ids": [31]}}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("ingest", "expected_config"),
+    [
+        # Unit-specific ingest: its module joins the scope.
+        ({"carbon_report_module_ids": [41]}, {"carbon_report_module_ids": [40, 41]}),
+        # Row diff: its changes lie in the modules it touched.
+        (
+            {"changed_entry_ids": [9], "changed_module_ids": [42]},
+            {"carbon_report_module_ids": [40, 42], "changed_module_ids": [42]},
+        ),
+        # Factor ingest: not confined to any module — whole slice.
+        ({"changed_factor_ids": [3]}, {}),
+        # Whole-slice re-upload.
+        ({}, {}),
+    ],
+)
+async def test_widen_active_recalc_targeting_merges_module_scope(
+    db_session: AsyncSession, ingest, expected_config
+):
+    """A recalc pinned to a unit-specific ingest's module widens to the
+    modules the new ingest's changes are confined to, or drops its scope
+    when they are not."""
+    repo = DataIngestionRepository(db_session)
+    job = await _add_active_recalc(
+        db_session, {"config": {"carbon_report_module_ids": [40]}}
+    )
+
+    widened = await repo.widen_active_recalc_targeting(
+        module_type_id=1, data_entry_type_id=10, year=2025, **ingest
+    )
+
+    assert widened == 1
+    assert job.meta == {"config": expected_config}
+
+
+@pytest.mark.asyncio
+async def test_widen_active_recalc_targeting_unit_ingest_drops_targeting(
+    db_session: AsyncSession,
+):
+    """A unit-specific ingest needs every entry of its module, which a
+    targeted recalc would skip: the targeting is dropped."""
+    repo = DataIngestionRepository(db_session)
+    job = await _add_active_recalc(
+        db_session, {"config": {"changed_entry_ids": [1], "changed_module_ids": [30]}}
+    )
+
+    await repo.widen_active_recalc_targeting(
+        module_type_id=1,
+        data_entry_type_id=10,
+        year=2025,
+        carbon_report_module_ids=[41],
+    )
+
+    assert job.meta == {"config": {"changed_module_ids": [30]}}
+
+
+# ======================================================================
+# create_ingestion_job priority floor
+# ======================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("job_type", "entity_type", "expected"),
+    [
+        ("csv_ingest", EntityType.MODULE_UNIT_SPECIFIC, JobPriority.INTERACTIVE),
+        ("aggregation", EntityType.MODULE_PER_YEAR, JobPriority.NORMAL),
+        ("emission_recalc", EntityType.MODULE_PER_YEAR, JobPriority.BULK),
+    ],
+)
+async def test_create_ingestion_job_sets_priority_by_trigger_and_type(
+    db_session: AsyncSession, job_type, entity_type, expected
+):
+    job = _make_job(
+        module_type_id=1,
+        data_entry_type_id=1,
+        year=2025,
+        target_type=TargetType.DATA_ENTRIES,
+        ingestion_method=IngestionMethod.csv,
+        state=IngestionState.NOT_STARTED,
+        result=None,
+        is_current=False,
+    )
+    job.job_type = job_type
+    job.entity_type = entity_type
+
+    created = await DataIngestionRepository(db_session).create_ingestion_job(job)
+
+    assert created.priority == expected
+
+
+@pytest.mark.asyncio
+async def test_create_ingestion_job_keeps_an_inherited_higher_priority(
+    db_session: AsyncSession,
+):
+    """A bulk-typed child of an interactive parent stays interactive."""
+    job = _make_job(
+        module_type_id=1,
+        data_entry_type_id=1,
+        year=2025,
+        target_type=TargetType.DATA_ENTRIES,
+        ingestion_method=IngestionMethod.computed,
+        state=IngestionState.NOT_STARTED,
+        result=None,
+        is_current=False,
+    )
+    job.job_type = "emission_recalc"
+    job.priority = JobPriority.INTERACTIVE
+
+    created = await DataIngestionRepository(db_session).create_ingestion_job(job)
+
+    assert created.priority == JobPriority.INTERACTIVE
@@ -0,0 +1,193 @@
+"""Unit tests for ModuleEmissionTotalRepository (``module_emission_totals``)."""
+
+import pytest
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.core.constants import ModuleStatus
+from app.models.carbon_project import CarbonProject
+from app.models.carbon_report import CarbonReport, CarbonReportModule, CarbonReportType
+from app.models.data_entry import DataEntry, DataEntryStatusEnum, DataEntryTypeEnum
+from app.models.data_entry_emission import DataEntryEmission, EmissionType
+from app.models.module_emission_total import ModuleEmissionTotal
+from app.models.module_type import ModuleTypeEnum
+from app.models.unit import Unit
+from app.repositories.data_entry_emission_repo import DataEntryEmissionRepository
+from app.repositories.data_entry_repo import DataEntryRepository
+from app.repositories.module_emission_total_repo import ModuleEmissionTotalRepository
+
+_PAPER = EmissionType.waste__recycling__paper
+_CARDBOARD = EmissionType.waste__recycling__cardboard
+_VEGETARIAN = EmissionType.food__vegetarian
+
+
+async def _seed_module(db_session: AsyncSession) -> CarbonReportModule:
+    unit = Unit(id=91001, institutional_code="MET-1", name="Unit MET", level=1)
+    db_session.add(unit)
+    await db_session.flush()
+    project = CarbonProject(
+        unit_id=unit.id, carbon_report_type=CarbonReportType.CALCULATOR
+    )
+    db_session.add(project)
+    await db_session.flush()
+    report = CarbonReport(unit_id=unit.id, year=2025, carbon_project_id=project.id)
+    db_session.add(report)
+    await db_session.flush()
+    module = CarbonReportModule(
+        carbon_report_id=report.id,
+        module_type_id=ModuleTypeEnum.headcount.value,
+        status=ModuleStatus.VALIDATED,
+    )
+    db_session.add(module)
+    await db_session.flush()
+    return module
+
+
+async def _seed_entry(
+    db_session: AsyncSession,
+    module: CarbonReportModule,
+    rows: list[tuple[EmissionType, float, float | None]],
+) -> DataEntry:
+    entry = DataEntry(
+        carbon_report_module_id=module.id,
+        data_entry_type_id=DataEntryTypeEnum.member,
+        status=DataEntryStatusEnum.PENDING,
+        data={"name": "Entry"},
+    )
+    db_session.add(entry)
+    await db_session.flush()
+    for emission_type, kg_co2eq, additional_value in rows:
+        db_session.add(
+            DataEntryEmission(
+                data_entry_id=entry.id,
+                emission_type_id=emission_type,
+                kg_co2eq=kg_co2eq,
+                additional_value=additional_value,
+                scope=emission_type.scope,
+            )
+        )
+    await db_session.flush()
+    return entry
+
+
+async def _totals(db_session: AsyncSession) -> dict[int, tuple]:
+    # Columns, not entities: the refresh is Core DELETE/INSERT and would
+    # leave stale objects in the identity map.
+    result = await db_session.execute(
+        select(
+            col(ModuleEmissionTotal.emission_type_id),
+            col(ModuleEmissionTotal.year),
+            col(ModuleEmissionTotal.kg_co2eq),
+            col(ModuleEmissionTotal.additional_value),
+            col(ModuleEmissionTotal.additional_count),
+            col(ModuleEmissionTotal.entry_count),
+        )
+    )
+    return {row[0]: tuple(row[1:]) for row in result.all()}
+
+
+@pytest.mark.asyncio
+async def test_refresh_modules_groups_per_emission_type(db_session: AsyncSession):
+    module = await _seed_module(db_session)
+    await _seed_entry(
+        db_session, module, [(_PAPER, 2.0, 10.0), (_VEGETARIAN, 5.0, None)]
+    )
+    await _seed_entry(db_session, module, [(_PAPER, 3.0, None), (_CARDBOARD, 0.0, 1.0)])
+
+    await ModuleEmissionTotalRepository(db_session).refresh_modules([module.id])
+
+    assert await _totals(db_session) == {
+        _PAPER.value: (2025, 5.0, 10.0, 1, 2),
+        _VEGETARIAN.value: (2025, 5.0, None, 0, 1),
+        _CARDBOARD.value: (2025, 0.0, 1.0, 1, 1),
+    }
+
+
+async def _add_emissions(
+    db_session: AsyncSession,
+    entry: DataEntry,
+    rows: list[tuple[EmissionType, float, float | None]],
+) -> None:
+    for emission_type, kg_co2eq, additional_value in rows:
+        db_session.add(
+            DataEntryEmission(
+                data_entry_id=entry.id,
+                emission_type_id=emission_type,
+                kg_co2eq=kg_co2eq,
+                additional_value=additional_value,
+                scope=emission_type.scope,
+            )
+        )
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+async def test_write_paths_keep_totals_equal_to_refresh(db_session: AsyncSession):
+    module = await _seed_module(db_session)
+    totals_repo = ModuleEmissionTotalRepository(db_session)
+    emission_repo = DataEntryEmissionRepository(db_session)
+    entry_repo = DataEntryRepository(db_session)
+
+    kept = await _seed_entry(db_session, module, [])
+    edited = await _seed_entry(db_session, module, [])
+    dropped = await _seed_entry(db_session, module, [])
+    async with totals_repo.tracking_entries([kept.id, edited.id, dropped.id]):
+        await _add_emissions(db_session, kept, [(_PAPER, 2.0, 10.0)])
+        await _add_emissions(
+            db_session, edited, [(_PAPER, 3.0, 4.0), (_VEGETARIAN, 5.0, None)]
+        )
+        await _add_emissions(db_session, dropped, [(_CARDBOARD, 1.0, 1.0)])
+
+    async with totals_repo.tracking_entries([edited.id]):
+        await emission_repo.delete_by_data_entry_id(edited.id)
+        await _add_emissions(db_session, edited, [(_CARDBOARD, 7.0, None)])
+    await entry_repo.delete_by_ids([dropped.id])
+    patched = await _totals(db_session)
+
+    await totals_repo.refresh_modules([module.id])
+    refreshed = await _totals(db_session)
+    assert patched.keys() == refreshed.keys() == {_PAPER.value, _CARDBOARD.value}
+    for emission_type_id, row in refreshed.items():
+        assert patched[emission_type_id] == pytest.approx(row)
+
+    await entry_repo.delete(kept.id)
+    await entry_repo.delete(edited.id)
+    assert await _totals(db_session) == {}
+
+
+@pytest.mark.asyncio
+async def test_readers_agree_on_summary_and_raw_emissions(
+    db_session: AsyncSession, monkeypatch
+):
+    # The summary is only ever written through the tracked paths here — no
+    # refresh — so this compares it with the live aggregate.
+    module = await _seed_module(db_session)
+    first = await _seed_entry(db_session, module, [])
+    second = await _seed_entry(db_session, module, [])
+    async with ModuleEmissionTotalRepository(db_session).tracking_entries(
+        [first.id, second.id]
+    ):
+        await _add_emissions(
+            db_session, first, [(_PAPER, 2.0, 10.0), (_VEGETARIAN, 5.0, None)]
+        )
+        await _add_emissions(db_session, second, [(_CARDBOARD, 3.0, 1.0)])
+    repo = DataEntryEmissionRepository(db_session)
+
+    async def read_all() -> tuple:
+        return (
+            await repo.get_stats_by_carbon_report_id(module.carbon_report_id),
+            sorted(await repo.get_emission_breakdown(module.carbon_report_id)),
+            sorted(
+                await repo.get_emission_breakdown_with_quantity(module.carbon_report_id)
+            ),
+            await repo.get_validated_totals_by_unit(91001),
+        )
+
+    monkeypatch.setattr(get_settings(), "EMISSION_TOTALS_SUMMARY", False)
+    raw = await read_all()
+    monkeypatch.setattr(get_settings(), "EMISSION_TOTALS_SUMMARY", True)
+    summary = await read_all()
+
+    assert summary == raw
+    assert raw[0] == {str(ModuleTypeEnum.headcount.value): pytest.approx(10.0)}
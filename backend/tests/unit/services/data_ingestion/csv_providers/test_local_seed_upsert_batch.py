@@ -57,15 +57,30 @@ async def test_local_factor_provider_upsert_batch_uses_legacy_bulk_create():
     # Patch _process_batch to confirm the legacy path runs without
     # depending on FactorService internals.
     with patch.object(
-        provider, "_process_batch", new_callable=AsyncMock
+        provider, "_process_batch", new_callable=AsyncMock, return_value=3
     ) as mock_process:
         reported = await provider._upsert_batch(batch, factor_repo)
 
     # Legacy path was taken — exactly one call with the same batch.
     mock_process.assert_awaited_once()
     assert mock_process.await_args.args[0] is batch
-    # Reported count matches input length (no rowcount feedback in the
-    # bulk_create path, so the override returns len(batch)).
+    # Reported count is what ``_process_batch`` counted from the
+    # INSERT's RETURNING ids, as the upsert path does.
     assert reported == 3
     # The base-class ValueError sentinel was never tripped.
     factor_repo.upsert_factors.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_process_batch_counts_factors_the_insert_returned():
+    """The legacy path counts the ids ``bulk_create`` got back, not the
+    batch length — same source as the upsert path's counts."""
+    provider = LocalFactorCSVProvider(
+        config={"local_file_path": "/tmp/test.csv", "year": 2025},
+        data_session=MagicMock(),
+    )
+    created = [MagicMock(id=1), MagicMock(id=2), MagicMock(id=None)]
+    factor_service = MagicMock()
+    factor_service.bulk_create = AsyncMock(return_value=created)
+
+    assert await provider._process_batch(created, factor_service) == 2
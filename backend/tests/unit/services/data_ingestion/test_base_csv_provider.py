@@ -1,21 +1,36 @@
 """Unit tests for BaseCSVProvider."""
 
+import csv
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.core.config import get_settings
-from app.models.data_entry import DataEntrySourceEnum, DataEntryTypeEnum
+from app.models.data_entry import (
+    DataEntrySourceEnum,
+    DataEntryStatusEnum,
+    DataEntryTypeEnum,
+)
 from app.models.data_ingestion import EntityType, IngestionResult
 from app.models.user import UserProvider
+from app.schemas.data_entry import BaseModuleHandler
+from app.services.data_ingestion import base_csv_provider
 from app.services.data_ingestion.base_csv_provider import (
     BaseCSVProvider,
     StatsDict,
     _get_expected_columns_from_handlers,
     _get_required_columns_from_handler,
+    _init_validation_worker,
     _is_blank_data_row,
+    _PendingMember,
+    _RowDiff,
+    _scan_column,
     _validate_file_path,
+    _validate_rows_chunk,
+    check_csv_encoding,
+    open_csv,
 )
 
 # ======================================================================
@@ -134,6 +149,22 @@ def test_is_blank_data_row_no_required_columns():
     assert _is_blank_data_row({"amount": ""}, set()) is False
 
 
+def test_open_csv_decodes_bytes_like_text():
+    """Bytes are read through an incremental decoder that drops the BOM
+    and keeps quoted newlines, matching a reader over the decoded text."""
+    text = 'unit,name\r\nU1,"multi\nline é"\r\nU2,plain\r\n'
+    from_bytes = list(csv.DictReader(open_csv(("\ufeff" + text).encode())))
+    assert from_bytes == list(csv.DictReader(open_csv(text)))
+    assert from_bytes[0] == {"unit": "U1", "name": "multi\nline é"}
+
+
+def test_scan_column_collects_stripped_distinct_values():
+    content = b"unit_institutional_id,name\n U1 ,a\nU2,b\n\nU1,c\n,d\nU3\n"
+    assert _scan_column(content, "unit_institutional_id") == {"U1", "U2", "U3"}
+    assert _scan_column(content, "missing") == set()
+    assert _scan_column(b"", "unit_institutional_id") == set()
+
+
 # ======================================================================
 # CSV Header Validation Tests
 # ======================================================================
@@ -185,6 +216,30 @@ async def test_validate_csv_headers_empty_file():
         await provider._validate_csv_headers(csv_text, set(), set())
 
 
+def test_check_csv_encoding_decodes_across_steps(monkeypatch):
+    """A multi-byte character split by a step boundary is still valid; a
+    bad byte past the first step is reported."""
+    monkeypatch.setattr(base_csv_provider, "_DECODE_CHECK_STEP", 4)
+    check_csv_encoding("\ufeffunit,name\nU1,é\n".encode())
+    check_csv_encoding("not bytes \udcff")
+    with pytest.raises(UnicodeDecodeError):
+        check_csv_encoding(b"unit,name\nU1,a\nU2,\xff\n")
+    with pytest.raises(UnicodeDecodeError):
+        check_csv_encoding(b"unit,name\nU1,\xc3")
+
+
+@pytest.mark.asyncio
+async def test_validate_csv_headers_rejects_invalid_utf8_past_first_rows():
+    """The readers decode lazily, so the header check decodes the whole
+    file before any batch is written."""
+    config = {"file_path": "tmp/test.csv", "carbon_report_module_id": 99}
+    provider = ConcreteCSVProvider(config, data_session=MagicMock())
+    csv_content = b"col1,col2\n" + b"a,b\n" * 50 + b"\xff,b\n"
+
+    with pytest.raises(ValueError, match="not valid UTF-8"):
+        await provider._validate_csv_headers(csv_content, {"col1"}, {"col1"})
+
+
 @pytest.mark.asyncio
 async def test_process_csv_with_blank_rows_does_not_raise_value_error():
     """Regression test: Verifies that intermittent and trailing structural
@@ -221,7 +276,8 @@ async def test_process_csv_with_blank_rows_does_not_raise_value_error():
     )
     handler.kind_field = "head1"
     handler.subkind_field = None
-    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s: (d, None))
+    handler.prefetch_csv = AsyncMock(return_value={})
+    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s, **_: (d, None))
 
     async def mock_setup():
         return {
@@ -388,6 +444,231 @@ async def test_validate_connection_exception():
     assert result is False
 
 
+# ======================================================================
+# Batched Institutional ID Check Tests
+# ======================================================================
+
+
+@pytest.mark.asyncio
+async def test_drop_taken_institutional_ids_one_lookup_per_batch():
+    """Rows whose uid the module already has are dropped with the per-row
+    error, and moved from processed to skipped; others keep their order."""
+    provider = ConcreteCSVProvider(
+        {"file_path": "tmp/test.csv"}, data_session=MagicMock()
+    )
+    batch = [MagicMock(name=f"entry{i}") for i in range(3)]
+    overrides = [1.0, None, 3.0]
+    pending = [
+        _PendingMember(0, 2, 7, "100", has_factor=True),
+        _PendingMember(1, 3, 7, "101", has_factor=False),
+        _PendingMember(2, 4, 8, "100", has_factor=True),
+    ]
+    service = MagicMock()
+    service.get_taken_institutional_ids = AsyncMock(return_value={(7, "101")})
+    stats: StatsDict = {
+        "rows_processed": 3,
+        "rows_with_factors": 2,
+        "rows_without_factors": 1,
+        "rows_skipped": 0,
+        "batches_processed": 0,
+        "row_errors": [],
+        "row_errors_count": 0,
+    }
+
+    kept, kept_overrides = await provider._drop_taken_institutional_ids(
+        batch, overrides, pending, service, stats, max_row_errors=10
+    )
+
+    service.get_taken_institutional_ids.assert_awaited_once_with([7, 8], ["100", "101"])
+    assert kept == [batch[0], batch[2]]
+    assert kept_overrides == [1.0, 3.0]
+    assert stats["rows_processed"] == 2
+    assert stats["rows_without_factors"] == 0
+    assert stats["rows_skipped"] == 1
+    assert stats["row_errors"] == [{"row": 3, "reason": "DUPLICATE_INSTITUTIONAL_ID"}]
+
+
+# ======================================================================
+# Row Diff Tests
+# ======================================================================
+
+
+def _row(module_id: int, **data):
+    return SimpleNamespace(
+        carbon_report_module_id=module_id,
+        data_entry_type_id=DataEntryTypeEnum.it,
+        data=data,
+    )
+
+
+def test_row_diff_matches_on_natural_key():
+    """Identical rows are kept, same-key rows with other data queued as
+    updates, unknown keys left to insert; unmatched stored rows remain."""
+    diff = _RowDiff(natural_key=("equipment_id",))
+    it = DataEntryTypeEnum.it.value
+    diff.add_stored(1, 7, it, {"equipment_id": "E1", "name": "PC"})
+    diff.add_stored(2, 7, it, {"equipment_id": "E2", "name": "Scope"})
+    diff.add_stored(3, 8, it, {"equipment_id": "E1", "name": "PC"})
+    diff.add_stored(4, 8, it, {"name": "no key"})
+
+    assert diff.match(_row(7, name="PC", equipment_id="E1")) is True
+    assert diff.match(_row(7, equipment_id="E2", name="Scope 2")) is True
+    assert diff.match(_row(7, equipment_id="E3", name="New")) is False
+    assert diff.match(_row(7, equipment_id="E2", name="Scope 2")) is False
+
+    assert diff.unchanged == 1
+    assert diff.updated_ids == [2]
+    assert diff.take_updates() == {2: {"equipment_id": "E2", "name": "Scope 2"}}
+    assert diff.pending_updates == {}
+    assert diff.touched_modules == {7}
+    assert sorted(diff.unmatched()) == [(3, 8), (4, 8)]
+
+
+@pytest.mark.asyncio
+async def test_apply_row_diff_reports_changed_entries(monkeypatch):
+    """Updates and deletes are written, the inserted ids read back, and
+    the changed entries listed up to the cap."""
+    provider = ConcreteCSVProvider(
+        {"file_path": "tmp/test.csv", "job_id": 42, "year": 2025},
+        data_session=MagicMock(),
+    )
+    diff = _RowDiff(natural_key=("equipment_id",))
+    it = DataEntryTypeEnum.it.value
+    diff.add_stored(1, 7, it, {"equipment_id": "E1"})
+    diff.add_stored(2, 8, it, {"equipment_id": "E2"})
+    assert diff.match(_row(7, equipment_id="E1", name="changed")) is True
+    repo = MagicMock()
+    repo.bulk_update_data = AsyncMock()
+    repo.delete_by_ids = AsyncMock(return_value=1)
+    repo.list_ids_created_by = AsyncMock(return_value=[10, 11])
+    service = SimpleNamespace(repo=repo)
+
+    result = await provider._apply_row_diff(diff, service)
+
+    repo.bulk_update_data.assert_awaited_once_with(
+        {1: {"equipment_id": "E1", "name": "changed"}}
+    )
+    repo.delete_by_ids.assert_awaited_once_with([2])
+    repo.list_ids_created_by.assert_awaited_once_with(
+        created_by_id=42,
+        year=2025,
+        source=DataEntrySourceEnum.CSV_MODULE_PER_YEAR.value,
+    )
+    assert result == {
+        "row_diff": {"unchanged": 0, "updated": 1, "inserted": 2, "deleted": 1},
+        "changed_entry_ids": [1, 10, 11],
+        "changed_module_ids": [7, 8],
+    }
+
+    monkeypatch.setattr(base_csv_provider, "CHANGED_ENTRY_IDS_META_CAP", 2)
+    capped = await provider._apply_row_diff(diff, service)
+    assert capped["changed_entry_ids"] is None
+
+
+# ======================================================================
+# Parallel Row Validation Tests
+# ======================================================================
+
+
+def test_validate_rows_chunk_fills_factor_defaults():
+    """The worker validates each payload and fills factor_value_fields from
+    the snapshot; failures come back as the in-process row errors."""
+    handler = BaseModuleHandler.get_by_type(DataEntryTypeEnum.it)
+    assert handler.csv_parallel_validation is True
+    meta = {
+        "data_entry_type_id": DataEntryTypeEnum.it.value,
+        "carbon_report_module_id": 1,
+        "status": DataEntryStatusEnum.VALIDATED.value,
+        "primary_factor_id": 7,
+    }
+    valid = {**meta, "equipment_id": "E1", "name": "PC", "equipment_class": "pc"}
+    missing_class = {**meta, "equipment_id": "E2", "name": "Scope"}
+    _init_validation_worker({7: {"active_usage_hours_per_week": 40}})
+    try:
+        results = _validate_rows_chunk([(handler, valid), (handler, missing_class)])
+    finally:
+        _init_validation_worker({})
+
+    (data, error), (bad_data, bad_error) = results
+    assert error is None
+    assert data["name"] == "PC"
+    assert data["active_usage_hours_per_week"] == 40
+    assert bad_data is None
+    assert bad_error.startswith("Validation error:")
+
+
+@pytest.mark.asyncio
+async def test_process_csv_parallel_validation_keeps_file_order(monkeypatch):
+    """Rows validated in the pool reach the COPY batch in file order, with
+    the failing row recorded under its own row number."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "INGEST_VALIDATION_WORKERS", 2)
+    monkeypatch.setattr(settings, "INGEST_VALIDATION_PARALLEL_MIN_ROWS", 1)
+    monkeypatch.setattr(base_csv_provider, "_VALIDATION_CHUNK_ROWS", 2)
+    # Threads stand in for the spawned processes: same initializer and
+    # entry point, no pickling.
+    monkeypatch.setattr(
+        base_csv_provider,
+        "_make_validation_executor",
+        lambda workers, factor_values: ThreadPoolExecutor(
+            max_workers=workers,
+            initializer=_init_validation_worker,
+            initargs=(factor_values,),
+        ),
+    )
+
+    config = {"file_path": "tmp/test.csv", "carbon_report_module_id": 99, "year": 2025}
+    provider = ConcreteCSVProvider(config, data_session=AsyncMock())
+    provider._process_batch = AsyncMock()
+    files_store = MagicMock()
+    files_store.move_file = AsyncMock(return_value="processing/test.csv")
+    files_store.get_file = AsyncMock(
+        return_value=(b"name,code\nr1,a\nr2,bad\nr3,c\nr4,d\nr5,e\n", "text/csv")
+    )
+    provider._files_store = files_store
+
+    def validate_create(payload):
+        if payload["code"] == "bad":
+            raise ValueError("bad code")
+        return SimpleNamespace(data={"name": payload["name"]})
+
+    handler = MagicMock()
+    handler.csv_parallel_validation = True
+    handler.factor_value_fields = None
+    handler.kind_field = "code"
+    handler.subkind_field = None
+    handler.validate_create.side_effect = validate_create
+    # Only row 1 (code "a") matches a factor.
+    factor = SimpleNamespace(id=5, values={})
+
+    async def mock_setup():
+        return {
+            "handlers": [handler],
+            "factors_map": {f"{DataEntryTypeEnum.student.value}:2025:a:": factor},
+            "factor_id_to_factor": {5: factor},
+            "expected_columns": {"name", "code"},
+            "required_columns": {"name"},
+        }
+
+    provider._setup_handlers_and_factors = mock_setup
+    provider._extract_kind_subkind_values = lambda row, handlers: (row["code"], None)
+    provider._resolve_handler_and_validate = AsyncMock(
+        return_value=(DataEntryTypeEnum.student, handler, None)
+    )
+
+    result = await provider.process_csv_in_batches()
+
+    (batch, *_), _ = provider._process_batch.call_args
+    assert [entry.data["name"] for entry in batch] == ["r1", "r3", "r4", "r5"]
+    assert all(entry.carbon_report_module_id == 99 for entry in batch)
+    assert result["stats"]["rows_processed"] == 4
+    assert result["stats"]["row_errors"] == [
+        {"row": 2, "reason": "Validation error: bad code"}
+    ]
+    assert result["stats"]["rows_with_factors"] == 1
+    assert result["stats"]["rows_without_factors"] == 3
+
+
 # ======================================================================
 # StatsDict Tests
 # ======================================================================
@@ -534,7 +815,8 @@ async def test_process_row_success_with_unit_mapping(monkeypatch):
     )
     handler.kind_field = "kind"
     handler.subkind_field = None
-    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s: (d, None))
+    handler.prefetch_csv = AsyncMock(return_value={})
+    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s, **_: (d, None))
 
     async def resolve_handler(*_args, **_kwargs):
         return (DataEntryTypeEnum.student, handler, None)
@@ -784,7 +1066,8 @@ async def test_process_row_extracts_kg_co2eq_out_of_band():
     provider = ConcreteCSVProvider(config, data_session=MagicMock())
 
     handler = MagicMock()
-    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s: (d, None))
+    handler.prefetch_csv = AsyncMock(return_value={})
+    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s, **_: (d, None))
     # validate_create receives the filtered_row payload — confirm kg_co2eq is
     # NOT present in what it sees, then return whatever data it likes.
     captured_validation_payload: list[dict] = []
@@ -886,7 +1169,8 @@ async def test_process_row_with_no_kg_co2eq_returns_none_override():
     )
     handler.kind_field = "category"
     handler.subkind_field = None
-    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s: (d, None))
+    handler.prefetch_csv = AsyncMock(return_value={})
+    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s, **_: (d, None))
 
     async def resolve_handler(*_args, **_kwargs):
         return (DataEntryTypeEnum.plane, handler, None)
@@ -936,7 +1220,8 @@ async def test_process_row_warns_on_unparseable_kg_co2eq(caplog):
     )
     handler.kind_field = "category"
     handler.subkind_field = None
-    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s: (d, None))
+    handler.prefetch_csv = AsyncMock(return_value={})
+    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s, **_: (d, None))
 
     async def resolve_handler(*_args, **_kwargs):
         return (DataEntryTypeEnum.plane, handler, None)
@@ -1015,7 +1300,8 @@ async def test_process_row_consumes_dumb_csv_fixture_for_plane():
     )
     handler.kind_field = "category"
     handler.subkind_field = None
-    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s: (d, None))
+    handler.prefetch_csv = AsyncMock(return_value={})
+    handler.enrich_csv_row = AsyncMock(side_effect=lambda d, s, **_: (d, None))
 
     async def resolve_handler(*_args, **_kwargs):
         return (DataEntryTypeEnum.plane, handler, None)
@@ -1492,3 +1778,105 @@ async def test_delete_all_types_when_no_data_entry_type_id():
     deleted_types = set(call_kwargs["data_entry_type_ids"])
     assert DataEntryTypeEnum.research_facilities.value in deleted_types
     assert DataEntryTypeEnum.mice_and_fish_animal_facilities.value in deleted_types
+
+
+# ======================================================================
+# Identical per-year re-upload short-circuit
+# ======================================================================
+
+
+def _make_reupload_provider(summary: tuple) -> tuple[ConcreteCSVProvider, MagicMock]:
+    """Provider for job 20 whose combo last finished with job 10 (pipeline 5,
+    3 rows inserted); the replaced scope reports ``summary``."""
+    from datetime import datetime, timezone
+
+    from app.models.data_ingestion import IngestionState
+
+    provider = _make_provider_with_job(module_type_id=4, data_entry_type_id=None)
+    provider.job.id = 20
+    settled = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    previous = SimpleNamespace(
+        id=10,
+        pipeline_id=5,
+        result=IngestionResult.SUCCESS,
+        meta={"upload_fingerprint": "abc", "inserted": 3},
+    )
+    provider._repo = MagicMock()
+    provider._repo.get_previous_finished_in_combo = AsyncMock(return_value=previous)
+    provider._repo.list_jobs_by_pipeline_id = AsyncMock(
+        return_value=[
+            SimpleNamespace(
+                state=IngestionState.FINISHED,
+                result=IngestionResult.SUCCESS,
+                finished_at=settled,
+            )
+        ]
+    )
+    entry_repo = MagicMock()
+    entry_repo.get_source_year_summary = AsyncMock(return_value=summary)
+    return provider, entry_repo
+
+
+@pytest.mark.asyncio
+async def test_identical_upload_source_requires_untouched_scope():
+    from datetime import datetime
+
+    before_settle = datetime(2026, 1, 1, 11)
+    after_settle = datetime(2026, 1, 1, 13)
+    for summary, fingerprint, expected in [
+        ((3, 3, before_settle), "abc", 10),
+        ((3, 3, before_settle), "other", None),  # content or factors changed
+        ((3, 2, before_settle), "abc", None),  # rows from another job
+        ((2, 2, before_settle), "abc", None),  # rows deleted since
+        ((3, 3, after_settle), "abc", None),  # rows edited since
+    ]:
+        provider, entry_repo = _make_reupload_provider(summary)
+        with patch.object(
+            base_csv_provider, "DataEntryRepository", return_value=entry_repo
+        ):
+            assert await provider._identical_upload_source(fingerprint) == expected
+
+    entry_repo.get_source_year_summary.assert_awaited_once()
+    kwargs = entry_repo.get_source_year_summary.call_args.kwargs
+    assert kwargs["created_by_id"] == 10
+    assert kwargs["source"] == DataEntrySourceEnum.CSV_MODULE_PER_YEAR.value
+
+
+@pytest.mark.asyncio
+async def test_process_csv_finishes_identical_upload_without_writing():
+    from app.models.data_ingestion import IngestionState
+
+    config = {"file_path": "tmp/test.csv", "job_id": 20, "year": 2026}
+    provider = ConcreteCSVProvider(config, data_session=MagicMock())
+    provider.job = SimpleNamespace(id=20, module_type_id=4, data_entry_type_id=None)
+    provider._files_store = MagicMock()
+    provider._files_store.move_file = AsyncMock(return_value=True)
+    provider._update_job = AsyncMock()
+    provider._identical_upload_source = AsyncMock(return_value=10)
+    provider._delete_existing_entries_for_module_per_year = AsyncMock()
+    provider._setup_and_validate = AsyncMock(
+        return_value={
+            "csv_content": b"a,b\n1,2\n",
+            "content_sha256": "0" * 64,
+            "processing_path": "processing/20/test.csv",
+            "filename": "test.csv",
+            "factors_map": {},
+            "handlers": [],
+        }
+    )
+
+    result = await provider.process_csv_in_batches()
+
+    assert result["unchanged"] is True
+    assert result["identical_to_job_id"] == 10
+    assert result["inserted"] == 0
+    provider._delete_existing_entries_for_module_per_year.assert_not_awaited()
+    provider._files_store.move_file.assert_awaited_once_with(
+        "processing/20/test.csv", "processed/20/test.csv"
+    )
+    first, last = provider._update_job.call_args_list[0], provider._update_job.call_args
+    assert first.kwargs["extra_metadata"]["content_sha256"] == "0" * 64
+    assert "upload_fingerprint" in first.kwargs["extra_metadata"]
+    assert last.kwargs["state"] == IngestionState.FINISHED
+    assert last.kwargs["result"] == IngestionResult.SUCCESS
+    assert last.kwargs["extra_metadata"]["identical_to_job_id"] == 10
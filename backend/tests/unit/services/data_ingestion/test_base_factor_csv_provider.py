@@ -7,6 +7,7 @@ import pytest
 
 from app.models.data_entry import DataEntryTypeEnum
 from app.models.data_ingestion import EntityType, IngestionState
+from app.repositories.factor_repo import FactorUpsertResult
 from app.services.data_ingestion import base_factor_csv_provider
 from app.services.data_ingestion.base_factor_csv_provider import BaseFactorCSVProvider
 
@@ -452,11 +453,9 @@ async def test_upsert_batch_raises_when_job_id_missing():
 
 
 @pytest.mark.asyncio
-async def test_upsert_batch_falls_back_to_batch_size_when_rowcount_negative():
-    """asyncpg returns rowcount=-1 for executemany ON CONFLICT statements
-    where it can't tally the result reliably.  ``_upsert_batch`` should
-    fall back to the input batch size so operator-visible stats don't
-    show a confusing -1."""
+async def test_upsert_batch_tallies_the_upsert_result():
+    """Written rows count as upserted and changed; rows the guarded
+    upsert left alone are only collected as unchanged."""
     provider = ConcreteFactorProvider(
         {"file_path": "tmp/test.csv", "data_entry_type_id": 1},
         data_session=MagicMock(),
@@ -464,9 +463,57 @@ async def test_upsert_batch_falls_back_to_batch_size_when_rowcount_negative():
     await provider.set_job_id(42)
 
     factor_repo = MagicMock()
-    factor_repo.upsert_factors = AsyncMock(return_value=-1)
+    factor_repo.upsert_factors = AsyncMock(
+        return_value=FactorUpsertResult(
+            inserted_ids=[1], updated_ids=[2], unchanged_ids=[3, 4]
+        )
+    )
+
+    reported = await provider._upsert_batch([MagicMock()] * 4, factor_repo)
+
+    assert reported == 2
+    assert provider._changed_factor_ids == {1, 2}
+    assert provider._unchanged_factor_ids == {3, 4}
+    assert (provider._factors_inserted, provider._factors_updated) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_stamp_reasserted_factors_skips_a_no_op_upload():
+    """Nothing changed, the whole scope repeated, nothing stale: no row is
+    stamped and the job is marked so the stale view passes over it."""
+    provider = ConcreteFactorProvider(
+        {"file_path": "tmp/test.csv", "data_entry_type_id": 1, "year": 2025},
+        data_session=MagicMock(),
+    )
+    await provider.set_job_id(42)
+    provider._unchanged_factor_ids = {3, 4}
+    factor_repo = MagicMock()
+    factor_repo.list_id_by_data_entry_type_and_year = AsyncMock(return_value=[3, 4])
+    factor_repo.list_stale_for_year = AsyncMock(return_value=[])
+    factor_repo.stamp_last_seen = AsyncMock()
+
+    meta = await provider._stamp_reasserted_factors(factor_repo)
+
+    assert meta == {"stamped_last_seen": False}
+    factor_repo.stamp_last_seen.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stamp_reasserted_factors_stamps_when_scope_moved():
+    """Once anything changed (or a stored factor was left out), the
+    unchanged rows get the job's stamp like the written ones."""
+    provider = ConcreteFactorProvider(
+        {"file_path": "tmp/test.csv", "data_entry_type_id": 1, "year": 2025},
+        data_session=MagicMock(),
+    )
+    await provider.set_job_id(42)
+    provider._unchanged_factor_ids = {4, 3}
+    factor_repo = MagicMock()
+    factor_repo.list_id_by_data_entry_type_and_year = AsyncMock(return_value=[3, 4, 5])
+    factor_repo.list_stale_for_year = AsyncMock(return_value=[])
+    factor_repo.stamp_last_seen = AsyncMock()
 
-    batch = [MagicMock(), MagicMock(), MagicMock()]
-    reported = await provider._upsert_batch(batch, factor_repo)
+    meta = await provider._stamp_reasserted_factors(factor_repo)
 
-    assert reported == 3, "negative rowcount should fall back to len(batch)"
+    assert meta == {}
+    factor_repo.stamp_last_seen.assert_awaited_once_with([3, 4], 42)
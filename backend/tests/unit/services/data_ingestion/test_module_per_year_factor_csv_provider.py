@@ -6,6 +6,7 @@ import pytest
 
 from app.models.data_entry import DataEntryTypeEnum
 from app.models.data_ingestion import IngestionState
+from app.repositories.factor_repo import FactorUpsertResult
 from app.services.data_ingestion import csv_providers as csv_providers_module
 from app.services.data_ingestion.csv_providers.factors import (
     ModulePerYearFactorCSVProvider,
@@ -103,7 +104,9 @@ async def test_finalize_and_commit_routes_batch_through_upsert(monkeypatch):
     provider._files_store.move_file = AsyncMock(return_value=True)
 
     mock_factor_repo = MagicMock()
-    mock_factor_repo.upsert_factors = AsyncMock(return_value=3)
+    mock_factor_repo.upsert_factors = AsyncMock(
+        return_value=FactorUpsertResult(inserted_ids=[1, 2, 3])
+    )
 
     batch = [
         Factor(
@@ -7,6 +7,7 @@ lookup, so the operator must supply it (the new ``stations.csv``-derived seed
 ships country codes natively).
 """
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -14,6 +15,7 @@ import pytest
 from app.modules.professional_travel.schemas import (
     ProfessionalTravelTrainModuleHandler,
 )
+from app.services.location_service import LocationIndex
 
 
 class _ForbiddenSession:
@@ -98,3 +100,50 @@ async def test_train_enrich_normalizes_country_code_case_for_lookup(
     assert err is None
     assert captured["Berne"] == "DE"
     assert captured["Geneva"] == "CH"
+
+
+@pytest.mark.asyncio
+async def test_train_enrich_resolves_from_prefetched_index() -> None:
+    """With the ``prefetch_csv`` index the resolver never reaches the
+    session, and 0 / 1 / many matches behave like the per-row lookup."""
+
+    def _station(name: str, country_code: str, key: str) -> SimpleNamespace:
+        return SimpleNamespace(name=name, country_code=country_code, natural_key=key)
+
+    stations = LocationIndex(
+        [
+            _station(" Bern ", "CH", "train:ch:bern"),
+            _station("Berne", "DE", "train:de:berne"),
+            _station("Paris", "FR", "train:fr:paris-1"),
+            _station("paris", "FR", "train:fr:paris-2"),
+        ]
+    )
+    handler = ProfessionalTravelTrainModuleHandler()
+    csv_cache = {"stations": stations}
+
+    enriched, err = await handler.enrich_csv_row(
+        {
+            "origin_name": "BERN",
+            "origin_country_code": "ch",
+            "destination_name": "Nowhere",
+            "destination_country_code": "CH",
+        },
+        _ForbiddenSession(),
+        csv_cache=csv_cache,
+    )
+    assert err is None
+    assert enriched["origin_natural_key"] == "train:ch:bern"
+    assert "destination_natural_key" not in enriched
+
+    _, err = await handler.enrich_csv_row(
+        {
+            "origin_name": "Paris",
+            "origin_country_code": "FR",
+            "destination_name": "Bern",
+            "destination_country_code": "CH",
+        },
+        _ForbiddenSession(),
+        csv_cache=csv_cache,
+    )
+    assert err is not None
+    assert "ambiguous: 2 matches in FR" in err
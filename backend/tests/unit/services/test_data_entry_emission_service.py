@@ -1,17 +1,26 @@
 """Unit tests for DataEntryEmissionService."""
 
+from contextlib import nullcontext
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.models.calculation_input import calculation_input_id
 from app.models.data_entry import DataEntryTypeEnum
 from app.models.data_entry_emission import (
     DataEntryEmission,
     EmissionComputation,
     EmissionType,
 )
+from app.repositories.data_entry_emission_repo import DataEntryEmissionRepository
 from app.schemas.data_entry import DataEntryResponse
-from app.services.data_entry_emission_service import DataEntryEmissionService
+from app.services.data_entry_emission_service import (
+    DataEntryEmissionService,
+    EmissionPlan,
+    _FactorTerm,
+    _inputs_fingerprint,
+    evaluate_emission_plans,
+)
 from app.utils.data_entry_emission_type_map import (
     DATA_ENTRY_TYPE_TO_ROLLUP_EMISSION,
     ROLLUP_EMISSION_TYPE_IDS,
@@ -29,6 +38,11 @@ def _make_service() -> DataEntryEmissionService:
     service.repo = MagicMock()
     service.repo.delete_by_data_entry_id = AsyncMock()
     service.repo.bulk_create = AsyncMock()
+    service.inputs_repo = MagicMock()
+    service.inputs_repo.store_many = AsyncMock()
+    # The module totals delta is the repository's to test.
+    service.totals_repo = MagicMock()
+    service.totals_repo.tracking_entries = MagicMock(return_value=nullcontext())
     return service
 
 
@@ -109,6 +123,7 @@ async def test_upsert_deletes_then_creates_emissions():
         await service.upsert_by_data_entry(data_entry)
 
     assert call_order == ["delete", "create"]
+    service.totals_repo.tracking_entries.assert_called_once_with([data_entry.id])
 
 
 @pytest.mark.asyncio
@@ -251,7 +266,10 @@ class TestMetaExtras:
     def _make_service(self) -> DataEntryEmissionService:
         session = MagicMock()
         session.flush = AsyncMock()
-        return DataEntryEmissionService(session)
+        service = DataEntryEmissionService(session)
+        service.inputs_repo = MagicMock()
+        service.inputs_repo.store_many = AsyncMock()
+        return service
 
     def _make_factor(self, emission_type_value: int, factor_values: dict):
         from app.models.factor import Factor
@@ -433,10 +451,15 @@ class TestMetaExtras:
 
         assert len(results) == 1
         meta = results[0].meta
-        # Travel inputs may include distance_km in ctx (thus present in meta),
-        # but the emission row persists it in additional_value (source of truth).
-        assert meta.get("distance_km") == pytest.approx(1000.0)
+        # Travel inputs include distance_km in ctx (stored once in
+        # calculation_inputs, referenced by inputs_id), but the emission row
+        # persists it in additional_value (source of truth).
+        assert "distance_km" not in meta
         assert "weight_kg" not in meta
+        (stored,) = service.inputs_repo.store_many.await_args.args
+        kind, ctx = stored[results[0].inputs_id]
+        assert kind == "context"
+        assert ctx.get("distance_km") == pytest.approx(1000.0)
         assert results[0].additional_value == pytest.approx(1000.0)
 
 
@@ -594,6 +617,230 @@ class TestPrepareCreate:
         assert result == []
 
 
+# ---------------------------------------------------------------------------
+# evaluate_emission_plans — batched formula pass
+# ---------------------------------------------------------------------------
+
+
+def _factor(factor_id: int, values: dict, emission_type: EmissionType) -> MagicMock:
+    factor = MagicMock()
+    factor.id = factor_id
+    factor.values = values
+    factor.emission_type_id = emission_type.value
+    return factor
+
+
+def _plan(entry_id: int, terms: list, rollup_type=None) -> EmissionPlan:
+    """Plan with one pending slot per (comp, factor, ctx) term."""
+    plan = EmissionPlan(data_entry_id=entry_id, rollup_type=rollup_type)
+    for comp, factor, ctx in terms:
+        plan.terms.append(
+            _FactorTerm(
+                slot=len(plan.rows),
+                comp=comp,
+                factor=factor,
+                ctx=ctx,
+                emission_type=comp.emission_type,
+            )
+        )
+        plan.rows.append(None)
+    return plan
+
+
+class TestEvaluateEmissionPlans:
+    def _comp(self, **kwargs) -> EmissionComputation:
+        return EmissionComputation(
+            emission_type=EmissionType.food,
+            quantity_key="kg",
+            formula_key="ef",
+            **kwargs,
+        )
+
+    def test_key_based_rows_match_scalar_formula(self):
+        comp = self._comp(multiplier_key="rfi", multiplier_default=2.0)
+        with_mult = _factor(1, {"ef": 0.5, "rfi": 3.0, "unit": "kg"}, EmissionType.food)
+        without_mult = _factor(2, {"ef": 0.25}, EmissionType.food)
+        plans = [
+            _plan(10, [(comp, with_mult, {"kg": 4.0})]),
+            _plan(11, [(comp, without_mult, {"kg": 8.0})]),
+        ]
+
+        batch = evaluate_emission_plans(plans)
+
+        assert batch.failed == {}
+        assert batch.data_entry_ids == [10, 11]
+        expected = [
+            DataEntryEmissionService._apply_formula(
+                {"kg": 4.0}, with_mult.values, comp
+            ),
+            DataEntryEmissionService._apply_formula(
+                {"kg": 8.0}, without_mult.values, comp
+            ),
+        ]
+        assert [row[3] for row in batch.rows] == expected == [6.0, 4.0]
+        first = DataEntryEmissionRepository.from_copy_row(batch.rows[0])
+        assert first.data_entry_id == 10
+        assert first.primary_factor_id == 1
+        assert first.emission_type_id == EmissionType.food.value
+        assert first.scope == EmissionType.food.scope
+        # food carries a kg additional value: quantity × multiplier.
+        assert first.additional_value == 12.0
+        assert first.meta["quantity"] == 12.0
+        assert first.meta["quantity_unit"] == "kg"
+        values_id = calculation_input_id(with_mult.values)
+        assert first.meta["factors_used"] == [{"id": 1, "values_id": values_id}]
+        assert "kg" not in first.meta
+        assert first.inputs_id == calculation_input_id({"kg": 4.0})
+        assert batch.inputs[values_id] == ("factor_values", with_mult.values)
+        assert batch.inputs[first.inputs_id] == ("context", {"kg": 4.0})
+
+    def test_shared_inputs_are_stored_once(self):
+        comp = self._comp()
+        factor = _factor(1, {"ef": 2.0}, EmissionType.food)
+        ctx = {"kg": 1.0}
+        waste = EmissionComputation(
+            emission_type=EmissionType.waste, quantity_key="kg", formula_key="ef"
+        )
+        plans = [
+            _plan(10, [(comp, factor, ctx), (waste, factor, ctx)]),
+            _plan(11, [(comp, factor, {"kg": 2.0})]),
+        ]
+
+        batch = evaluate_emission_plans(plans)
+
+        assert len(batch.rows) == 3
+        # One snapshot for the factor, one context per entry.
+        assert sorted(kind for kind, _ in batch.inputs.values()) == [
+            "context",
+            "context",
+            "factor_values",
+        ]
+        first, second, third = (
+            DataEntryEmissionRepository.from_copy_row(row) for row in batch.rows
+        )
+        assert first.inputs_id == second.inputs_id != third.inputs_id
+        assert (
+            first.meta["factors_used"]
+            == second.meta["factors_used"]
+            == third.meta["factors_used"]
+        )
+
+    def test_missing_value_drops_only_that_row(self):
+        comp = self._comp()
+        plans = [
+            _plan(
+                10,
+                [
+                    (comp, _factor(1, {"ef": 2.0}, EmissionType.food), {"kg": 1.0}),
+                    (comp, _factor(2, {}, EmissionType.food), {"kg": 1.0}),
+                ],
+            )
+        ]
+
+        batch = evaluate_emission_plans(plans)
+
+        assert batch.data_entry_ids == [10]
+        assert [row[2] for row in batch.rows] == [1]
+
+    def test_non_numeric_value_fails_only_its_entry(self):
+        comp = self._comp()
+        plans = [
+            _plan(10, [(comp, _factor(1, {"ef": 2.0}, EmissionType.food), {"kg": 1})]),
+            _plan(
+                11, [(comp, _factor(2, {"ef": "n/a"}, EmissionType.food), {"kg": 1})]
+            ),
+        ]
+
+        batch = evaluate_emission_plans(plans)
+
+        assert batch.data_entry_ids == [10]
+        assert list(batch.failed) == [11]
+        assert isinstance(batch.failed[11], ValueError)
+        assert [row[0] for row in batch.rows] == [10]
+
+    def test_formula_func_uses_scalar_path(self):
+        comp = EmissionComputation(
+            emission_type=EmissionType.food,
+            formula_func=lambda ctx, fv: ctx["n"] * fv["ef"] + 1,
+        )
+        plans = [
+            _plan(10, [(comp, _factor(1, {"ef": 2.0}, EmissionType.food), {"n": 3})])
+        ]
+
+        batch = evaluate_emission_plans(plans)
+
+        assert [row[3] for row in batch.rows] == [7.0]
+
+    def test_rollup_appended_after_evaluation(self):
+        rollup = DATA_ENTRY_TYPE_TO_ROLLUP_EMISSION[DataEntryTypeEnum.building]
+        comp = EmissionComputation(
+            emission_type=EmissionType.buildings__rooms__lighting,
+            quantity_key="kwh",
+            formula_key="ef",
+        )
+        lighting = EmissionType.buildings__rooms__lighting
+        plans = [
+            _plan(
+                10,
+                [
+                    (comp, _factor(9, {"ef": 1.0}, lighting), {"kwh": 2.0}),
+                    (comp, _factor(7, {"ef": 3.0}, lighting), {"kwh": 2.0}),
+                ],
+                rollup_type=rollup,
+            )
+        ]
+
+        batch = evaluate_emission_plans(plans)
+
+        assert len(batch.rows) == 3
+        rollup_row = DataEntryEmissionRepository.from_copy_row(batch.rows[-1])
+        assert rollup_row.emission_type_id == rollup.value
+        assert rollup_row.kg_co2eq == 8.0
+        assert rollup_row.primary_factor_id == 7
+        assert rollup_row.scope is None
+        assert rollup_row.meta == {"is_rollup": True}
+
+    def test_rows_carry_plan_fingerprint(self):
+        comp = self._comp()
+        factor = _factor(1, {"ef": 2.0}, EmissionType.food)
+        plan = _plan(10, [(comp, factor, {"kg": 1.0})])
+        plan.fingerprint = "f" * 32
+
+        batch = evaluate_emission_plans([plan])
+
+        row = DataEntryEmissionRepository.from_copy_row(batch.rows[0])
+        assert row.inputs_fingerprint == "f" * 32
+
+
+class TestInputsFingerprint:
+    def _fingerprint(self, values: dict, ctx: dict, year: int | None = 2025) -> str:
+        comp = EmissionComputation(
+            emission_type=EmissionType.food, quantity_key="kg", formula_key="ef"
+        )
+        plan = _plan(10, [(comp, _factor(1, values, EmissionType.food), ctx)])
+        return _inputs_fingerprint(plan, ctx, year)
+
+    def test_stable_for_identical_inputs(self):
+        first = self._fingerprint({"ef": 2.0}, {"kg": 1.0, "_year": 2025})
+        second = self._fingerprint({"ef": 2.0}, {"_year": 2025, "kg": 1.0})
+        assert first == second
+        assert len(first) == 32
+
+    def test_changes_with_any_input(self):
+        base = self._fingerprint({"ef": 2.0}, {"kg": 1.0})
+        assert self._fingerprint({"ef": 2.5}, {"kg": 1.0}) != base
+        assert self._fingerprint({"ef": 2.0}, {"kg": 3.0}) != base
+        assert self._fingerprint({"ef": 2.0}, {"kg": 1.0}, year=2024) != base
+
+    def test_formula_version_is_part_of_the_digest(self):
+        base = self._fingerprint({"ef": 2.0}, {"kg": 1.0})
+        with patch(
+            "app.services.data_entry_emission_service.settings"
+        ) as mock_settings:
+            mock_settings.FORMULA_VERSION_SHA256_SHORT = "deadbeef"
+            assert self._fingerprint({"ef": 2.0}, {"kg": 1.0}) != base
+
+
 # ---------------------------------------------------------------------------
 # _get_year_from_data_entry
 # ---------------------------------------------------------------------------
@@ -1483,6 +1730,9 @@ class TestPrepareCreateRollup:
         assert rollup.kg_co2eq == pytest.approx(sum(r.kg_co2eq for r in leaf_rows)), (
             "Rollup kg_co2eq must equal the sum of all leaf rows"
         )
+        # One inputs fingerprint stamped across the entry's whole set.
+        fingerprints = {r.inputs_fingerprint for r in results}
+        assert len(fingerprints) == 1 and None not in fingerprints
 
     @pytest.mark.asyncio
     async def test_non_building_gets_no_rollup_row(self):
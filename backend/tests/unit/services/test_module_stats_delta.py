@@ -0,0 +1,196 @@
+"""Unit tests for delta-maintained module stats (``apply_module_stats_delta``)."""
+
+import pytest
+from sqlmodel import col, delete
+
+from app.models.data_entry_emission import DataEntryEmission, EmissionType
+from app.models.module_type import MODULE_TYPE_TO_EMISSION_ROOTS, ModuleTypeEnum
+from app.services.carbon_report_module_service import (
+    CarbonReportModuleService,
+    apply_module_stats_delta,
+    compute_module_stats,
+)
+
+_BUILDINGS = MODULE_TYPE_TO_EMISSION_ROOTS[ModuleTypeEnum.buildings]
+_HEADCOUNT = MODULE_TYPE_TO_EMISSION_ROOTS[ModuleTypeEnum.headcount]
+
+
+def _stats(rows: dict[EmissionType, float], roots, entry_count: int) -> dict:
+    return compute_module_stats(
+        leaf_emissions={str(et.value): kg for et, kg in rows.items()},
+        additional_values={},
+        emission_roots=roots,
+        entry_count=entry_count,
+    )
+
+
+def _without_timestamp(stats: dict) -> dict:
+    return {k: v for k, v in stats.items() if k != "computed_at"}
+
+
+def _flat(stats: dict) -> dict:
+    """Stats as one level of ``key`` / ``key.emission_type`` entries, since
+    ``pytest.approx`` does not compare nested dicts."""
+    flat = {}
+    for key, value in _without_timestamp(stats).items():
+        if isinstance(value, dict):
+            flat.update({f"{key}.{k}": v for k, v in value.items()})
+        else:
+            flat[key] = value
+    return flat
+
+
+@pytest.mark.parametrize(
+    ("before", "after", "delta", "entry_count_delta"),
+    [
+        # Edit: one leaf changes, a sibling stays.
+        (
+            {EmissionType.food__vegetarian: 10.0, EmissionType.waste__composting: 2.0},
+            {EmissionType.food__vegetarian: 4.0, EmissionType.waste__composting: 2.0},
+            {EmissionType.food__vegetarian: -6.0},
+            0,
+        ),
+        # Create: a new leaf under a new branch.
+        (
+            {EmissionType.food__vegetarian: 10.0},
+            {
+                EmissionType.food__vegetarian: 10.0,
+                EmissionType.waste__recycling__paper: 1.5,
+            },
+            {EmissionType.waste__recycling__paper: 1.5},
+            1,
+        ),
+        # Delete: a leaf goes, a sibling under the same parent stays.
+        (
+            {
+                EmissionType.waste__recycling__paper: 1.5,
+                EmissionType.waste__recycling__cardboard: 2.0,
+            },
+            {EmissionType.waste__recycling__cardboard: 2.0},
+            {EmissionType.waste__recycling__paper: -1.5},
+            -1,
+        ),
+    ],
+)
+def test_delta_matches_full_recompute(before, after, delta, entry_count_delta):
+    patched = apply_module_stats_delta(
+        _stats(before, _HEADCOUNT, entry_count=3),
+        {et.value: change for et, change in delta.items()},
+        {},
+        _HEADCOUNT,
+        entry_count_delta,
+    )
+
+    assert patched is not None
+    expected = _stats(after, _HEADCOUNT, entry_count=3 + entry_count_delta)
+    assert _flat(patched) == pytest.approx(_flat(expected))
+
+
+def test_delta_ignores_types_outside_module():
+    stats = _stats({EmissionType.food__vegetarian: 10.0}, _HEADCOUNT, entry_count=1)
+
+    patched = apply_module_stats_delta(
+        stats, {EmissionType.equipment.value: 5.0}, {}, _HEADCOUNT
+    )
+
+    assert patched is not None
+    assert _without_timestamp(patched) == _without_timestamp(stats)
+
+
+def test_delta_falls_back_when_rollup_drops_to_zero():
+    """A subtree emptied by the edit may still show the node's own rows
+    (e.g. a rollup-row type), which the stored stats cannot tell."""
+    leaf = EmissionType.waste__recycling__paper
+    stats = _stats({leaf: 1.5}, _HEADCOUNT, entry_count=1)
+
+    assert apply_module_stats_delta(stats, {leaf.value: -1.5}, {}, _HEADCOUNT) is None
+
+
+def test_delta_falls_back_without_stored_stats():
+    assert (
+        apply_module_stats_delta(
+            None, {EmissionType.food__vegetarian.value: 1.0}, {}, _HEADCOUNT
+        )
+        is None
+    )
+
+
+def test_delta_falls_back_on_scoped_non_leaf():
+    stats = _stats({EmissionType.food__vegetarian: 10.0}, _HEADCOUNT, entry_count=1)
+
+    assert (
+        apply_module_stats_delta(stats, {EmissionType.food.value: 1.0}, {}, _HEADCOUNT)
+        is None
+    )
+
+
+def test_delta_leaves_hidden_rollup_rows_alone():
+    """Buildings entries also write a ``buildings__rooms`` rollup row; while
+    the room leaves sum to non-zero the stored value is their rollup, so
+    the rollup row's own delta does not show."""
+    lighting = EmissionType.buildings__rooms__lighting__office
+    stats = _stats({lighting: 8.0}, _BUILDINGS, entry_count=1)
+
+    patched = apply_module_stats_delta(
+        stats,
+        {lighting.value: 2.0, EmissionType.buildings__rooms.value: 2.0},
+        {},
+        _BUILDINGS,
+    )
+
+    assert patched is not None
+    expected = _stats({lighting: 10.0}, _BUILDINGS, entry_count=1)
+    assert _without_timestamp(patched) == _without_timestamp(expected)
+
+
+@pytest.mark.asyncio
+async def test_entry_of_another_module_is_not_patched_in(
+    db_session,
+    make_unit,
+    make_carbon_report,
+    make_carbon_report_module,
+    make_data_entry,
+    make_data_entry_emission,
+):
+    """An edit addressed to module A for an entry of module B recomputes A
+    instead of moving B's emissions through A's stored stats."""
+    vegetarian = EmissionType.food__vegetarian.value
+    modules = []
+    for kg_co2eq in (10.0, 4.0):
+        unit = await make_unit(db_session)
+        report = await make_carbon_report(db_session, unit_id=unit.id)
+        module = await make_carbon_report_module(
+            db_session,
+            carbon_report_id=report.id,
+            module_type_id=ModuleTypeEnum.headcount.value,
+        )
+        entry = await make_data_entry(db_session, carbon_report_module_id=module.id)
+        await make_data_entry_emission(
+            db_session,
+            data_entry_id=entry.id,
+            emission_type_id=vegetarian,
+            kg_co2eq=kg_co2eq,
+        )
+        modules.append((module, entry))
+    (module_a, entry_a), (_module_b, entry_b) = modules
+    service = CarbonReportModuleService(db_session)
+    await service.recompute_stats_many([m.id for m, _ in modules])
+    expected = _without_timestamp(module_a.stats)
+
+    assert await service.snapshot_entry_emissions(module_a.id, entry_a.id)
+    before = await service.snapshot_entry_emissions(module_a.id, entry_b.id)
+    assert before is None
+
+    # Edit module B's entry through module A.
+    await db_session.exec(
+        delete(DataEntryEmission).where(
+            col(DataEntryEmission.data_entry_id) == entry_b.id
+        )
+    )
+    await make_data_entry_emission(
+        db_session, data_entry_id=entry_b.id, emission_type_id=vegetarian, kg_co2eq=7.0
+    )
+    await service.apply_entry_stats_delta(module_a.id, entry_b.id, before)
+
+    await db_session.refresh(module_a)
+    assert _without_timestamp(module_a.stats) == expected
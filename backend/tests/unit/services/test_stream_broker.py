@@ -0,0 +1,122 @@
+"""Per-pod SSE fan-out (``app.services.stream_broker``).
+
+The contract the job/pipeline stream endpoints rely on: one poll per
+watched key however many subscribers, nothing published while the
+fingerprint holds, a closing update once the stream is done, and the
+poll stopped as soon as the last subscriber leaves.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.stream_broker import StreamBroker, StreamState
+
+
+class _Source:
+    """Scripted ``fetch``: returns each state in turn, then repeats the last."""
+
+    def __init__(self, *states):
+        self.states = list(states)
+        self.calls = 0
+
+    async def fetch(self):
+        state = self.states[min(self.calls, len(self.states) - 1)]
+        self.calls += 1
+        return state
+
+
+async def _connected() -> bool:
+    return False
+
+
+async def _collect(broker, key, source, **kwargs):
+    return [u async for u in broker.watch(key, source.fetch, _connected, **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_subscribers_share_one_poll():
+    broker = StreamBroker(poll_interval=0.01)
+    source = _Source(
+        StreamState({"n": 1}),
+        StreamState({"n": 2}),
+        StreamState({"n": 2}, done=True),
+    )
+
+    first, second = await asyncio.gather(
+        _collect(broker, ("job", 1), source),
+        _collect(broker, ("job", 1), source),
+    )
+
+    assert first == second
+    assert [u.payload for u in first] == [{"n": 1}, {"n": 2}, {"n": 2}]
+    assert first[-1].closed is True
+    # Two done polls close the topic: four reads total, not eight.
+    assert source.calls == 4
+    assert broker.topic_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_unchanged_fingerprint_publishes_nothing():
+    broker = StreamBroker(poll_interval=0.01)
+    source = _Source(
+        StreamState({"jobs": [], "progress": 0}, fingerprint=[]),
+        StreamState({"jobs": [], "progress": 1}, fingerprint=[]),
+        StreamState({"jobs": [], "progress": 2}, done=True, fingerprint=[]),
+    )
+
+    updates = await _collect(broker, ("pipeline", "p"), source)
+
+    # One snapshot, then the closing re-send of the same version with the
+    # freshest payload.
+    assert [(u.version, u.closed) for u in updates] == [(1, False), (1, True)]
+    assert updates[-1].payload["progress"] == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_key_closes_with_empty_payload():
+    broker = StreamBroker(poll_interval=0.01)
+
+    async def gone():
+        return None
+
+    updates = [u async for u in broker.watch(("job", 9), gone, _connected)]
+
+    assert len(updates) == 1
+    assert updates[0].payload is None and updates[0].closed is True
+
+
+@pytest.mark.asyncio
+async def test_last_subscriber_leaving_stops_the_poll():
+    broker = StreamBroker(poll_interval=0.01)
+    source = _Source(StreamState({"n": 1}))
+    disconnected = False
+
+    async def is_disconnected():
+        return disconnected
+
+    stream = broker.watch(("job", 1), source.fetch, is_disconnected)
+    assert (await anext(stream)).payload == {"n": 1}
+    assert broker.topic_count() == 1
+
+    disconnected = True
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+
+    assert broker.topic_count() == 0
+    calls = source.calls
+    await asyncio.sleep(0.05)
+    assert source.calls == calls
+
+
+@pytest.mark.asyncio
+async def test_idle_timeout_yields_keep_alive():
+    broker = StreamBroker(poll_interval=0.01)
+    source = _Source(StreamState({"n": 1}))
+
+    stream = broker.watch(("job", 1), source.fetch, _connected, idle_timeout=0.02)
+    assert (await anext(stream)).version == 1
+    assert await anext(stream) is None
+    await stream.aclose()
+
+    assert broker.topic_count() == 0
@@ -16,7 +16,11 @@ import gc
 
 import pytest
 
-from app.tasks._background import _BACKGROUND_TASKS, fire_and_forget
+from app.tasks._background import (
+    _BACKGROUND_TASKS,
+    cancel_background_tasks,
+    fire_and_forget,
+)
 
 
 @pytest.mark.asyncio
@@ -70,6 +74,28 @@ async def test_fire_and_forget_removes_from_set_when_done():
     assert len(_BACKGROUND_TASKS) == started_size
 
 
+@pytest.mark.asyncio
+async def test_cancel_background_tasks_waits_for_cleanup():
+    """A stopping worker cancels what outlived the grace period; the
+    tasks' own cleanup (a cut-off job's release) has run on return."""
+    cleaned_up = []
+
+    async def _work():
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await asyncio.sleep(0)
+            cleaned_up.append(True)
+
+    task = fire_and_forget(_work(), name="cut-off")
+    await asyncio.sleep(0)
+
+    await cancel_background_tasks()
+
+    assert task.cancelled()
+    assert cleaned_up == [True]
+
+
 @pytest.mark.asyncio
 async def test_fire_and_forget_logs_unhandled_exception(caplog):
     """When the coroutine raises, the done-callback logs the error so it
@@ -28,6 +28,7 @@ from app.models.data_ingestion import (
     EntityType,
     IngestionMethod,
     IngestionState,
+    JobPriority,
     TargetType,
 )
 from app.tasks import _chain as chain_mod
@@ -40,6 +41,7 @@ def _make_parent(job_id: int = 100) -> MagicMock:
     job.module_type_id = 11
     job.year = 2025
     job.pipeline_id = None
+    job.priority = JobPriority.INTERACTIVE
     return job
 
 
@@ -109,6 +111,8 @@ async def test_chain_job_inherits_pipeline_id_and_fires_run_job():
     assert created.target_type == TargetType.DATA_ENTRIES
     assert created.ingestion_method == IngestionMethod.computed
     assert created.entity_type == EntityType.MODULE_PER_YEAR
+    # Dispatch priority inherited; create_ingestion_job applies the floor.
+    assert created.priority == parent.priority
 
     assert fired == [f"run_job-{child_id}"]
 
@@ -19,6 +19,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.core.config import get_settings
 from app.models.data_entry import DataEntryTypeEnum
 from app.models.data_ingestion import IngestionResult
 from app.tasks import emission_recalculation_tasks as recalc_mod
@@ -90,6 +91,7 @@ async def test_emission_recalc_handler_calls_workflow_and_returns_meta():
 
     repo = MagicMock()
     repo.update_ingestion_job = AsyncMock()
+    repo.get_job_by_id = AsyncMock(return_value=job)
 
     workflow = MagicMock()
     workflow.recalculate_for_data_entry_type = AsyncMock(
@@ -116,11 +118,59 @@ async def test_emission_recalc_handler_calls_workflow_and_returns_meta():
     # The handler wires a progress callback so the job row (and SSE)
     # tracks long recalcs.
     assert callable(await_args.kwargs.get("progress_callback"))
+    # Worker count comes from settings; the workflow decides per slice
+    # size whether to shard.
+    assert (
+        await_args.kwargs.get("parallel_workers")
+        == get_settings().EMISSION_RECALC_WORKERS
+    )
     assert meta["status_message"] == "Emission recalculation completed"
     assert meta["result"] == IngestionResult.SUCCESS
     assert meta["recalculation"]["recalculated"] == 7
 
 
+@pytest.mark.asyncio
+async def test_emission_recalc_handler_rereads_scope_after_lock():
+    """A job chained unscoped may have been widened by a deduped ingest
+    while it waited: the scope is always re-read from the row."""
+    job = _make_job(meta={"config": {}})
+    widened = _make_job(
+        meta={
+            "config": {
+                "carbon_report_module_ids": [40, 41],
+                "changed_entry_ids": [3, 9],
+                "changed_module_ids": [42],
+            }
+        }
+    )
+    job_session = MagicMock()
+    job_session.commit = AsyncMock()
+
+    repo = MagicMock()
+    repo.update_ingestion_job = AsyncMock()
+    repo.get_job_by_id = AsyncMock(return_value=widened)
+
+    workflow = MagicMock()
+    workflow.recalculate_for_data_entry_type = AsyncMock(
+        return_value={"recalculated": 2, "errors": 0, "affected_module_ids": [40]}
+    )
+
+    with (
+        patch.object(recalc_mod, "DataIngestionRepository", return_value=repo),
+        patch.object(
+            recalc_mod, "EmissionRecalculationWorkflow", return_value=workflow
+        ),
+        patch.object(recalc_mod, "chain_job", new_callable=AsyncMock),
+    ):
+        meta = await recalc_mod.emission_recalc_handler(job, job_session, MagicMock())
+
+    kwargs = workflow.recalculate_for_data_entry_type.await_args.kwargs
+    assert kwargs["carbon_report_module_ids"] == [40, 41]
+    assert kwargs["data_entry_ids"] == [3, 9]
+    assert kwargs["changed_factor_ids"] is None
+    assert meta["recalculation"]["affected_module_ids"] == [40, 42]
+
+
 @pytest.mark.asyncio
 async def test_emission_recalc_handler_chains_aggregation_with_dedup_on_success():
     """Plan 310-D — the handler no longer calls ``recompute_stats``
@@ -134,6 +184,7 @@ async def test_emission_recalc_handler_chains_aggregation_with_dedup_on_success(
 
     repo = MagicMock()
     repo.update_ingestion_job = AsyncMock()
+    repo.get_job_by_id = AsyncMock(return_value=job)
 
     workflow = MagicMock()
     workflow.recalculate_for_data_entry_type = AsyncMock(
@@ -193,6 +244,7 @@ async def test_emission_recalc_handler_chains_aggregation_on_warning():
 
     repo = MagicMock()
     repo.update_ingestion_job = AsyncMock()
+    repo.get_job_by_id = AsyncMock(return_value=job)
 
     workflow = MagicMock()
     workflow.recalculate_for_data_entry_type = AsyncMock(
@@ -235,6 +287,7 @@ async def test_emission_recalc_handler_warning_when_errors_present():
 
     repo = MagicMock()
     repo.update_ingestion_job = AsyncMock()
+    repo.get_job_by_id = AsyncMock(return_value=job)
 
     workflow = MagicMock()
     workflow.recalculate_for_data_entry_type = AsyncMock(
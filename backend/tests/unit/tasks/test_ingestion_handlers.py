@@ -356,6 +356,99 @@ async def test_factor_ingest_handler_chains_recalc_for_single_type():
     assert meta["upsert_count"] == 3
 
 
+@pytest.mark.asyncio
+async def test_factor_ingest_handler_targets_recalc_at_changed_factors():
+    """The provider's ``changed_factor_ids`` become the child's
+    ``config.changed_factor_ids``; on a dedup hit the already-active
+    recalc is widened to cover them instead."""
+    job = _make_job(
+        module_type_id=5,
+        data_entry_type_id=11,
+        year=2025,
+        meta={"provider_name": "FakeFactor"},
+    )
+
+    fake_provider = MagicMock()
+    fake_provider.set_job_id = AsyncMock()
+    fake_provider.ingest = AsyncMock(
+        return_value={
+            "status_message": "Factors upserted",
+            "data": {
+                "result": IngestionResult.SUCCESS,
+                "changed_factor_ids": [4, 2],
+            },
+        }
+    )
+
+    class FakeProviderClass:
+        def __new__(cls, *args, **kwargs):
+            return fake_provider
+
+    repo = MagicMock()
+    repo.widen_active_recalc_targeting = AsyncMock(return_value=1)
+    job_session = MagicMock()
+    job_session.commit = AsyncMock()
+
+    with (
+        patch.object(
+            ingest_mod.ProviderFactory,
+            "get_provider_class",
+            return_value=FakeProviderClass,
+        ),
+        patch.object(ingest_mod, "DataIngestionRepository", return_value=repo),
+        patch.object(
+            ingest_mod, "chain_job", new_callable=AsyncMock, return_value=None
+        ) as mock_chain,
+    ):
+        await ingest_mod.factor_ingest_handler(job, job_session, MagicMock())
+
+    assert mock_chain.await_args.kwargs["config"] == {"changed_factor_ids": [4, 2]}
+    repo.widen_active_recalc_targeting.assert_awaited_once_with(
+        module_type_id=5,
+        data_entry_type_id=11,
+        year=2025,
+        changed_factor_ids=[4, 2],
+    )
+
+
+@pytest.mark.asyncio
+async def test_factor_ingest_handler_skips_recalc_when_no_factor_changed():
+    """A re-import without edits reports ``changed_factor_ids=[]``:
+    no emission can move, so nothing is chained."""
+    job = _make_job(
+        module_type_id=5,
+        data_entry_type_id=11,
+        year=2025,
+        meta={"provider_name": "FakeFactor"},
+    )
+
+    fake_provider = MagicMock()
+    fake_provider.set_job_id = AsyncMock()
+    fake_provider.ingest = AsyncMock(
+        return_value={
+            "status_message": "Factors upserted",
+            "data": {"result": IngestionResult.SUCCESS, "changed_factor_ids": []},
+        }
+    )
+
+    class FakeProviderClass:
+        def __new__(cls, *args, **kwargs):
+            return fake_provider
+
+    with (
+        patch.object(
+            ingest_mod.ProviderFactory,
+            "get_provider_class",
+            return_value=FakeProviderClass,
+        ),
+        patch.object(ingest_mod, "chain_job", new_callable=AsyncMock) as mock_chain,
+    ):
+        meta = await ingest_mod.factor_ingest_handler(job, MagicMock(), MagicMock())
+
+    mock_chain.assert_not_awaited()
+    assert meta["changed_factor_ids"] == []
+
+
 @pytest.mark.asyncio
 async def test_factor_ingest_handler_chains_per_det_for_multitype_upload():
     """Parent has module set, det=NULL → expand via
@@ -856,6 +949,8 @@ async def test_csv_ingest_fan_out_counts_only_owned_children():
     # First det: created (returns an id). Remaining dets: dedup-skipped
     # (return None) — already owned by an earlier active pipeline.
     returns = [42] + [None] * (len(expected_dets) - 1)
+    repo = MagicMock()
+    repo.widen_active_recalc_targeting = AsyncMock(return_value=0)
 
     with (
         patch.object(
@@ -867,10 +962,21 @@ async def test_csv_ingest_fan_out_counts_only_owned_children():
             new_callable=AsyncMock,
             side_effect=returns,
         ) as mock_chain,
+        patch.object(ingest_mod, "DataIngestionRepository", return_value=repo),
     ):
         meta = await ingest_mod.csv_ingest_handler(job, MagicMock(), MagicMock())
 
-    # All dets attempted, but only the one owned child counts.
+    # All dets attempted, but only the one owned child counts; the
+    # deduped ones fold this (whole-slice) ingest into the active recalc.
     assert mock_chain.await_count == len(expected_dets)
+    assert repo.widen_active_recalc_targeting.await_count == len(expected_dets) - 1
+    assert repo.widen_active_recalc_targeting.await_args.kwargs == {
+        "module_type_id": module.value,
+        "data_entry_type_id": expected_dets[-1],
+        "year": 2025,
+        "changed_entry_ids": None,
+        "changed_module_ids": None,
+        "carbon_report_module_ids": None,
+    }
     assert "recalc_jobs_chained" not in meta  # Phase 5B retired
     assert meta["result"] == IngestionResult.SUCCESS
@@ -0,0 +1,97 @@
+"""Job ``LISTEN``/``NOTIFY`` wake-up for the dispatch sweep.
+
+Covers the pieces that don't need a live Postgres:
+
+- A notification wakes ``wait_for_job_notify``; bursts coalesce.
+- The poller slows its timed sweep only while the listener is connected.
+- ``notify_jobs_ready`` queues one ``pg_notify`` on Postgres and is a
+  no-op elsewhere.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.repositories.data_ingestion import (
+    JOB_NOTIFY_CHANNEL,
+    DataIngestionRepository,
+)
+from app.tasks import _job_listener
+
+
+@pytest.fixture(autouse=True)
+def _fresh_wakeup():
+    """The module-level Event binds to the first loop that waits on it;
+    give each test (and its event loop) its own."""
+    with patch.object(_job_listener, "_wakeup", asyncio.Event()):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_notification_wakes_the_waiter_once():
+    _job_listener.wake_dispatcher()
+    _job_listener.wake_dispatcher()
+
+    assert await _job_listener.wait_for_job_notify(1) is True
+    # Both wake-ups were consumed by the one wait.
+    assert await _job_listener.wait_for_job_notify(0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_mid_sleep():
+    waiter = asyncio.create_task(_job_listener.wait_for_job_notify(5))
+    await asyncio.sleep(0)
+    _job_listener.wake_dispatcher()
+
+    assert await asyncio.wait_for(waiter, 1) is True
+
+
+def test_poll_interval_slows_while_listening():
+    from app.tasks._poller import _poll_interval
+
+    settings = MagicMock(POLLER_INTERVAL_SECONDS=2, JOB_NOTIFY_FALLBACK_POLL_SECONDS=30)
+    with patch("app.tasks._poller.is_listening", return_value=False):
+        assert _poll_interval(settings) == 2
+    with patch("app.tasks._poller.is_listening", return_value=True):
+        assert _poll_interval(settings) == 30
+
+
+@pytest.mark.asyncio
+async def test_listener_stays_off_outside_postgres():
+    engine = MagicMock()
+    engine.dialect.name = "sqlite"
+    with patch.object(_job_listener, "engine", engine):
+        await asyncio.wait_for(_job_listener.listen_for_jobs(), 1)
+
+    engine.connect.assert_not_called()
+    assert _job_listener.is_listening() is False
+
+
+def _session(dialect_name: str) -> MagicMock:
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = dialect_name
+    session.execute = AsyncMock()
+    return session
+
+
+@pytest.mark.asyncio
+async def test_notify_jobs_ready_queues_pg_notify_on_postgres():
+    session = _session("postgresql")
+
+    await DataIngestionRepository(session).notify_jobs_ready([7, 9])
+
+    session.execute.assert_awaited_once()
+    params = session.execute.await_args.args[1]
+    assert params == {"channel": JOB_NOTIFY_CHANNEL, "ids": [7, 9]}
+
+
+@pytest.mark.asyncio
+async def test_notify_jobs_ready_is_a_no_op_elsewhere():
+    session = _session("sqlite")
+    repo = DataIngestionRepository(session)
+
+    await repo.notify_jobs_ready([7])
+    await repo.notify_jobs_ready([])
+
+    session.execute.assert_not_awaited()
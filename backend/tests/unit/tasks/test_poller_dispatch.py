@@ -8,11 +8,15 @@ branching here (the registry is the single source of truth — see
 ``app/tasks/registry.py``).
 """
 
+from contextlib import ExitStack, asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 
 from app.models.data_ingestion import DataIngestionJob
+from app.tasks import _poller
 from app.tasks._poller import dispatch_job
 
 
@@ -70,3 +74,116 @@ async def test_dispatch_job_skips_when_id_missing():
     with patch("app.tasks._poller.run_job", new_callable=AsyncMock) as mock_run:
         await dispatch_job(job, "test-pod")
     mock_run.assert_not_awaited()
+
+
+def test_within_free_slots_trims_capped_job_types():
+    """The sweep schedules no more jobs of a capped type than the pod has
+    free slots for; uncapped types pass through."""
+    from app.tasks._poller import _within_free_slots
+
+    jobs = [
+        _make_job(1, "emission_recalc"),
+        _make_job(2, "emission_recalc"),
+        _make_job(3, "csv_ingest"),
+        _make_job(4, "emission_recalc"),
+        _make_job(5, "unit_sync"),
+    ]
+    slots = {"emission_recalc": 2, "csv_ingest": 0}
+    with patch(
+        "app.tasks._poller.free_slots",
+        side_effect=lambda job_type, pipeline_id=None: slots.get(job_type),
+    ):
+        kept = _within_free_slots(jobs)
+
+    assert [job.id for job in kept] == [1, 2, 5]
+
+
+def test_within_free_slots_keeps_a_slot_for_other_pipelines():
+    """With a cap of 2 and one reserved slot, a bulk pipeline's backlog
+    takes one slot and the next pipeline's job gets the other."""
+    from app.tasks._poller import _within_free_slots
+
+    bulk, user = uuid4(), uuid4()
+    jobs = [
+        _make_job(1, "emission_recalc"),
+        _make_job(2, "emission_recalc"),
+        _make_job(3, "emission_recalc"),
+        _make_job(4, "emission_recalc"),
+    ]
+    for job, pipeline_id in zip(jobs, [bulk, bulk, bulk, user]):
+        job.pipeline_id = pipeline_id
+    settings = MagicMock(
+        JOB_CONCURRENCY_LIMITS={"emission_recalc": 2}, JOB_PIPELINE_RESERVED_SLOTS=1
+    )
+    with patch("app.tasks._concurrency.get_settings", return_value=settings):
+        kept = _within_free_slots(jobs)
+
+    assert [job.id for job in kept] == [1, 4]
+
+
+async def _poll_once(run_after: datetime | None = None) -> list[float]:
+    """One ``poll_pending_jobs`` iteration with the listener connected
+    (fallback 30s, interval 10s) and no job pending; returns the wait
+    timeout the loop chose."""
+    repo = MagicMock()
+    repo.sweep_stuck_running_jobs = AsyncMock(return_value=(0, 0))
+    waits = []
+
+    async def _execute(stmt):
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        result.scalar_one_or_none.return_value = run_after
+        return result
+
+    @asynccontextmanager
+    async def _session_local():
+        session = MagicMock()
+        session.execute = _execute
+        yield session
+
+    async def _wait(timeout):
+        waits.append(timeout)
+        return False
+
+    settings = MagicMock(
+        POLLER_INTERVAL_SECONDS=10,
+        JOB_NOTIFY_FALLBACK_POLL_SECONDS=30,
+        POLLER_BATCH_LIMIT=100,
+        STALE_JOB_TIMEOUT_MINUTES=30,
+    )
+    with ExitStack() as stack:
+        for name, value in [
+            ("get_settings", MagicMock(return_value=settings)),
+            ("SessionLocal", _session_local),
+            ("DataIngestionRepository", MagicMock(return_value=repo)),
+            ("is_listening", MagicMock(return_value=True)),
+            ("saturated_job_types", MagicMock(return_value=())),
+            ("wait_for_job_notify", _wait),
+            ("is_draining", MagicMock(side_effect=[False, True])),
+        ]:
+            stack.enter_context(patch.object(_poller, name, value))
+        await _poller.poll_pending_jobs()
+
+    repo.sweep_stuck_running_jobs.assert_awaited_once()
+    return waits
+
+
+@pytest.mark.asyncio
+async def test_poller_keeps_recovery_cadence_while_listening():
+    """The listener slows the timed dispatch sweep to the fallback, but
+    stale-job recovery gets no notification and stays on
+    ``POLLER_INTERVAL_SECONDS``."""
+    waits = await _poll_once()
+
+    assert waits == [pytest.approx(10, abs=1)]
+
+
+@pytest.mark.asyncio
+async def test_poller_wakes_when_earliest_run_after_comes_due():
+    """A deferred job is announced by nothing; the sweep wakes for it.
+    SQLite hands ``run_after`` back naive (UTC)."""
+    run_after = datetime.now(timezone.utc) + timedelta(seconds=4)
+
+    waits = await _poll_once(run_after.replace(tzinfo=None))
+
+    assert waits == [pytest.approx(4, abs=1)]
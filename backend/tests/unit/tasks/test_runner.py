@@ -11,8 +11,10 @@ to ``app.tasks._chain`` to break the static import cycle CodeQL flagged
 on PR #1050 (alerts #644/#645/#646).
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 from sqlalchemy.exc import PendingRollbackError
@@ -20,6 +22,7 @@ from sqlalchemy.exc import PendingRollbackError
 from app.models.data_ingestion import (
     IngestionResult,
 )
+from app.tasks import _concurrency, _draining
 from app.tasks import runner as runner_mod
 from app.tasks.registry import _REGISTRY, register
 
@@ -163,6 +166,204 @@ async def test_run_job_claim_fails_returns_silently():
     repo.update_ingestion_job.assert_not_called()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("in_worker", [False, True])
+async def test_run_job_skipped_in_api_process_when_api_runs_no_jobs(in_worker):
+    """``API_RUNS_JOBS=false`` → an endpoint's in-process ``run_job`` is a
+    no-op and the row waits for a worker; ``app.worker`` still runs it."""
+    job = _make_job()
+    repo = _make_repo_returning(job)
+    repo.claim_job = AsyncMock(return_value=False)
+
+    with (
+        patch.object(
+            runner_mod, "get_settings", return_value=MagicMock(API_RUNS_JOBS=False)
+        ),
+        patch.object(runner_mod, "_in_worker_process", in_worker),
+        _patch_session_local(),
+        patch.object(runner_mod, "DataIngestionRepository", return_value=repo),
+    ):
+        await runner_mod.run_job(1)
+
+    assert repo.claim_job.called is in_worker
+
+
+# ---------------------------------------------------------------------------
+# run_job — per-job-type concurrency caps
+# ---------------------------------------------------------------------------
+
+
+def _patch_concurrency_limits(limits: dict[str, int]):
+    return patch(
+        "app.tasks._concurrency.get_settings",
+        return_value=MagicMock(JOB_CONCURRENCY_LIMITS=limits),
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_job_at_concurrency_cap_leaves_job_unclaimed():
+    """Pod already runs its cap of this job type → no claim, so the row
+    stays NOT_STARTED for another pod."""
+    job = _make_job()
+    repo = _make_repo_returning(job)
+
+    with (
+        _patch_concurrency_limits({"test_job": 1}),
+        patch.dict(_concurrency._running, {"test_job": 1}),
+        _patch_session_local(),
+        patch.object(runner_mod, "DataIngestionRepository", return_value=repo),
+    ):
+        await runner_mod.run_job(1)
+
+    repo.claim_job.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_job_fair_share_leaves_a_slot_for_another_pipeline():
+    """Cap 3, one reserved slot: a pipeline already running two jobs of
+    the type is at its share, so its next job stays unclaimed while
+    another pipeline's job takes the last slot.  (With a cap of 1 the
+    share is that one slot, so fair share only shows above 1.)"""
+    bulk, user = uuid4(), uuid4()
+    settings = MagicMock(
+        JOB_CONCURRENCY_LIMITS={"test_job": 3}, JOB_PIPELINE_RESERVED_SLOTS=1
+    )
+    claimed = []
+
+    @register("test_job")
+    async def _handler(j, js, ds) -> dict:
+        claimed.append(j.pipeline_id)
+        return {}
+
+    with (
+        patch("app.tasks._concurrency.get_settings", return_value=settings),
+        patch("app.tasks._concurrency.wake_dispatcher"),
+        patch.dict(_concurrency._running, {"test_job": 2}),
+        patch.dict(_concurrency._running_by_pipeline, {("test_job", bulk): 2}),
+        _patch_session_local(),
+        _patch_heartbeat(),
+    ):
+        for job_id, pipeline_id in [(1, bulk), (2, user)]:
+            job = _make_job(job_id)
+            job.pipeline_id = pipeline_id
+            job.locked_by = runner_mod.POD_ID
+            repo = _make_repo_returning(job)
+            with patch.object(runner_mod, "DataIngestionRepository", return_value=repo):
+                await runner_mod.run_job(job_id)
+            if pipeline_id == bulk:
+                repo.claim_job.assert_not_called()
+            else:
+                repo.claim_job.assert_awaited_once()
+
+    assert claimed == [user]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("claimed", [True, False])
+async def test_run_job_releases_its_concurrency_slot(claimed):
+    """The slot is given back whether the job ran or the claim lost."""
+    job = _make_job()
+    job.locked_by = runner_mod.POD_ID
+    repo = _make_repo_returning(job)
+    repo.claim_job = AsyncMock(return_value=claimed)
+
+    slots_while_running = []
+
+    @register("test_job")
+    async def _handler(j, js, ds) -> dict:
+        slots_while_running.append(_concurrency.free_slots("test_job"))
+        return {}
+
+    with (
+        _patch_concurrency_limits({"test_job": 1}),
+        patch("app.tasks._concurrency.wake_dispatcher") as wake,
+        _patch_session_local(),
+        _patch_heartbeat(),
+        patch.object(runner_mod, "DataIngestionRepository", return_value=repo),
+    ):
+        await runner_mod.run_job(1)
+        assert _concurrency.free_slots("test_job") == 1
+
+    wake.assert_called_once_with()
+    assert slots_while_running == ([0] if claimed else [])
+
+
+@pytest.mark.asyncio
+async def test_run_job_releases_its_concurrency_slot_when_claim_raises():
+    """A DB error in ``claim_job`` propagates, but the slot is not leaked."""
+    job = _make_job()
+    repo = _make_repo_returning(job)
+    repo.claim_job = AsyncMock(side_effect=RuntimeError("db down"))
+
+    with (
+        _patch_concurrency_limits({"test_job": 1}),
+        patch("app.tasks._concurrency.wake_dispatcher"),
+        _patch_session_local(),
+        patch.object(runner_mod, "DataIngestionRepository", return_value=repo),
+    ):
+        with pytest.raises(RuntimeError, match="db down"):
+            await runner_mod.run_job(1)
+        assert _concurrency.free_slots("test_job") == 1
+
+
+@pytest.mark.asyncio
+async def test_run_job_while_draining_leaves_job_unclaimed():
+    """A stopping worker claims nothing — chained children included —
+    and gives the slot back."""
+    job = _make_job()
+    repo = _make_repo_returning(job)
+
+    with (
+        patch.object(_draining, "_draining", True),
+        _patch_concurrency_limits({"test_job": 1}),
+        patch("app.tasks._concurrency.wake_dispatcher"),
+        _patch_session_local(),
+        patch.object(runner_mod, "DataIngestionRepository", return_value=repo),
+    ):
+        await runner_mod.run_job(1)
+        assert _concurrency.free_slots("test_job") == 1
+
+    repo.claim_job.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_job_cancelled_mid_handler_releases_job_for_retry():
+    """Cut off by the worker's shutdown: the handler is stopped, nothing
+    is committed or finished, and the row is handed back to
+    NOT_STARTED before the cancellation propagates."""
+    job = _make_job()
+    job.locked_by = runner_mod.POD_ID
+    repo = _make_repo_returning(job)
+    repo.release_job = AsyncMock(return_value=True)
+    started = asyncio.Event()
+    handler_cancelled = []
+
+    @register("test_job")
+    async def _handler(j, js, ds) -> dict:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            handler_cancelled.append(True)
+            raise
+        return {}
+
+    with (
+        _patch_session_local(),
+        _patch_heartbeat(),
+        patch.object(runner_mod, "DataIngestionRepository", return_value=repo),
+    ):
+        task = asyncio.create_task(runner_mod.run_job(1))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert handler_cancelled == [True]
+    repo.release_job.assert_awaited_once_with(1, runner_mod.POD_ID)
+    repo.finish_job.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # run_job — success / error paths
 # ---------------------------------------------------------------------------
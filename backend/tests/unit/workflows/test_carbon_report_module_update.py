@@ -61,7 +61,8 @@ async def test_update_partial_patch_retains_persisted_classification():
     emission_service = MagicMock()
     emission_service.upsert_by_data_entry = AsyncMock()
     module_service = MagicMock()
-    module_service.recompute_stats = AsyncMock()
+    module_service.snapshot_entry_emissions = AsyncMock(return_value=[])
+    module_service.apply_entry_stats_delta = AsyncMock()
 
     with (
         patch(
@@ -95,3 +96,6 @@ async def test_update_partial_patch_retains_persisted_classification():
     persisted = captured["data"].data
     assert persisted["equipment_class"] == "Lab Freezer / Frigde"
     assert persisted["sub_class"] == "Recent -80C freezers (<12yo)"
+    # Stats are patched from the entry's pre-edit emission rows.
+    module_service.snapshot_entry_emissions.assert_awaited_once_with(18036, 1)
+    module_service.apply_entry_stats_delta.assert_awaited_once_with(18036, 1, [])
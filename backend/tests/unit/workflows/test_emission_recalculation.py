@@ -5,7 +5,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from app.models.data_entry import DataEntryTypeEnum
-from app.workflows.emission_recalculation import EmissionRecalculationWorkflow
+from app.workflows.emission_recalculation import (
+    EmissionRecalculationWorkflow,
+    RecalcCheckpoint,
+)
 
 
 def _make_mock_entry(entry_id: int, module_id: int) -> MagicMock:
@@ -26,6 +29,25 @@ def _make_mock_handler() -> MagicMock:
     return handler
 
 
+def _mock_slice(mock_repo_cls: MagicMock, entries: list) -> None:
+    """Wire the patched ``DataEntryRepository`` to stream ``entries``.
+
+    Mirrors the real keyset reader: ``count_…`` sizes the slice and
+    ``iter_…`` yields it in ``chunk_size`` chunks; ``release_chunk`` is
+    the per-chunk flush + detach the workflow awaits.
+    """
+
+    async def _iter(*_args, chunk_size: int, after_id: int = 0, **_kwargs):
+        rest = [e for e in entries if e.id > after_id]
+        for i in range(0, len(rest), chunk_size):
+            yield rest[i : i + chunk_size]
+
+    repo = mock_repo_cls.return_value
+    repo.count_by_data_entry_type_and_year = AsyncMock(return_value=len(entries))
+    repo.iter_by_data_entry_type_and_year = _iter
+    repo.release_chunk = AsyncMock()
+
+
 # ======================================================================
 # recalculate_for_data_entry_type Tests
 # ======================================================================
@@ -58,14 +80,12 @@ async def test_recalculate_all_success():
         ) as mock_handler_cls,
     ):
         mock_handler_cls.get_by_type.return_value = _make_mock_handler()
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=entries
-        )
+        _mock_slice(mock_repo_cls, entries)
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[]
         )
-        mock_emission_cls.return_value.prepare_create = AsyncMock(return_value=[])
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
         mock_response_cls.model_validate.return_value = mock_entry_response
@@ -114,9 +134,7 @@ async def test_recalculate_partial_error():
         ) as mock_handler_cls,
     ):
         mock_handler_cls.get_by_type.return_value = _make_mock_handler()
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=entries
-        )
+        _mock_slice(mock_repo_cls, entries)
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[]
         )
@@ -132,10 +150,10 @@ async def test_recalculate_partial_error():
         async def _prepare(entry_response, **kwargs):
             if entry_response.id == 2:
                 raise ValueError("factor not found")
-            return []
+            return None
 
-        mock_emission_cls.return_value.prepare_create = _prepare
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = _prepare
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
 
@@ -190,9 +208,7 @@ async def test_recalculate_aborts_batch_on_connection_invalidated():
         ) as mock_handler_cls,
     ):
         mock_handler_cls.get_by_type.return_value = _make_mock_handler()
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=entries
-        )
+        _mock_slice(mock_repo_cls, entries)
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[]
         )
@@ -215,10 +231,10 @@ async def test_recalculate_aborts_batch_on_connection_invalidated():
                     Exception("server closed the connection unexpectedly"),
                     connection_invalidated=True,
                 )
-            return []
+            return None
 
-        mock_emission_cls.return_value.prepare_create = _prepare
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = _prepare
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
 
@@ -264,9 +280,7 @@ async def test_recalculate_aborts_batch_on_pending_rollback():
         ) as mock_handler_cls,
     ):
         mock_handler_cls.get_by_type.return_value = _make_mock_handler()
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=entries
-        )
+        _mock_slice(mock_repo_cls, entries)
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[]
         )
@@ -287,10 +301,10 @@ async def test_recalculate_aborts_batch_on_pending_rollback():
                     "This Session's transaction has been rolled back "
                     "due to a previous exception during flush."
                 )
-            return []
+            return None
 
-        mock_emission_cls.return_value.prepare_create = _prepare
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = _prepare
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
 
@@ -313,9 +327,7 @@ async def test_recalculate_empty_result():
         patch("app.workflows.emission_recalculation.DataEntryEmissionService"),
         patch("app.workflows.emission_recalculation.BaseModuleHandler"),
     ):
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=[]
-        )
+        _mock_slice(mock_repo_cls, [])
 
         result = await svc.recalculate_for_data_entry_type(
             DataEntryTypeEnum.plane, 2025
@@ -328,6 +340,66 @@ async def test_recalculate_empty_result():
     assert result["error_details"] == []
 
 
+@pytest.mark.asyncio
+async def test_recalculate_targets_changed_factors():
+    """``changed_factor_ids`` narrows the slice to the entries those
+    factors feed: only the slice's own (det, year) factors count, and
+    their rematch keys ride along for entries that would move onto them."""
+    from app.repositories.data_entry_repo import ChangedFactorScope
+
+    mock_session = MagicMock()
+    svc = EmissionRecalculationWorkflow(mock_session)
+    handler = _make_override_handler()
+
+    in_slice = _make_factor(7, {"purchase_institutional_code": "A1"})
+    in_slice.data_entry_type_id = DataEntryTypeEnum.plane
+    in_slice.year = 2025
+    coded = _make_factor(
+        8,
+        {
+            "purchase_institutional_code": "B2",
+            "purchase_additional_code": "X9",
+        },
+    )
+    coded.data_entry_type_id = DataEntryTypeEnum.plane
+    coded.year = 2025
+    other_year = _make_factor(9, {"purchase_institutional_code": "C3"})
+    other_year.data_entry_type_id = DataEntryTypeEnum.plane
+    other_year.year = 2024
+
+    with (
+        patch(
+            "app.workflows.emission_recalculation.DataEntryRepository"
+        ) as mock_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.FactorRepository"
+        ) as mock_factor_repo_cls,
+        patch("app.workflows.emission_recalculation.DataEntryEmissionService"),
+        patch(
+            "app.workflows.emission_recalculation.BaseModuleHandler"
+        ) as mock_handler_cls,
+    ):
+        mock_handler_cls.get_by_type.return_value = handler
+        _mock_slice(mock_repo_cls, [])
+        mock_factor_repo_cls.return_value.list_by_ids = AsyncMock(
+            return_value=[in_slice, coded, other_year]
+        )
+
+        result = await svc.recalculate_for_data_entry_type(
+            DataEntryTypeEnum.plane, 2025, changed_factor_ids=[7, 8, 9]
+        )
+
+    assert result["recalculated"] == 0
+    count = mock_repo_cls.return_value.count_by_data_entry_type_and_year
+    assert count.await_args.args[3] == ChangedFactorScope(
+        factor_ids=(7, 8),
+        kind_field="purchase_institutional_code",
+        kinds=("A1", "B2"),
+        override_field="purchase_additional_code",
+        override_codes=("X9",),
+    )
+
+
 @pytest.mark.asyncio
 async def test_recalculate_rematches_primary_factor_id_when_changed():
     """Plan 310B Part 6: Strategy A entries (kind_field present in
@@ -358,9 +430,7 @@ async def test_recalculate_rematches_primary_factor_id_when_changed():
             "app.workflows.emission_recalculation.BaseModuleHandler"
         ) as mock_handler_cls,
     ):
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=[entry]
-        )
+        _mock_slice(mock_repo_cls, [entry])
         # Bulk dict has the new factor for kind=Laptop with id=1234.
         new_factor = MagicMock()
         new_factor.id = 1234
@@ -368,8 +438,8 @@ async def test_recalculate_rematches_primary_factor_id_when_changed():
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[new_factor]
         )
-        mock_emission_cls.return_value.prepare_create = AsyncMock(return_value=[])
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
         # Strategy A handler: kind_field maps to a key in entry.data so
@@ -412,14 +482,12 @@ async def test_recalculate_does_not_touch_entry_when_factor_unchanged():
             "app.workflows.emission_recalculation.BaseModuleHandler"
         ) as mock_handler_cls,
     ):
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=[entry]
-        )
+        _mock_slice(mock_repo_cls, [entry])
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[]
         )
-        mock_emission_cls.return_value.prepare_create = AsyncMock(return_value=[])
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
         # Handler with no kind_field (MagicMock attr is not in entry.data
@@ -467,14 +535,12 @@ async def test_recalculate_reports_affected_module_ids_for_chain():
         ) as mock_handler_cls,
     ):
         mock_handler_cls.get_by_type.return_value = _make_mock_handler()
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=entries
-        )
+        _mock_slice(mock_repo_cls, entries)
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[]
         )
-        mock_emission_cls.return_value.prepare_create = AsyncMock(return_value=[])
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
         mock_response_cls.model_validate.return_value = mock_entry_response
@@ -526,14 +592,12 @@ async def test_recalculate_skips_rematch_for_strategy_b_handlers():
             "app.workflows.emission_recalculation.BaseModuleHandler"
         ) as mock_handler_cls,
     ):
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=[entry]
-        )
+        _mock_slice(mock_repo_cls, [entry])
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[]
         )
-        mock_emission_cls.return_value.prepare_create = AsyncMock(return_value=[])
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
         # Strategy B handler shape: kind_field set, but its value isn't
@@ -564,7 +628,7 @@ async def test_recalculate_skips_rematch_for_strategy_b_handlers():
 @pytest.mark.asyncio
 async def test_recalculate_rolls_back_entry_data_on_upsert_failure():
     """Plan 310B Part 6 (Copilot follow-up): if the per-entry compute
-    (``prepare_create``) raises mid-loop, the in-memory ``entry.data``
+    (``plan_create``) raises mid-loop, the in-memory ``entry.data``
     mutation must be rolled back so the outer ``data_session.commit()``
     doesn't persist a stale primary_factor_id alongside an old
     emissions row.
@@ -592,9 +656,7 @@ async def test_recalculate_rolls_back_entry_data_on_upsert_failure():
             "app.workflows.emission_recalculation.BaseModuleHandler"
         ) as mock_handler_cls,
     ):
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=[entry]
-        )
+        _mock_slice(mock_repo_cls, [entry])
         # Bulk dict has the new factor with id 1234 — rematch tentatively
         # swaps entry.data['primary_factor_id'] from 7 → 1234, then upsert
         # fails so the rollback restores the original.
@@ -606,10 +668,10 @@ async def test_recalculate_rolls_back_entry_data_on_upsert_failure():
         )
         # The compute step raises — simulates a downstream failure between
         # the rematch swap and the emissions-row write.
-        mock_emission_cls.return_value.prepare_create = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(
             side_effect=RuntimeError("compute blew up")
         )
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
         strategy_a_handler = _make_mock_handler()
@@ -631,6 +693,180 @@ async def test_recalculate_rolls_back_entry_data_on_upsert_failure():
     )
 
 
+@pytest.mark.asyncio
+async def test_recalculate_batch_formula_failure_isolated_per_entry():
+    """The formula pass runs once per chunk; a non-numeric factor value
+    fails only its own entry — relink reverted, old emissions kept —
+    while the other entry's rows are written."""
+    from app.models.data_entry_emission import EmissionComputation, EmissionType
+    from app.services.data_entry_emission_service import EmissionPlan, _FactorTerm
+
+    mock_session = MagicMock()
+    svc = EmissionRecalculationWorkflow(mock_session)
+
+    good = _make_mock_entry(1, 10)
+    bad = _make_mock_entry(2, 11)
+    bad.data = {"primary_factor_id": 7, "equipment_class": "Laptop"}
+    original_bad = dict(bad.data)
+
+    comp = EmissionComputation(
+        emission_type=EmissionType.food, quantity_key="kg", formula_key="ef"
+    )
+
+    def _model_validate(entry):
+        m = MagicMock()
+        m.id = entry.id
+        return m
+
+    async def _plan(entry_response, **kwargs):
+        factor = MagicMock()
+        factor.id = 1234
+        factor.emission_type_id = EmissionType.food.value
+        factor.values = {"ef": 2.0} if entry_response.id == 1 else {"ef": "n/a"}
+        plan = EmissionPlan(data_entry_id=entry_response.id, rollup_type=None)
+        plan.terms.append(
+            _FactorTerm(
+                slot=0,
+                comp=comp,
+                factor=factor,
+                ctx={"kg": 3.0},
+                emission_type=EmissionType.food,
+            )
+        )
+        plan.rows.append(None)
+        return plan
+
+    with (
+        patch(
+            "app.workflows.emission_recalculation.DataEntryRepository"
+        ) as mock_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.FactorRepository"
+        ) as mock_factor_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.DataEntryEmissionService"
+        ) as mock_emission_cls,
+        patch(
+            "app.workflows.emission_recalculation.DataEntryResponse"
+        ) as mock_response_cls,
+        patch(
+            "app.workflows.emission_recalculation.BaseModuleHandler"
+        ) as mock_handler_cls,
+    ):
+        _mock_slice(mock_repo_cls, [good, bad])
+        new_factor = MagicMock()
+        new_factor.id = 1234
+        new_factor.classification = {"equipment_class": "Laptop"}
+        mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
+            return_value=[new_factor]
+        )
+        mock_response_cls.model_validate.side_effect = _model_validate
+        mock_emission_cls.return_value.plan_create = _plan
+        replace_rows = AsyncMock(return_value=1)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = replace_rows
+        handler = _make_mock_handler()
+        handler.kind_field = "equipment_class"
+        handler.kind_field_override = None
+        handler.subkind_field = None
+        mock_handler_cls.get_by_type.return_value = handler
+
+        result = await svc.recalculate_for_data_entry_type(DataEntryTypeEnum.it, 2025)
+
+    assert result["recalculated"] == 1
+    assert result["errors"] == 1
+    assert result["error_details"][0]["data_entry_id"] == 2
+    assert result["affected_module_ids"] == [10]
+    assert bad.data == original_bad
+    ids, rows, _inputs = replace_rows.await_args.args
+    assert ids == [1]
+    assert [(row[0], row[3]) for row in rows] == [(1, 6.0)]
+
+
+@pytest.mark.asyncio
+async def test_recalculate_skips_entries_with_unchanged_fingerprint():
+    """An entry whose fresh inputs fingerprint matches its stored one is
+    counted as recalculated but neither evaluated nor replaced; the
+    other entry is rewritten as usual."""
+    from app.models.data_entry_emission import EmissionComputation, EmissionType
+    from app.services.data_entry_emission_service import EmissionPlan, _FactorTerm
+
+    mock_session = MagicMock()
+    svc = EmissionRecalculationWorkflow(mock_session)
+    entries = [_make_mock_entry(1, 10), _make_mock_entry(2, 11)]
+    comp = EmissionComputation(
+        emission_type=EmissionType.food, quantity_key="kg", formula_key="ef"
+    )
+
+    def _model_validate(entry):
+        m = MagicMock()
+        m.id = entry.id
+        return m
+
+    async def _plan(entry_response, **kwargs):
+        factor = MagicMock()
+        factor.id = 1234
+        factor.emission_type_id = EmissionType.food.value
+        factor.values = {"ef": 2.0}
+        plan = EmissionPlan(
+            data_entry_id=entry_response.id,
+            rollup_type=None,
+            fingerprint=f"fp-{entry_response.id}",
+        )
+        plan.terms.append(
+            _FactorTerm(
+                slot=0,
+                comp=comp,
+                factor=factor,
+                ctx={"kg": 3.0},
+                emission_type=EmissionType.food,
+            )
+        )
+        plan.rows.append(None)
+        return plan
+
+    with (
+        patch(
+            "app.workflows.emission_recalculation.DataEntryRepository"
+        ) as mock_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.FactorRepository"
+        ) as mock_factor_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.DataEntryEmissionService"
+        ) as mock_emission_cls,
+        patch(
+            "app.workflows.emission_recalculation.DataEntryResponse"
+        ) as mock_response_cls,
+        patch(
+            "app.workflows.emission_recalculation.BaseModuleHandler"
+        ) as mock_handler_cls,
+    ):
+        mock_handler_cls.get_by_type.return_value = _make_mock_handler()
+        _mock_slice(mock_repo_cls, entries)
+        mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
+            return_value=[]
+        )
+        mock_response_cls.model_validate.side_effect = _model_validate
+        mock_emission_cls.return_value.plan_create = _plan
+        # Entry 1's stored rows match; entry 2 was computed from other inputs.
+        lookup = AsyncMock(return_value={1: "fp-1", 2: "stale"})
+        mock_emission_cls.return_value.get_inputs_fingerprints = lookup
+        replace_rows = AsyncMock(return_value=1)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = replace_rows
+
+        result = await svc.recalculate_for_data_entry_type(
+            DataEntryTypeEnum.plane, 2025
+        )
+
+    assert sorted(lookup.await_args.args[0]) == [1, 2]
+    assert result["recalculated"] == 2
+    assert result["unchanged"] == 1
+    assert result["affected_module_ids"] == [10, 11]
+    ids, rows, _inputs = replace_rows.await_args.args
+    assert ids == [2]
+    assert [(row[0], row[3], row[-1]) for row in rows] == [(2, 6.0, "fp-2")]
+
+
 @pytest.mark.asyncio
 async def test_recalculate_uses_single_factor_bulk_fetch():
     """Plan 310D: the workflow pulls all factors for
@@ -678,14 +914,12 @@ async def test_recalculate_uses_single_factor_bulk_fetch():
             "app.workflows.emission_recalculation.BaseModuleHandler"
         ) as mock_handler_cls,
     ):
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=entries
-        )
+        _mock_slice(mock_repo_cls, entries)
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[laptop_factor]
         )
-        mock_emission_cls.return_value.prepare_create = AsyncMock(return_value=[])
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
         strategy_a_handler = _make_mock_handler()
@@ -747,14 +981,12 @@ async def test_recalculate_kind_only_fallback_in_dict():
             "app.workflows.emission_recalculation.BaseModuleHandler"
         ) as mock_handler_cls,
     ):
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=[entry]
-        )
+        _mock_slice(mock_repo_cls, [entry])
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[kind_only_factor]
         )
-        mock_emission_cls.return_value.prepare_create = AsyncMock(return_value=[])
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
         handler = _make_mock_handler()
@@ -802,14 +1034,12 @@ async def test_recalculate_reports_progress_at_interval(monkeypatch):
         ) as mock_handler_cls,
     ):
         mock_handler_cls.get_by_type.return_value = _make_mock_handler()
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=entries
-        )
+        _mock_slice(mock_repo_cls, entries)
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[]
         )
-        mock_emission_cls.return_value.prepare_create = AsyncMock(return_value=[])
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
 
@@ -820,6 +1050,486 @@ async def test_recalculate_reports_progress_at_interval(monkeypatch):
     assert progress_calls == [(1, 2), (2, 2)]
 
 
+@pytest.mark.asyncio
+async def test_recalculate_streams_slice_in_chunks(monkeypatch):
+    """The slice is read in PROGRESS_INTERVAL-sized chunks: each chunk
+    gets its own prefetch and its own DELETE + COPY, and is released
+    (flushed + detached) before the next one is read, so only one
+    chunk of ORM rows is ever resident."""
+    import app.workflows.emission_recalculation as wf_mod
+
+    monkeypatch.setattr(wf_mod, "PROGRESS_INTERVAL", 2)
+    mock_session = MagicMock()
+    svc = EmissionRecalculationWorkflow(mock_session)
+
+    entries = [_make_mock_entry(i, 10) for i in range(1, 6)]
+    progress_calls: list[tuple[int, int]] = []
+
+    async def _progress(done: int, total: int) -> None:
+        progress_calls.append((done, total))
+
+    def _model_validate(entry):
+        m = MagicMock()
+        m.id = entry.id
+        return m
+
+    with (
+        patch(
+            "app.workflows.emission_recalculation.DataEntryRepository"
+        ) as mock_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.FactorRepository"
+        ) as mock_factor_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.DataEntryEmissionService"
+        ) as mock_emission_cls,
+        patch(
+            "app.workflows.emission_recalculation.DataEntryResponse"
+        ) as mock_response_cls,
+        patch(
+            "app.workflows.emission_recalculation.BaseModuleHandler"
+        ) as mock_handler_cls,
+    ):
+        handler = _make_mock_handler()
+        mock_handler_cls.get_by_type.return_value = handler
+        _mock_slice(mock_repo_cls, entries)
+        mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
+            return_value=[]
+        )
+        mock_response_cls.model_validate.side_effect = _model_validate
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        bulk_replace = AsyncMock(return_value=0)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = bulk_replace
+
+        result = await svc.recalculate_for_data_entry_type(
+            DataEntryTypeEnum.plane, 2025, progress_callback=_progress
+        )
+
+    assert result["recalculated"] == 5
+    replaced_ids = [call.args[0] for call in bulk_replace.await_args_list]
+    assert replaced_ids == [[1, 2], [3, 4], [5]]
+    released = mock_repo_cls.return_value.release_chunk.await_args_list
+    assert [[e.id for e in call.args[0]] for call in released] == [
+        [1, 2],
+        [3, 4],
+        [5],
+    ]
+    assert handler.prefetch_slice.await_count == 3
+    assert progress_calls == [(2, 5), (4, 5), (5, 5)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write_behind", [True, False])
+async def test_recalculate_writes_chunk_during_next_compute(monkeypatch, write_behind):
+    """With write-behind, chunk N's DELETE + COPY runs after chunk N+1
+    is read and planned (during its formula pass) and the last chunk is
+    flushed after the loop; without it each chunk is written inline."""
+    import app.workflows.emission_recalculation as wf_mod
+    from app.core.config import get_settings
+
+    settings = get_settings().model_copy(
+        update={"EMISSION_RECALC_WRITE_BEHIND": write_behind}
+    )
+    monkeypatch.setattr(wf_mod, "get_settings", lambda: settings)
+    monkeypatch.setattr(wf_mod, "PROGRESS_INTERVAL", 2)
+    svc = EmissionRecalculationWorkflow(MagicMock())
+    entries = [_make_mock_entry(i, 10) for i in range(1, 6)]
+    events: list[tuple[str, list[int]]] = []
+
+    async def _prefetch(chunk, *_args, **_kwargs):
+        events.append(("compute", [e.id for e in chunk]))
+        return {}
+
+    async def _replace(ids, rows, inputs):
+        events.append(("write", list(ids)))
+        return len(ids)
+
+    async def _release(chunk):
+        events.append(("release", [e.id for e in chunk]))
+
+    with (
+        patch(
+            "app.workflows.emission_recalculation.DataEntryRepository"
+        ) as mock_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.FactorRepository"
+        ) as mock_factor_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.DataEntryEmissionService"
+        ) as mock_emission_cls,
+        patch("app.workflows.emission_recalculation.DataEntryResponse"),
+        patch(
+            "app.workflows.emission_recalculation.BaseModuleHandler"
+        ) as mock_handler_cls,
+    ):
+        handler = _make_mock_handler()
+        handler.prefetch_slice = _prefetch
+        mock_handler_cls.get_by_type.return_value = handler
+        _mock_slice(mock_repo_cls, entries)
+        mock_repo_cls.return_value.release_chunk = _release
+        mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
+            return_value=[]
+        )
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = _replace
+
+        result = await svc.recalculate_for_data_entry_type(
+            DataEntryTypeEnum.plane, 2025
+        )
+
+    assert result["recalculated"] == 5
+    if write_behind:
+        assert events == [
+            ("compute", [1, 2]),
+            ("release", [1, 2]),
+            ("compute", [3, 4]),
+            ("write", [1, 2]),
+            ("release", [3, 4]),
+            ("compute", [5]),
+            ("write", [3, 4]),
+            ("release", [5]),
+            ("write", [5]),
+        ]
+    else:
+        assert events == [
+            ("compute", [1, 2]),
+            ("write", [1, 2]),
+            ("release", [1, 2]),
+            ("compute", [3, 4]),
+            ("write", [3, 4]),
+            ("release", [3, 4]),
+            ("compute", [5]),
+            ("write", [5]),
+            ("release", [5]),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_recalculate_checkpoints_each_chunk_and_resumes(monkeypatch):
+    """A checkpointed run hands the cursor to ``checkpoint`` after each
+    chunk is written, stays in-process even with workers allowed, and a
+    ``resume_from`` run skips up to the cursor with its counters seeded."""
+    import app.workflows.emission_recalculation as wf_mod
+
+    make_executor = MagicMock()
+    _patch_sharding(monkeypatch, wf_mod, MagicMock(), min_entries=1)
+    monkeypatch.setattr(wf_mod, "_make_shard_executor", make_executor)
+    monkeypatch.setattr(wf_mod, "PROGRESS_INTERVAL", 2)
+    entries = [_make_mock_entry(i, 10 + i % 2) for i in range(1, 6)]
+    checkpoints: list[RecalcCheckpoint] = []
+
+    async def _checkpoint(progress: RecalcCheckpoint) -> None:
+        checkpoints.append(progress)
+
+    async def _run(resume_from=None):
+        svc = EmissionRecalculationWorkflow(MagicMock())
+        with (
+            patch(
+                "app.workflows.emission_recalculation.DataEntryRepository"
+            ) as mock_repo_cls,
+            patch(
+                "app.workflows.emission_recalculation.FactorRepository"
+            ) as mock_factor_repo_cls,
+            patch(
+                "app.workflows.emission_recalculation.DataEntryEmissionService"
+            ) as mock_emission_cls,
+            patch("app.workflows.emission_recalculation.DataEntryResponse"),
+            patch(
+                "app.workflows.emission_recalculation.BaseModuleHandler"
+            ) as mock_handler_cls,
+        ):
+            mock_handler_cls.get_by_type.return_value = _make_mock_handler()
+            _mock_slice(mock_repo_cls, entries)
+            mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
+                return_value=[]
+            )
+            mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+            bulk_replace = AsyncMock(return_value=0)
+            mock_emission_cls.return_value.bulk_replace_rows_for_entries = bulk_replace
+            result = await svc.recalculate_for_data_entry_type(
+                DataEntryTypeEnum.plane,
+                2025,
+                parallel_workers=4,
+                checkpoint=_checkpoint,
+                resume_from=resume_from,
+            )
+        return result, [call.args[0] for call in bulk_replace.await_args_list]
+
+    result, replaced = await _run()
+
+    assert result["recalculated"] == 5
+    assert replaced == [[1, 2], [3, 4], [5]]
+    assert [cp.after_id for cp in checkpoints] == [2, 4, 5]
+    assert [cp.recalculated for cp in checkpoints] == [2, 4, 5]
+    assert checkpoints[0].affected_module_ids == [10, 11]
+    make_executor.assert_not_called()
+
+    # Crash after the second chunk: resume from its checkpoint.
+    resumed = RecalcCheckpoint.from_meta(checkpoints[1].to_meta())
+    checkpoints.clear()
+    result, replaced = await _run(resume_from=resumed)
+
+    assert replaced == [[5]]
+    assert result["recalculated"] == 5
+    assert [cp.after_id for cp in checkpoints] == [5]
+
+
+# ======================================================================
+# Sharded (multi-process) recalc
+# ======================================================================
+
+
+def test_partition_modules_balances_by_entry_count():
+    """Heaviest module first into the lightest shard; modules never split."""
+    from app.workflows.emission_recalculation import _partition_modules
+
+    shards = _partition_modules([(1, 50), (2, 30), (3, 20), (4, 10), (5, 5)], 2)
+    assert shards == [[1, 4], [2, 3, 5]]
+    # Never more shards than modules, never an empty shard.
+    assert _partition_modules([(7, 3)], 4) == [[7]]
+
+
+def _shard_part(
+    ids: list[int], module_id: int, *, last_id: int, exhausted: bool
+) -> dict:
+    """Worker payload shaped like ``_compute_shard_chunk``'s return."""
+    return {
+        "last_id": last_id,
+        "exhausted": exhausted,
+        "entry_ids": ids,
+        "rows": [(i, 1, None, float(i), None, 1, {}, None, None, None) for i in ids],
+        "inputs": {},
+        "relinked": {ids[0]: {"primary_factor_id": 99}} if ids else {},
+        "recalculated": len(ids),
+        "unchanged": 0,
+        "errors": 0,
+        "error_details": [],
+        "affected_module_ids": [module_id] if ids else [],
+        "seg": {"rematch": 0.0, "validate": 0.0, "prepare": 0.0},
+    }
+
+
+def _patch_sharding(monkeypatch, wf_mod, fake_chunk, *, min_entries: int = 1):
+    """Run shard workers on threads with a fake chunk function."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    settings = MagicMock()
+    settings.EMISSION_RECALC_PARALLEL_MIN_ENTRIES = min_entries
+    monkeypatch.setattr(wf_mod, "get_settings", lambda: settings)
+    monkeypatch.setattr(
+        wf_mod, "_make_shard_executor", lambda workers: ThreadPoolExecutor(workers)
+    )
+    monkeypatch.setattr(wf_mod, "_compute_shard_chunk", fake_chunk)
+
+
+@pytest.mark.asyncio
+async def test_recalculate_sharded_writes_worker_chunks_on_own_session(
+    monkeypatch,
+):
+    """Workers compute per-module shards chunk by chunk; every relink and
+    emission replace is applied through the workflow's own session (so
+    the caller's advisory lock and the runner's commit still cover
+    them), and progress tracks the merged count."""
+    import app.workflows.emission_recalculation as wf_mod
+
+    monkeypatch.setattr(wf_mod, "PROGRESS_INTERVAL", 2)
+    pages = {
+        (10, 0): _shard_part([1, 2], 10, last_id=2, exhausted=False),
+        (10, 2): _shard_part([3], 10, last_id=3, exhausted=True),
+        (11, 0): _shard_part([4, 5], 11, last_id=5, exhausted=False),
+        (11, 5): _shard_part([], 11, last_id=5, exhausted=True),
+    }
+    calls: list[tuple] = []
+
+    def _fake_chunk(
+        det, year, module_ids, after_id, chunk_size, changed_factors, entry_ids
+    ):
+        calls.append((det, year, tuple(module_ids), after_id, chunk_size))
+        return pages[(module_ids[0], after_id)]
+
+    _patch_sharding(monkeypatch, wf_mod, _fake_chunk)
+    progress_calls: list[tuple[int, int]] = []
+
+    async def _progress(done: int, total: int) -> None:
+        progress_calls.append((done, total))
+
+    svc = EmissionRecalculationWorkflow(MagicMock())
+    with (
+        patch(
+            "app.workflows.emission_recalculation.DataEntryRepository"
+        ) as mock_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.DataEntryEmissionService"
+        ) as mock_emission_cls,
+    ):
+        repo = mock_repo_cls.return_value
+        repo.count_by_data_entry_type_and_year = AsyncMock(return_value=5)
+        repo.count_by_module_for_data_entry_type_and_year = AsyncMock(
+            return_value=[(10, 3), (11, 2)]
+        )
+        repo.bulk_update_data = AsyncMock()
+        replace_rows = AsyncMock(side_effect=lambda ids, rows, inputs: len(rows))
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = replace_rows
+        mock_emission_cls.return_value.plan_create = AsyncMock()
+
+        result = await svc.recalculate_for_data_entry_type(
+            DataEntryTypeEnum.it, 2025, progress_callback=_progress, parallel_workers=4
+        )
+
+    assert result["recalculated"] == 5
+    assert result["errors"] == 0
+    assert result["affected_module_ids"] == [10, 11]
+    # Each shard is paged by its own keyset cursor.
+    assert sorted(calls) == [
+        (DataEntryTypeEnum.it.value, 2025, (10,), 0, 2),
+        (DataEntryTypeEnum.it.value, 2025, (10,), 2, 2),
+        (DataEntryTypeEnum.it.value, 2025, (11,), 0, 2),
+        (DataEntryTypeEnum.it.value, 2025, (11,), 5, 2),
+    ]
+    replaced = sorted(
+        tuple(call.args[0]) for call in replace_rows.await_args_list if call.args[0]
+    )
+    assert replaced == [(1, 2), (3,), (4, 5)]
+    relinked: dict = {}
+    for call in repo.bulk_update_data.await_args_list:
+        relinked.update(call.args[0])
+    assert relinked == {
+        1: {"primary_factor_id": 99},
+        3: {"primary_factor_id": 99},
+        4: {"primary_factor_id": 99},
+    }
+    # No compute happened in-process.
+    mock_emission_cls.return_value.plan_create.assert_not_awaited()
+    assert progress_calls[-1] == (5, 5)
+
+
+@pytest.mark.asyncio
+async def test_recalculate_sharded_hands_each_shard_its_own_entry_ids(
+    monkeypatch,
+):
+    """A targeted recalc sends each worker only its modules' ids past its
+    cursor, not the whole id list with every chunk."""
+    import app.workflows.emission_recalculation as wf_mod
+
+    monkeypatch.setattr(wf_mod, "PROGRESS_INTERVAL", 2)
+    pages = {
+        (10, 0): _shard_part([1, 2], 10, last_id=2, exhausted=False),
+        (10, 2): _shard_part([3], 10, last_id=3, exhausted=True),
+        (11, 0): _shard_part([4, 5], 11, last_id=5, exhausted=True),
+    }
+    sent: dict[tuple[int, int], list[int]] = {}
+
+    def _fake_chunk(
+        det, year, module_ids, after_id, chunk_size, changed_factors, entry_ids
+    ):
+        sent[(module_ids[0], after_id)] = entry_ids
+        return pages[(module_ids[0], after_id)]
+
+    _patch_sharding(monkeypatch, wf_mod, _fake_chunk)
+    svc = EmissionRecalculationWorkflow(MagicMock())
+    with (
+        patch(
+            "app.workflows.emission_recalculation.DataEntryRepository"
+        ) as mock_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.DataEntryEmissionService"
+        ) as mock_emission_cls,
+    ):
+        repo = mock_repo_cls.return_value
+        repo.count_by_data_entry_type_and_year = AsyncMock(return_value=5)
+        repo.count_by_module_for_data_entry_type_and_year = AsyncMock(
+            return_value=[(10, 3), (11, 2)]
+        )
+        repo.group_ids_by_module = AsyncMock(return_value={10: [1, 2, 3], 11: [4, 5]})
+        repo.bulk_update_data = AsyncMock()
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
+            side_effect=lambda ids, rows, inputs: len(rows)
+        )
+        mock_emission_cls.return_value.plan_create = AsyncMock()
+
+        result = await svc.recalculate_for_data_entry_type(
+            DataEntryTypeEnum.it,
+            2025,
+            parallel_workers=4,
+            data_entry_ids=[5, 4, 3, 2, 1, 99],
+        )
+
+    assert result["recalculated"] == 5
+    repo.group_ids_by_module.assert_awaited_once_with([5, 4, 3, 2, 1, 99])
+    assert sent == {(10, 0): [1, 2, 3], (10, 2): [3], (11, 0): [4, 5]}
+
+
+@pytest.mark.asyncio
+async def test_recalculate_sharded_reraises_worker_failure(monkeypatch):
+    """A worker's session-fatal error aborts the slice so the runner
+    rolls every write back."""
+    from sqlalchemy.exc import InvalidRequestError
+
+    import app.workflows.emission_recalculation as wf_mod
+
+    def _fake_chunk(*_args):
+        raise InvalidRequestError("connection lost")
+
+    _patch_sharding(monkeypatch, wf_mod, _fake_chunk)
+    svc = EmissionRecalculationWorkflow(MagicMock())
+    with patch(
+        "app.workflows.emission_recalculation.DataEntryRepository"
+    ) as mock_repo_cls:
+        repo = mock_repo_cls.return_value
+        repo.count_by_data_entry_type_and_year = AsyncMock(return_value=3)
+        repo.count_by_module_for_data_entry_type_and_year = AsyncMock(
+            return_value=[(10, 3)]
+        )
+        with pytest.raises(InvalidRequestError):
+            await svc.recalculate_for_data_entry_type(
+                DataEntryTypeEnum.it, 2025, parallel_workers=2
+            )
+
+
+@pytest.mark.asyncio
+async def test_recalculate_small_slice_stays_in_process(monkeypatch):
+    """Below EMISSION_RECALC_PARALLEL_MIN_ENTRIES no worker pool is
+    spawned even when parallel workers are allowed."""
+    import app.workflows.emission_recalculation as wf_mod
+
+    make_executor = MagicMock()
+    _patch_sharding(monkeypatch, wf_mod, MagicMock(), min_entries=100)
+    monkeypatch.setattr(wf_mod, "_make_shard_executor", make_executor)
+
+    svc = EmissionRecalculationWorkflow(MagicMock())
+    with (
+        patch(
+            "app.workflows.emission_recalculation.DataEntryRepository"
+        ) as mock_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.FactorRepository"
+        ) as mock_factor_repo_cls,
+        patch(
+            "app.workflows.emission_recalculation.DataEntryEmissionService"
+        ) as mock_emission_cls,
+        patch("app.workflows.emission_recalculation.DataEntryResponse"),
+        patch(
+            "app.workflows.emission_recalculation.BaseModuleHandler"
+        ) as mock_handler_cls,
+    ):
+        mock_handler_cls.get_by_type.return_value = _make_mock_handler()
+        _mock_slice(mock_repo_cls, [_make_mock_entry(1, 10)])
+        mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
+            return_value=[]
+        )
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
+            return_value=0
+        )
+
+        result = await svc.recalculate_for_data_entry_type(
+            DataEntryTypeEnum.plane, 2025, parallel_workers=4
+        )
+
+    assert result["recalculated"] == 1
+    make_executor.assert_not_called()
+
+
 # ======================================================================
 # _lookup_factor_id_with_override unit tests
 # ======================================================================
@@ -979,14 +1689,12 @@ async def test_recalculate_override_handler_resolves_by_code():
         ) as mock_handler_cls,
     ):
         mock_handler_cls.get_by_type.return_value = _make_override_handler()
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=[entry]
-        )
+        _mock_slice(mock_repo_cls, [entry])
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[factor_specific, factor_average]
         )
-        mock_emission_cls.return_value.prepare_create = AsyncMock(return_value=[])
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
 
@@ -1034,14 +1742,12 @@ async def test_recalculate_override_handler_falls_back_to_average():
         ) as mock_handler_cls,
     ):
         mock_handler_cls.get_by_type.return_value = _make_override_handler()
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=[entry]
-        )
+        _mock_slice(mock_repo_cls, [entry])
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[factor_specific, factor_average]
         )
-        mock_emission_cls.return_value.prepare_create = AsyncMock(return_value=[])
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
 
@@ -1085,14 +1791,12 @@ async def test_recalculate_override_handler_strict_drop_on_miss():
         ) as mock_handler_cls,
     ):
         mock_handler_cls.get_by_type.return_value = _make_override_handler()
-        mock_repo_cls.return_value.list_by_data_entry_type_and_year = AsyncMock(
-            return_value=[entry]
-        )
+        _mock_slice(mock_repo_cls, [entry])
         mock_factor_repo_cls.return_value.list_by_data_entry_type = AsyncMock(
             return_value=[factor_food]
         )
-        mock_emission_cls.return_value.prepare_create = AsyncMock(return_value=[])
-        mock_emission_cls.return_value.bulk_replace_for_entries = AsyncMock(
+        mock_emission_cls.return_value.plan_create = AsyncMock(return_value=None)
+        mock_emission_cls.return_value.bulk_replace_rows_for_entries = AsyncMock(
             return_value=0
         )
 